@@ -0,0 +1,56 @@
+"""Admin endpoints for the in-process analytics DataFrame and response caches."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from app.api.v1.endpoint.common import require_roles_dep
+from app.db.models.user import TfUser
+from app.schemas.analytics_cache import AnalyticsCacheStats, AnalyticsResponseCacheStats
+from app.utils.analytics_cache import analytics_dataframe_cache_enabled, campaign_dataframe_cache
+from app.utils.response_cache import analytics_response_cache, analytics_response_cache_enabled
+
+router = APIRouter()
+
+SuperadminUser = Annotated[TfUser, Depends(require_roles_dep("superadmin"))]
+
+
+@router.get("/api/analytics-cache/stats", response_model=AnalyticsCacheStats)
+async def analytics_cache_stats(
+    current_user: SuperadminUser,  # noqa: ARG001
+) -> AnalyticsCacheStats:
+    """Return analytics cache usage counters for tuning the byte budget."""
+    stats = campaign_dataframe_cache.stats()
+    lookups = stats.hits + stats.misses
+    response_stats = analytics_response_cache.stats()
+    response_lookups = response_stats.hits + response_stats.misses
+    return AnalyticsCacheStats(
+        success=True,
+        message="Analytics cache stats loaded.",
+        enabled=analytics_dataframe_cache_enabled(),
+        read_only=stats.read_only,
+        entries=stats.entries,
+        max_entries=stats.max_entries,
+        ttl_seconds=stats.ttl_seconds,
+        total_bytes=stats.total_bytes,
+        max_bytes=stats.max_bytes,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_ratio=round(stats.hits / lookups, 4) if lookups else None,
+        evictions=stats.evictions,
+        evicted_bytes=stats.evicted_bytes,
+        oversized_rejections=stats.oversized_rejections,
+        response_cache=AnalyticsResponseCacheStats(
+            enabled=analytics_response_cache_enabled(),
+            entries=response_stats.entries,
+            max_entries=response_stats.max_entries,
+            total_bytes=response_stats.total_bytes,
+            max_bytes=response_stats.max_bytes,
+            hits=response_stats.hits,
+            misses=response_stats.misses,
+            hit_ratio=round(response_stats.hits / response_lookups, 4) if response_lookups else None,
+            evictions=response_stats.evictions,
+        ),
+    )
@@ -7,7 +7,7 @@ Traders Family application.
 import logging
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import (
@@ -22,15 +22,38 @@ from app.api.v1.functions.fetch_campaign import (
 )
 from app.api.v1.functions.fetch_internal_register import fetch_internal_register_payload
 from app.api.v1.functions.fetch_login_activity import fetch_login_activity_payload
+from app.db.models.external_api import (
+    Campaign,
+    DailyRegister,
+    DataDepo,
+    DataMsDeposit,
+    FacebookAds,
+    GoogleAds,
+    TikTokAds,
+)
 from app.db.models.user import TfUser
-from app.db.session import get_db
+from app.db.session import get_db, sqlite_read_session
 from app.schemas.responses import AnalyticsResponse
 from app.utils.campaign import CampaignData
 from app.utils.rbac import ANALYTICS_ROLES, FINANCE_ANALYTICS_ROLES
+from app.utils.response_cache import response_cache_scope
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Source tables each campaign payload reads; a reload of any of them retires cached responses.
+CAMPAIGN_ANALYTICS_TABLES = (
+    GoogleAds.__tablename__,
+    FacebookAds.__tablename__,
+    TikTokAds.__tablename__,
+    Campaign.__tablename__,
+    DailyRegister.__tablename__,
+    DataDepo.__tablename__,
+    DataMsDeposit.__tablename__,
+)
+INTERNAL_REGISTER_TABLES = (Campaign.__tablename__, DailyRegister.__tablename__)
+LOGIN_ACTIVITY_TABLES = (Campaign.__tablename__, DataMsDeposit.__tablename__)
+
 
 async def _build_campaign_data(
     session: AsyncSession,
@@ -43,6 +66,7 @@ async def _build_campaign_data(
         session=session,
         from_date=start_date,
         to_date=end_date,
+        read_session_factory=sqlite_read_session,
     )
 
 
@@ -129,6 +153,7 @@ async def _load_login_activity_payload(
 
 @router.get("/api/campaign/user-acquisition", response_model=AnalyticsResponse)
 async def user_acquisition_overview(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -141,11 +166,14 @@ async def user_acquisition_overview(
         logger=logger,
         failure_log_message="Failed to generate user acquisition overview payload",
         failure_detail_message="An internal error occurred while generating user acquisition overview.",
+        cache=response_cache_scope(request, session, tables=CAMPAIGN_ANALYTICS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/campaign/brand-awareness", response_model=AnalyticsResponse)
 async def brand_awareness_overview(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -158,11 +186,14 @@ async def brand_awareness_overview(
         logger=logger,
         failure_log_message="Failed to generate brand awareness overview payload",
         failure_detail_message="An internal error occurred while generating brand awareness overview.",
+        cache=response_cache_scope(request, session, tables=CAMPAIGN_ANALYTICS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/campaign/remarketing", response_model=AnalyticsResponse)
 async def remarketing_overview(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -175,11 +206,14 @@ async def remarketing_overview(
         logger=logger,
         failure_log_message="Failed to generate remarketing overview payload",
         failure_detail_message="An internal error occurred while generating remarketing overview.",
+        cache=response_cache_scope(request, session, tables=CAMPAIGN_ANALYTICS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/campaign/internal-register", response_model=AnalyticsResponse)
 async def internal_register_overview(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     source: str = Query("all"),
@@ -193,11 +227,14 @@ async def internal_register_overview(
         logger=logger,
         failure_log_message="Failed to generate internal register overview payload",
         failure_detail_message="An internal error occurred while generating internal register overview.",
+        cache=response_cache_scope(request, session, tables=INTERNAL_REGISTER_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/campaign/login-activity", response_model=AnalyticsResponse)
 async def login_activity_overview(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     source: str = Query("all"),
@@ -211,4 +248,6 @@ async def login_activity_overview(
         logger=logger,
         failure_log_message="Failed to generate login activity overview payload",
         failure_detail_message="An internal error occurred while generating login activity overview.",
+        cache=response_cache_scope(request, session, tables=LOGIN_ACTIVITY_TABLES),
+        request=request,
     )
@@ -7,10 +7,19 @@ from collections.abc import Awaitable, Callable
 from datetime import date
 from typing import NoReturn
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.responses import Response
 
 from app.db.models.user import TfUser
-from app.schemas.responses import AnalyticsResponse
+from app.schemas.responses import API_RESPONSE_VERSION
+from app.utils.arrow_response import AnalyticsArrowResponse, accepts_arrow_stream
+from app.utils.json_response import AnalyticsJSONResponse
+from app.utils.response_cache import (
+    ResponseCacheScope,
+    analytics_response_cache,
+    analytics_response_cache_enabled,
+    response_cache_key,
+)
 from app.utils.user_utils import get_current_user, require_roles
 
 
@@ -68,14 +77,35 @@ async def build_analytics_response(
     logger: logging.Logger,
     failure_log_message: str,
     failure_detail_message: str,
-) -> AnalyticsResponse:
-    """Run one analytics payload loader with centralized exception mapping."""
+    cache: ResponseCacheScope | None = None,
+    request: Request | None = None,
+) -> Response:
+    """Run one analytics payload loader with centralized exception mapping.
+
+    With a ``cache`` scope, the payload is served from the response cache
+    while none of the scope's tables has been reloaded since it was built.
+    The ``AnalyticsResponse`` envelope is rendered directly by
+    ``AnalyticsJSONResponse``, or by ``AnalyticsArrowResponse`` when
+    ``request`` accepts the Arrow IPC stream; routes keep it as
+    ``response_model`` for docs.
+    """
     try:
-        data = await loader()
-        return AnalyticsResponse(
-            success=True,
-            message=success_message,
-            data=data,
+        if cache is not None and analytics_response_cache_enabled():
+            cache_key = await response_cache_key(cache)
+            data = analytics_response_cache.get(cache_key)
+            if data is None:
+                data = analytics_response_cache.set(cache_key, await loader())
+        else:
+            data = await loader()
+        response_class = AnalyticsArrowResponse if accepts_arrow_stream(request) else AnalyticsJSONResponse
+        return response_class(
+            content={
+                "api_version": API_RESPONSE_VERSION,
+                "success": True,
+                "message": success_message,
+                "data": data,
+            },
+            headers={"Vary": "Accept"},
         )
     except HTTPException:
         raise
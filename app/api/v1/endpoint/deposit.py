@@ -8,7 +8,7 @@ import logging
 from datetime import date
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import (
@@ -17,16 +17,23 @@ from app.api.v1.endpoint.common import (
     validate_date_range,
 )
 from app.api.v1.functions.fetch_deposit import fetch_deposit_daily_overview_payload
+from app.db.models.external_api import Campaign, DataDepo, DataMsDeposit
 from app.db.models.user import TfUser
 from app.db.session import get_db
 from app.schemas.responses import AnalyticsResponse
+from app.utils.arrow_response import negotiated_orient
 from app.utils.deposit_utils import DepositData
+from app.utils.json_response import TableOrient
 from app.utils.rbac import FINANCE_ANALYTICS_ROLES
 from app.utils.remarketing_deposit_utils import RemarketingDepositData
+from app.utils.response_cache import response_cache_scope
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+DEPOSIT_DAILY_REPORT_TABLES = (Campaign.__tablename__, DataDepo.__tablename__)
+REMARKETING_REPORT_TABLES = (Campaign.__tablename__, DataMsDeposit.__tablename__)
+
 
 async def _build_deposit_data(
     session: AsyncSession,
@@ -61,6 +68,7 @@ async def _load_deposit_daily_report_payload(
     start_date: date,
     end_date: date,
     campaign_type: Literal["all", "user_acquisition", "brand_awareness"],
+    orient: TableOrient = "records",
 ) -> dict[str, object]:
     deposit_data = await _build_deposit_data(
         session=session,
@@ -73,6 +81,7 @@ async def _load_deposit_daily_report_payload(
         start_date=start_date,
         end_date=end_date,
         campaign_type=selected_type,
+        orient=orient,
     )
 
 
@@ -97,24 +106,34 @@ async def _load_remarketing_report_payload(
 
 @router.get("/api/deposit/daily-report", response_model=AnalyticsResponse)
 async def deposit_daily_report(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     campaign_type: Literal["all", "user_acquisition", "brand_awareness"] = Query(default="all"),
+    orient: TableOrient = Query(default="records"),
     session: AsyncSession = Depends(get_db),
     current_user: TfUser = Depends(require_roles_dep(*FINANCE_ANALYTICS_ROLES)),  # noqa: ARG001
 ):
-    """Generate daily deposit report payload."""
+    """Generate daily deposit report payload.
+
+    ``orient=split`` ships ``campaign_daily_metrics`` column-wise; Arrow
+    requests always build it that way.
+    """
+    orient = negotiated_orient(request, orient)
     return await build_analytics_response(
-        loader=lambda: _load_deposit_daily_report_payload(session, start_date, end_date, campaign_type),
+        loader=lambda: _load_deposit_daily_report_payload(session, start_date, end_date, campaign_type, orient),
         success_message="Deposit daily report generated.",
         logger=logger,
         failure_log_message="Failed to generate deposit daily report payload",
         failure_detail_message="An internal error occurred while generating deposit daily report.",
+        cache=response_cache_scope(request, session, tables=DEPOSIT_DAILY_REPORT_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/deposit/remarketing-report", response_model=AnalyticsResponse)
 async def remarketing_deposit_report(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     campaign_type: Literal["all", "user_acquisition", "brand_awareness", "remarketing"] = Query(default="all"),
@@ -128,4 +147,6 @@ async def remarketing_deposit_report(
         logger=logger,
         failure_log_message="Failed to generate remarketing deposit report payload",
         failure_detail_message="An internal error occurred while generating remarketing deposit report.",
+        cache=response_cache_scope(request, session, tables=REMARKETING_REPORT_TABLES),
+        request=request,
     )
@@ -5,22 +5,27 @@ from __future__ import annotations
 from datetime import date
 import logging
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import build_analytics_response, require_roles_dep, validate_date_range
 from app.api.v1.functions.fetch_facebook import fetch_facebook_analytics_payload
+from app.db.models.external_api import FacebookPageInsights, FacebookPageMediaInsights
 from app.db.models.user import TfUser
 from app.db.session import get_db
 from app.schemas.responses import AnalyticsResponse
 from app.utils.rbac import SOCMED_ANALYTICS_ROLES
+from app.utils.response_cache import response_cache_scope
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+FACEBOOK_ANALYTICS_TABLES = (FacebookPageInsights.__tablename__, FacebookPageMediaInsights.__tablename__)
+
 
 @router.get("/api/facebook/analytics", response_model=AnalyticsResponse)
 async def facebook_analytics(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -38,4 +43,6 @@ async def facebook_analytics(
         logger=logger,
         failure_log_message="Failed to generate Facebook analytics payload",
         failure_detail_message="An internal error occurred while generating Facebook analytics.",
+        cache=response_cache_scope(request, session, tables=FACEBOOK_ANALYTICS_TABLES),
+        request=request,
     )
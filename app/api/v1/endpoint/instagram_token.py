@@ -8,23 +8,28 @@ import logging
 
 import httpx
 from decouple import config as env
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import build_analytics_response, require_roles_dep, validate_date_range
 from app.api.v1.functions.fetch_instagram import fetch_instagram_analytics_payload
 from app.core.security import decrypt_secret, encrypt_secret
-from app.db.models.external_api import ManagedSecret
+from app.db.models.external_api import InstagramInsights, InstagramMediaInsights, ManagedSecret
 from app.db.models.user import TfUser
 from app.db.session import get_db
 from app.schemas.responses import AnalyticsResponse, ApiResponseV1
+from app.utils.arrow_response import negotiated_orient
+from app.utils.json_response import TableOrient
 from app.utils.rbac import SOCMED_ANALYTICS_ROLES
+from app.utils.response_cache import response_cache_scope
 from app.utils.user_utils import get_current_user, require_roles
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+INSTAGRAM_ANALYTICS_TABLES = (InstagramInsights.__tablename__, InstagramMediaInsights.__tablename__)
+
 INSTAGRAM_ACCESS_TOKEN_SECRET_KEY = "instagram_access_token"
 
 
@@ -154,23 +159,33 @@ async def instagram_token_status(
 
 @router.get("/api/instagram/analytics", response_model=AnalyticsResponse)
 async def instagram_analytics(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
+    orient: TableOrient = Query(default="records"),
     session: AsyncSession = Depends(get_db),
     current_user: TfUser = Depends(require_roles_dep(*SOCMED_ANALYTICS_ROLES)),  # noqa: ARG001
 ):
-    """Generate Instagram analytics payload for dashboard rendering."""
+    """Generate Instagram analytics payload for dashboard rendering.
+
+    ``orient=split`` ships the row tables column-wise; Arrow requests
+    always build them that way.
+    """
     validate_date_range(start_date, end_date)
+    orient = negotiated_orient(request, orient)
     return await build_analytics_response(
         loader=lambda: fetch_instagram_analytics_payload(
             session=session,
             start_date=start_date,
             end_date=end_date,
+            orient=orient,
         ),
         success_message="Instagram analytics generated.",
         logger=logger,
         failure_log_message="Failed to generate Instagram analytics payload",
         failure_detail_message="An internal error occurred while generating Instagram analytics.",
+        cache=response_cache_scope(request, session, tables=INSTAGRAM_ANALYTICS_TABLES),
+        request=request,
     )
 
 
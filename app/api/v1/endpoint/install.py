@@ -5,19 +5,22 @@ from __future__ import annotations
 from datetime import date
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import build_analytics_response, validate_date_range
 from app.api.v1.functions.fetch_install import fetch_install_analytics_payload
+from app.db.models.external_api import PlayConsoleInstallMetrics
 from app.db.models.user import TfUser
 from app.db.session import get_db
 from app.schemas.responses import AnalyticsResponse
+from app.utils.response_cache import response_cache_scope
 from app.utils.user_utils import get_current_user
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 INSTALL_ANALYTICS_ROLES = {"superadmin", "analyst", "digital_marketing", "tech_it"}
+INSTALL_ANALYTICS_TABLES = (PlayConsoleInstallMetrics.__tablename__,)
 
 
 async def require_install_analytics_role(current_user: TfUser = Depends(get_current_user)) -> TfUser:
@@ -33,6 +36,7 @@ async def require_install_analytics_role(current_user: TfUser = Depends(get_curr
 
 @router.get("/api/install/analytics", response_model=AnalyticsResponse)
 async def install_analytics(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     package_name: str = Query(default="all"),
@@ -54,4 +58,6 @@ async def install_analytics(
         logger=logger,
         failure_log_message="Failed to generate install analytics payload",
         failure_detail_message="An internal error occurred while generating install analytics.",
+        cache=response_cache_scope(request, session, tables=INSTALL_ANALYTICS_TABLES),
+        request=request,
     )
@@ -4,7 +4,7 @@ import logging
 from datetime import date
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.endpoint.common import (
@@ -17,6 +17,16 @@ from app.api.v1.functions.fetch_overview_brand import fetch_overview_brand_aware
 from app.api.v1.functions.fetch_overview_campaign import fetch_overview_campaign_cost_payload
 from app.api.v1.functions.fetch_overview_leads import fetch_overview_leads_acquisition_payload
 from app.api.v1.functions.fetch_overview_remarketing import fetch_overview_remarketing_payload
+from app.db.models.external_api import (
+    Campaign,
+    DailyRegister,
+    DataDepo,
+    DataMsDeposit,
+    FacebookAds,
+    Ga4DailyMetrics,
+    GoogleAds,
+    TikTokAds,
+)
 from app.db.models.user import TfUser
 from app.db.session import get_db
 from app.schemas.responses import AnalyticsResponse
@@ -28,10 +38,22 @@ from app.utils.overview import (
     OverviewRemarketingPerformanceData,
 )
 from app.utils.rbac import ANALYTICS_ROLES
+from app.utils.response_cache import response_cache_scope
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Source tables each overview payload reads; a reload of any of them retires cached responses.
+ACTIVE_USERS_TABLES = (Ga4DailyMetrics.__tablename__,)
+ADS_ANALYTICS_TABLES = (
+    GoogleAds.__tablename__,
+    FacebookAds.__tablename__,
+    TikTokAds.__tablename__,
+    Campaign.__tablename__,
+    DailyRegister.__tablename__,
+)
+LEADS_ACQUISITION_TABLES = ADS_ANALYTICS_TABLES + (DataDepo.__tablename__, DataMsDeposit.__tablename__)
+
 
 async def _build_overview_data(
     session: AsyncSession,
@@ -168,6 +190,7 @@ async def _load_remarketing_payload(
 
 @router.get("/api/overview/active-users", response_model=AnalyticsResponse)
 async def overview_active_users(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     source: Literal["app", "web", "app_web"] = Query(default="app"),
@@ -181,11 +204,14 @@ async def overview_active_users(
         logger=logger,
         failure_log_message="Failed to generate overview active users payload",
         failure_detail_message="An internal error occurred while generating overview active users.",
+        cache=response_cache_scope(request, session, tables=ACTIVE_USERS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/overview/campaign-cost", response_model=AnalyticsResponse)
 async def overview_campaign_cost(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -198,11 +224,14 @@ async def overview_campaign_cost(
         logger=logger,
         failure_log_message="Failed to generate overview campaign cost payload",
         failure_detail_message="An internal error occurred while generating overview campaign cost.",
+        cache=response_cache_scope(request, session, tables=ADS_ANALYTICS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/overview/leads-acquisition", response_model=AnalyticsResponse)
 async def overview_leads_acquisition(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -215,11 +244,14 @@ async def overview_leads_acquisition(
         logger=logger,
         failure_log_message="Failed to generate overview leads acquisition payload",
         failure_detail_message="An internal error occurred while generating overview leads acquisition.",
+        cache=response_cache_scope(request, session, tables=LEADS_ACQUISITION_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/overview/brand-awareness", response_model=AnalyticsResponse)
 async def overview_brand_awareness(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -232,11 +264,14 @@ async def overview_brand_awareness(
         logger=logger,
         failure_log_message="Failed to generate overview brand awareness payload",
         failure_detail_message="An internal error occurred while generating overview brand awareness.",
+        cache=response_cache_scope(request, session, tables=ADS_ANALYTICS_TABLES),
+        request=request,
     )
 
 
 @router.get("/api/overview/remarketing", response_model=AnalyticsResponse)
 async def overview_remarketing(
+    request: Request,
     start_date: date = Query(...),
     end_date: date = Query(...),
     session: AsyncSession = Depends(get_db),
@@ -249,4 +284,6 @@ async def overview_remarketing(
         logger=logger,
         failure_log_message="Failed to generate overview remarketing payload",
         failure_detail_message="An internal error occurred while generating overview remarketing.",
+        cache=response_cache_scope(request, session, tables=ADS_ANALYTICS_TABLES),
+        request=request,
     )
@@ -7,6 +7,7 @@ Traders Family application.
 from datetime import date
 
 from app.utils.deposit_utils import DepositData
+from app.utils.json_response import TableOrient
 
 
 async def fetch_deposit_daily_overview_payload(
@@ -14,6 +15,7 @@ async def fetch_deposit_daily_overview_payload(
     start_date: date,
     end_date: date,
     campaign_type: str | None = None,
+    orient: TableOrient = "records",
 ) -> dict[str, object]:
     """Build normalized payload for Deposit Daily Report API response.
 
@@ -23,6 +25,8 @@ async def fetch_deposit_daily_overview_payload(
         end_date (date): Inclusive report end date requested by client.
         campaign_type (str | None): Optional campaign type filter. ``None`` means
             all campaign types are included.
+        orient (TableOrient): Shape of the report's campaign table, row dicts
+            (``records``) or columnar (``split``).
 
     Returns:
         dict[str, object]: Response-ready payload containing normalized date
@@ -31,5 +35,5 @@ async def fetch_deposit_daily_overview_payload(
     return {
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
-        "report": await deposit_data.build_daily_report_payload(campaign_type=campaign_type),
+        "report": await deposit_data.build_daily_report_payload(campaign_type=campaign_type, orient=orient),
     }
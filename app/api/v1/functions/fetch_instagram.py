@@ -5,13 +5,26 @@ from __future__ import annotations
 from datetime import date
 import re
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.external_api import InstagramInsights, InstagramMediaInsights
+from app.utils.json_response import TableOrient, table_payload
 
 HASHTAG_PATTERN = re.compile(r"(?<![\w])#([\w]+)", re.UNICODE)
+HASHTAG_METRIC_COLUMNS = (
+    "total_engagement",
+    "likes",
+    "comments",
+    "shares",
+    "saves",
+    "reach",
+    "views",
+    "profile_visits",
+    "follows",
+)
 
 
 def _empty_instagram_frame() -> pd.DataFrame:
@@ -163,6 +176,13 @@ def _safe_percentage(numerator: float, denominator: float) -> float:
     return round((numerator / denominator) * 100, 2) if denominator else 0.0
 
 
+def _safe_percentage_series(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+    """Column-wise ``_safe_percentage``."""
+    denominator = denominator.astype(float)
+    ratio = numerator.astype(float) / denominator.where(denominator != 0)
+    return (ratio * 100).round(2).fillna(0.0)
+
+
 def _latest_non_zero(series: pd.Series) -> int:
     non_zero = series[pd.to_numeric(series, errors="coerce").fillna(0) > 0]
     if non_zero.empty:
@@ -229,16 +249,13 @@ def _summary_payload(df: pd.DataFrame) -> dict[str, object]:
     return {"current_period": {"metrics": current}, "growth_percentage": growth}
 
 
-def _daily_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
+def _daily_rows_payload(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
-        return []
+        return pd.DataFrame()
     rows = df.sort_values("date").copy()
-    rows["engagement_rate"] = rows.apply(
-        lambda row: _safe_percentage(float(row["total_engagement"]), float(row["total_followers"])),
-        axis=1,
-    )
+    rows["engagement_rate"] = _safe_percentage_series(rows["total_engagement"], rows["total_followers"])
     rows["date"] = rows["date"].astype(str)
-    return rows.to_dict(orient="records")
+    return rows
 
 
 def _media_summary_payload(df: pd.DataFrame) -> dict[str, object]:
@@ -305,15 +322,14 @@ def _media_summary_payload(df: pd.DataFrame) -> dict[str, object]:
     return {"totals": totals, "by_type": grouped.to_dict(orient="records")}
 
 
-def _media_daily_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
+def _media_daily_rows_payload(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
-        return []
+        return pd.DataFrame()
     bucketed = df.copy()
-    bucketed["media_bucket"] = bucketed.apply(
-        lambda row: "REELS"
-        if str(row["media_product_type"]).upper() == "REELS"
-        else str(row["media_type"]).upper(),
-        axis=1,
+    bucketed["media_bucket"] = np.where(
+        bucketed["media_product_type"].astype(str).str.upper() == "REELS",
+        "REELS",
+        bucketed["media_type"].astype(str).str.upper(),
     )
     grouped = (
         bucketed.groupby(["date", "media_bucket"], as_index=False)
@@ -331,61 +347,34 @@ def _media_daily_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
         )
         .sort_values(["date", "media_bucket"])
     )
-    grouped["engagement_rate"] = grouped.apply(
-        lambda row: _safe_percentage(float(row["total_engagement"]), float(row["reach"])),
-        axis=1,
-    )
+    grouped["engagement_rate"] = _safe_percentage_series(grouped["total_engagement"], grouped["reach"])
     grouped["date"] = grouped["date"].astype(str)
-    return grouped.to_dict(orient="records")
+    return grouped
 
 
-def _media_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
+def _media_rows_payload(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
-        return []
+        return pd.DataFrame()
     rows = df.sort_values(["total_engagement", "reach", "date"], ascending=[False, False, False]).copy()
-    rows["engagement_rate"] = rows.apply(
-        lambda row: _safe_percentage(float(row["total_engagement"]), float(row["reach"])),
-        axis=1,
-    )
+    rows["engagement_rate"] = _safe_percentage_series(rows["total_engagement"], rows["reach"])
     rows["date"] = rows["date"].astype(str)
     rows["timestamp"] = rows["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S").fillna("")
-    return rows.to_dict(orient="records")
-
-
-def _extract_hashtags(caption: object) -> list[str]:
-    tags = {
-        f"#{match.group(1).lower()}"
-        for match in HASHTAG_PATTERN.finditer(str(caption or ""))
-    }
-    return sorted(tags)
+    return rows
 
 
-def _hashtag_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
+def _hashtag_rows_payload(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
-        return []
-
-    rows: list[dict[str, object]] = []
-    for _, media in df.iterrows():
-        for hashtag in _extract_hashtags(media.get("caption")):
-            rows.append(
-                {
-                    "hashtag": hashtag,
-                    "media_id": media.get("media_id"),
-                    "total_engagement": int(media.get("total_engagement") or 0),
-                    "likes": int(media.get("likes") or 0),
-                    "comments": int(media.get("comments") or 0),
-                    "shares": int(media.get("shares") or 0),
-                    "saves": int(media.get("saves") or 0),
-                    "reach": int(media.get("reach") or 0),
-                    "views": int(media.get("views") or 0),
-                    "profile_visits": int(media.get("profile_visits") or 0),
-                    "follows": int(media.get("follows") or 0),
-                }
-            )
-    if not rows:
-        return []
-
-    hashtag_df = pd.DataFrame(rows)
+        return pd.DataFrame()
+
+    # One row per media row and distinct lower-cased hashtag in its caption.
+    hashtag_df = df[["media_id", *HASHTAG_METRIC_COLUMNS]].assign(
+        hashtag=df["caption"].fillna("").astype(str).str.findall(HASHTAG_PATTERN)
+    ).explode("hashtag")
+    hashtag_df = hashtag_df.loc[hashtag_df["hashtag"].notna()]
+    if hashtag_df.empty:
+        return pd.DataFrame()
+    hashtag_df["hashtag"] = "#" + hashtag_df["hashtag"].str.lower()
+    hashtag_df = hashtag_df.reset_index().drop_duplicates(subset=["index", "hashtag"])
     grouped = (
         hashtag_df.groupby("hashtag", as_index=False)
         .agg(
@@ -402,16 +391,11 @@ def _hashtag_rows_payload(df: pd.DataFrame) -> list[dict[str, object]]:
         )
         .sort_values(["total_engagement", "reach", "post_count"], ascending=[False, False, False])
     )
-    grouped["avg_engagement_per_post"] = grouped.apply(
-        lambda row: round(float(row["total_engagement"]) / float(row["post_count"]), 2)
-        if float(row["post_count"]) else 0.0,
-        axis=1,
-    )
-    grouped["engagement_rate"] = grouped.apply(
-        lambda row: _safe_percentage(float(row["total_engagement"]), float(row["reach"])),
-        axis=1,
-    )
-    return grouped.to_dict(orient="records")
+    grouped["avg_engagement_per_post"] = (
+        grouped["total_engagement"] / grouped["post_count"].where(grouped["post_count"] != 0)
+    ).round(2).fillna(0.0)
+    grouped["engagement_rate"] = _safe_percentage_series(grouped["total_engagement"], grouped["reach"])
+    return grouped
 
 
 def _best_time_empty_payload() -> dict[str, object]:
@@ -539,8 +523,13 @@ async def fetch_instagram_analytics_payload(
     *,
     start_date: date,
     end_date: date,
+    orient: TableOrient = "records",
 ) -> dict[str, object]:
-    """Build Instagram analytics payload for the dashboard page."""
+    """Build Instagram analytics payload for the dashboard page.
+
+    ``orient`` selects the shape of the row tables (``daily_rows``,
+    ``media_daily_rows``, ``media_rows`` and ``hashtag_rows``).
+    """
     df = await _read_instagram_rows(
         session=session,
         start_date=start_date,
@@ -555,10 +544,10 @@ async def fetch_instagram_analytics_payload(
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
         "metrics": _summary_payload(df),
-        "daily_rows": _daily_rows_payload(df),
+        "daily_rows": table_payload(_daily_rows_payload(df), orient),
         "media_summary": _media_summary_payload(media_df),
-        "media_daily_rows": _media_daily_rows_payload(media_df),
-        "media_rows": _media_rows_payload(media_df),
-        "hashtag_rows": _hashtag_rows_payload(media_df),
+        "media_daily_rows": table_payload(_media_daily_rows_payload(media_df), orient),
+        "media_rows": table_payload(_media_rows_payload(media_df), orient),
+        "hashtag_rows": table_payload(_hashtag_rows_payload(media_df), orient),
         "best_time": _best_time_rows_payload(media_df),
     }
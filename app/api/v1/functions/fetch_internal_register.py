@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.external_api import Campaign, DailyRegister
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 SOURCE_OPTIONS = {
     "all": None,
@@ -89,26 +87,22 @@ async def _read_internal_register_rows(
     return df
 
 
-def _serialize_figure(figure: go.Figure) -> dict[str, object]:
-    return json.loads(json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder))
-
-
 def _date_labels(series: pd.Series) -> list[str]:
     return pd.to_datetime(series).dt.strftime("%b %d\n%Y").tolist()
 
 
-async def _figure_payload(figure: go.Figure, rows: pd.DataFrame) -> dict[str, object]:
+async def _figure_payload(figure: ChartData, rows: pd.DataFrame) -> dict[str, object]:
     serializable = rows.copy()
     if "date" in serializable.columns:
         serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
     return {
         "rows": await asyncio.to_thread(lambda: serializable.to_dict(orient="records")),
-        "figure": _serialize_figure(figure),
+        **await chart_payload(figure),
     }
 
 
-def _empty_figure(title: str, message: str = "No register data for selected date range") -> go.Figure:
-    figure = go.Figure()
+def _empty_figure(title: str, message: str = "No register data for selected date range") -> ChartData:
+    figure = ChartData()
     figure.update_layout(
         title=title,
         annotations=[
@@ -130,9 +124,10 @@ async def _daily_trend_chart(df: pd.DataFrame) -> dict[str, object]:
         return await _figure_payload(_empty_figure("Daily Internal Register"), pd.DataFrame())
 
     daily = df.groupby("date", as_index=False)["total_regis"].sum().sort_values("date")
-    figure = go.Figure()
+    figure = ChartData()
     figure.add_trace(
-        go.Bar(
+        trace(
+            "bar",
             x=_date_labels(daily["date"]),
             y=daily["total_regis"],
             name="Register",
@@ -142,7 +137,8 @@ async def _daily_trend_chart(df: pd.DataFrame) -> dict[str, object]:
         )
     )
     figure.add_trace(
-        go.Scatter(
+        trace(
+            "scatter",
             x=_date_labels(daily["date"]),
             y=daily["total_regis"].rolling(window=7, min_periods=1).mean(),
             name="7D Avg",
@@ -160,12 +156,13 @@ async def _source_mix_chart(df: pd.DataFrame) -> dict[str, object]:
 
     daily_source = df.groupby(["date", "ad_source"], as_index=False)["total_regis"].sum().sort_values(["date", "ad_source"])
     pivot = daily_source.pivot_table(index="date", columns="ad_source", values="total_regis", aggfunc="sum", fill_value=0).reset_index()
-    figure = go.Figure()
+    figure = ChartData()
     date_labels = _date_labels(pivot["date"])
     source_order = ["google_ads", "facebook_ads", "tiktok_ads", "unknown"]
     for source in [item for item in source_order if item in pivot.columns] + [item for item in pivot.columns if item not in {"date", *source_order}]:
         figure.add_trace(
-            go.Bar(
+            trace(
+                "bar",
                 x=date_labels,
                 y=pivot[source],
                 name=source.replace("_", " ").title(),
@@ -193,7 +190,7 @@ async def _cumulative_trend_chart(df: pd.DataFrame, top_n: int = 8) -> dict[str,
         .sort_values(["campaign_name", "date"])
     )
     daily["cumulative_register"] = daily.groupby("campaign_id")["total_regis"].cumsum()
-    figure = go.Figure()
+    figure = ChartData()
     ordered_campaigns = top_campaigns.sort_values("total_regis", ascending=False)
     for _, campaign in ordered_campaigns.iterrows():
         subset = daily.loc[daily["campaign_id"] == campaign["campaign_id"]].sort_values("date")
@@ -202,7 +199,8 @@ async def _cumulative_trend_chart(df: pd.DataFrame, top_n: int = 8) -> dict[str,
         campaign_name = str(campaign["campaign_name"])
         short_name = campaign_name if len(campaign_name) <= 34 else f"{campaign_name[:31]}..."
         figure.add_trace(
-            go.Scatter(
+            trace(
+                "scatter",
                 x=_date_labels(subset["date"]),
                 y=subset["cumulative_register"],
                 mode="lines+markers",
@@ -249,9 +247,10 @@ async def _campaign_heatmap_chart(df: pd.DataFrame, top_n: int = 12) -> dict[str
     )
     heatmap = heatmap.reindex(ordered_labels)
     date_labels = pd.to_datetime(heatmap.columns).strftime("%b %d\n%Y").tolist()
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Heatmap(
+            trace(
+                "heatmap",
                 x=date_labels,
                 y=heatmap.index.tolist(),
                 z=heatmap.to_numpy(),
@@ -276,9 +275,10 @@ async def _type_mix_chart(df: pd.DataFrame) -> dict[str, object]:
         return await _figure_payload(_empty_figure("Register by Campaign Type"), pd.DataFrame())
 
     type_df = df.groupby("ad_type", as_index=False)["total_regis"].sum().sort_values("total_regis", ascending=False)
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Pie(
+            trace(
+                "pie",
                 labels=type_df["ad_type"].str.replace("_", " ").str.title(),
                 values=type_df["total_regis"],
                 hole=0.48,
@@ -297,9 +297,10 @@ async def _tag_mix_chart(df: pd.DataFrame) -> dict[str, object]:
     tag_df = df.groupby("tag_name", as_index=False)["total_regis"].sum().sort_values("total_regis", ascending=False)
     total = float(tag_df["total_regis"].sum()) or 1.0
     tag_df["share_pct"] = tag_df["total_regis"].apply(lambda value: round((float(value) / total) * 100, 2))
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Pie(
+            trace(
+                "pie",
                 labels=tag_df["tag_name"],
                 values=tag_df["total_regis"],
                 hole=0.46,
@@ -325,9 +326,10 @@ async def _top_campaign_chart(df: pd.DataFrame, top_n: int = 15) -> dict[str, ob
         .sort_values("total_regis", ascending=True)
     )
     campaign_df["short_name"] = campaign_df["campaign_name"].astype(str).apply(lambda value: value if len(value) <= 42 else f"{value[:39]}...")
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Bar(
+            trace(
+                "bar",
                 x=campaign_df["total_regis"],
                 y=campaign_df["short_name"],
                 orientation="h",
@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.external_api import Campaign, DataMsDeposit
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 SOURCE_OPTIONS = {
     "all": None,
@@ -68,26 +66,22 @@ async def _read_login_rows(
     return df
 
 
-def _serialize_figure(figure: go.Figure) -> dict[str, object]:
-    return json.loads(json.dumps(figure, cls=plotly.utils.PlotlyJSONEncoder))
-
-
 def _date_labels(series: pd.Series) -> list[str]:
     return pd.to_datetime(series).dt.strftime("%b %d\n%Y").tolist()
 
 
-async def _figure_payload(figure: go.Figure, rows: pd.DataFrame) -> dict[str, object]:
+async def _figure_payload(figure: ChartData, rows: pd.DataFrame) -> dict[str, object]:
     serializable = rows.copy()
     if "date" in serializable.columns:
         serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
     return {
         "rows": await asyncio.to_thread(lambda: serializable.to_dict(orient="records")),
-        "figure": _serialize_figure(figure),
+        **await chart_payload(figure),
     }
 
 
-def _empty_figure(title: str, message: str = "No login data for selected date range") -> go.Figure:
-    figure = go.Figure()
+def _empty_figure(title: str, message: str = "No login data for selected date range") -> ChartData:
+    figure = ChartData()
     figure.update_layout(
         title=title,
         annotations=[{"text": message, "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}],
@@ -111,9 +105,10 @@ async def _daily_trend_chart(df: pd.DataFrame) -> dict[str, object]:
     daily = _daily_unique(df)
     if daily.empty:
         return await _figure_payload(_empty_figure("Daily Login"), pd.DataFrame())
-    figure = go.Figure()
+    figure = ChartData()
     figure.add_trace(
-        go.Bar(
+        trace(
+            "bar",
             x=_date_labels(daily["date"]),
             y=daily["total_login"],
             name="Login",
@@ -123,7 +118,8 @@ async def _daily_trend_chart(df: pd.DataFrame) -> dict[str, object]:
         )
     )
     figure.add_trace(
-        go.Scatter(
+        trace(
+            "scatter",
             x=_date_labels(daily["date"]),
             y=daily["total_login"].rolling(window=7, min_periods=1).mean(),
             name="7D Avg",
@@ -145,12 +141,13 @@ async def _source_mix_chart(df: pd.DataFrame) -> dict[str, object]:
         .sort_values(["date", "ad_source"])
     )
     pivot = daily_source.pivot_table(index="date", columns="ad_source", values="login", aggfunc="sum", fill_value=0).reset_index()
-    figure = go.Figure()
+    figure = ChartData()
     date_labels = _date_labels(pivot["date"])
     source_order = ["google_ads", "facebook_ads", "tiktok_ads", "unknown"]
     for source in [item for item in source_order if item in pivot.columns] + [item for item in pivot.columns if item not in {"date", *source_order}]:
         figure.add_trace(
-            go.Bar(
+            trace(
+                "bar",
                 x=date_labels,
                 y=pivot[source],
                 name=source.replace("_", " ").title(),
@@ -173,9 +170,10 @@ async def _top_campaign_chart(df: pd.DataFrame, top_n: int = 15) -> dict[str, ob
         .sort_values("total_login", ascending=True)
     )
     campaign_df["short_name"] = campaign_df["campaign_name"].astype(str).apply(lambda value: value if len(value) <= 42 else f"{value[:39]}...")
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Bar(
+            trace(
+                "bar",
                 x=campaign_df["total_login"],
                 y=campaign_df["short_name"],
                 orientation="h",
@@ -207,7 +205,7 @@ async def _cumulative_trend_chart(df: pd.DataFrame, top_n: int = 8) -> dict[str,
     )
     selected = daily.loc[daily["campaign_id"].isin(top_campaigns["campaign_id"])].copy()
     selected["cumulative_login"] = selected.groupby("campaign_id")["daily_login"].cumsum()
-    figure = go.Figure()
+    figure = ChartData()
     ordered_campaigns = top_campaigns.sort_values("daily_login", ascending=False)
     for _, campaign in ordered_campaigns.iterrows():
         subset = selected.loc[selected["campaign_id"] == campaign["campaign_id"]].sort_values("date")
@@ -216,7 +214,8 @@ async def _cumulative_trend_chart(df: pd.DataFrame, top_n: int = 8) -> dict[str,
         campaign_name = str(campaign["campaign_name"])
         short_name = campaign_name if len(campaign_name) <= 34 else f"{campaign_name[:31]}..."
         figure.add_trace(
-            go.Scatter(
+            trace(
+                "scatter",
                 x=_date_labels(subset["date"]),
                 y=subset["cumulative_login"],
                 mode="lines+markers",
@@ -256,9 +255,10 @@ async def _campaign_heatmap_chart(df: pd.DataFrame, top_n: int = 12) -> dict[str
     ordered_labels = selected.groupby("campaign_label")["total_login"].sum().sort_values(ascending=True).index.tolist()
     heatmap = heatmap.reindex(ordered_labels)
     date_labels = pd.to_datetime(heatmap.columns).strftime("%b %d\n%Y").tolist()
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Heatmap(
+            trace(
+                "heatmap",
                 x=date_labels,
                 y=heatmap.index.tolist(),
                 z=heatmap.to_numpy(),
@@ -286,9 +286,10 @@ async def _type_mix_chart(df: pd.DataFrame) -> dict[str, object]:
         .rename(columns={"email": "total_login"})
         .sort_values("total_login", ascending=False)
     )
-    figure = go.Figure(
+    figure = ChartData(
         data=[
-            go.Pie(
+            trace(
+                "pie",
                 labels=type_df["ad_type"].str.replace("_", " ").str.title(),
                 values=type_df["total_login"],
                 hole=0.48,
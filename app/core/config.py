@@ -102,6 +102,7 @@ class Settings(BaseModel):
     INITIAL_SUPERADMIN_PASSWORD: str | None = None
     AUTO_INIT_DB_ON_STARTUP: bool = False
     SQLITE_BUSY_TIMEOUT_MS: int = 30000
+    SQLITE_READ_POOL_SIZE: int = 4
     ALLOW_CONCURRENT_ETL_RUNS: bool = False
     REQUEST_LOG_ENABLED: bool = True
     REQUEST_LOG_SAMPLE_RATE: float = 1.0
@@ -114,6 +115,12 @@ class Settings(BaseModel):
     ANALYTICS_DATAFRAME_CACHE_ENABLED: bool = True
     ANALYTICS_DATAFRAME_CACHE_TTL_SECONDS: int = 300
     ANALYTICS_DATAFRAME_CACHE_MAX_ENTRIES: int = 64
+    ANALYTICS_DATAFRAME_CACHE_MAX_BYTES: int = 268435456
+    ANALYTICS_DATAFRAME_CACHE_READ_ONLY: bool = True
+    ANALYTICS_RESPONSE_CACHE_ENABLED: bool = True
+    ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    ANALYTICS_RESPONSE_CACHE_MAX_BYTES: int = 67108864
+    ANALYTICS_LEGACY_FIGURE_JSON: bool = False
 
     @staticmethod
     def _split_origins(raw_value: str | None) -> list[str]:
@@ -285,6 +292,7 @@ class DevelopmentSettings(Settings):
     )
     AUTO_INIT_DB_ON_STARTUP: bool = env("AUTO_INIT_DB_ON_STARTUP", default=False, cast=bool)
     SQLITE_BUSY_TIMEOUT_MS: int = env("SQLITE_BUSY_TIMEOUT_MS", default=30000, cast=int)
+    SQLITE_READ_POOL_SIZE: int = env("SQLITE_READ_POOL_SIZE", default=4, cast=int)
     ALLOW_CONCURRENT_ETL_RUNS: bool = env("ALLOW_CONCURRENT_ETL_RUNS", default=False, cast=bool)
     REQUEST_LOG_ENABLED: bool = env("REQUEST_LOG_ENABLED", default=True, cast=bool)
     REQUEST_LOG_SAMPLE_RATE: float = env("REQUEST_LOG_SAMPLE_RATE", default=1.0, cast=float)
@@ -317,6 +325,36 @@ class DevelopmentSettings(Settings):
         default=64,
         cast=int,
     )
+    ANALYTICS_DATAFRAME_CACHE_MAX_BYTES: int = env(
+        "ANALYTICS_DATAFRAME_CACHE_MAX_BYTES",
+        default=268435456,
+        cast=int,
+    )
+    ANALYTICS_DATAFRAME_CACHE_READ_ONLY: bool = env(
+        "ANALYTICS_DATAFRAME_CACHE_READ_ONLY",
+        default=True,
+        cast=bool,
+    )
+    ANALYTICS_RESPONSE_CACHE_ENABLED: bool = env(
+        "ANALYTICS_RESPONSE_CACHE_ENABLED",
+        default=True,
+        cast=bool,
+    )
+    ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES: int = env(
+        "ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES",
+        default=256,
+        cast=int,
+    )
+    ANALYTICS_RESPONSE_CACHE_MAX_BYTES: int = env(
+        "ANALYTICS_RESPONSE_CACHE_MAX_BYTES",
+        default=67108864,
+        cast=int,
+    )
+    ANALYTICS_LEGACY_FIGURE_JSON: bool = env(
+        "ANALYTICS_LEGACY_FIGURE_JSON",
+        default=False,
+        cast=bool,
+    )
 
 
 class ProductionSettings(Settings):
@@ -351,6 +389,7 @@ class ProductionSettings(Settings):
     )
     AUTO_INIT_DB_ON_STARTUP: bool = env("AUTO_INIT_DB_ON_STARTUP", default=False, cast=bool)
     SQLITE_BUSY_TIMEOUT_MS: int = env("SQLITE_BUSY_TIMEOUT_MS", default=30000, cast=int)
+    SQLITE_READ_POOL_SIZE: int = env("SQLITE_READ_POOL_SIZE", default=4, cast=int)
     ALLOW_CONCURRENT_ETL_RUNS: bool = env("ALLOW_CONCURRENT_ETL_RUNS", default=False, cast=bool)
     REQUEST_LOG_ENABLED: bool = env("REQUEST_LOG_ENABLED", default=True, cast=bool)
     REQUEST_LOG_SAMPLE_RATE: float = env("REQUEST_LOG_SAMPLE_RATE", default=1.0, cast=float)
@@ -383,6 +422,36 @@ class ProductionSettings(Settings):
         default=64,
         cast=int,
     )
+    ANALYTICS_DATAFRAME_CACHE_MAX_BYTES: int = env(
+        "ANALYTICS_DATAFRAME_CACHE_MAX_BYTES",
+        default=268435456,
+        cast=int,
+    )
+    ANALYTICS_DATAFRAME_CACHE_READ_ONLY: bool = env(
+        "ANALYTICS_DATAFRAME_CACHE_READ_ONLY",
+        default=True,
+        cast=bool,
+    )
+    ANALYTICS_RESPONSE_CACHE_ENABLED: bool = env(
+        "ANALYTICS_RESPONSE_CACHE_ENABLED",
+        default=True,
+        cast=bool,
+    )
+    ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES: int = env(
+        "ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES",
+        default=256,
+        cast=int,
+    )
+    ANALYTICS_RESPONSE_CACHE_MAX_BYTES: int = env(
+        "ANALYTICS_RESPONSE_CACHE_MAX_BYTES",
+        default=67108864,
+        cast=int,
+    )
+    ANALYTICS_LEGACY_FIGURE_JSON: bool = env(
+        "ANALYTICS_LEGACY_FIGURE_JSON",
+        default=False,
+        cast=bool,
+    )
 
 
 @lru_cache
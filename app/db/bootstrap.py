@@ -296,6 +296,130 @@ async def _migration_20260716_001_play_console_install_metrics(connection) -> No
     await connection.execute(text("CREATE INDEX IF NOT EXISTS ix_play_console_install_metrics_country ON play_console_install_metrics(country)"))
 
 
+async def _migration_20261018_001_etl_sheet_watermark(connection) -> None:
+    """Create watermark storage for incremental Google Sheets reads."""
+    await connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS etl_sheet_watermark (
+                source VARCHAR NOT NULL PRIMARY KEY,
+                spreadsheet_id VARCHAR NOT NULL,
+                range_name VARCHAR NOT NULL,
+                window_start DATE NOT NULL,
+                resume_row INTEGER NOT NULL,
+                last_row INTEGER NOT NULL,
+                header_hash VARCHAR NOT NULL,
+                anchor_hash VARCHAR NOT NULL,
+                updated_at DATETIME NOT NULL
+            )
+            """
+        )
+    )
+
+
+async def _migration_20261018_002_ads_covering_indexes(connection) -> None:
+    """Create covering date-range indexes for ads analytics reads."""
+    for table_name in ("google_ads", "facebook_ads", "tiktok_ads"):
+        await connection.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table_name}_date_covering ON {table_name}"
+                "(date, campaign_id, ad_group, ad_name, cost, impressions, clicks, campaign_name)"
+            )
+        )
+
+
+async def _migration_20261018_003_etl_gcs_object_manifest(connection) -> None:
+    """Create the per-object manifest for incremental GCS report ingestion."""
+    await connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS etl_gcs_object_manifest (
+                bucket VARCHAR NOT NULL,
+                object_name VARCHAR NOT NULL,
+                generation VARCHAR NOT NULL,
+                etag VARCHAR,
+                md5_hash VARCHAR,
+                size_bytes BIGINT,
+                row_count INTEGER NOT NULL,
+                rows JSON NOT NULL,
+                updated_at DATETIME NOT NULL,
+                PRIMARY KEY (bucket, object_name)
+            )
+            """
+        )
+    )
+
+
+async def _migration_20261018_004_etl_load_fingerprint(connection) -> None:
+    """Create per-source, per-window content fingerprints of ETL loads."""
+    await connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS etl_load_fingerprint (
+                source VARCHAR NOT NULL,
+                window_start DATE NOT NULL,
+                window_end DATE NOT NULL,
+                content_hash VARCHAR NOT NULL,
+                row_count INTEGER NOT NULL,
+                run_id VARCHAR,
+                updated_at DATETIME NOT NULL,
+                PRIMARY KEY (source, window_start, window_end)
+            )
+            """
+        )
+    )
+
+
+async def _migration_20261018_006_analytics_data_version(connection) -> None:
+    """Create per-table data versions used to key cached analytics responses."""
+    await connection.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS analytics_data_version (
+                table_name VARCHAR NOT NULL PRIMARY KEY,
+                version INTEGER NOT NULL,
+                updated_at DATETIME NOT NULL
+            )
+            """
+        )
+    )
+
+
+async def _migration_20261018_007_etl_gcs_manifest_content_hash(connection) -> None:
+    """Replace stored manifest rows with a content hash of the normalized rows.
+
+    The manifest is only a download cache, so an old table that still carries
+    ``rows`` is rebuilt empty; every object is downloaded once more.
+    """
+    manifest_columns = {
+        row[1]
+        for row in (
+            await connection.execute(text("PRAGMA table_info('etl_gcs_object_manifest')"))
+        ).fetchall()
+    }
+    if "rows" not in manifest_columns:
+        return
+    await connection.execute(text("DROP TABLE etl_gcs_object_manifest"))
+    await connection.execute(
+        text(
+            """
+            CREATE TABLE etl_gcs_object_manifest (
+                bucket VARCHAR NOT NULL,
+                object_name VARCHAR NOT NULL,
+                generation VARCHAR NOT NULL,
+                etag VARCHAR,
+                md5_hash VARCHAR,
+                size_bytes BIGINT,
+                row_count INTEGER NOT NULL,
+                content_hash VARCHAR NOT NULL,
+                updated_at DATETIME NOT NULL,
+                PRIMARY KEY (bucket, object_name)
+            )
+            """
+        )
+    )
+
+
 SCHEMA_MIGRATIONS: tuple[tuple[str, str, MigrationHandler], ...] = (
     (
         "20260624_001_auth_indexes",
@@ -342,6 +466,36 @@ SCHEMA_MIGRATIONS: tuple[tuple[str, str, MigrationHandler], ...] = (
         "Create Google Play Console install metric table.",
         _migration_20260716_001_play_console_install_metrics,
     ),
+    (
+        "20261018_001_etl_sheet_watermark",
+        "Create incremental Google Sheets read watermark table.",
+        _migration_20261018_001_etl_sheet_watermark,
+    ),
+    (
+        "20261018_002_ads_covering_indexes",
+        "Create covering date-range indexes on ads fact tables.",
+        _migration_20261018_002_ads_covering_indexes,
+    ),
+    (
+        "20261018_003_etl_gcs_object_manifest",
+        "Create per-object manifest for incremental GCS report ingestion.",
+        _migration_20261018_003_etl_gcs_object_manifest,
+    ),
+    (
+        "20261018_004_etl_load_fingerprint",
+        "Create content fingerprints used to skip unchanged ETL loads.",
+        _migration_20261018_004_etl_load_fingerprint,
+    ),
+    (
+        "20261018_006_analytics_data_version",
+        "Create per-table data versions for the analytics response cache.",
+        _migration_20261018_006_analytics_data_version,
+    ),
+    (
+        "20261018_007_etl_gcs_manifest_content_hash",
+        "Store a content hash instead of decoded rows in the GCS object manifest.",
+        _migration_20261018_007_etl_gcs_manifest_content_hash,
+    ),
 )
 
 
@@ -2,7 +2,14 @@
 
 # Ensure all SQLAlchemy models are imported and registered in metadata
 # before schema bootstrap runs.
-from app.db.models.etl_run import EtlRun  # noqa: F401
+from app.db.models.ads_rollup import AdsDailyAdRollup, AdsDailyCampaignRollup, AdsDailyTypeRollup  # noqa: F401
+from app.db.models.etl_run import (  # noqa: F401
+    AnalyticsDataVersion,
+    EtlGcsObjectManifest,
+    EtlLoadFingerprint,
+    EtlRun,
+    EtlSheetWatermark,
+)
 from app.db.models.schema_migration import SchemaMigration  # noqa: F401
 from app.db.models.external_api import (  # noqa: F401
     Campaign,
@@ -0,0 +1,91 @@
+"""Daily ads rollup models.
+
+These tables hold ads facts pre-aggregated by the ETL so analytics reads scale
+with the number of days in a range instead of the number of raw ad rows. They
+are derived data: `app.etl.ads_rollup` rebuilds them from `google_ads`,
+`facebook_ads`, `tiktok_ads`, `daily_register`, and `campaign`.
+"""
+
+from sqlalchemy import Column, Date, Float, Integer, String, UniqueConstraint
+
+from app.db.base import SqliteBase
+
+
+class AdsDailyAdRollup(SqliteBase):
+    """Daily ads metrics per ad, with register leads allocated by spend share.
+
+    Attributes:
+        source (str): Ads fact table the row was built from.
+        leads (float): Campaign daily register total allocated to this ad by
+            its share of campaign spend, or evenly when the campaign spent nothing.
+    """
+
+    __tablename__ = "ads_daily_ad_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "source",
+            "date",
+            "campaign_id",
+            "ad_group",
+            "ad_name",
+            name="uq_ads_daily_ad_rollup_source_date_ad",
+        ),
+    )
+
+    id = Column("id", Integer, primary_key=True, autoincrement=True)
+    date = Column("date", Date, nullable=False)
+    source = Column("source", String, nullable=False)
+    campaign_id = Column("campaign_id", String, nullable=False)
+    campaign_name = Column("campaign_name", String, nullable=False)
+    ad_group = Column("ad_group", String, nullable=False)
+    ad_name = Column("ad_name", String, nullable=False)
+    cost = Column("cost", Float, nullable=False, default=0.0)
+    impressions = Column("impressions", Integer, nullable=False, default=0)
+    clicks = Column("clicks", Integer, nullable=False, default=0)
+    leads = Column("leads", Float, nullable=False, default=0.0)
+
+
+class AdsDailyCampaignRollup(SqliteBase):
+    """Daily ads metrics per campaign with the campaign's register total as leads."""
+
+    __tablename__ = "ads_daily_campaign_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "source",
+            "date",
+            "campaign_id",
+            name="uq_ads_daily_campaign_rollup_source_date_campaign",
+        ),
+    )
+
+    id = Column("id", Integer, primary_key=True, autoincrement=True)
+    date = Column("date", Date, nullable=False)
+    source = Column("source", String, nullable=False)
+    campaign_id = Column("campaign_id", String, nullable=False)
+    cost = Column("cost", Float, nullable=False, default=0.0)
+    impressions = Column("impressions", Integer, nullable=False, default=0)
+    clicks = Column("clicks", Integer, nullable=False, default=0)
+    leads = Column("leads", Float, nullable=False, default=0.0)
+
+
+class AdsDailyTypeRollup(SqliteBase):
+    """Daily ads metrics per source and campaign ad type."""
+
+    __tablename__ = "ads_daily_type_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "source",
+            "date",
+            "ad_type",
+            name="uq_ads_daily_type_rollup_source_date_type",
+        ),
+    )
+
+    id = Column("id", Integer, primary_key=True, autoincrement=True)
+    date = Column("date", Date, nullable=False)
+    source = Column("source", String, nullable=False)
+    ad_type = Column("ad_type", String, nullable=False)
+    cost = Column("cost", Float, nullable=False, default=0.0)
+    impressions = Column("impressions", Integer, nullable=False, default=0)
+    clicks = Column("clicks", Integer, nullable=False, default=0)
+    leads = Column("leads", Float, nullable=False, default=0.0)
@@ -3,7 +3,7 @@
 This module stores execution metadata for ETL trigger requests.
 """
 
-from sqlalchemy import Column, Date, DateTime, Index, Integer, JSON, String
+from sqlalchemy import BigInteger, Column, Date, DateTime, Index, Integer, JSON, String
 
 from app.db.base import SqliteBase
 
@@ -40,3 +40,82 @@ class EtlRun(SqliteBase):
     started_at = Column("started_at", DateTime, nullable=False)
     ended_at = Column("ended_at", DateTime, nullable=True)
     triggered_by = Column("triggered_by", String, nullable=True)
+
+
+class EtlSheetWatermark(SqliteBase):
+    """Remember where the next incremental Google Sheets read can resume.
+
+    ``resume_row`` is the first 1-based sheet row whose date is on or after
+    ``window_start``; every row above it is older than that date. The header and
+    the rows just above ``resume_row`` are hashed so a later read can detect
+    inserted, deleted, or reordered rows and fall back to a full read.
+    """
+
+    __tablename__ = "etl_sheet_watermark"
+
+    source = Column("source", String, primary_key=True)
+    spreadsheet_id = Column("spreadsheet_id", String, nullable=False)
+    range_name = Column("range_name", String, nullable=False)
+    window_start = Column("window_start", Date, nullable=False)
+    resume_row = Column("resume_row", Integer, nullable=False)
+    last_row = Column("last_row", Integer, nullable=False)
+    header_hash = Column("header_hash", String, nullable=False)
+    anchor_hash = Column("anchor_hash", String, nullable=False)
+    updated_at = Column("updated_at", DateTime, nullable=False)
+
+
+class EtlGcsObjectManifest(SqliteBase):
+    """Remember which version of each GCS report object was last ingested.
+
+    ``generation`` changes whenever the object content is rewritten and
+    ``md5_hash`` (``etag`` for composite objects without one) identifies the
+    bytes. ``row_count`` and ``content_hash`` summarize the normalized rows the
+    object produced, so an unchanged object can be rebuilt from the loaded fact
+    rows instead of being downloaded and decoded again.
+    """
+
+    __tablename__ = "etl_gcs_object_manifest"
+
+    bucket = Column("bucket", String, primary_key=True)
+    object_name = Column("object_name", String, primary_key=True)
+    generation = Column("generation", String, nullable=False)
+    etag = Column("etag", String, nullable=True)
+    md5_hash = Column("md5_hash", String, nullable=True)
+    size_bytes = Column("size_bytes", BigInteger, nullable=True)
+    row_count = Column("row_count", Integer, nullable=False)
+    content_hash = Column("content_hash", String, nullable=False)
+    updated_at = Column("updated_at", DateTime, nullable=False)
+
+
+class EtlLoadFingerprint(SqliteBase):
+    """Content hash of the rows last loaded for one source and date window.
+
+    A re-run whose normalized rows hash to ``content_hash`` while the window
+    still holds ``row_count`` rows would rewrite identical data, so the load is
+    skipped.
+    """
+
+    __tablename__ = "etl_load_fingerprint"
+
+    source = Column("source", String, primary_key=True)
+    window_start = Column("window_start", Date, primary_key=True)
+    window_end = Column("window_end", Date, primary_key=True)
+    content_hash = Column("content_hash", String, nullable=False)
+    row_count = Column("row_count", Integer, nullable=False)
+    run_id = Column("run_id", String, nullable=True)
+    updated_at = Column("updated_at", DateTime, nullable=False)
+
+
+class AnalyticsDataVersion(SqliteBase):
+    """Monotonic per-table data version read by the analytics response cache.
+
+    ``complete_run`` bumps the versions of the tables a successful ETL run
+    loaded, so cached responses built from an older version are never served
+    again, whichever process ran the ETL.
+    """
+
+    __tablename__ = "analytics_data_version"
+
+    table_name = Column("table_name", String, primary_key=True)
+    version = Column("version", Integer, nullable=False, default=0)
+    updated_at = Column("updated_at", DateTime, nullable=False)
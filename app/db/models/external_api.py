@@ -244,6 +244,17 @@ class GoogleAds(SqliteBase):
             name="uq_google_ads_date_campaign_adgroup_adname",
         ),
         Index("ix_google_ads_date", "date"),
+        Index(
+            "ix_google_ads_date_covering",
+            "date",
+            "campaign_id",
+            "ad_group",
+            "ad_name",
+            "cost",
+            "impressions",
+            "clicks",
+            "campaign_name",
+        ),
         Index("ix_google_ads_campaign_id", "campaign_id"),
         {"schema": None}
     )
@@ -295,6 +306,17 @@ class FacebookAds(SqliteBase):
             name="uq_facebook_ads_date_campaign_adgroup_adname",
         ),
         Index("ix_facebook_ads_date", "date"),
+        Index(
+            "ix_facebook_ads_date_covering",
+            "date",
+            "campaign_id",
+            "ad_group",
+            "ad_name",
+            "cost",
+            "impressions",
+            "clicks",
+            "campaign_name",
+        ),
         Index("ix_facebook_ads_campaign_id", "campaign_id"),
         {"schema": None}
     )
@@ -346,6 +368,17 @@ class TikTokAds(SqliteBase):
             name="uq_tiktok_ads_date_campaign_adgroup_adname",
         ),
         Index("ix_tiktok_ads_date", "date"),
+        Index(
+            "ix_tiktok_ads_date_covering",
+            "date",
+            "campaign_id",
+            "ad_group",
+            "ad_name",
+            "cost",
+            "impressions",
+            "clicks",
+            "campaign_name",
+        ),
         Index("ix_tiktok_ads_campaign_id", "campaign_id"),
         {"schema": None}
     )
@@ -83,6 +83,56 @@ def create_engine(db_url: str) -> AsyncEngine:
     return engine
 
 
+def _configure_sqlite_readonly_engine(engine: AsyncEngine) -> None:
+    """Attach pragmas for read-only analytics connections."""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_read_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+
+def create_readonly_engine(db_url: str, *, pool_size: int) -> AsyncEngine | None:
+    """Create a pooled read-only engine for concurrent analytics reads.
+
+    File-backed SQLite databases are reopened with ``mode=ro`` so each pooled
+    connection reads its own WAL snapshot while the ETL writer keeps the main
+    engine. In-memory and non-SQLite URLs have no separate read path.
+
+    Args:
+        db_url (str): SQLAlchemy async connection URL of the main database.
+        pool_size (int): Number of pooled read connections; ``0`` disables the pool.
+
+    Returns:
+        AsyncEngine | None: Read-only engine, or ``None`` when not applicable.
+    """
+    sqlite_file_path = _sqlite_file_path(db_url)
+    if pool_size <= 0 or sqlite_file_path is None:
+        return None
+
+    url = make_url(db_url)
+    readonly_path = Path(sqlite_file_path).resolve().as_posix()
+    readonly_url = f"{url.drivername}:///file:{readonly_path}?mode=ro&uri=true"
+    engine = create_async_engine(
+        readonly_url,
+        echo=False,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=0,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+    )
+    _configure_sqlite_readonly_engine(engine)
+    return engine
+
+
 def create_session_factory(engine: AsyncEngine) -> sessionmaker:
     """Create SQLAlchemy async session factory bound to a given engine.
 
@@ -101,6 +151,10 @@ def create_session_factory(engine: AsyncEngine) -> sessionmaker:
 
 sqlite_engine = create_engine(settings.DB_URL)
 sqlite_async_session = create_session_factory(sqlite_engine)
+sqlite_read_engine = create_readonly_engine(settings.DB_URL, pool_size=settings.SQLITE_READ_POOL_SIZE)
+sqlite_read_session = (
+    create_session_factory(sqlite_read_engine) if sqlite_read_engine is not None else None
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,270 @@
+"""Maintain the daily ads rollup tables from ads and daily register facts.
+
+Each refresh deletes one source's rollup rows inside a date window and
+re-inserts them with ``INSERT ... SELECT``, so the work is bounded by the
+reloaded window. Grains are built bottom-up: ads rows into the per-ad rollup,
+that into the per-campaign rollup, and that into the per-ad-type rollup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+
+from sqlalchemy import String, and_, case, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.db.models.ads_rollup import AdsDailyAdRollup, AdsDailyCampaignRollup, AdsDailyTypeRollup
+from app.db.models.external_api import Campaign, DailyRegister, FacebookAds, GoogleAds, TikTokAds
+
+ADS_ROLLUP_MODELS = {
+    GoogleAds.__tablename__: GoogleAds,
+    FacebookAds.__tablename__: FacebookAds,
+    TikTokAds.__tablename__: TikTokAds,
+}
+ADS_ROLLUP_SOURCES = tuple(ADS_ROLLUP_MODELS)
+
+
+def _in_window(column, window_start: date | None, window_end: date | None) -> list:
+    """Return inclusive date bounds for ``column``; ``None`` leaves that side open."""
+    conditions = []
+    if window_start is not None:
+        conditions.append(column >= window_start)
+    if window_end is not None:
+        conditions.append(column <= window_end)
+    return conditions
+
+
+def _daily_register_totals(window_start: date | None, window_end: date | None):
+    return (
+        select(
+            DailyRegister.date.label("date"),
+            DailyRegister.campaign_id.label("campaign_id"),
+            func.sum(DailyRegister.total_regis).label("total_regis"),
+        )
+        .where(*_in_window(DailyRegister.date, window_start, window_end))
+        .group_by(DailyRegister.date, DailyRegister.campaign_id)
+        .subquery()
+    )
+
+
+def ad_rollup_select(source: str, window_start: date | None = None, window_end: date | None = None):
+    """Aggregate ``source`` ads rows per ad and day and allocate register leads.
+
+    A campaign's daily register total is split across its ads by spend share,
+    or evenly when the campaign spent nothing that day.
+    """
+    model = ADS_ROLLUP_MODELS[source]
+    daily_rows = (
+        select(
+            model.date.label("date"),
+            model.campaign_id.label("campaign_id"),
+            model.campaign_name.label("campaign_name"),
+            model.ad_group.label("ad_group"),
+            model.ad_name.label("ad_name"),
+            func.coalesce(func.sum(model.cost), 0.0).label("cost"),
+            func.coalesce(func.sum(model.impressions), 0).label("impressions"),
+            func.coalesce(func.sum(model.clicks), 0).label("clicks"),
+        )
+        .join(model.campaign)
+        .where(*_in_window(model.date, window_start, window_end))
+        .group_by(model.date, model.campaign_id, model.campaign_name, model.ad_group, model.ad_name)
+        .subquery()
+    )
+    campaign_daily_totals = (
+        select(
+            daily_rows.c.date.label("date"),
+            daily_rows.c.campaign_id.label("campaign_id"),
+            func.sum(daily_rows.c.cost).label("campaign_spend"),
+            func.count().label("row_count"),
+        )
+        .group_by(daily_rows.c.date, daily_rows.c.campaign_id)
+        .subquery()
+    )
+    daily_register = _daily_register_totals(window_start, window_end)
+    register_total = func.coalesce(daily_register.c.total_regis, 0)
+    lead_allocation = case(
+        (
+            campaign_daily_totals.c.campaign_spend > 0,
+            register_total * (daily_rows.c.cost / campaign_daily_totals.c.campaign_spend),
+        ),
+        else_=register_total / campaign_daily_totals.c.row_count,
+    )
+    return (
+        select(
+            daily_rows.c.date,
+            literal(source, String).label("source"),
+            daily_rows.c.campaign_id,
+            daily_rows.c.campaign_name,
+            daily_rows.c.ad_group,
+            daily_rows.c.ad_name,
+            daily_rows.c.cost,
+            daily_rows.c.impressions,
+            daily_rows.c.clicks,
+            lead_allocation.label("leads"),
+        )
+        .select_from(daily_rows)
+        .join(
+            campaign_daily_totals,
+            and_(
+                campaign_daily_totals.c.date == daily_rows.c.date,
+                campaign_daily_totals.c.campaign_id == daily_rows.c.campaign_id,
+            ),
+        )
+        .outerjoin(
+            daily_register,
+            and_(
+                daily_register.c.date == daily_rows.c.date,
+                daily_register.c.campaign_id == daily_rows.c.campaign_id,
+            ),
+        )
+    )
+
+
+def campaign_rollup_select(source: str, window_start: date | None = None, window_end: date | None = None):
+    """Aggregate the per-ad rollup per campaign and day with the full register total as leads."""
+    ad_totals = (
+        select(
+            AdsDailyAdRollup.date.label("date"),
+            AdsDailyAdRollup.campaign_id.label("campaign_id"),
+            func.sum(AdsDailyAdRollup.cost).label("cost"),
+            func.sum(AdsDailyAdRollup.impressions).label("impressions"),
+            func.sum(AdsDailyAdRollup.clicks).label("clicks"),
+        )
+        .where(
+            AdsDailyAdRollup.source == source,
+            *_in_window(AdsDailyAdRollup.date, window_start, window_end),
+        )
+        .group_by(AdsDailyAdRollup.date, AdsDailyAdRollup.campaign_id)
+        .subquery()
+    )
+    daily_register = _daily_register_totals(window_start, window_end)
+    return (
+        select(
+            ad_totals.c.date,
+            literal(source, String).label("source"),
+            ad_totals.c.campaign_id,
+            ad_totals.c.cost,
+            ad_totals.c.impressions,
+            ad_totals.c.clicks,
+            func.coalesce(daily_register.c.total_regis, 0).label("leads"),
+        )
+        .select_from(ad_totals)
+        .outerjoin(
+            daily_register,
+            and_(
+                daily_register.c.date == ad_totals.c.date,
+                daily_register.c.campaign_id == ad_totals.c.campaign_id,
+            ),
+        )
+    )
+
+
+def type_rollup_select(source: str, window_start: date | None = None, window_end: date | None = None):
+    """Aggregate the per-campaign rollup per current campaign ad type and day."""
+    return (
+        select(
+            AdsDailyCampaignRollup.date,
+            literal(source, String).label("source"),
+            Campaign.ad_type,
+            func.sum(AdsDailyCampaignRollup.cost).label("cost"),
+            func.sum(AdsDailyCampaignRollup.impressions).label("impressions"),
+            func.sum(AdsDailyCampaignRollup.clicks).label("clicks"),
+            func.sum(AdsDailyCampaignRollup.leads).label("leads"),
+        )
+        .join(Campaign, Campaign.campaign_id == AdsDailyCampaignRollup.campaign_id)
+        .where(
+            AdsDailyCampaignRollup.source == source,
+            *_in_window(AdsDailyCampaignRollup.date, window_start, window_end),
+        )
+        .group_by(AdsDailyCampaignRollup.date, Campaign.ad_type)
+    )
+
+
+ROLLUP_GRAINS = (
+    (AdsDailyAdRollup, ad_rollup_select),
+    (AdsDailyCampaignRollup, campaign_rollup_select),
+    (AdsDailyTypeRollup, type_rollup_select),
+)
+
+
+async def _replace_rollup_window(
+    session: AsyncSession | AsyncConnection,
+    rollup_model: type,
+    rows_select,
+    *,
+    source: str,
+    window_start: date | None,
+    window_end: date | None,
+) -> None:
+    await session.execute(
+        delete(rollup_model).where(
+            rollup_model.source == source,
+            *_in_window(rollup_model.date, window_start, window_end),
+        )
+    )
+    columns = [column.name for column in rollup_model.__table__.columns if column.name != "id"]
+    await session.execute(insert(rollup_model).from_select(columns, rows_select))
+
+
+async def refresh_ads_rollups(
+    session: AsyncSession | AsyncConnection,
+    *,
+    window_start: date | None = None,
+    window_end: date | None = None,
+    sources: Iterable[str] = ADS_ROLLUP_SOURCES,
+) -> None:
+    """Rebuild every rollup grain of ``sources`` inside the inclusive date window.
+
+    Runs in the caller's transaction so rollups change together with the
+    facts they summarize. Omitting both bounds rebuilds the full history.
+    """
+    for source in sources:
+        for rollup_model, rows_select in ROLLUP_GRAINS:
+            await _replace_rollup_window(
+                session,
+                rollup_model,
+                rows_select(source, window_start, window_end),
+                source=source,
+                window_start=window_start,
+                window_end=window_end,
+            )
+
+
+async def refresh_ads_type_rollups(
+    session: AsyncSession | AsyncConnection,
+    *,
+    sources: Iterable[str] = ADS_ROLLUP_SOURCES,
+) -> None:
+    """Rebuild the per-ad-type rollup after campaign ad types may have changed."""
+    for source in sources:
+        await _replace_rollup_window(
+            session,
+            AdsDailyTypeRollup,
+            type_rollup_select(source),
+            source=source,
+            window_start=None,
+            window_end=None,
+        )
+
+
+async def backfill_missing_ads_rollups(session: AsyncSession | AsyncConnection) -> list[str]:
+    """Build the full rollup history of ads sources that have facts but no rollup rows.
+
+    Run after schema setup so facts loaded before the rollup tables existed
+    are covered; ETL loads keep the rollups current from then on.
+
+    Returns:
+        list[str]: Sources whose rollups were rebuilt.
+    """
+    missing_sources = []
+    for source, model in ADS_ROLLUP_MODELS.items():
+        has_facts = (await session.execute(select(model.id).limit(1))).first() is not None
+        has_rollups = (
+            await session.execute(select(AdsDailyAdRollup.id).where(AdsDailyAdRollup.source == source).limit(1))
+        ).first() is not None
+        if has_facts and not has_rollups:
+            missing_sources.append(source)
+    if missing_sources:
+        await refresh_ads_rollups(session, sources=missing_sources)
+    return missing_sources
@@ -3,22 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import calendar
+import codecs
 import csv
 import gzip
 import io
 import json
+import logging
+import re
+import tempfile
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
+from typing import BinaryIO
+from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
 
 from decouple import config
 from google.ads.googleads.client import GoogleAdsClient
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaIoBaseDownload, build_http
 import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decrypt_secret, encrypt_secret
-from app.db.models.external_api import ManagedSecret
+from app.db.models.external_api import ManagedSecret, PlayConsoleInstallMetrics
 from app.db.session import sqlite_async_session
 from app.etl.extract_helpers import (
     extract_meta_leads,
@@ -26,6 +39,40 @@ from app.etl.extract_helpers import (
     normalize_customer_id,
     normalize_meta_ad_account_id,
 )
+from app.etl.gcs_manifest import gcs_object_unchanged, load_gcs_manifest, save_gcs_manifest
+from app.etl.http_clients import HttpClientRegistry
+from app.etl.load import build_play_console_install_rows
+from app.etl.load_fingerprint import rows_fingerprint
+from app.etl.pagination import enrich_pages
+from app.etl.pipeline_core import SQLITE_WRITE_LOCK, SqliteWriteQueue
+from app.etl.sheet_snapshot import SheetSnapshotCache
+from app.etl.transform import parse_play_console_install_dataframe
+
+logger = logging.getLogger(__name__)
+
+GRAPH_BATCH_MAX_REQUESTS = 50
+INSTAGRAM_MEDIA_METRIC_ALIASES = {
+    "shares": ("shares",),
+    "saves": ("saves", "saved"),
+    "reach": ("reach",),
+    "views": ("views",),
+    "profile_visits": ("profile_visits",),
+    "follows": ("follows",),
+}
+FACEBOOK_POST_METRIC_ALIASES = {
+    "post_media_view": ("post_media_view",),
+    "post_clicks": ("post_clicks",),
+    "post_video_views": ("post_video_views",),
+    "post_reactions_by_type_total": ("post_reactions_by_type_total",),
+}
+FACEBOOK_REACTION_COLUMNS = {
+    "like": "reaction_like",
+    "love": "reaction_love",
+    "wow": "reaction_wow",
+    "haha": "reaction_haha",
+    "sorry": "reaction_sorry",
+    "anger": "reaction_anger",
+}
 
 
 def _parse_gcs_bucket_config(raw_value: str) -> tuple[str, str | None]:
@@ -39,14 +86,33 @@ def _parse_gcs_bucket_config(raw_value: str) -> tuple[str, str | None]:
     return bucket, prefix.strip("/") or None
 
 
-def _decode_play_console_csv_payload(payload: bytes) -> str:
-    """Decode Play Console CSV exports, which may be UTF-8 or UTF-16."""
-    for encoding in ("utf-8-sig", "utf-16", "utf-16-le", "utf-16-be"):
-        try:
-            return payload.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    return payload.decode("utf-8-sig", errors="replace")
+def _play_console_csv_encoding(head: bytes) -> str:
+    """Pick the text encoding of a Play Console CSV export from its first bytes."""
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    if head and head.count(0) >= len(head) // 4:
+        # BOM-less UTF-16: ASCII text leaves a NUL in every other byte.
+        return "utf-16-le" if head[1::2].count(0) >= head[0::2].count(0) else "utf-16-be"
+    return "utf-8-sig"
+
+
+def _read_play_console_csv(stream: BinaryIO, *, gzipped: bool = False) -> list[dict]:
+    """Decode a Play Console CSV export incrementally, without one decoded text buffer.
+
+    Exports may be UTF-8 or UTF-16 and optionally gzip-compressed; the
+    encoding is sniffed from the first bytes and rows are parsed as the
+    stream is decoded.
+    """
+    binary = gzip.GzipFile(fileobj=stream, mode="rb") if gzipped else stream
+    head = binary.read(4096)
+    binary.seek(0)
+    text = io.TextIOWrapper(binary, encoding=_play_console_csv_encoding(head), errors="replace", newline="")
+    try:
+        return list(csv.DictReader(text))
+    finally:
+        text.detach()
 
 
 def _play_console_month_tokens(start_date: date, end_date: date) -> set[str]:
@@ -69,6 +135,31 @@ def _play_console_month_tokens(start_date: date, end_date: date) -> set[str]:
     return tokens
 
 
+_PLAY_CONSOLE_OBJECT_MONTH = re.compile(r"_(\d{4})(\d{2})_overview\.csv$", re.IGNORECASE)
+
+
+def _play_console_object_month(object_name: str) -> tuple[date, date] | None:
+    """Return the first and last day of the month a monthly export covers."""
+    match = _PLAY_CONSOLE_OBJECT_MONTH.search(object_name)
+    if match is None:
+        return None
+    year, month = int(match.group(1)), int(match.group(2))
+    if not 1 <= month <= 12:
+        return None
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _play_console_rows_summary(raw_rows: list[dict]) -> tuple[int, str]:
+    """Return the row count and content hash of the daily metrics ``raw_rows`` load as.
+
+    Decoded CSV rows and rows rebuilt from ``play_console_install_metrics``
+    summarize identically when they describe the same data.
+    """
+    df = parse_play_console_install_dataframe(raw_rows)
+    rows = [] if df.empty else build_play_console_install_rows(df, pull_date=None)
+    return len(rows), rows_fingerprint(rows)
+
+
 class ExternalApiExtractor:
     """Extract raw payloads from active ETL sources.
 
@@ -78,8 +169,16 @@ class ExternalApiExtractor:
         - GA4 Analytics Data API for app/web user metrics.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        sheet_snapshots: SheetSnapshotCache | None = None,
+        http_clients: HttpClientRegistry | None = None,
+        write_queue: SqliteWriteQueue | None = None,
+    ) -> None:
         self.service = None
+        self.sheet_snapshots = sheet_snapshots or SheetSnapshotCache()
+        self.http_clients = http_clients
+        self.write_queue = write_queue
         self.sheet_id = config("GSHEET_SHEET_ID", default="", cast=str).strip() or None
         raw_gsheet_creds = config("GSHEET_SA_CREDS", default="", cast=str).strip()
         if raw_gsheet_creds:
@@ -114,6 +213,13 @@ class ExternalApiExtractor:
             default="'RAW Regis'!A:G",
             cast=str,
         ).strip()
+        self.sheet_incremental_reads = config("GSHEET_INCREMENTAL_READS", default=True, cast=bool)
+        for spreadsheet_id, range_name in (
+            (self.first_deposit_sheet_id, self.first_deposit_sheet_range),
+            (self.first_deposit_sheet_id, self.ms_deposit_sheet_range),
+            (self.daily_regis_sheet_id, self.daily_regis_sheet_range),
+        ):
+            self.sheet_snapshots.register(spreadsheet_id, range_name)
         self.ga4_property_id = config("GA4_PROPERTY_ID", default=None, cast=str)
         raw_ga4_sa_creds = config("GA4_SA_CREDS", default="", cast=str).strip()
         self.ga4_service = None
@@ -146,6 +252,9 @@ class ExternalApiExtractor:
         if play_console_prefix and play_console_prefix not in self.play_console_report_prefixes:
             self.play_console_report_prefixes.insert(0, play_console_prefix)
         self.play_console_storage_service = None
+        self.play_console_credentials = None
+        self.play_console_download_workers = config("PLAY_CONSOLE_DOWNLOAD_WORKERS", default=4, cast=int)
+        self._play_console_thread_local = threading.local()
         raw_play_console_sa = config("PLAY_CONSOLE_SA", default="", cast=str).strip()
         if raw_play_console_sa:
             play_console_sa = load_service_account_info("PLAY_CONSOLE_SA")
@@ -153,6 +262,7 @@ class ExternalApiExtractor:
                 play_console_sa,
                 scopes=["https://www.googleapis.com/auth/devstorage.read_only"],
             )
+            self.play_console_credentials = play_console_creds
             self.play_console_storage_service = build(
                 "storage",
                 version="v1",
@@ -182,18 +292,39 @@ class ExternalApiExtractor:
             default=10,
             cast=int,
         )
+        self.meta_graph_batch_enabled = config(
+            "META_GRAPH_BATCH_ENABLED",
+            default=True,
+            cast=bool,
+        )
         self.youtube_media_insight_concurrency = config(
             "YOUTUBE_MEDIA_INSIGHT_CONCURRENCY",
             default=5,
             cast=int,
         )
+        self.youtube_media_insight_batch_size = config(
+            "YOUTUBE_MEDIA_INSIGHT_BATCH_SIZE",
+            default=50,
+            cast=int,
+        )
         self.tiktok_video_list_max_pages = config(
             "TIKTOK_VIDEO_LIST_MAX_PAGES",
             default=100,
             cast=int,
         )
+        self.listing_prefetch_pages = config(
+            "ETL_LISTING_PREFETCH_PAGES",
+            default=2,
+            cast=int,
+        )
         self.google_ads_client = None
 
+    def _http_session(self):
+        """Return the shared batch client, or a one-off client when none is configured."""
+        if self.http_clients is not None:
+            return self.http_clients.session()
+        return httpx.AsyncClient(timeout=120)
+
     async def _load_managed_secret(self, secret_key: str) -> str:
         """Load and decrypt a managed secret from backend storage when present."""
         async with sqlite_async_session() as session:
@@ -276,6 +407,35 @@ class ExternalApiExtractor:
 
         return await asyncio.to_thread(_request)
 
+    async def fetch_spreadsheet_ranges(self, spreadsheet_id: str, ranges: list[str]) -> list[list]:
+        """Fetch several A1 ranges from one spreadsheet in a single ``batchGet`` call.
+
+        Args:
+            spreadsheet_id (str): Spreadsheet identifier.
+            ranges (list[str]): A1 ranges, returned in the same order.
+
+        Returns:
+            list[list]: Row values per requested range.
+        """
+        if self.service is None or not spreadsheet_id:
+            raise ValueError(
+                "Google Sheets credentials are not fully configured. "
+                "Required env vars: GSHEET_SA_CREDS and the spreadsheet ID for this source."
+            )
+
+        def _request():
+            result = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+            ).execute()
+            value_ranges = result.get("valueRanges", [])
+            return [
+                value_ranges[index].get("values", []) if index < len(value_ranges) else []
+                for index in range(len(ranges))
+            ]
+
+        return await asyncio.to_thread(_request)
+
     async def fetch_ga4_daily_metrics(self, start_date: date, end_date: date) -> list[dict]:
         """Fetch GA4 daily user metrics by platform in a date range.
 
@@ -477,7 +637,7 @@ class ExternalApiExtractor:
         request_url = f"https://graph.facebook.com/{self.meta_api_version}/{meta_ad_account_id}/insights"
         parsed_rows: list[dict] = []
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             while request_url:
                 response = await client.get(request_url, params=params if request_url.endswith("/insights") else None)
                 response.raise_for_status()
@@ -536,7 +696,7 @@ class ExternalApiExtractor:
             for target_date in self._iter_dates(start_date, end_date)
         }
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             profile = await self._fetch_instagram_profile(
                 client=client,
                 base_url=base_url,
@@ -635,7 +795,7 @@ class ExternalApiExtractor:
         end_date: date,
     ) -> list[dict]:
         """Fetch daily channel metrics from the YouTube Analytics API."""
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             access_token = await self._refresh_youtube_access_token(client)
 
             response = await client.get(
@@ -722,36 +882,63 @@ class ExternalApiExtractor:
         if not self.youtube_channel_id:
             raise ValueError("YouTube channel ID is missing. Configure YOUTUBE_CHANNEL_ID.")
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             access_token = await self._refresh_youtube_access_token(client)
             uploads_playlist_id = await self._youtube_uploads_playlist_id(
                 client=client,
                 access_token=access_token,
             )
-            media_rows = await self._youtube_upload_rows(
-                client=client,
-                access_token=access_token,
-                uploads_playlist_id=uploads_playlist_id,
-                start_date=start_date,
-                end_date=end_date,
-            )
-
             semaphore = asyncio.Semaphore(max(1, self.youtube_media_insight_concurrency))
 
-            async def enrich_media(row: dict) -> dict:
+            async def single_video_metrics(row: dict) -> dict:
                 async with semaphore:
-                    metrics = await self._youtube_video_analytics(
+                    return await self._youtube_video_analytics(
                         client=client,
                         access_token=access_token,
                         video_id=row["video_id"],
                         published_date=date.fromisoformat(row["date"]),
                     )
-                enriched = dict(row)
-                enriched.update(metrics)
-                return enriched
 
-            if media_rows:
-                media_rows = list(await asyncio.gather(*(enrich_media(row) for row in media_rows)))
+            async def chunk_metrics(chunk: list[dict]) -> dict[str, dict]:
+                if len(chunk) > 1:
+                    try:
+                        async with semaphore:
+                            return await self._youtube_video_analytics_batch(
+                                client=client,
+                                access_token=access_token,
+                                video_ids=[row["video_id"] for row in chunk],
+                                start_date=min(date.fromisoformat(row["date"]) for row in chunk),
+                            )
+                    except ValueError as error:
+                        logger.warning(
+                            "YouTube batched video analytics failed, falling back to per-video reports: %s",
+                            error,
+                        )
+                results = await asyncio.gather(*(single_video_metrics(row) for row in chunk))
+                return {row["video_id"]: metrics for row, metrics in zip(chunk, results)}
+
+            async def enrich_page(page_rows: list[dict]) -> list[dict]:
+                batch_size = max(1, self.youtube_media_insight_batch_size)
+                chunks = [page_rows[index:index + batch_size] for index in range(0, len(page_rows), batch_size)]
+                metrics_by_video: dict[str, dict] = {}
+                for chunk_result in await asyncio.gather(*(chunk_metrics(chunk) for chunk in chunks)):
+                    metrics_by_video.update(chunk_result)
+                return [
+                    {**row, **metrics_by_video.get(row["video_id"], {})}
+                    for row in page_rows
+                ]
+
+            media_rows = await enrich_pages(
+                self._youtube_upload_pages(
+                    client=client,
+                    access_token=access_token,
+                    uploads_playlist_id=uploads_playlist_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                ),
+                enrich_page,
+                max_pending_pages=self.listing_prefetch_pages,
+            )
 
         return sorted(media_rows, key=lambda row: (row["date"], row["video_id"]))
 
@@ -786,7 +973,7 @@ class ExternalApiExtractor:
             raise ValueError("YouTube uploads playlist was not returned for the configured channel.")
         return playlist_id
 
-    async def _youtube_upload_rows(
+    async def _youtube_upload_pages(
         self,
         *,
         client: httpx.AsyncClient,
@@ -794,9 +981,12 @@ class ExternalApiExtractor:
         uploads_playlist_id: str,
         start_date: date,
         end_date: date,
-    ) -> list[dict]:
-        """List channel uploads published inside the requested ETL window."""
-        rows: list[dict] = []
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of channel uploads published inside the requested ETL window.
+
+        Listing stops after the first page that reaches uploads older than
+        ``start_date``, since the uploads playlist is newest first.
+        """
         page_token: str | None = None
         reached_older_video = False
         while not reached_older_video:
@@ -818,6 +1008,7 @@ class ExternalApiExtractor:
                 raise ValueError(f"YouTube uploads request failed: {detail}")
 
             payload = response.json()
+            rows: list[dict] = []
             for item in payload.get("items") or []:
                 snippet = item.get("snippet") or {}
                 content_details = item.get("contentDetails") or {}
@@ -858,11 +1049,11 @@ class ExternalApiExtractor:
                         "subscribers_gained": 0,
                     }
                 )
+            yield rows
 
             page_token = payload.get("nextPageToken")
             if not page_token:
                 break
-        return rows
 
     async def _youtube_video_analytics(
         self,
@@ -896,7 +1087,58 @@ class ExternalApiExtractor:
         payload = response.json()
         headers = [item.get("name") for item in payload.get("columnHeaders", [])]
         values = (payload.get("rows") or [])[0] if payload.get("rows") else []
-        item = dict(zip(headers, values))
+        return self._youtube_video_metrics(dict(zip(headers, values)))
+
+    async def _youtube_video_analytics_batch(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        access_token: str,
+        video_ids: list[str],
+        start_date: date,
+    ) -> dict[str, dict]:
+        """Fetch lifetime snapshots for several videos in one report request.
+
+        The report starts at the earliest publish date in the chunk; views before
+        a video's own publish date are zero, so totals match per-video reports.
+        Videos without any report row get the same zeroed snapshot as the
+        per-video path.
+        """
+        response = await client.get(
+            "https://youtubeanalytics.googleapis.com/v2/reports",
+            params={
+                "ids": "channel==MINE",
+                "startDate": start_date.isoformat(),
+                "endDate": datetime.now().date().isoformat(),
+                "dimensions": "video,creatorContentType",
+                "filters": f"video=={','.join(video_ids)}",
+                "metrics": (
+                    "views,estimatedMinutesWatched,averageViewPercentage,"
+                    "likes,comments,shares,subscribersGained"
+                ),
+                "sort": "-views",
+                "maxResults": len(video_ids),
+            },
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        if response.status_code >= 400:
+            payload = response.json()
+            detail = (payload.get("error") or {}).get("message") or "unknown error"
+            raise ValueError(f"YouTube batched video analytics failed: {detail}")
+
+        payload = response.json()
+        headers = [item.get("name") for item in payload.get("columnHeaders", [])]
+        items_by_video: dict[str, dict] = {}
+        for values in payload.get("rows") or []:
+            item = dict(zip(headers, values))
+            video_id = str(item.get("video") or "")
+            # Rows are sorted by views, so the first row per video carries its main content type.
+            items_by_video.setdefault(video_id, item)
+        return {video_id: self._youtube_video_metrics(items_by_video.get(video_id, {})) for video_id in video_ids}
+
+    @staticmethod
+    def _youtube_video_metrics(item: dict) -> dict:
+        """Map one YouTube Analytics report row onto media insight columns."""
         return {
             "content_type": str(item.get("creatorContentType") or "UNKNOWN").upper(),
             "views": int(float(item.get("views") or 0)),
@@ -984,7 +1226,7 @@ class ExternalApiExtractor:
         }
         fetched_metric_count = 0
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             access_token = await self._resolve_facebook_page_access_token(
                 client=client,
                 base_url=base_url,
@@ -1045,70 +1287,25 @@ class ExternalApiExtractor:
             )
 
         base_url = f"https://graph.instagram.com/{self.meta_api_version}"
-        instagram_user_path = self.instagram_user_id or "me"
-        media_rows: list[dict] = []
-
-        async with httpx.AsyncClient(timeout=120) as client:
-            request_url = f"{base_url}/{instagram_user_path}/media"
-            params = {
-                "fields": (
-                    "id,caption,media_type,media_product_type,timestamp,permalink,"
-                    "media_url,thumbnail_url,like_count,comments_count"
-                ),
-                "access_token": access_token,
-                "limit": 100,
-            }
-            reached_older_media = False
-            while request_url:
-                response = await client.get(request_url, params=params)
-                if response.status_code >= 400:
-                    self._raise_instagram_api_error(response, "media")
-                payload = response.json()
-                for media in payload.get("data", []):
-                    parsed_timestamp = self._parse_instagram_datetime(media.get("timestamp"))
-                    if parsed_timestamp is None:
-                        continue
-                    media_date = parsed_timestamp.date()
-                    if media_date < start_date:
-                        reached_older_media = True
-                        continue
-                    if media_date > end_date:
-                        continue
-
-                    normalized_product_type = self._instagram_media_product_type(media)
-                    if normalized_product_type not in {"FEED", "REELS"}:
-                        continue
-
-                    media_rows.append(
-                        {
-                            "date": media_date.isoformat(),
-                            "media_id": str(media.get("id") or "").strip(),
-                            "media_type": str(media.get("media_type") or "").strip().upper() or "UNKNOWN",
-                            "media_product_type": normalized_product_type,
-                            "timestamp": parsed_timestamp.isoformat(),
-                            "caption": media.get("caption"),
-                            "permalink": media.get("permalink"),
-                            "media_url": media.get("media_url"),
-                            "thumbnail_url": media.get("thumbnail_url"),
-                            "likes": int(float(media.get("like_count") or 0)),
-                            "comments": int(float(media.get("comments_count") or 0)),
-                            "shares": 0,
-                            "saves": 0,
-                            "reach": 0,
-                            "views": 0,
-                            "profile_visits": 0,
-                            "follows": 0,
-                            "total_engagement": 0,
-                        }
-                    )
-
-                if reached_older_media:
-                    break
-                request_url = payload.get("paging", {}).get("next")
-                params = None
 
+        async with self._http_session() as client:
             semaphore = asyncio.Semaphore(max(1, self.instagram_media_insight_concurrency))
 
+            def apply_insights(row: dict, insights: dict[str, int]) -> dict:
+                enriched = dict(row)
+                for metric in ("shares", "saves", "reach", "views", "profile_visits", "follows"):
+                    enriched[metric] = int(insights.get(metric) or 0)
+                if enriched["media_product_type"] != "FEED":
+                    enriched["profile_visits"] = 0
+                    enriched["follows"] = 0
+                enriched["total_engagement"] = (
+                    int(enriched["likes"])
+                    + int(enriched["comments"])
+                    + int(enriched["shares"])
+                    + int(enriched["saves"])
+                )
+                return enriched
+
             async def enrich_media(row: dict) -> dict:
                 async with semaphore:
                     insights = await self._fetch_instagram_media_insight_metrics(
@@ -1117,25 +1314,118 @@ class ExternalApiExtractor:
                         media_id=row["media_id"],
                         access_token=access_token,
                     )
-                    enriched = dict(row)
-                    for metric in ("shares", "saves", "reach", "views", "profile_visits", "follows"):
-                        enriched[metric] = int(insights.get(metric) or 0)
-                    if enriched["media_product_type"] != "FEED":
-                        enriched["profile_visits"] = 0
-                        enriched["follows"] = 0
-                    enriched["total_engagement"] = (
-                        int(enriched["likes"])
-                        + int(enriched["comments"])
-                        + int(enriched["shares"])
-                        + int(enriched["saves"])
-                    )
-                    return enriched
-
-            if media_rows:
-                media_rows = list(await asyncio.gather(*(enrich_media(row) for row in media_rows)))
+                return apply_insights(row, insights)
+
+            async def enrich_page(page_rows: list[dict]) -> list[dict]:
+                if self.meta_graph_batch_enabled:
+                    try:
+                        insights_by_media = await self._fetch_graph_insight_metrics_batch(
+                            client=client,
+                            base_url=base_url,
+                            access_token=access_token,
+                            object_ids=[row["media_id"] for row in page_rows],
+                            metric_aliases=INSTAGRAM_MEDIA_METRIC_ALIASES,
+                            semaphore=semaphore,
+                            raise_api_error=self._raise_instagram_api_error,
+                        )
+                    except ValueError as error:
+                        logger.warning("Instagram batch insights unavailable, using per-media requests: %s", error)
+                    else:
+                        return [
+                            apply_insights(row, insights_by_media.get(row["media_id"], {}))
+                            for row in page_rows
+                        ]
+                return list(await asyncio.gather(*(enrich_media(row) for row in page_rows)))
+
+            media_rows = await enrich_pages(
+                self._instagram_media_pages(
+                    client=client,
+                    base_url=base_url,
+                    access_token=access_token,
+                    start_date=start_date,
+                    end_date=end_date,
+                ),
+                enrich_page,
+                max_pending_pages=self.listing_prefetch_pages,
+            )
 
         return sorted(media_rows, key=lambda row: (row["date"], row["media_id"]))
 
+    async def _instagram_media_pages(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        base_url: str,
+        access_token: str,
+        start_date: date,
+        end_date: date,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of feed and reels media published inside the ETL window.
+
+        Listing stops after the first page that reaches media older than
+        ``start_date``, since the media edge is newest first.
+        """
+        instagram_user_path = self.instagram_user_id or "me"
+        request_url = f"{base_url}/{instagram_user_path}/media"
+        params = {
+            "fields": (
+                "id,caption,media_type,media_product_type,timestamp,permalink,"
+                "media_url,thumbnail_url,like_count,comments_count"
+            ),
+            "access_token": access_token,
+            "limit": 100,
+        }
+        reached_older_media = False
+        while request_url:
+            response = await client.get(request_url, params=params)
+            if response.status_code >= 400:
+                self._raise_instagram_api_error(response, "media")
+            payload = response.json()
+            rows: list[dict] = []
+            for media in payload.get("data", []):
+                parsed_timestamp = self._parse_instagram_datetime(media.get("timestamp"))
+                if parsed_timestamp is None:
+                    continue
+                media_date = parsed_timestamp.date()
+                if media_date < start_date:
+                    reached_older_media = True
+                    continue
+                if media_date > end_date:
+                    continue
+
+                normalized_product_type = self._instagram_media_product_type(media)
+                if normalized_product_type not in {"FEED", "REELS"}:
+                    continue
+
+                rows.append(
+                    {
+                        "date": media_date.isoformat(),
+                        "media_id": str(media.get("id") or "").strip(),
+                        "media_type": str(media.get("media_type") or "").strip().upper() or "UNKNOWN",
+                        "media_product_type": normalized_product_type,
+                        "timestamp": parsed_timestamp.isoformat(),
+                        "caption": media.get("caption"),
+                        "permalink": media.get("permalink"),
+                        "media_url": media.get("media_url"),
+                        "thumbnail_url": media.get("thumbnail_url"),
+                        "likes": int(float(media.get("like_count") or 0)),
+                        "comments": int(float(media.get("comments_count") or 0)),
+                        "shares": 0,
+                        "saves": 0,
+                        "reach": 0,
+                        "views": 0,
+                        "profile_visits": 0,
+                        "follows": 0,
+                        "total_engagement": 0,
+                    }
+                )
+            yield rows
+
+            if reached_older_media:
+                break
+            request_url = payload.get("paging", {}).get("next")
+            params = None
+
     async def fetch_facebook_page_media_insights(self, start_date: date, end_date: date) -> list[dict]:
         """Fetch Facebook Page post/media lifetime insight snapshots for a date range."""
         meta_access_token = await self._load_managed_secret("meta_ads_access_token")
@@ -1151,7 +1441,7 @@ class ExternalApiExtractor:
         base_url = f"https://graph.facebook.com/{self.meta_api_version}"
         media_rows: list[dict] = []
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             access_token = await self._resolve_facebook_page_access_token(
                 client=client,
                 base_url=base_url,
@@ -1227,6 +1517,29 @@ class ExternalApiExtractor:
 
             semaphore = asyncio.Semaphore(max(1, self.instagram_media_insight_concurrency))
 
+            def apply_post_metrics(row: dict, social_counts: dict[str, int], insights: dict[str, int]) -> dict:
+                enriched = dict(row)
+                enriched["likes"] = int(social_counts.get("likes") or 0)
+                enriched["comments"] = int(social_counts.get("comments") or 0)
+                for metric in (
+                    *FACEBOOK_REACTION_COLUMNS.values(),
+                    "post_media_view",
+                    "post_clicks",
+                    "post_video_views",
+                ):
+                    enriched[metric] = int(insights.get(metric) or 0)
+                if not enriched["reaction_like"]:
+                    enriched["reaction_like"] = int(enriched["likes"])
+                reaction_total = sum(
+                    int(enriched.get(metric) or 0) for metric in FACEBOOK_REACTION_COLUMNS.values()
+                )
+                enriched["total_engagement"] = (
+                    max(int(enriched["likes"]), reaction_total)
+                    + int(enriched["comments"])
+                    + int(enriched["shares"])
+                )
+                return enriched
+
             async def enrich_post(row: dict) -> dict:
                 async with semaphore:
                     social_counts = await self._fetch_facebook_post_social_counts(
@@ -1241,43 +1554,45 @@ class ExternalApiExtractor:
                         post_id=row["post_id"],
                         access_token=access_token,
                     )
-                    enriched = dict(row)
-                    enriched["likes"] = int(social_counts.get("likes") or 0)
-                    enriched["comments"] = int(social_counts.get("comments") or 0)
-                    for metric in (
-                        "reaction_like",
-                        "reaction_love",
-                        "reaction_wow",
-                        "reaction_haha",
-                        "reaction_sorry",
-                        "reaction_anger",
-                        "post_media_view",
-                        "post_clicks",
-                        "post_video_views",
-                    ):
-                        enriched[metric] = int(insights.get(metric) or 0)
-                    if not enriched["reaction_like"]:
-                        enriched["reaction_like"] = int(enriched["likes"])
-                    reaction_total = sum(
-                        int(enriched.get(metric) or 0)
-                        for metric in (
-                            "reaction_like",
-                            "reaction_love",
-                            "reaction_wow",
-                            "reaction_haha",
-                            "reaction_sorry",
-                            "reaction_anger",
-                        )
-                    )
-                    enriched["total_engagement"] = (
-                        max(int(enriched["likes"]), reaction_total)
-                        + int(enriched["comments"])
-                        + int(enriched["shares"])
-                    )
-                    return enriched
+                return apply_post_metrics(row, social_counts, insights)
 
             if media_rows:
-                media_rows = list(await asyncio.gather(*(enrich_post(row) for row in media_rows)))
+                batched = None
+                if self.meta_graph_batch_enabled:
+                    post_ids = [row["post_id"] for row in media_rows]
+                    try:
+                        batched = await asyncio.gather(
+                            self._fetch_facebook_post_social_counts_batch(
+                                client=client,
+                                base_url=base_url,
+                                access_token=access_token,
+                                post_ids=post_ids,
+                                semaphore=semaphore,
+                            ),
+                            self._fetch_graph_insight_metrics_batch(
+                                client=client,
+                                base_url=base_url,
+                                access_token=access_token,
+                                object_ids=post_ids,
+                                metric_aliases=FACEBOOK_POST_METRIC_ALIASES,
+                                semaphore=semaphore,
+                                raise_api_error=self._raise_facebook_api_error,
+                            ),
+                        )
+                    except ValueError as error:
+                        logger.warning("Facebook batch post metrics unavailable, using per-post requests: %s", error)
+                if batched is None:
+                    media_rows = list(await asyncio.gather(*(enrich_post(row) for row in media_rows)))
+                else:
+                    social_by_post, insights_by_post = batched
+                    media_rows = [
+                        apply_post_metrics(
+                            row,
+                            social_by_post.get(row["post_id"], {}),
+                            insights_by_post.get(row["post_id"], {}),
+                        )
+                        for row in media_rows
+                    ]
 
         return sorted(media_rows, key=lambda row: (row["date"], row["post_id"]))
 
@@ -1766,16 +2081,8 @@ class ExternalApiExtractor:
         """Fetch lifetime media insight metrics, tolerating unavailable metrics."""
         if not media_id:
             return {}
-        metric_aliases = {
-            "shares": ("shares",),
-            "saves": ("saves", "saved"),
-            "reach": ("reach",),
-            "views": ("views",),
-            "profile_visits": ("profile_visits",),
-            "follows": ("follows",),
-        }
         totals: dict[str, int] = {}
-        for target_name, candidates in metric_aliases.items():
+        for target_name, candidates in INSTAGRAM_MEDIA_METRIC_ALIASES.items():
             for metric in candidates:
                 response = await client.get(
                     f"{base_url}/{media_id}/insights",
@@ -1786,14 +2093,7 @@ class ExternalApiExtractor:
                 )
                 if response.status_code >= 400:
                     continue
-                payload = response.json()
-                resolved = False
-                for metric_payload in payload.get("data", []):
-                    values = metric_payload.get("values") or []
-                    value = values[0].get("value") if values else 0
-                    totals[target_name] = int(float(value or 0))
-                    resolved = True
-                if resolved:
+                if self._apply_graph_insight_payload(totals, target_name, response.json()):
                     break
         return totals
 
@@ -1808,14 +2108,8 @@ class ExternalApiExtractor:
         """Fetch lifetime Facebook post insight metrics, tolerating unavailable metrics."""
         if not post_id:
             return {}
-        metric_aliases = {
-            "post_media_view": ("post_media_view",),
-            "post_clicks": ("post_clicks",),
-            "post_video_views": ("post_video_views",),
-            "post_reactions_by_type_total": ("post_reactions_by_type_total",),
-        }
         totals: dict[str, int] = {}
-        for target_name, candidates in metric_aliases.items():
+        for target_name, candidates in FACEBOOK_POST_METRIC_ALIASES.items():
             for metric in candidates:
                 response = await client.get(
                     f"{base_url}/{post_id}/insights",
@@ -1826,26 +2120,7 @@ class ExternalApiExtractor:
                 )
                 if response.status_code >= 400:
                     continue
-                payload = response.json()
-                resolved = False
-                for metric_payload in payload.get("data", []):
-                    values = metric_payload.get("values") or []
-                    value = values[0].get("value") if values else 0
-                    if target_name == "post_reactions_by_type_total":
-                        reaction_values = value if isinstance(value, dict) else {}
-                        for reaction_key, column in {
-                            "like": "reaction_like",
-                            "love": "reaction_love",
-                            "wow": "reaction_wow",
-                            "haha": "reaction_haha",
-                            "sorry": "reaction_sorry",
-                            "anger": "reaction_anger",
-                        }.items():
-                            totals[column] = int(float(reaction_values.get(reaction_key) or 0))
-                    else:
-                        totals[target_name] = int(float(value or 0))
-                    resolved = True
-                if resolved:
+                if self._apply_graph_insight_payload(totals, target_name, response.json()):
                     break
         return totals
 
@@ -1876,6 +2151,155 @@ class ExternalApiExtractor:
             totals[target_name] = self._facebook_summary_count(payload)
         return totals
 
+    @staticmethod
+    def _apply_graph_insight_payload(totals: dict[str, int], target_name: str, payload: dict) -> bool:
+        """Copy one ``/insights`` response into ``totals``; return whether the metric resolved."""
+        resolved = False
+        for metric_payload in payload.get("data", []):
+            values = metric_payload.get("values") or []
+            value = values[0].get("value") if values else 0
+            if target_name == "post_reactions_by_type_total":
+                reaction_values = value if isinstance(value, dict) else {}
+                for reaction_key, column in FACEBOOK_REACTION_COLUMNS.items():
+                    totals[column] = int(float(reaction_values.get(reaction_key) or 0))
+            else:
+                totals[target_name] = int(float(value or 0))
+            resolved = True
+        return resolved
+
+    async def _graph_batch_get(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        base_url: str,
+        access_token: str,
+        relative_urls: list[str],
+        semaphore: asyncio.Semaphore,
+        raise_api_error,
+    ) -> list[tuple[int, dict]]:
+        """Run GET sub-requests through the Graph API ``batch`` endpoint.
+
+        Sub-requests are sent at most ``GRAPH_BATCH_MAX_REQUESTS`` per HTTP call.
+        Each one maps to ``(status_code, body)`` in input order, so a failing
+        media only fails its own entries; timed-out sub-requests come back as
+        status ``0``. Raises ``ValueError`` when a batch call itself is rejected.
+        """
+
+        async def run_chunk(chunk: list[str]) -> list[tuple[int, dict]]:
+            async with semaphore:
+                response = await client.post(
+                    f"{base_url}/",
+                    data={
+                        "access_token": access_token,
+                        "include_headers": "false",
+                        "batch": json.dumps([{"method": "GET", "relative_url": url} for url in chunk]),
+                    },
+                )
+            if response.status_code >= 400:
+                raise_api_error(response, "batch")
+            items = response.json()
+            if not isinstance(items, list) or len(items) != len(chunk):
+                raise ValueError("Graph batch response did not match the number of sub-requests.")
+            results: list[tuple[int, dict]] = []
+            for item in items:
+                if not isinstance(item, dict):
+                    results.append((0, {}))
+                    continue
+                try:
+                    body = json.loads(item.get("body") or "{}")
+                except ValueError:
+                    body = {}
+                results.append((int(item.get("code") or 0), body if isinstance(body, dict) else {}))
+            return results
+
+        chunks = [
+            relative_urls[index:index + GRAPH_BATCH_MAX_REQUESTS]
+            for index in range(0, len(relative_urls), GRAPH_BATCH_MAX_REQUESTS)
+        ]
+        chunk_results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+        return [result for chunk_result in chunk_results for result in chunk_result]
+
+    async def _fetch_graph_insight_metrics_batch(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        base_url: str,
+        access_token: str,
+        object_ids: list[str],
+        metric_aliases: dict[str, tuple[str, ...]],
+        semaphore: asyncio.Semaphore,
+        raise_api_error,
+    ) -> dict[str, dict[str, int]]:
+        """Batched equivalent of the per-object ``/insights`` alias loops.
+
+        Every unresolved metric is retried with its next alias in a later round,
+        mirroring the per-object fallback order.
+        """
+        totals: dict[str, dict[str, int]] = {object_id: {} for object_id in object_ids if object_id}
+        pending = [
+            (object_id, target_name, candidates)
+            for object_id in totals
+            for target_name, candidates in metric_aliases.items()
+        ]
+        alias_index = 0
+        while pending:
+            requests = [item for item in pending if alias_index < len(item[2])]
+            if not requests:
+                break
+            responses = await self._graph_batch_get(
+                client=client,
+                base_url=base_url,
+                access_token=access_token,
+                relative_urls=[
+                    f"{object_id}/insights?{urlencode({'metric': candidates[alias_index]})}"
+                    for object_id, _target_name, candidates in requests
+                ],
+                semaphore=semaphore,
+                raise_api_error=raise_api_error,
+            )
+            pending = []
+            for (object_id, target_name, candidates), (status_code, body) in zip(requests, responses):
+                if 200 <= status_code < 300 and self._apply_graph_insight_payload(
+                    totals[object_id], target_name, body
+                ):
+                    continue
+                pending.append((object_id, target_name, candidates))
+            alias_index += 1
+        return totals
+
+    async def _fetch_facebook_post_social_counts_batch(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        base_url: str,
+        access_token: str,
+        post_ids: list[str],
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, dict[str, int]]:
+        """Batched equivalent of :meth:`_fetch_facebook_post_social_counts`."""
+        requests = [
+            (post_id, edge)
+            for post_id in post_ids
+            if post_id
+            for edge in ("likes", "comments")
+        ]
+        responses = await self._graph_batch_get(
+            client=client,
+            base_url=base_url,
+            access_token=access_token,
+            relative_urls=[
+                f"{post_id}/{edge}?{urlencode({'summary': 'true', 'limit': 0})}"
+                for post_id, edge in requests
+            ],
+            semaphore=semaphore,
+            raise_api_error=self._raise_facebook_api_error,
+        )
+        totals: dict[str, dict[str, int]] = {post_id: {} for post_id in post_ids if post_id}
+        for (post_id, edge), (status_code, body) in zip(requests, responses):
+            if 200 <= status_code < 300:
+                totals[post_id][edge] = self._facebook_summary_count(body)
+        return totals
+
     async def _refresh_tiktok_access_token(self, client: httpx.AsyncClient) -> str:
         """Exchange the stored TikTok refresh token for a new access token."""
         refresh_token = await self._load_managed_secret("tiktok_refresh_token")
@@ -2015,14 +2439,15 @@ class ExternalApiExtractor:
                 break
         return totals, access_token
 
-    async def _fetch_tiktok_video_rows(
+    async def _tiktok_video_pages(
         self,
         *,
         client: httpx.AsyncClient,
         access_token: str,
         start_date: date,
         end_date: date,
-    ) -> tuple[list[dict], str]:
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of videos created inside the ETL window, newest first."""
         fields = ",".join(
             [
                 "id",
@@ -2037,7 +2462,6 @@ class ExternalApiExtractor:
                 "share_count",
             ]
         )
-        rows: list[dict] = []
         cursor = None
         has_more = True
         page_count = 0
@@ -2057,6 +2481,7 @@ class ExternalApiExtractor:
                 headers={"Content-Type": "application/json"},
             )
             data = payload.get("data") or {}
+            rows: list[dict] = []
             for video in data.get("videos") or []:
                 created_at = self._parse_tiktok_create_time(video.get("create_time"))
                 if created_at is None:
@@ -2089,13 +2514,13 @@ class ExternalApiExtractor:
                         "engagement_rate": (engagement / views * 100) if views else 0.0,
                     }
                 )
+            yield rows
 
             has_more = bool(data.get("has_more"))
             cursor = data.get("cursor")
             page_count += 1
             if reached_older_video or (has_more and cursor is None):
                 break
-        return rows, access_token
 
     async def fetch_tiktok_insights(self, start_date: date, end_date: date) -> list[dict]:
         """Fetch TikTok account-level snapshot metrics for the reporting window end date."""
@@ -2109,7 +2534,7 @@ class ExternalApiExtractor:
                 "Connect the account from the TikTok Token page or set fallback TIKTOK_ACCESS_TOKEN."
             )
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with self._http_session() as client:
             user, access_token = await self._fetch_tiktok_user_info(
                 client=client,
                 access_token=access_token,
@@ -2147,14 +2572,18 @@ class ExternalApiExtractor:
                 "Connect the account from the TikTok Token page or set fallback TIKTOK_ACCESS_TOKEN."
             )
 
-        async with httpx.AsyncClient(timeout=120) as client:
-            rows, _access_token = await self._fetch_tiktok_video_rows(
-                client=client,
-                access_token=access_token,
-                start_date=start_date,
-                end_date=end_date,
-            )
-        return rows
+        async with self._http_session() as client:
+            # Video list pages already carry lifetime metrics, so there is nothing to enrich.
+            return [
+                row
+                async for page in self._tiktok_video_pages(
+                    client=client,
+                    access_token=access_token,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                for row in page
+            ]
 
     @staticmethod
     def _parse_tiktok_create_time(value) -> datetime | None:
@@ -2184,14 +2613,11 @@ class ExternalApiExtractor:
                 "Required env vars: GSHEET_SA_CREDS and FIRST_DEPOSIT_SHEET_ID."
             )
 
-        def _request():
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.first_deposit_sheet_id,
-                range=self.first_deposit_sheet_range,
-            ).execute()
-            return result.get("values", [])
-
-        values = await asyncio.to_thread(_request)
+        values = await self.sheet_snapshots.get_values(
+            self.service,
+            self.first_deposit_sheet_id,
+            self.first_deposit_sheet_range,
+        )
         if not values:
             return []
 
@@ -2237,14 +2663,11 @@ class ExternalApiExtractor:
                 "Required env vars: GSHEET_SA_CREDS and FIRST_DEPOSIT_SHEET_ID."
             )
 
-        def _request():
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.first_deposit_sheet_id,
-                range=self.ms_deposit_sheet_range,
-            ).execute()
-            return result.get("values", [])
-
-        values = await asyncio.to_thread(_request)
+        values = await self.sheet_snapshots.get_values(
+            self.service,
+            self.first_deposit_sheet_id,
+            self.ms_deposit_sheet_range,
+        )
         if not values:
             return []
 
@@ -2281,14 +2704,11 @@ class ExternalApiExtractor:
                 "Required env vars: GSHEET_SA_CREDS and DAILY_REGIS_SHEET_ID."
             )
 
-        def _request():
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.daily_regis_sheet_id,
-                range=self.daily_regis_sheet_range,
-            ).execute()
-            return result.get("values", [])
-
-        return await asyncio.to_thread(_request)
+        return await self.sheet_snapshots.get_values(
+            self.service,
+            self.daily_regis_sheet_id,
+            self.daily_regis_sheet_range,
+        )
 
     async def fetch_play_console_install_rows(self, start_date: date, end_date: date) -> list[dict]:
         """Fetch Google Play Console install/acquisition report rows from GCS exports."""
@@ -2305,33 +2725,98 @@ class ExternalApiExtractor:
                 "(example: pubsite_prod_rev_XXXXXXXXXXXX)."
             )
 
-        return await asyncio.to_thread(
-            self._fetch_play_console_install_rows_sync,
-            start_date,
-            end_date,
-        )
-
-    def _fetch_play_console_install_rows_sync(self, start_date: date, end_date: date) -> list[dict]:
-        month_tokens = _play_console_month_tokens(start_date, end_date)
-        objects = [
-            object_name
-            for object_name in self._list_play_console_report_objects()
-            if self._is_play_console_install_overview_object(object_name)
-            and any(token in object_name for token in month_tokens)
-        ]
+        objects = await asyncio.to_thread(self._list_play_console_install_objects, start_date, end_date)
         if not objects:
             return []
 
+        bucket = self.play_console_report_bucket
+        rows_by_object: dict[str, list[dict]] = {}
+        async with sqlite_async_session() as session:
+            manifest = await load_gcs_manifest(session, bucket, [item["name"] for item in objects])
+            for item in objects:
+                entry = manifest.get(item["name"])
+                if not gcs_object_unchanged(entry, item):
+                    continue
+                stored_rows = await self._play_console_loaded_rows(session, item["name"])
+                # Reuse the loaded rows only while they still match what the object held.
+                if stored_rows and _play_console_rows_summary(stored_rows) == (entry.row_count, entry.content_hash):
+                    rows_by_object[item["name"]] = stored_rows
+        changed = [item for item in objects if item["name"] not in rows_by_object]
+        downloaded = await self._download_play_console_objects([item["name"] for item in changed])
+        if changed:
+            await self._save_play_console_manifest(
+                bucket,
+                [(item, *_play_console_rows_summary(downloaded[item["name"]])) for item in changed],
+            )
+        rows_by_object.update(downloaded)
+        logger.info(
+            "Play Console reports: %s objects, %s unchanged, %s downloaded",
+            len(objects),
+            len(objects) - len(changed),
+            len(changed),
+        )
+
         rows: list[dict] = []
-        for object_name in objects:
-            object_rows = self._download_play_console_csv(object_name)
-            if not object_rows:
-                continue
-            for row in object_rows:
-                row["source_object"] = object_name
-                rows.append(row)
+        for item in objects:
+            for row in rows_by_object[item["name"]]:
+                rows.append({**row, "source_object": item["name"]})
         return rows
 
+    async def _play_console_loaded_rows(self, session: AsyncSession, object_name: str) -> list[dict]:
+        """Rebuild the rows a monthly export loaded from ``play_console_install_metrics``."""
+        month = _play_console_object_month(object_name)
+        if month is None:
+            return []
+        month_start, month_end = month
+        result = await session.execute(
+            select(
+                PlayConsoleInstallMetrics.date,
+                PlayConsoleInstallMetrics.package_name,
+                PlayConsoleInstallMetrics.country,
+                PlayConsoleInstallMetrics.installers,
+                PlayConsoleInstallMetrics.uninstallers,
+                PlayConsoleInstallMetrics.active_devices,
+            ).where(
+                PlayConsoleInstallMetrics.date.between(month_start, month_end),
+                PlayConsoleInstallMetrics.package_name == self.play_console_package_name,
+            )
+        )
+        return [
+            {
+                "date": row.date.isoformat(),
+                "package_name": row.package_name,
+                "country": row.country,
+                "installers": row.installers,
+                "uninstallers": row.uninstallers,
+                "active_devices": row.active_devices,
+            }
+            for row in result
+        ]
+
+    async def _save_play_console_manifest(self, bucket: str, downloads: list[tuple[dict, int, str]]) -> None:
+        """Record downloaded object versions through the shared SQLite writer."""
+
+        async def _save(write_session: AsyncSession) -> None:
+            await save_gcs_manifest(write_session, bucket, downloads)
+            await write_session.commit()
+
+        if self.write_queue is not None:
+            await self.write_queue.submit(_save)
+            return
+        async with SQLITE_WRITE_LOCK:
+            async with sqlite_async_session() as session:
+                await _save(session)
+
+    def _list_play_console_install_objects(self, start_date: date, end_date: date) -> list[dict]:
+        """List install overview exports whose month overlaps the requested window."""
+        month_tokens = _play_console_month_tokens(start_date, end_date)
+        return [
+            item
+            for item in self._list_play_console_report_objects()
+            if self._is_play_console_install_overview_object(item["name"])
+            and any(token in item["name"] for token in month_tokens)
+        ]
+
     @staticmethod
     def _is_play_console_install_overview_object(object_name: str) -> bool:
         normalized = object_name.lower()
@@ -2340,8 +2825,9 @@ class ExternalApiExtractor:
             and normalized.endswith("_overview.csv")
         )
 
-    def _list_play_console_report_objects(self) -> list[str]:
-        object_names: list[str] = []
+    def _list_play_console_report_objects(self) -> list[dict]:
+        """Return ``objects().list`` items (name, generation, md5Hash, ...) sorted by name."""
+        items_by_name: dict[str, dict] = {}
         for prefix in self.play_console_report_prefixes:
             page_token = None
             while True:
@@ -2357,24 +2843,52 @@ class ExternalApiExtractor:
                         continue
                     if self.play_console_package_name and self.play_console_package_name not in name:
                         continue
-                    object_names.append(name)
+                    items_by_name[name] = item
                 page_token = response.get("nextPageToken")
                 if not page_token:
                     break
-        return sorted(set(object_names))
+        return [items_by_name[name] for name in sorted(items_by_name)]
+
+    async def _download_play_console_objects(self, object_names: list[str]) -> dict[str, list[dict]]:
+        """Download and decode changed report objects in parallel worker threads."""
+        if not object_names:
+            return {}
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(self.play_console_download_workers, len(object_names))),
+            thread_name_prefix="play-console-gcs",
+        )
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(pool, self._download_play_console_csv, name) for name in object_names)
+            )
+        finally:
+            # Do not block the event loop on downloads still running after a failure.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return dict(zip(object_names, results))
+
+    def _play_console_thread_http(self):
+        """Return this worker thread's authorized HTTP transport (``httplib2`` is not thread-safe)."""
+        http = getattr(self._play_console_thread_local, "http", None)
+        if http is None:
+            http = self._play_console_thread_local.http = AuthorizedHttp(
+                self.play_console_credentials,
+                http=build_http(),
+            )
+        return http
 
     def _download_play_console_csv(self, object_name: str) -> list[dict]:
         request = self.play_console_storage_service.objects().get_media(
             bucket=self.play_console_report_bucket,
             object=object_name,
         )
-        buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
-        done = False
-        while not done:
-            _status, done = downloader.next_chunk()
-        payload = buffer.getvalue()
-        if object_name.lower().endswith(".gz"):
-            payload = gzip.decompress(payload)
-        text = _decode_play_console_csv_payload(payload)
-        return list(csv.DictReader(io.StringIO(text)))
+        if self.play_console_credentials is not None:
+            request.http = self._play_console_thread_http()
+        # Spooled to disk past 8 MiB so large exports are not held in one bytes buffer.
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as buffer:
+            downloader = MediaIoBaseDownload(buffer, request)
+            done = False
+            while not done:
+                _status, done = downloader.next_chunk()
+            buffer.seek(0)
+            return _read_play_console_csv(buffer, gzipped=object_name.lower().endswith(".gz"))
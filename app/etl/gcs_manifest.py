@@ -0,0 +1,96 @@
+"""Per-object manifest so unchanged GCS report exports are not re-downloaded."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.etl_run import EtlGcsObjectManifest
+
+
+def gcs_object_fingerprint(item: dict[str, Any]) -> tuple[str, str | None]:
+    """Return the ``(generation, content hash)`` identifying one object version.
+
+    ``item`` is an entry of a GCS ``objects().list`` response. Composite
+    objects have no ``md5Hash``, so their ``etag`` stands in for it.
+    """
+    return str(item.get("generation") or ""), item.get("md5Hash") or item.get("etag")
+
+
+def gcs_object_unchanged(entry: EtlGcsObjectManifest | None, item: dict[str, Any]) -> bool:
+    """Return whether ``item`` is the same object version recorded in ``entry``."""
+    if entry is None:
+        return False
+    generation, content_hash = gcs_object_fingerprint(item)
+    if not generation or generation != entry.generation:
+        return False
+    return content_hash == (entry.md5_hash or entry.etag)
+
+
+async def load_gcs_manifest(
+    session: AsyncSession,
+    bucket: str,
+    object_names: Sequence[str],
+) -> dict[str, EtlGcsObjectManifest]:
+    """Load manifest entries for ``object_names`` keyed by object name."""
+    if not object_names:
+        return {}
+    result = await session.execute(
+        select(EtlGcsObjectManifest).where(
+            EtlGcsObjectManifest.bucket == bucket,
+            EtlGcsObjectManifest.object_name.in_(list(object_names)),
+        )
+    )
+    return {entry.object_name: entry for entry in result.scalars()}
+
+
+async def save_gcs_manifest(
+    session: AsyncSession,
+    bucket: str,
+    downloads: Iterable[tuple[dict[str, Any], int, str]],
+) -> int:
+    """Upsert manifest entries for freshly downloaded objects in the caller's transaction.
+
+    Args:
+        session (AsyncSession): Session the caller commits.
+        bucket (str): Bucket the objects were listed from.
+        downloads (Iterable[tuple[dict, int, str]]): ``objects().list`` item,
+            normalized row count and content hash of each downloaded object.
+
+    Returns:
+        int: Number of manifest entries written.
+    """
+    timestamp = datetime.now()
+    values = [
+        {
+            "bucket": bucket,
+            "object_name": item["name"],
+            "generation": str(item.get("generation") or ""),
+            "etag": item.get("etag"),
+            "md5_hash": item.get("md5Hash"),
+            "size_bytes": int(item["size"]) if item.get("size") is not None else None,
+            "row_count": row_count,
+            "content_hash": content_hash,
+            "updated_at": timestamp,
+        }
+        for item, row_count, content_hash in downloads
+    ]
+    if not values:
+        return 0
+    insert_stmt = sqlite_insert(EtlGcsObjectManifest).values(values)
+    await session.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=["bucket", "object_name"],
+            set_={
+                column: insert_stmt.excluded[column]
+                for column in values[0]
+                if column not in {"bucket", "object_name"}
+            },
+        )
+    )
+    return len(values)
@@ -0,0 +1,480 @@
+"""Long-lived HTTP clients shared by ETL extractors within one batch."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import importlib.util
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic, perf_counter
+from typing import Any
+
+import httpx
+from decouple import config
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, retry_if_result, stop_after_attempt
+from tenacity.wait import wait_exponential_jitter
+
+_REQUEST_SCOPE: contextvars.ContextVar[str | None] = contextvars.ContextVar("etl_http_scope", default=None)
+
+# Rate-limit headers Meta attaches to Graph and Marketing API responses.
+META_USAGE_HEADERS = ("x-app-usage", "x-page-usage", "x-ad-account-usage", "x-business-use-case-usage")
+# 429/503 mean the request was not processed, so they are safe to resend for any method.
+RETRYABLE_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset({502, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Raised before the request reached the server, so they are safe to resend for any method.
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def http2_available() -> bool:
+    """Return whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class HostCounters:
+    """Request count and latency totals for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    retries: int = 0
+    throttled: int = 0
+
+    def record(self, latency_ms: float, *, failed: bool, throttled: bool = False) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.throttled += int(throttled)
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "avg_latency_ms": round(self.total_latency_ms / self.requests, 1) if self.requests else 0.0,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
+@dataclass(frozen=True)
+class ThrottleSignal:
+    """Rate-limit feedback extracted from one response.
+
+    ``usage_pct`` is the highest quota usage the API reported (Meta usage
+    headers), ``pause_seconds`` how long the host asked callers to back off.
+    """
+
+    throttled: bool = False
+    usage_pct: float | None = None
+    pause_seconds: float | None = None
+
+
+def _usage_values(payload: Any) -> Iterator[tuple[str, float]]:
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            if isinstance(value, (dict, list)):
+                yield from _usage_values(value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                yield key, float(value)
+    elif isinstance(payload, list):
+        for item in payload:
+            yield from _usage_values(item)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def throttle_signal(response: httpx.Response, *, usage_high_watermark: float = 85.0) -> ThrottleSignal:
+    """Read throttling hints from ``Retry-After`` and Meta's usage headers.
+
+    Meta reports ``call_count``/``total_time``/``total_cputime`` percentages
+    (``acc_id_util_pct`` for ad accounts) plus an estimated time to regain
+    access in minutes (``reset_time_duration`` in seconds for ad accounts).
+    A 429 or usage at or above ``usage_high_watermark`` counts as throttled.
+    """
+    usage_pct: float | None = None
+    pause_seconds = _parse_retry_after(response.headers.get("retry-after"))
+    for header in META_USAGE_HEADERS:
+        raw_value = response.headers.get(header)
+        if not raw_value:
+            continue
+        try:
+            payload = json.loads(raw_value)
+        except ValueError:
+            continue
+        for key, value in _usage_values(payload):
+            if key == "estimated_time_to_regain_access":
+                if value > 0:
+                    pause_seconds = max(pause_seconds or 0.0, value * 60)
+            elif key == "reset_time_duration":
+                # Only a hint to pause once the ad account is actually exhausted.
+                continue
+            else:
+                usage_pct = value if usage_pct is None else max(usage_pct, value)
+        if header == "x-ad-account-usage" and isinstance(payload, dict) and float(payload.get("acc_id_util_pct") or 0) >= 100:
+            reset_seconds = float(payload.get("reset_time_duration") or 0)
+            if reset_seconds > 0:
+                pause_seconds = max(pause_seconds or 0.0, reset_seconds)
+    throttled = response.status_code == 429 or (usage_pct is not None and usage_pct >= usage_high_watermark)
+    return ThrottleSignal(throttled=throttled, usage_pct=usage_pct, pause_seconds=pause_seconds)
+
+
+class AdaptiveHostLimiter:
+    """AIMD concurrency window with token-bucket pacing for one host.
+
+    The window starts at ``max_concurrency``, grows by ``1 / window`` per
+    unthrottled response and halves on a throttle signal, at most once per
+    window of requests so a burst of 429s from one wave only backs off once.
+    When ``rate_per_second`` is set, a token bucket paces request starts at
+    that rate scaled by the current window. ``Retry-After`` and Meta's
+    regain-access hints pause the whole host, capped at ``max_pause_seconds``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        rate_per_second: float = 0.0,
+        max_pause_seconds: float = 300.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = min(max(1, int(min_concurrency)), self.max_concurrency)
+        self.rate_per_second = max(0.0, float(rate_per_second))
+        self.max_pause_seconds = max(0.0, float(max_pause_seconds))
+        self.limit = float(self.max_concurrency)
+        self.decreases = 0
+        self._clock = clock
+        self._in_flight = 0
+        self._sequence = 0
+        self._decrease_fence = 0
+        self._paused_until = 0.0
+        self._burst = max(1.0, self.rate_per_second)
+        self._tokens = self._burst
+        self._refilled_at = clock()
+        self._waiters: list[asyncio.Future] = []
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _refill(self, now: float) -> float:
+        rate = self.rate_per_second * self.limit / self.max_concurrency
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        return rate
+
+    def _admission_delay(self, now: float) -> float | None:
+        """Return 0 when a request may start, seconds to wait, or ``None`` to wait for a release."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= int(self.limit):
+            return None
+        if self.rate_per_second:
+            rate = self._refill(now)
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / rate
+        return 0.0
+
+    async def acquire(self) -> int:
+        """Wait for a slot and return a ticket to pass to :meth:`release`."""
+        while True:
+            delay = self._admission_delay(self._clock())
+            if delay == 0.0:
+                if self.rate_per_second:
+                    self._tokens -= 1.0
+                self._in_flight += 1
+                self._sequence += 1
+                return self._sequence
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout=delay)
+            except TimeoutError:
+                pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(self, ticket: int, signal: ThrottleSignal | None = None) -> None:
+        """Free a slot and adapt the window to the response's throttle feedback.
+
+        ``signal`` is ``None`` when the request failed without a response; the
+        window is then left unchanged.
+        """
+        self._in_flight -= 1
+        if signal is not None:
+            if signal.pause_seconds:
+                pause = min(signal.pause_seconds, self.max_pause_seconds)
+                self._paused_until = max(self._paused_until, self._clock() + pause)
+            if signal.throttled:
+                # Responses to requests started before the last decrease saw the old window.
+                if ticket > self._decrease_fence:
+                    self.limit = max(float(self.min_concurrency), self.limit / 2)
+                    self._decrease_fence = self._sequence
+                    self.decreases += 1
+            else:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+class _PerHostTransport(httpx.AsyncBaseTransport):
+    """Route each request to a keep-alive transport dedicated to its host."""
+
+    def __init__(self, registry: HttpClientRegistry) -> None:
+        self._registry = registry
+        self._transports: dict[str, httpx.AsyncBaseTransport] = {}
+
+    def _new_transport(self, host: str) -> httpx.AsyncBaseTransport:
+        del host
+        return httpx.AsyncHTTPTransport(
+            http2=self._registry.http2,
+            limits=httpx.Limits(
+                max_connections=self._registry.max_connections_per_host,
+                max_keepalive_connections=self._registry.max_connections_per_host,
+                keepalive_expiry=self._registry.keepalive_expiry,
+            ),
+        )
+
+    def _transport_for(self, host: str) -> httpx.AsyncBaseTransport:
+        transport = self._transports.get(host)
+        if transport is None:
+            transport = self._transports[host] = self._new_transport(host)
+        return transport
+
+    async def _send_once(self, request: httpx.Request, host: str, limiter: AdaptiveHostLimiter) -> httpx.Response:
+        ticket = await limiter.acquire()
+        started = perf_counter()
+        try:
+            response = await self._transport_for(host).handle_async_request(request)
+        except Exception:
+            limiter.release(ticket)
+            self._registry.record(host, (perf_counter() - started) * 1000, failed=True)
+            raise
+        signal = throttle_signal(response, usage_high_watermark=self._registry.usage_high_watermark)
+        limiter.release(ticket, signal)
+        # Latency is time to response headers; bodies are streamed afterwards.
+        self._registry.record(
+            host,
+            (perf_counter() - started) * 1000,
+            failed=response.status_code >= 400,
+            throttled=signal.throttled,
+        )
+        return response
+
+    def _is_transient_response(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            return True
+        if response.status_code in IDEMPOTENT_RETRYABLE_STATUS_CODES:
+            return request.method in IDEMPOTENT_METHODS
+        if response.status_code >= 400:
+            # Meta answers exhausted quotas with 4xx error codes 4/17/32/613 and 100% usage.
+            usage_pct = throttle_signal(response).usage_pct
+            return usage_pct is not None and usage_pct >= 100
+        return False
+
+    @staticmethod
+    def _is_transient_error(request: httpx.Request, error: BaseException) -> bool:
+        if isinstance(error, UNSENT_REQUEST_ERRORS):
+            return True
+        return isinstance(error, httpx.TransportError) and request.method in IDEMPOTENT_METHODS
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        limiter = self._registry.limiter(host)
+        if self._registry.retry_attempts <= 1 or not isinstance(request.stream, httpx.ByteStream):
+            # Streamed request bodies cannot be replayed.
+            return await self._send_once(request, host, limiter)
+
+        async def close_discarded(retry_state: RetryCallState) -> None:
+            self._registry.record_retry(host)
+            if not retry_state.outcome.failed:
+                await retry_state.outcome.result().aclose()
+
+        retrying = AsyncRetrying(
+            retry=(
+                retry_if_result(lambda response: self._is_transient_response(request, response))
+                | retry_if_exception(lambda error: self._is_transient_error(request, error))
+            ),
+            # The budget check runs only when a retry is wanted and spends one retry.
+            stop=stop_after_attempt(self._registry.retry_attempts) | (lambda _state: not self._registry.take_retry(host)),
+            wait=wait_exponential_jitter(
+                initial=self._registry.retry_backoff_seconds,
+                max=30,
+                jitter=self._registry.retry_backoff_seconds,
+            ),
+            before_sleep=close_discarded,
+            # Out of attempts or budget: hand back the last response, or raise its error.
+            retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+        )
+        return await retrying(self._send_once, request, host, limiter)
+
+    async def aclose(self) -> None:
+        transports, self._transports = list(self._transports.values()), {}
+        for transport in transports:
+            await transport.aclose()
+
+
+class HttpClientRegistry:
+    """Extractor-scoped ``httpx`` client with per-host pools, limits and counters.
+
+    One ``AsyncClient`` is created lazily and kept open until :meth:`aclose`,
+    so sources in the same ETL batch reuse TLS sessions and keep-alive
+    connections. Every host gets its own connection pool bounded by
+    ``max_connections_per_host``; HTTP/2 is used when ``h2`` is installed.
+    Request counters are kept per host and per scope (usually an ETL run id,
+    see :meth:`scope`) so concurrent sources report their own traffic.
+
+    Requests to each host also pass through an :class:`AdaptiveHostLimiter`
+    whose window never exceeds ``max_connections_per_host``. Throttled (429,
+    503, exhausted Meta quota) and transient transport failures are retried
+    with jittered exponential backoff, up to ``retry_attempts`` per request
+    and ``retry_budget`` retries per host for the registry's lifetime, so a
+    throttled API slows the batch down instead of failing it outright.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 120.0,
+        max_connections_per_host: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool | None = None,
+        retry_attempts: int = 4,
+        retry_budget: int = 50,
+        retry_backoff_seconds: float = 1.0,
+        rate_per_second: float = 0.0,
+        usage_high_watermark: float = 85.0,
+        max_pause_seconds: float = 300.0,
+    ) -> None:
+        self.timeout = timeout
+        self.max_connections_per_host = max(1, int(max_connections_per_host))
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2_available() if http2 is None else bool(http2) and http2_available()
+        self.retry_attempts = max(1, int(retry_attempts))
+        self.retry_budget = max(0, int(retry_budget))
+        self.retry_backoff_seconds = max(0.0, float(retry_backoff_seconds))
+        self.rate_per_second = max(0.0, float(rate_per_second))
+        self.usage_high_watermark = float(usage_high_watermark)
+        self.max_pause_seconds = max(0.0, float(max_pause_seconds))
+        self._client: httpx.AsyncClient | None = None
+        self._counters: dict[str | None, dict[str, HostCounters]] = {}
+        self._limiters: dict[str, AdaptiveHostLimiter] = {}
+        self._retries_spent: dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> HttpClientRegistry:
+        """Build a registry configured by the ``ETL_HTTP_*`` environment variables."""
+        return cls(
+            max_connections_per_host=config("ETL_HTTP_MAX_CONNECTIONS_PER_HOST", default=10, cast=int),
+            retry_attempts=config("ETL_HTTP_RETRY_ATTEMPTS", default=4, cast=int),
+            retry_budget=config("ETL_HTTP_RETRY_BUDGET", default=50, cast=int),
+            rate_per_second=config("ETL_HTTP_HOST_RATE_PER_SECOND", default=0.0, cast=float),
+            usage_high_watermark=config("ETL_HTTP_USAGE_HIGH_WATERMARK", default=85.0, cast=float),
+            max_pause_seconds=config("ETL_HTTP_MAX_PAUSE_SECONDS", default=300.0, cast=float),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                transport=_PerHostTransport(self),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared client without closing it on exit."""
+        yield self.client
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """Attribute requests made inside this context (and its tasks) to ``name``."""
+        token = _REQUEST_SCOPE.set(name)
+        try:
+            yield
+        finally:
+            _REQUEST_SCOPE.reset(token)
+
+    def limiter(self, host: str) -> AdaptiveHostLimiter:
+        """Return the adaptive limiter shared by every request to ``host``."""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = AdaptiveHostLimiter(
+                max_concurrency=self.max_connections_per_host,
+                rate_per_second=self.rate_per_second,
+                max_pause_seconds=self.max_pause_seconds,
+            )
+        return limiter
+
+    def take_retry(self, host: str) -> bool:
+        """Spend one retry from ``host``'s budget; ``False`` once it is exhausted."""
+        spent = self._retries_spent.get(host, 0)
+        if spent >= self.retry_budget:
+            return False
+        self._retries_spent[host] = spent + 1
+        return True
+
+    def _host_counters(self, host: str) -> HostCounters:
+        return self._counters.setdefault(_REQUEST_SCOPE.get(), {}).setdefault(host, HostCounters())
+
+    def record(self, host: str, latency_ms: float, *, failed: bool, throttled: bool = False) -> None:
+        self._host_counters(host).record(latency_ms, failed=failed, throttled=throttled)
+
+    def record_retry(self, host: str) -> None:
+        self._host_counters(host).retries += 1
+
+    def host_stats(self, scope: str | None = None) -> dict[str, dict[str, Any]]:
+        """Return per-host counters recorded under ``scope`` and each host's current window."""
+        stats = {}
+        for host, counters in sorted(self._counters.get(scope, {}).items()):
+            stats[host] = counters.as_dict()
+            limiter = self._limiters.get(host)
+            if limiter is not None:
+                stats[host]["concurrency_limit"] = round(limiter.limit, 1)
+        return stats
+
+    def pop_host_stats(self, scope: str | None = None) -> dict[str, dict[str, Any]]:
+        """Return and forget per-host counters recorded under ``scope``."""
+        stats = self.host_stats(scope)
+        self._counters.pop(scope, None)
+        return stats
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> HttpClientRegistry:
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.aclose()
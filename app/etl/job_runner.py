@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
 from time import perf_counter
 from typing import Any
 
@@ -33,12 +34,17 @@ from app.db.models.external_api import (
     YouTubeMediaInsight,
 )
 from app.db.session import sqlite_async_session
+from app.etl.http_clients import HttpClientRegistry
 from app.etl.load import rebuild_unique_campaign
+from app.etl.pipeline_core import LOAD_OUTCOME_SKIPPED_UNCHANGED, SQLITE_WRITE_LOCK, SqliteWriteQueue
 from app.etl.pipelines import GoogleSheetApi
 from app.etl.run_report import build_quality_report
+from app.etl.sheet_snapshot import SheetSnapshotCache
 from app.etl.transform import resolve_date_window
-from app.utils.analytics_cache import clear_campaign_analytics_cache
+from app.utils.analytics_cache import invalidate_campaign_analytics_cache
 from app.utils.etl_run_utils import (
+    STATUS_SKIPPED_UNCHANGED,
+    STATUS_SUCCESS,
     cleanup_stale_runs,
     complete_run,
     fail_run,
@@ -73,14 +79,19 @@ PipelineExecutor = Callable[[GoogleSheetApi, Any, str, Any, Any, str], Awaitable
 
 
 async def _run_unique_campaign(
-    _gsheet: GoogleSheetApi,
+    gsheet: GoogleSheetApi,
     session,
     _types: str,
     _start_date,
     _end_date,
     _run_id: str,
 ) -> str:
-    return await rebuild_unique_campaign(session=session)
+    if gsheet.write_queue is not None:
+        return await gsheet.write_queue.submit(
+            lambda write_session: rebuild_unique_campaign(session=write_session)
+        )
+    async with SQLITE_WRITE_LOCK:
+        return await rebuild_unique_campaign(session=session)
 
 
 async def _run_google_ads(
@@ -479,6 +490,9 @@ async def execute_update_job(
     types: str,
     start_date,
     end_date,
+    write_queue: SqliteWriteQueue | None = None,
+    sheet_snapshots: SheetSnapshotCache | None = None,
+    http_clients: HttpClientRegistry | None = None,
 ) -> dict[str, Any]:
     """Execute one ETL task and persist lifecycle status into ``etl_run``.
 
@@ -488,6 +502,12 @@ async def execute_update_job(
         types (str): Trigger mode that influences date-window resolution.
         start_date: Optional requested start date.
         end_date: Optional requested end date.
+        write_queue (SqliteWriteQueue | None): Shared writer used by batch runs
+            so staging and final loads are applied by one writer task.
+        sheet_snapshots (SheetSnapshotCache | None): Batch-scoped Google Sheets
+            snapshots shared by sources that read the same spreadsheet tab.
+        http_clients (HttpClientRegistry | None): Batch-scoped HTTP clients reused
+            across sources. A run-scoped registry is created and closed when omitted.
 
     Returns:
         dict[str, Any]: Structured result payload describing whether the job
@@ -506,6 +526,11 @@ async def execute_update_job(
     )
 
     started_perf = perf_counter()
+    owns_http_clients = http_clients is None
+    if http_clients is None:
+        http_clients = HttpClientRegistry.from_env()
+    # A run-scoped registry closes with this run; a batch registry outlives it.
+    http_clients_lifetime = http_clients if owns_http_clients else nullcontext()
 
     def _duration_ms() -> int:
         return int((perf_counter() - started_perf) * 1000)
@@ -515,22 +540,29 @@ async def execute_update_job(
         *,
         duration_ms: int,
         rows_loaded: int | None,
+        status: str = STATUS_SUCCESS,
+        load_counts: dict[str, dict[str, int]] | None = None,
+        changed_tables: tuple[str, ...] = (),
     ) -> None:
         quality_report = build_quality_report(
             source=data,
-            status="success",
+            status=status,
             message=message,
             rows_loaded=rows_loaded,
             duration_ms=duration_ms,
+            http_hosts=http_clients.pop_host_stats(run_id),
+            load_counts=load_counts,
         )
         async with sqlite_async_session() as status_session:
             await complete_run(
                 session=status_session,
                 run_id=run_id,
+                status=status,
                 message=message,
                 rows_loaded=rows_loaded,
                 duration_ms=duration_ms,
                 quality_report=quality_report,
+                changed_tables=changed_tables,
             )
 
     async def _mark_failed(error_detail: str, *, duration_ms: int) -> None:
@@ -539,6 +571,7 @@ async def execute_update_job(
             status="failed",
             error_detail=error_detail,
             duration_ms=duration_ms,
+            http_hosts=http_clients.pop_host_stats(run_id),
         )
         async with sqlite_async_session() as status_session:
             await fail_run(
@@ -553,61 +586,62 @@ async def execute_update_job(
         async with sqlite_async_session() as status_session:
             await mark_run_running(session=status_session, run_id=run_id)
 
-    async with sqlite_async_session() as session:
+    async with sqlite_async_session() as session, http_clients_lifetime:
         try:
             await _mark_running()
-            gsheet = GoogleSheetApi()
+            gsheet = GoogleSheetApi(
+                write_queue=write_queue,
+                sheet_snapshots=sheet_snapshots,
+                http_clients=http_clients,
+            )
             executor = PIPELINE_EXECUTORS.get(data)
             if executor is None:
                 raise HTTPException(status_code=404, detail="Please chose one data to update!")
-            message = await executor(gsheet, session, types, start_date, end_date, run_id)
+            with http_clients.scope(run_id):
+                message = await executor(gsheet, session, types, start_date, end_date, run_id)
 
             if not message:
                 raise HTTPException(status_code=404, detail="Something is error, data update is failed!")
 
             duration_ms = _duration_ms()
             target_start, target_end = resolve_run_window(data, types, start_date, end_date)
-            rows_loaded = await count_source_rows(
-                session=session,
-                source=data,
-                window_start=target_start,
-                window_end=target_end,
+            # Every final load of this run matched its last fingerprint: nothing was written.
+            unchanged = bool(gsheet.load_outcomes) and all(
+                outcome == LOAD_OUTCOME_SKIPPED_UNCHANGED for outcome in gsheet.load_outcomes.values()
             )
+            if unchanged:
+                run_status = STATUS_SKIPPED_UNCHANGED
+                rows_loaded = 0
+            else:
+                run_status = STATUS_SUCCESS
+                rows_loaded = await count_source_rows(
+                    session=session,
+                    source=data,
+                    window_start=target_start,
+                    window_end=target_end,
+                )
+            source_model = SOURCE_MODELS.get(data)
             await _mark_success(
                 message=message,
                 duration_ms=duration_ms,
                 rows_loaded=rows_loaded,
+                status=run_status,
+                load_counts=gsheet.load_counts,
+                changed_tables=(source_model.__tablename__,) if source_model is not None and not unchanged else (),
             )
-            if data in {
-                "google_ads",
-                "facebook_ads",
-                "tiktok_ads",
-                "daily_register",
-                "first_deposit",
-                "first_deposit_ba",
-                "ms_deposit",
-                "play_console_install_metrics",
-                "unique_campaign",
-                "instagram_insights",
-                "instagram_media_insights",
-                "tiktok_insights",
-                "tiktok_media_insights",
-                "youtube_daily_insight",
-                "youtube_media_insight",
-                "facebook_page_insights",
-                "facebook_page_media_insights",
-                "play_console_install_metrics",
-            }:
-                clear_campaign_analytics_cache()
+            if source_model is not None and not unchanged:
+                # Only cache entries that read this table inside the reloaded window go stale.
+                invalidate_campaign_analytics_cache(source_model.__tablename__, target_start, target_end)
             logger.info(
                 json.dumps(
                     {
                         "event": "etl_background_job_completed",
                         "run_id": run_id,
                         "source": data,
-                        "status": "success",
+                        "status": run_status,
                         "message": message,
                         "rows_loaded": rows_loaded,
+                        "load_counts": gsheet.load_counts,
                         "duration_ms": duration_ms,
                     },
                     default=str,
@@ -617,6 +651,7 @@ async def execute_update_job(
                 "success": True,
                 "run_id": run_id,
                 "source": data,
+                "status": run_status,
                 "message": message,
                 "rows_loaded": rows_loaded,
                 "duration_ms": duration_ms,
@@ -678,6 +713,10 @@ async def trigger_and_wait_update_job(
     start_date=None,
     end_date=None,
     triggered_by: str | None = None,
+    allow_concurrent_runs: bool = False,
+    write_queue: SqliteWriteQueue | None = None,
+    sheet_snapshots: SheetSnapshotCache | None = None,
+    http_clients: HttpClientRegistry | None = None,
 ) -> dict[str, Any]:
     """Create an ``etl_run`` row, execute the ETL, and return the final status."""
     window_start, window_end = resolve_run_window(
@@ -695,6 +734,7 @@ async def trigger_and_wait_update_job(
             window_start=window_start,
             window_end=window_end,
             triggered_by=triggered_by,
+            allow_concurrent_runs=allow_concurrent_runs,
         )
     return await execute_update_job(
         run_id=run_id,
@@ -702,4 +742,7 @@ async def trigger_and_wait_update_job(
         types=types,
         start_date=start_date,
         end_date=end_date,
+        write_queue=write_queue,
+        sheet_snapshots=sheet_snapshots,
+        http_clients=http_clients,
     )
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
 from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import case, delete, literal, select, union_all
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    UniqueConstraint,
+    and_,
+    case,
+    delete,
+    exists,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable, DropTable
 
 from app.db.models.external_api import (
     Campaign,
@@ -29,33 +51,115 @@ from app.db.models.external_api import (
     YouTubeDailyInsight,
     YouTubeMediaInsight,
 )
+from app.etl.ads_rollup import refresh_ads_type_rollups
+from app.etl.load_fingerprint import VOLATILE_ROW_COLUMNS
 
 
-SQLITE_MAX_VARIABLES = 999
+# Compile-time default of SQLite builds older than 3.32.
+SQLITE_LEGACY_MAX_VARIABLES = 999
 SQLITE_VARIABLE_HEADROOM = 50
 
 
-def _optional_int(value):
-    """Convert optional numeric value to int while preserving null-like inputs."""
-    if value is None or pd.isna(value):
-        return None
-    return int(value)
+@lru_cache(maxsize=1)
+def sqlite_max_variables() -> int:
+    """Return the bind-variable limit of the SQLite library linked into this process.
+
+    SQLite 3.32+ allows 32766 variables per statement by default, but builds
+    can lower it, so the limit is read from a probe connection rather than
+    assumed.
+    """
+    connection = sqlite3.connect(":memory:")
+    try:
+        return int(connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER))
+    except AttributeError:
+        # ``getlimit`` is Python 3.11+; fall back to the library's documented default.
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else SQLITE_LEGACY_MAX_VARIABLES
+    finally:
+        connection.close()
+
 
+SQLITE_MAX_VARIABLES = sqlite_max_variables()
 
-def _optional_float(value):
-    """Convert optional numeric value to float while preserving null-like inputs."""
-    if value is None or pd.isna(value):
-        return None
-    return float(value)
 
+def _rows_from_columns(columns: dict[str, Any]) -> list[dict]:
+    """Assemble payload dicts from per-column value lists.
+
+    List values supply one value per row; any other value (e.g. ``pull_date``)
+    is repeated on every row.
+    """
+    names = list(columns)
+    length = max((len(values) for values in columns.values() if isinstance(values, list)), default=0)
+    value_columns = [
+        values if isinstance(values, list) else [values] * length
+        for values in columns.values()
+    ]
+    return [dict(zip(names, row_values)) for row_values in zip(*value_columns)]
 
-def _normalize_sql_value(value):
-    """Convert pandas/numpy null-like scalars into DB-safe Python values."""
-    if value is None:
-        return None
-    if pd.isna(value):
-        return None
-    return value
+
+def _values(df: pd.DataFrame, column: str) -> list:
+    """Return a column as native Python values, unchanged."""
+    return df[column].tolist()
+
+
+def _nullable_values(df: pd.DataFrame, column: str, *, blank_as_null: bool = False) -> list:
+    """Return a column with null-like values (and optionally ``""``) replaced by ``None``.
+
+    Missing columns yield ``None`` for every row, like ``row.get(column)``.
+    """
+    if column not in df:
+        return [None] * len(df)
+    values = df[column].to_numpy(dtype=object, copy=True)
+    null_mask = pd.isna(values)
+    if blank_as_null:
+        null_mask |= values == ""
+    values[null_mask] = None
+    return values.tolist()
+
+
+def _int_values(df: pd.DataFrame, column: str) -> list[int]:
+    """Return a required integer column as Python ints."""
+    return df[column].astype("int64").tolist()
+
+
+def _float_values(df: pd.DataFrame, column: str) -> list[float]:
+    """Return a required float column as Python floats."""
+    return df[column].astype("float64").tolist()
+
+
+def _optional_numeric_values(df: pd.DataFrame, column: str, dtype: str) -> list:
+    """Return a numeric column cast to ``dtype`` with nulls (or a missing column) as ``None``."""
+    if column not in df:
+        return [None] * len(df)
+    series = df[column]
+    valid = series.notna().to_numpy()
+    values = np.full(len(series), None, dtype=object)
+    values[valid] = series[valid].astype(dtype).tolist()
+    return values.tolist()
+
+
+def _optional_bool_values(df: pd.DataFrame, column: str) -> list:
+    """Return truthiness of each non-null value, with nulls as ``None``."""
+    values = _nullable_values(df, column)
+    return [None if value is None else bool(value) for value in values]
+
+
+def _naive_datetime_values(df: pd.DataFrame, column: str) -> list:
+    """Return datetimes with any timezone dropped, keeping local wall-clock time."""
+    series = df[column]
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        series = series.dt.tz_localize(None)
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        values = series.array.to_pydatetime().astype(object)
+        values[series.isna().to_numpy()] = None
+        return values.tolist()
+    naive_values = []
+    for value in series.tolist():
+        if hasattr(value, "to_pydatetime"):
+            value = value.to_pydatetime()
+        if value is not None and not pd.isna(value) and value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        naive_values.append(None if value is None or pd.isna(value) else value)
+    return naive_values
 
 
 def _iter_row_chunks(rows: list[dict], columns_per_row: int):
@@ -76,6 +180,29 @@ def _iter_row_chunks(rows: list[dict], columns_per_row: int):
         yield rows[idx : idx + chunk_size]
 
 
+async def _bulk_upsert(
+    session: AsyncSession,
+    model_cls,
+    rows: list[dict],
+    *,
+    index_elements: list[str],
+    update_columns: Iterable[str],
+) -> None:
+    """Upsert rows with one prepared ``INSERT ... ON CONFLICT`` run through ``executemany``.
+
+    The statement is compiled once and bound per row, so neither the number
+    of rows nor the number of columns is capped by the SQLite variable limit.
+    """
+    if not rows:
+        return
+    insert_stmt = sqlite_insert(model_cls.__table__)
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: insert_stmt.excluded[column] for column in update_columns},
+    )
+    await session.execute(upsert_stmt, rows)
+
+
 async def rebuild_unique_campaign(session: AsyncSession) -> str:
     """Rebuild campaign dimension table from all ads fact tables.
 
@@ -114,17 +241,15 @@ async def rebuild_unique_campaign(session: AsyncSession) -> str:
     if not rows:
         return "No data found from source."
 
-    insert_stmt = sqlite_insert(Campaign).values(rows)
-    upsert_stmt = insert_stmt.on_conflict_do_update(
+    await _bulk_upsert(
+        session,
+        Campaign,
+        rows,
         index_elements=["campaign_id"],
-        set_={
-            "campaign_name": insert_stmt.excluded.campaign_name,
-            "ad_source": insert_stmt.excluded.ad_source,
-            "ad_type": insert_stmt.excluded.ad_type,
-            "created_at": insert_stmt.excluded.created_at,
-        },
+        update_columns=("campaign_name", "ad_source", "ad_type", "created_at"),
     )
-    await session.execute(upsert_stmt)
+    # Ad types may have been re-derived, which regroups the per-type rollup.
+    await refresh_ads_type_rollups(session)
     await session.commit()
 
     return "Data is being updated!"
@@ -140,23 +265,20 @@ def build_ads_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     Returns:
         list[dict]: Ads-table-compatible payload rows.
     """
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "campaign_id": row["campaign_id"],
-                "campaign_name": row["campaign_name"],
-                "ad_group": row["ad_group"],
-                "ad_name": row["ad_name"],
-                "cost": row["cost"],
-                "impressions": row["impressions"],
-                "clicks": row["clicks"],
-                "leads": row["leads"],
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "campaign_id": _values(df, "campaign_id"),
+            "campaign_name": _values(df, "campaign_name"),
+            "ad_group": _values(df, "ad_group"),
+            "ad_name": _values(df, "ad_name"),
+            "cost": _values(df, "cost"),
+            "impressions": _values(df, "impressions"),
+            "clicks": _values(df, "clicks"),
+            "leads": _values(df, "leads"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_ga4_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
@@ -169,189 +291,170 @@ def build_ga4_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     Returns:
         list[dict]: ``ga4_daily_metrics``-compatible payload rows.
     """
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "source": row["source"],
-                "daily_active_users": row["daily_active_users"],
-                "monthly_active_users": row["monthly_active_users"],
-                "active_users": row["active_users"],
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "source": _values(df, "source"),
+            "daily_active_users": _values(df, "daily_active_users"),
+            "monthly_active_users": _values(df, "monthly_active_users"),
+            "active_users": _values(df, "active_users"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_daily_register_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized daily register rows into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "campaign_id": row["campaign_id"],
-                "tag_name": row["tag_name"],
-                "total_regis": int(row["total_regis"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "campaign_id": _values(df, "campaign_id"),
+            "tag_name": _values(df, "tag_name"),
+            "total_regis": _int_values(df, "total_regis"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_instagram_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized Instagram insights rows into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "total_followers": int(row["total_followers"]),
-                "new_followers": int(row["new_followers"]),
-                "unfollowers": int(row["unfollowers"]),
-                "total_engagement": int(row["total_engagement"]),
-                "likes": int(row["likes"]),
-                "comments": int(row["comments"]),
-                "shares": int(row["shares"]),
-                "saves": int(row["saves"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            **{
+                column: _int_values(df, column)
+                for column in (
+                    "total_followers",
+                    "new_followers",
+                    "unfollowers",
+                    "total_engagement",
+                    "likes",
+                    "comments",
+                    "shares",
+                    "saves",
+                )
+            },
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_tiktok_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized TikTok insight rows into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "followers_snapshot": int(row["followers_snapshot"]),
-                "total_likes": int(row["total_likes"]),
-                "video_count": int(row["video_count"]),
-                "views": int(row["views"]),
-                "likes": int(row["likes"]),
-                "comments": int(row["comments"]),
-                "shares": int(row["shares"]),
-                "engagement": int(row["engagement"]),
-                "engagement_rate": float(row["engagement_rate"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            **{
+                column: _int_values(df, column)
+                for column in (
+                    "followers_snapshot",
+                    "total_likes",
+                    "video_count",
+                    "views",
+                    "likes",
+                    "comments",
+                    "shares",
+                    "engagement",
+                )
+            },
+            "engagement_rate": _float_values(df, "engagement_rate"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_tiktok_media_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized TikTok media insight rows into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        created_at = row["created_at"]
-        if hasattr(created_at, "to_pydatetime"):
-            created_at = created_at.to_pydatetime()
-        if created_at.tzinfo is not None:
-            created_at = created_at.replace(tzinfo=None)
-        payload = {
-            "date": row["date"],
-            "video_id": row["video_id"],
-            "created_at": created_at,
-            "description": row.get("description") or None,
-            "permalink": row.get("permalink") or None,
-            "cover_image_url": row.get("cover_image_url") or None,
-            "duration": int(row["duration"]),
-            "views": int(row["views"]),
-            "likes": int(row["likes"]),
-            "comments": int(row["comments"]),
-            "shares": int(row["shares"]),
-            "engagement": int(row["engagement"]),
-            "engagement_rate": float(row["engagement_rate"]),
+    return _rows_from_columns(
+        {
+            "date": _nullable_values(df, "date"),
+            "video_id": _nullable_values(df, "video_id"),
+            "created_at": _naive_datetime_values(df, "created_at"),
+            "description": _nullable_values(df, "description", blank_as_null=True),
+            "permalink": _nullable_values(df, "permalink", blank_as_null=True),
+            "cover_image_url": _nullable_values(df, "cover_image_url", blank_as_null=True),
+            **{
+                column: _int_values(df, column)
+                for column in ("duration", "views", "likes", "comments", "shares", "engagement")
+            },
+            "engagement_rate": _float_values(df, "engagement_rate"),
             "pull_date": pull_date,
         }
-        rows.append({key: _normalize_sql_value(value) for key, value in payload.items()})
-    return rows
+    )
 
 
 def build_youtube_daily_insight_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized YouTube daily metrics into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "views": int(row["views"]),
-                "watch_hours": float(row["watch_hours"]),
-                "subscribers_gained": int(row["subscribers_gained"]),
-                "subscribers_lost": int(row["subscribers_lost"]),
-                "net_subscribers": int(row["net_subscribers"]),
-                "likes": int(row["likes"]),
-                "comments": int(row["comments"]),
-                "shares": int(row["shares"]),
-                "average_view_duration": float(row["average_view_duration"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "views": _int_values(df, "views"),
+            "watch_hours": _float_values(df, "watch_hours"),
+            "subscribers_gained": _int_values(df, "subscribers_gained"),
+            "subscribers_lost": _int_values(df, "subscribers_lost"),
+            "net_subscribers": _int_values(df, "net_subscribers"),
+            "likes": _int_values(df, "likes"),
+            "comments": _int_values(df, "comments"),
+            "shares": _int_values(df, "shares"),
+            "average_view_duration": _float_values(df, "average_view_duration"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_youtube_media_insight_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized YouTube media snapshots into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        published_at = row["published_at"]
-        if hasattr(published_at, "to_pydatetime"):
-            published_at = published_at.to_pydatetime()
-        if published_at.tzinfo is not None:
-            published_at = published_at.replace(tzinfo=None)
-        rows.append(
-            {
-                "date": row["date"],
-                "video_id": row["video_id"],
-                "title": row["title"],
-                "published_at": published_at,
-                "content_type": row["content_type"],
-                "thumbnail_url": None if pd.isna(row["thumbnail_url"]) else row["thumbnail_url"],
-                "permalink": row["permalink"],
-                "views": int(row["views"]),
-                "watch_hours": float(row["watch_hours"]),
-                "average_view_percentage": float(row["average_view_percentage"]),
-                "likes": int(row["likes"]),
-                "comments": int(row["comments"]),
-                "shares": int(row["shares"]),
-                "subscribers_gained": int(row["subscribers_gained"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "video_id": _values(df, "video_id"),
+            "title": _values(df, "title"),
+            "published_at": _naive_datetime_values(df, "published_at"),
+            "content_type": _values(df, "content_type"),
+            "thumbnail_url": _nullable_values(df, "thumbnail_url"),
+            "permalink": _values(df, "permalink"),
+            "views": _int_values(df, "views"),
+            "watch_hours": _float_values(df, "watch_hours"),
+            "average_view_percentage": _float_values(df, "average_view_percentage"),
+            "likes": _int_values(df, "likes"),
+            "comments": _int_values(df, "comments"),
+            "shares": _int_values(df, "shares"),
+            "subscribers_gained": _int_values(df, "subscribers_gained"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 def build_instagram_media_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized Instagram media insights rows into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        payload = {
-            "date": row["date"],
-            "media_id": row["media_id"],
-            "media_type": row["media_type"],
-            "media_product_type": row["media_product_type"],
-            "timestamp": row.get("timestamp"),
-            "caption": row.get("caption") or None,
-            "permalink": row.get("permalink") or None,
-            "media_url": row.get("media_url") or None,
-            "thumbnail_url": row.get("thumbnail_url") or None,
-            "likes": int(row["likes"]),
-            "comments": int(row["comments"]),
-            "shares": int(row["shares"]),
-            "saves": int(row["saves"]),
-            "reach": int(row["reach"]),
-            "views": int(row["views"]),
-            "profile_visits": int(row["profile_visits"]),
-            "follows": int(row["follows"]),
-            "total_engagement": int(row["total_engagement"]),
+    return _rows_from_columns(
+        {
+            "date": _nullable_values(df, "date"),
+            "media_id": _nullable_values(df, "media_id"),
+            "media_type": _nullable_values(df, "media_type"),
+            "media_product_type": _nullable_values(df, "media_product_type"),
+            "timestamp": _nullable_values(df, "timestamp"),
+            "caption": _nullable_values(df, "caption", blank_as_null=True),
+            "permalink": _nullable_values(df, "permalink", blank_as_null=True),
+            "media_url": _nullable_values(df, "media_url", blank_as_null=True),
+            "thumbnail_url": _nullable_values(df, "thumbnail_url", blank_as_null=True),
+            **{
+                column: _int_values(df, column)
+                for column in (
+                    "likes",
+                    "comments",
+                    "shares",
+                    "saves",
+                    "reach",
+                    "views",
+                    "profile_visits",
+                    "follows",
+                    "total_engagement",
+                )
+            },
             "pull_date": pull_date,
         }
-        rows.append({key: _normalize_sql_value(value) for key, value in payload.items()})
-    return rows
+    )
 
 
 def build_facebook_page_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
@@ -374,17 +477,14 @@ def build_facebook_page_insights_rows(df: pd.DataFrame, pull_date: date) -> list
         "page_video_views",
         "page_views_total",
     ]
-    rows = []
-    for _, row in df.iterrows():
-        payload = {
-            "page_id": row["page_id"],
-            "date": row["date"],
+    return _rows_from_columns(
+        {
+            "page_id": _values(df, "page_id"),
+            "date": _values(df, "date"),
             "pull_date": pull_date,
+            **{column: _int_values(df, column) for column in metric_columns},
         }
-        for column in metric_columns:
-            payload[column] = int(row[column])
-        rows.append(payload)
-    return rows
+    )
 
 
 def build_facebook_page_media_insights_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
@@ -404,24 +504,21 @@ def build_facebook_page_media_insights_rows(df: pd.DataFrame, pull_date: date) -
         "post_video_views",
         "total_engagement",
     ]
-    rows = []
-    for _, row in df.iterrows():
-        payload = {
-            "page_id": row["page_id"],
-            "date": row["date"],
-            "post_id": row["post_id"],
-            "post_type": row["post_type"],
-            "status_type": row.get("status_type") or None,
-            "created_time": row.get("created_time"),
-            "message": row.get("message") or None,
-            "permalink_url": row.get("permalink_url") or None,
-            "full_picture": row.get("full_picture") or None,
+    return _rows_from_columns(
+        {
+            "page_id": _nullable_values(df, "page_id"),
+            "date": _nullable_values(df, "date"),
+            "post_id": _nullable_values(df, "post_id"),
+            "post_type": _nullable_values(df, "post_type"),
+            "status_type": _nullable_values(df, "status_type", blank_as_null=True),
+            "created_time": _nullable_values(df, "created_time"),
+            "message": _nullable_values(df, "message", blank_as_null=True),
+            "permalink_url": _nullable_values(df, "permalink_url", blank_as_null=True),
+            "full_picture": _nullable_values(df, "full_picture", blank_as_null=True),
             "pull_date": pull_date,
+            **{column: _int_values(df, column) for column in metric_columns},
         }
-        for column in metric_columns:
-            payload[column] = int(row[column])
-        rows.append({key: _normalize_sql_value(value) for key, value in payload.items()})
-    return rows
+    )
 
 
 def _infer_ad_type_from_campaign_name(campaign_name: str) -> str:
@@ -477,9 +574,10 @@ async def _ensure_campaign_rows_for_ads(
     if not missing_rows:
         return
 
-    insert_stmt = sqlite_insert(Campaign).values(missing_rows)
-    upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["campaign_id"])
-    await session.execute(upsert_stmt)
+    for chunk in _iter_row_chunks(missing_rows, len(missing_rows[0])):
+        insert_stmt = sqlite_insert(Campaign).values(chunk)
+        upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["campaign_id"])
+        await session.execute(upsert_stmt)
 
 
 async def upsert_ads_rows(session: AsyncSession, model_cls, rows: list[dict]) -> None:
@@ -496,21 +594,20 @@ async def upsert_ads_rows(session: AsyncSession, model_cls, rows: list[dict]) ->
     if not rows:
         return
     await _ensure_campaign_rows_for_ads(session=session, model_cls=model_cls, rows=rows)
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(model_cls).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date", "campaign_id", "ad_group", "ad_name"],
-            set_={
-                "campaign_name": insert_stmt.excluded.campaign_name,
-                "cost": insert_stmt.excluded.cost,
-                "impressions": insert_stmt.excluded.impressions,
-                "clicks": insert_stmt.excluded.clicks,
-                "leads": insert_stmt.excluded.leads,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        model_cls,
+        rows,
+        index_elements=["date", "campaign_id", "ad_group", "ad_name"],
+        update_columns=(
+            "campaign_name",
+            "cost",
+            "impressions",
+            "clicks",
+            "leads",
+            "pull_date",
+        ),
+    )
 
 
 async def delete_rows_in_date_window(
@@ -527,6 +624,178 @@ async def delete_rows_in_date_window(
     return int(result.rowcount or 0)
 
 
+@dataclass(frozen=True)
+class WindowMergeCounts:
+    """Row changes applied to a target table by one window load."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return counts as a plain dict for logs and run reports."""
+        return asdict(self)
+
+
+def natural_key_columns(table: Table) -> list[str]:
+    """Return the business-key columns of a fact table's unique constraint."""
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return [column.name for column in constraint.columns]
+    raise ValueError(f"{table.name} has no unique business key to merge on.")
+
+
+def _with_scalar_defaults(table: Table, rows: list[dict]) -> list[dict]:
+    """Fill columns the payload omits with their scalar model defaults.
+
+    ``INSERT ... SELECT`` from the merge table bypasses ORM-side defaults, so
+    they are applied to the payload up front.
+    """
+    defaults = {
+        column.name: column.default.arg
+        for column in table.columns
+        if column.default is not None and column.default.is_scalar and column.name not in rows[0]
+    }
+    if not defaults:
+        return rows
+    return [{**defaults, **row} for row in rows]
+
+
+async def merge_rows_in_date_window(
+    session: AsyncSession,
+    model_cls,
+    rows: list[dict],
+    *,
+    window_start: date,
+    window_end: date,
+    date_column: str = "date",
+) -> WindowMergeCounts:
+    """Merge a window payload into a fact table with three set-based statements.
+
+    Incoming rows are bulk-loaded into a TEMP table, then the target window
+    is reconciled against it: keys that vanished from the window are
+    deleted, existing keys whose values differ are updated, and new keys are
+    inserted. Rows whose values are unchanged (ignoring ``pull_date``) are not
+    rewritten, so a re-pulled window only touches rows and index entries
+    that actually changed. The final table contents match a delete-window
+    then upsert load of the same rows.
+
+    Args:
+        session (AsyncSession): Active database session; the caller commits.
+        model_cls: Target SQLAlchemy fact model.
+        rows (list[dict]): Prepared payload rows for the window.
+        window_start (date): Inclusive window start.
+        window_end (date): Inclusive window end.
+        date_column (str): Column that places a row inside the window.
+
+    Returns:
+        WindowMergeCounts: Inserted, updated, deleted and unchanged row counts.
+    """
+    table = model_cls.__table__
+    window_filter = table.c[date_column].between(window_start, window_end)
+    if not rows:
+        result = await session.execute(delete(table).where(window_filter))
+        return WindowMergeCounts(deleted=int(result.rowcount or 0))
+
+    key_columns = natural_key_columns(table)
+    # Last row wins per key, as with consecutive upserts of the same payload.
+    payload_rows = list(
+        {tuple(row[column] for column in key_columns): row for row in _with_scalar_defaults(table, rows)}.values()
+    )
+    column_names = list(payload_rows[0])
+    value_columns = [name for name in column_names if name not in key_columns]
+    compared_columns = [name for name in value_columns if name not in VOLATILE_ROW_COLUMNS]
+
+    merge_table = Table(
+        f"merge_{table.name}",
+        MetaData(),
+        *(Column(name, table.c[name].type) for name in column_names),
+        prefixes=["TEMPORARY"],
+    )
+    await session.execute(DropTable(merge_table, if_exists=True))
+    await session.execute(CreateTable(merge_table))
+    await session.execute(insert(merge_table), payload_rows)
+
+    # Null-safe so nullable key parts (ad_group, tag, ...) still match their stored row.
+    key_match = and_(*(table.c[name].is_not_distinct_from(merge_table.c[name]) for name in key_columns))
+    deleted = await session.execute(
+        delete(table).where(window_filter, ~exists().where(key_match).correlate(table))
+    )
+    updated_count = 0
+    if value_columns and compared_columns:
+        updated = await session.execute(
+            update(table)
+            .values({name: merge_table.c[name] for name in value_columns})
+            .where(
+                key_match,
+                or_(*(table.c[name].is_distinct_from(merge_table.c[name]) for name in compared_columns)),
+            )
+        )
+        updated_count = int(updated.rowcount or 0)
+    inserted = await session.execute(
+        insert(table).from_select(
+            column_names,
+            select(*(merge_table.c[name] for name in column_names)).where(
+                ~exists().where(key_match).correlate(merge_table)
+            ),
+        )
+    )
+    await session.execute(DropTable(merge_table, if_exists=True))
+
+    inserted_count = int(inserted.rowcount or 0)
+    return WindowMergeCounts(
+        inserted=inserted_count,
+        updated=updated_count,
+        deleted=int(deleted.rowcount or 0),
+        unchanged=len(payload_rows) - inserted_count - updated_count,
+    )
+
+
+async def merge_ads_rows(
+    session: AsyncSession,
+    model_cls,
+    rows: list[dict],
+    *,
+    window_start: date,
+    window_end: date,
+) -> WindowMergeCounts:
+    """Merge an ads window, creating missing campaign dimension rows first."""
+    await _ensure_campaign_rows_for_ads(session=session, model_cls=model_cls, rows=rows)
+    return await merge_rows_in_date_window(
+        session,
+        model_cls,
+        rows,
+        window_start=window_start,
+        window_end=window_end,
+    )
+
+
+async def merge_deposit_rows(
+    session: AsyncSession,
+    model_cls,
+    rows: list[dict],
+    *,
+    window_start: date,
+    window_end: date,
+    date_column: str = "date",
+) -> WindowMergeCounts:
+    """Merge a campaign-keyed deposit/register window, creating placeholder campaigns first."""
+    if rows:
+        await _ensure_campaign_rows_for_deposits(
+            session=session,
+            campaign_ids={str(row["campaign_id"]).strip() or "-" for row in rows},
+        )
+    return await merge_rows_in_date_window(
+        session,
+        model_cls,
+        rows,
+        window_start=window_start,
+        window_end=window_end,
+        date_column=date_column,
+    )
+
+
 async def upsert_ga4_rows(session: AsyncSession, rows: list[dict]) -> None:
     """Upsert rows into ``ga4_daily_metrics`` using GA4 business key.
 
@@ -539,19 +808,18 @@ async def upsert_ga4_rows(session: AsyncSession, rows: list[dict]) -> None:
     """
     if not rows:
         return
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(Ga4DailyMetrics).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date", "source"],
-            set_={
-                "daily_active_users": insert_stmt.excluded.daily_active_users,
-                "monthly_active_users": insert_stmt.excluded.monthly_active_users,
-                "active_users": insert_stmt.excluded.active_users,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        Ga4DailyMetrics,
+        rows,
+        index_elements=["date", "source"],
+        update_columns=(
+            "daily_active_users",
+            "monthly_active_users",
+            "active_users",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_daily_register_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -563,17 +831,16 @@ async def upsert_daily_register_rows(session: AsyncSession, rows: list[dict]) ->
         session=session,
         campaign_ids={str(row["campaign_id"]).strip() or "-" for row in rows},
     )
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(DailyRegister).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date", "campaign_id", "tag_name"],
-            set_={
-                "total_regis": insert_stmt.excluded.total_regis,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        DailyRegister,
+        rows,
+        index_elements=["date", "campaign_id", "tag_name"],
+        update_columns=(
+            "total_regis",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_instagram_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -581,24 +848,23 @@ async def upsert_instagram_insights_rows(session: AsyncSession, rows: list[dict]
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(InstagramInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date"],
-            set_={
-                "total_followers": insert_stmt.excluded.total_followers,
-                "new_followers": insert_stmt.excluded.new_followers,
-                "unfollowers": insert_stmt.excluded.unfollowers,
-                "total_engagement": insert_stmt.excluded.total_engagement,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "saves": insert_stmt.excluded.saves,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        InstagramInsights,
+        rows,
+        index_elements=["date"],
+        update_columns=(
+            "total_followers",
+            "new_followers",
+            "unfollowers",
+            "total_engagement",
+            "likes",
+            "comments",
+            "shares",
+            "saves",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_tiktok_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -606,25 +872,24 @@ async def upsert_tiktok_insights_rows(session: AsyncSession, rows: list[dict]) -
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(TikTokInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date"],
-            set_={
-                "followers_snapshot": insert_stmt.excluded.followers_snapshot,
-                "total_likes": insert_stmt.excluded.total_likes,
-                "video_count": insert_stmt.excluded.video_count,
-                "views": insert_stmt.excluded.views,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "engagement": insert_stmt.excluded.engagement,
-                "engagement_rate": insert_stmt.excluded.engagement_rate,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        TikTokInsights,
+        rows,
+        index_elements=["date"],
+        update_columns=(
+            "followers_snapshot",
+            "total_likes",
+            "video_count",
+            "views",
+            "likes",
+            "comments",
+            "shares",
+            "engagement",
+            "engagement_rate",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_tiktok_media_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -632,28 +897,27 @@ async def upsert_tiktok_media_insights_rows(session: AsyncSession, rows: list[di
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(TikTokMediaInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["video_id"],
-            set_={
-                "date": insert_stmt.excluded.date,
-                "created_at": insert_stmt.excluded.created_at,
-                "description": insert_stmt.excluded.description,
-                "permalink": insert_stmt.excluded.permalink,
-                "cover_image_url": insert_stmt.excluded.cover_image_url,
-                "duration": insert_stmt.excluded.duration,
-                "views": insert_stmt.excluded.views,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "engagement": insert_stmt.excluded.engagement,
-                "engagement_rate": insert_stmt.excluded.engagement_rate,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        TikTokMediaInsights,
+        rows,
+        index_elements=["video_id"],
+        update_columns=(
+            "date",
+            "created_at",
+            "description",
+            "permalink",
+            "cover_image_url",
+            "duration",
+            "views",
+            "likes",
+            "comments",
+            "shares",
+            "engagement",
+            "engagement_rate",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_youtube_daily_insight_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -661,25 +925,24 @@ async def upsert_youtube_daily_insight_rows(session: AsyncSession, rows: list[di
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(YouTubeDailyInsight).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date"],
-            set_={
-                "views": insert_stmt.excluded.views,
-                "watch_hours": insert_stmt.excluded.watch_hours,
-                "subscribers_gained": insert_stmt.excluded.subscribers_gained,
-                "subscribers_lost": insert_stmt.excluded.subscribers_lost,
-                "net_subscribers": insert_stmt.excluded.net_subscribers,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "average_view_duration": insert_stmt.excluded.average_view_duration,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        YouTubeDailyInsight,
+        rows,
+        index_elements=["date"],
+        update_columns=(
+            "views",
+            "watch_hours",
+            "subscribers_gained",
+            "subscribers_lost",
+            "net_subscribers",
+            "likes",
+            "comments",
+            "shares",
+            "average_view_duration",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_youtube_media_insight_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -687,29 +950,28 @@ async def upsert_youtube_media_insight_rows(session: AsyncSession, rows: list[di
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(YouTubeMediaInsight).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["video_id"],
-            set_={
-                "date": insert_stmt.excluded.date,
-                "title": insert_stmt.excluded.title,
-                "published_at": insert_stmt.excluded.published_at,
-                "content_type": insert_stmt.excluded.content_type,
-                "thumbnail_url": insert_stmt.excluded.thumbnail_url,
-                "permalink": insert_stmt.excluded.permalink,
-                "views": insert_stmt.excluded.views,
-                "watch_hours": insert_stmt.excluded.watch_hours,
-                "average_view_percentage": insert_stmt.excluded.average_view_percentage,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "subscribers_gained": insert_stmt.excluded.subscribers_gained,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        YouTubeMediaInsight,
+        rows,
+        index_elements=["video_id"],
+        update_columns=(
+            "date",
+            "title",
+            "published_at",
+            "content_type",
+            "thumbnail_url",
+            "permalink",
+            "views",
+            "watch_hours",
+            "average_view_percentage",
+            "likes",
+            "comments",
+            "shares",
+            "subscribers_gained",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_instagram_media_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -717,33 +979,32 @@ async def upsert_instagram_media_insights_rows(session: AsyncSession, rows: list
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(InstagramMediaInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["media_id"],
-            set_={
-                "date": insert_stmt.excluded.date,
-                "media_type": insert_stmt.excluded.media_type,
-                "media_product_type": insert_stmt.excluded.media_product_type,
-                "timestamp": insert_stmt.excluded.timestamp,
-                "caption": insert_stmt.excluded.caption,
-                "permalink": insert_stmt.excluded.permalink,
-                "media_url": insert_stmt.excluded.media_url,
-                "thumbnail_url": insert_stmt.excluded.thumbnail_url,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "saves": insert_stmt.excluded.saves,
-                "reach": insert_stmt.excluded.reach,
-                "views": insert_stmt.excluded.views,
-                "profile_visits": insert_stmt.excluded.profile_visits,
-                "follows": insert_stmt.excluded.follows,
-                "total_engagement": insert_stmt.excluded.total_engagement,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        InstagramMediaInsights,
+        rows,
+        index_elements=["media_id"],
+        update_columns=(
+            "date",
+            "media_type",
+            "media_product_type",
+            "timestamp",
+            "caption",
+            "permalink",
+            "media_url",
+            "thumbnail_url",
+            "likes",
+            "comments",
+            "shares",
+            "saves",
+            "reach",
+            "views",
+            "profile_visits",
+            "follows",
+            "total_engagement",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_facebook_page_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -751,32 +1012,31 @@ async def upsert_facebook_page_insights_rows(session: AsyncSession, rows: list[d
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(FacebookPageInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["page_id", "date"],
-            set_={
-                "page_fans": insert_stmt.excluded.page_fans,
-                "page_fan_adds": insert_stmt.excluded.page_fan_adds,
-                "page_fan_removes": insert_stmt.excluded.page_fan_removes,
-                "page_impressions": insert_stmt.excluded.page_impressions,
-                "page_impressions_unique": insert_stmt.excluded.page_impressions_unique,
-                "page_impressions_paid": insert_stmt.excluded.page_impressions_paid,
-                "page_impressions_organic_v2": insert_stmt.excluded.page_impressions_organic_v2,
-                "page_post_engagements": insert_stmt.excluded.page_post_engagements,
-                "reaction_like": insert_stmt.excluded.reaction_like,
-                "reaction_love": insert_stmt.excluded.reaction_love,
-                "reaction_wow": insert_stmt.excluded.reaction_wow,
-                "reaction_haha": insert_stmt.excluded.reaction_haha,
-                "reaction_sorry": insert_stmt.excluded.reaction_sorry,
-                "reaction_anger": insert_stmt.excluded.reaction_anger,
-                "page_video_views": insert_stmt.excluded.page_video_views,
-                "page_views_total": insert_stmt.excluded.page_views_total,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        FacebookPageInsights,
+        rows,
+        index_elements=["page_id", "date"],
+        update_columns=(
+            "page_fans",
+            "page_fan_adds",
+            "page_fan_removes",
+            "page_impressions",
+            "page_impressions_unique",
+            "page_impressions_paid",
+            "page_impressions_organic_v2",
+            "page_post_engagements",
+            "reaction_like",
+            "reaction_love",
+            "reaction_wow",
+            "reaction_haha",
+            "reaction_sorry",
+            "reaction_anger",
+            "page_video_views",
+            "page_views_total",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_facebook_page_media_insights_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -784,37 +1044,36 @@ async def upsert_facebook_page_media_insights_rows(session: AsyncSession, rows:
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(FacebookPageMediaInsights).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["post_id"],
-            set_={
-                "page_id": insert_stmt.excluded.page_id,
-                "date": insert_stmt.excluded.date,
-                "post_type": insert_stmt.excluded.post_type,
-                "status_type": insert_stmt.excluded.status_type,
-                "created_time": insert_stmt.excluded.created_time,
-                "message": insert_stmt.excluded.message,
-                "permalink_url": insert_stmt.excluded.permalink_url,
-                "full_picture": insert_stmt.excluded.full_picture,
-                "likes": insert_stmt.excluded.likes,
-                "comments": insert_stmt.excluded.comments,
-                "shares": insert_stmt.excluded.shares,
-                "reaction_like": insert_stmt.excluded.reaction_like,
-                "reaction_love": insert_stmt.excluded.reaction_love,
-                "reaction_wow": insert_stmt.excluded.reaction_wow,
-                "reaction_haha": insert_stmt.excluded.reaction_haha,
-                "reaction_sorry": insert_stmt.excluded.reaction_sorry,
-                "reaction_anger": insert_stmt.excluded.reaction_anger,
-                "post_media_view": insert_stmt.excluded.post_media_view,
-                "post_clicks": insert_stmt.excluded.post_clicks,
-                "post_video_views": insert_stmt.excluded.post_video_views,
-                "total_engagement": insert_stmt.excluded.total_engagement,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        FacebookPageMediaInsights,
+        rows,
+        index_elements=["post_id"],
+        update_columns=(
+            "page_id",
+            "date",
+            "post_type",
+            "status_type",
+            "created_time",
+            "message",
+            "permalink_url",
+            "full_picture",
+            "likes",
+            "comments",
+            "shares",
+            "reaction_like",
+            "reaction_love",
+            "reaction_wow",
+            "reaction_haha",
+            "reaction_sorry",
+            "reaction_anger",
+            "post_media_view",
+            "post_clicks",
+            "post_video_views",
+            "total_engagement",
+            "pull_date",
+        ),
+    )
 
 
 def build_first_deposit_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
@@ -828,31 +1087,29 @@ def build_first_deposit_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
         list[dict]: Insert/upsert payload rows compatible with the
         ``data_depo`` SQLAlchemy model.
     """
-    rows = []
-    for _, row in df.iterrows():
-        payload = {
-            "user_id": int(row["user_id"]),
-            "tanggal_regis": row["tanggal_regis"],
-            "fullname": row.get("fullname") or None,
-            "email": row["email"] or None,
-            "phone": row.get("phone") or None,
-            "user_status": row["user_status"] or None,
-            "campaign_id": row["campaign_id"],
-            "tag": row.get("tag") or None,
-            "protection": _optional_int(row.get("protection")),
-            "assign_date": row.get("assign_date") or None,
-            "analyst": _optional_int(row.get("analyst")),
-            "first_depo_date": row.get("first_depo_date") or None,
-            "first_depo": float(row["first_depo"]),
-            "time_to_closing": row.get("time_to_closing") or None,
-            "nmi": _optional_float(row.get("nmi")),
-            "lot": _optional_float(row.get("lot")),
-            "cabang": row.get("cabang") or None,
-            "pool": bool(row["pool"]) if pd.notna(row.get("pool")) else None,
+    return _rows_from_columns(
+        {
+            "user_id": _int_values(df, "user_id"),
+            "tanggal_regis": _nullable_values(df, "tanggal_regis"),
+            "fullname": _nullable_values(df, "fullname", blank_as_null=True),
+            "email": _nullable_values(df, "email", blank_as_null=True),
+            "phone": _nullable_values(df, "phone", blank_as_null=True),
+            "user_status": _nullable_values(df, "user_status", blank_as_null=True),
+            "campaign_id": _nullable_values(df, "campaign_id"),
+            "tag": _nullable_values(df, "tag", blank_as_null=True),
+            "protection": _optional_numeric_values(df, "protection", "int64"),
+            "assign_date": _nullable_values(df, "assign_date", blank_as_null=True),
+            "analyst": _optional_numeric_values(df, "analyst", "int64"),
+            "first_depo_date": _nullable_values(df, "first_depo_date", blank_as_null=True),
+            "first_depo": _float_values(df, "first_depo"),
+            "time_to_closing": _nullable_values(df, "time_to_closing", blank_as_null=True),
+            "nmi": _optional_numeric_values(df, "nmi", "float64"),
+            "lot": _optional_numeric_values(df, "lot", "float64"),
+            "cabang": _nullable_values(df, "cabang", blank_as_null=True),
+            "pool": _optional_bool_values(df, "pool"),
             "pull_date": pull_date,
         }
-        rows.append({key: _normalize_sql_value(value) for key, value in payload.items()})
-    return rows
+    )
 
 
 async def _ensure_campaign_rows_for_deposits(session: AsyncSession, campaign_ids: set[str]) -> None:
@@ -894,9 +1151,10 @@ async def _ensure_campaign_rows_for_deposits(session: AsyncSession, campaign_ids
         }
         for campaign_id in sorted(missing_ids)
     ]
-    insert_stmt = sqlite_insert(Campaign).values(placeholder_rows)
-    upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["campaign_id"])
-    await session.execute(upsert_stmt)
+    for chunk in _iter_row_chunks(placeholder_rows, len(placeholder_rows[0])):
+        insert_stmt = sqlite_insert(Campaign).values(chunk)
+        upsert_stmt = insert_stmt.on_conflict_do_nothing(index_elements=["campaign_id"])
+        await session.execute(upsert_stmt)
 
 
 async def upsert_first_deposit_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -922,31 +1180,30 @@ async def upsert_first_deposit_rows(session: AsyncSession, rows: list[dict]) ->
         session=session,
         campaign_ids={str(row["campaign_id"]).strip() or "-" for row in rows},
     )
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(DataDepo).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["user_id", "tanggal_regis", "campaign_id"],
-            set_={
-                "fullname": insert_stmt.excluded.fullname,
-                "email": insert_stmt.excluded.email,
-                "phone": insert_stmt.excluded.phone,
-                "user_status": insert_stmt.excluded.user_status,
-                "tag": insert_stmt.excluded.tag,
-                "protection": insert_stmt.excluded.protection,
-                "assign_date": insert_stmt.excluded.assign_date,
-                "analyst": insert_stmt.excluded.analyst,
-                "first_depo_date": insert_stmt.excluded.first_depo_date,
-                "first_depo": insert_stmt.excluded.first_depo,
-                "time_to_closing": insert_stmt.excluded.time_to_closing,
-                "nmi": insert_stmt.excluded.nmi,
-                "lot": insert_stmt.excluded.lot,
-                "cabang": insert_stmt.excluded.cabang,
-                "pool": insert_stmt.excluded.pool,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        DataDepo,
+        rows,
+        index_elements=["user_id", "tanggal_regis", "campaign_id"],
+        update_columns=(
+            "fullname",
+            "email",
+            "phone",
+            "user_status",
+            "tag",
+            "protection",
+            "assign_date",
+            "analyst",
+            "first_depo_date",
+            "first_depo",
+            "time_to_closing",
+            "nmi",
+            "lot",
+            "cabang",
+            "pool",
+            "pull_date",
+        ),
+    )
 
 
 async def upsert_first_deposit_ba_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -958,31 +1215,30 @@ async def upsert_first_deposit_ba_rows(session: AsyncSession, rows: list[dict])
         session=session,
         campaign_ids={str(row["campaign_id"]).strip() or "-" for row in rows},
     )
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(DataDepoBa).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["user_id", "tanggal_regis", "campaign_id"],
-            set_={
-                "fullname": insert_stmt.excluded.fullname,
-                "email": insert_stmt.excluded.email,
-                "phone": insert_stmt.excluded.phone,
-                "user_status": insert_stmt.excluded.user_status,
-                "tag": insert_stmt.excluded.tag,
-                "protection": insert_stmt.excluded.protection,
-                "assign_date": insert_stmt.excluded.assign_date,
-                "analyst": insert_stmt.excluded.analyst,
-                "first_depo_date": insert_stmt.excluded.first_depo_date,
-                "first_depo": insert_stmt.excluded.first_depo,
-                "time_to_closing": insert_stmt.excluded.time_to_closing,
-                "nmi": insert_stmt.excluded.nmi,
-                "lot": insert_stmt.excluded.lot,
-                "cabang": insert_stmt.excluded.cabang,
-                "pool": insert_stmt.excluded.pool,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        DataDepoBa,
+        rows,
+        index_elements=["user_id", "tanggal_regis", "campaign_id"],
+        update_columns=(
+            "fullname",
+            "email",
+            "phone",
+            "user_status",
+            "tag",
+            "protection",
+            "assign_date",
+            "analyst",
+            "first_depo_date",
+            "first_depo",
+            "time_to_closing",
+            "nmi",
+            "lot",
+            "cabang",
+            "pool",
+            "pull_date",
+        ),
+    )
 
 
 async def delete_first_deposit_rows_in_window(
@@ -1013,40 +1269,35 @@ async def delete_first_deposit_ba_rows_in_window(
 
 def build_ms_deposit_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized MS1 deposit/activity rows into load payload dicts."""
-    rows = []
-    for _, row in df.iterrows():
-        payload = {
-            "email": row["email"],
-            "tag": row.get("tag") or None,
-            "campaign_id": row["campaign_id"],
-            "user_status": row["user_status"] or None,
-            "first_depo": float(row["first_depo"]),
-            "time_to_closing": row.get("time_to_closing") or None,
-            "last_depo": row.get("last_depo") or None,
-            "last_depo_amount": _optional_float(row.get("last_depo_amount")),
-            "last_activity": row["last_activity"],
+    return _rows_from_columns(
+        {
+            "email": _nullable_values(df, "email"),
+            "tag": _nullable_values(df, "tag", blank_as_null=True),
+            "campaign_id": _nullable_values(df, "campaign_id"),
+            "user_status": _nullable_values(df, "user_status", blank_as_null=True),
+            "first_depo": _float_values(df, "first_depo"),
+            "time_to_closing": _nullable_values(df, "time_to_closing", blank_as_null=True),
+            "last_depo": _nullable_values(df, "last_depo", blank_as_null=True),
+            "last_depo_amount": _optional_numeric_values(df, "last_depo_amount", "float64"),
+            "last_activity": _nullable_values(df, "last_activity"),
             "pull_date": pull_date,
         }
-        rows.append({key: _normalize_sql_value(value) for key, value in payload.items()})
-    return rows
+    )
 
 
 def build_play_console_install_rows(df: pd.DataFrame, pull_date: date) -> list[dict]:
     """Convert normalized Play Console install metrics into insert dictionaries."""
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(
-            {
-                "date": row["date"],
-                "package_name": row["package_name"],
-                "country": row["country"],
-                "installers": int(row["installers"]),
-                "uninstallers": int(row["uninstallers"]),
-                "active_devices": int(row["active_devices"]),
-                "pull_date": pull_date,
-            }
-        )
-    return rows
+    return _rows_from_columns(
+        {
+            "date": _values(df, "date"),
+            "package_name": _values(df, "package_name"),
+            "country": _values(df, "country"),
+            "installers": _int_values(df, "installers"),
+            "uninstallers": _int_values(df, "uninstallers"),
+            "active_devices": _int_values(df, "active_devices"),
+            "pull_date": pull_date,
+        }
+    )
 
 
 async def upsert_ms_deposit_rows(session: AsyncSession, rows: list[dict]) -> None:
@@ -1058,21 +1309,20 @@ async def upsert_ms_deposit_rows(session: AsyncSession, rows: list[dict]) -> Non
         session=session,
         campaign_ids={str(row["campaign_id"]).strip() or "-" for row in rows},
     )
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(DataMsDeposit).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["email", "last_activity", "campaign_id", "tag"],
-            set_={
-                "user_status": insert_stmt.excluded.user_status,
-                "first_depo": insert_stmt.excluded.first_depo,
-                "time_to_closing": insert_stmt.excluded.time_to_closing,
-                "last_depo": insert_stmt.excluded.last_depo,
-                "last_depo_amount": insert_stmt.excluded.last_depo_amount,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        DataMsDeposit,
+        rows,
+        index_elements=["email", "last_activity", "campaign_id", "tag"],
+        update_columns=(
+            "user_status",
+            "first_depo",
+            "time_to_closing",
+            "last_depo",
+            "last_depo_amount",
+            "pull_date",
+        ),
+    )
 
 
 async def delete_ms_deposit_rows_in_window(
@@ -1093,19 +1343,18 @@ async def upsert_play_console_install_rows(session: AsyncSession, rows: list[dic
     if not rows:
         return
 
-    columns_per_row = len(rows[0])
-    for chunk in _iter_row_chunks(rows, columns_per_row):
-        insert_stmt = sqlite_insert(PlayConsoleInstallMetrics).values(chunk)
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=["date", "package_name", "country"],
-            set_={
-                "installers": insert_stmt.excluded.installers,
-                "uninstallers": insert_stmt.excluded.uninstallers,
-                "active_devices": insert_stmt.excluded.active_devices,
-                "pull_date": insert_stmt.excluded.pull_date,
-            },
-        )
-        await session.execute(upsert_stmt)
+    await _bulk_upsert(
+        session,
+        PlayConsoleInstallMetrics,
+        rows,
+        index_elements=["date", "package_name", "country"],
+        update_columns=(
+            "installers",
+            "uninstallers",
+            "active_devices",
+            "pull_date",
+        ),
+    )
 
 
 async def delete_play_console_install_rows_in_window(
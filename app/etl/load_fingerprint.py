@@ -0,0 +1,93 @@
+"""Content fingerprints that let a re-run skip loading identical rows."""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.etl_run import EtlLoadFingerprint
+from app.etl.staging import payload_hash
+
+# Stamped by the row builders on every run, so they never describe source content.
+VOLATILE_ROW_COLUMNS = frozenset({"pull_date"})
+
+
+def rows_fingerprint(rows: list[dict]) -> str:
+    """Hash built load rows independently of row order and volatile columns."""
+    serialized_rows = sorted(
+        json.dumps(
+            {column: value for column, value in row.items() if column not in VOLATILE_ROW_COLUMNS},
+            sort_keys=True,
+            default=str,
+            separators=(",", ":"),
+        )
+        for row in rows
+    )
+    return payload_hash(serialized_rows)
+
+
+async def window_row_count(session: AsyncSession, model: type, date_column: str, window_start: date, window_end: date) -> int:
+    """Count rows currently stored for ``model`` inside the inclusive window."""
+    result = await session.execute(
+        select(func.count()).select_from(model).where(getattr(model, date_column).between(window_start, window_end))
+    )
+    return int(result.scalar_one())
+
+
+async def load_is_unchanged(
+    session: AsyncSession,
+    *,
+    source: str,
+    window_start: date,
+    window_end: date,
+    content_hash: str,
+    stored_row_count: int,
+) -> bool:
+    """Return whether the last load of this window had the same content and is still intact.
+
+    ``stored_row_count`` is the current row count of the target window; a
+    mismatch means rows were changed outside this pipeline since the
+    fingerprint was recorded, so the window must be reloaded.
+    """
+    fingerprint = await session.get(EtlLoadFingerprint, (source, window_start, window_end))
+    return (
+        fingerprint is not None
+        and fingerprint.content_hash == content_hash
+        and fingerprint.row_count == stored_row_count
+    )
+
+
+async def save_load_fingerprint(session: AsyncSession, fingerprint: dict[str, Any]) -> None:
+    """Record a fingerprint for one loaded window in the caller's transaction.
+
+    Fingerprints of other windows of the same source that overlap this one
+    described rows that were just replaced, so they are dropped.
+    """
+    await session.execute(
+        delete(EtlLoadFingerprint).where(
+            EtlLoadFingerprint.source == fingerprint["source"],
+            EtlLoadFingerprint.window_start <= fingerprint["window_end"],
+            EtlLoadFingerprint.window_end >= fingerprint["window_start"],
+            ~and_(
+                EtlLoadFingerprint.window_start == fingerprint["window_start"],
+                EtlLoadFingerprint.window_end == fingerprint["window_end"],
+            ),
+        )
+    )
+    values = {**fingerprint, "updated_at": datetime.now()}
+    insert_stmt = sqlite_insert(EtlLoadFingerprint).values(**values)
+    await session.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=["source", "window_start", "window_end"],
+            set_={
+                column: insert_stmt.excluded[column]
+                for column in values
+                if column not in {"source", "window_start", "window_end"}
+            },
+        )
+    )
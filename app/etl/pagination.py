@@ -0,0 +1,62 @@
+"""Overlap paginated API listings with per-page enrichment."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
+from typing import TypeVar
+
+RowT = TypeVar("RowT")
+EnrichedT = TypeVar("EnrichedT")
+
+_END_OF_LISTING = object()
+
+
+async def enrich_pages(
+    pages: AsyncIterator[list[RowT]],
+    enrich: Callable[[list[RowT]], Awaitable[list[EnrichedT]]],
+    *,
+    max_pending_pages: int,
+) -> list[EnrichedT]:
+    """Enrich listing pages while later pages are still being fetched.
+
+    The listing runs as a producer that feeds a queue of at most
+    ``max_pending_pages`` pages. The same number of workers enrich pages as
+    soon as they arrive, so listing stops waiting on enrichment only when the
+    queue is full, and un-enriched rows held in memory are bounded by the
+    queue rather than by the length of the listing. An error on either side
+    cancels the other and is raised to the caller.
+
+    Returns:
+        list: Enriched rows in listing order.
+    """
+    workers = max(1, int(max_pending_pages))
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+    enriched_pages: dict[int, list[EnrichedT]] = {}
+
+    async def produce() -> None:
+        page_index = 0
+        async with aclosing(pages) as listing:
+            async for page in listing:
+                if page:
+                    await queue.put((page_index, page))
+                    page_index += 1
+        for _ in range(workers):
+            await queue.put(_END_OF_LISTING)
+
+    async def consume() -> None:
+        while (item := await queue.get()) is not _END_OF_LISTING:
+            page_index, page = item
+            enriched_pages[page_index] = await enrich(page)
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(produce())
+            for _ in range(workers):
+                task_group.create_task(consume())
+    except BaseExceptionGroup as error_group:
+        # Callers handle the extractor's ValueErrors, not task-group wrappers.
+        raise error_group.exceptions[0] from None
+
+    return [row for page_index in sorted(enriched_pages) for row in enriched_pages[page_index]]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from collections.abc import Awaitable, Callable
@@ -10,12 +11,106 @@ from datetime import datetime
 from time import perf_counter
 from typing import Any
 
+from decouple import config
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.etl.load import WindowMergeCounts
+from app.etl.load_fingerprint import load_is_unchanged, rows_fingerprint, save_load_fingerprint, window_row_count
 from app.etl.transform import dedupe_ads_dataframe, resolve_date_window
 
+# SQLite allows one writer at a time. Sources may extract concurrently, but every
+# staging commit and final window replacement in this process goes through this lock.
+SQLITE_WRITE_LOCK = asyncio.Lock()
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+LOAD_OUTCOME_LOADED = "loaded"
+LOAD_OUTCOME_SKIPPED_UNCHANGED = "skipped_unchanged"
+
+# ``merge`` reconciles the window row by row; ``replace`` deletes it and reloads every row.
+LOAD_STRATEGY_MERGE = "merge"
+LOAD_STRATEGY_REPLACE = "replace"
+
+
+class SqliteWriteQueue:
+    """Single writer task that applies queued SQLite write jobs one at a time.
+
+    Pipelines keep extracting, parsing and validating concurrently and hand their
+    staging and final-load writes to this queue, which applies them on one
+    session owned by the writer for its whole lifetime. Run bookkeeping
+    (``mark_running``/``complete_run``/``fail_run``) still commits on its own
+    session, as do writers outside a pipeline that fall back to
+    ``SQLITE_WRITE_LOCK``.
+    """
+
+    def __init__(self, session_factory: Callable[[], Any], *, max_pending: int = 4) -> None:
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "SqliteWriteQueue":
+        self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the writer task if it is not running yet."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Drain pending jobs and stop the writer task."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.put(None)
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    async def submit(self, job: WriteJob) -> Any:
+        """Queue one write job and wait for its result.
+
+        ``put`` blocks while ``max_pending`` batches are already waiting, which
+        keeps row batches from piling up in memory when the writer falls behind.
+        """
+        if self._task is None or self._task.done():
+            raise RuntimeError("SQLite write queue is not running.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((job, future))
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            async with self._session_factory() as session:
+                while True:
+                    item = await self._queue.get()
+                    if item is None:
+                        return
+                    job, future = item
+                    if future.done():
+                        continue
+                    try:
+                        result = await job(session)
+                    except Exception as error:
+                        await session.rollback()
+                        if not future.done():
+                            future.set_exception(error)
+                    else:
+                        if not future.done():
+                            future.set_result(result)
+        except BaseException as error:
+            while not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is not None and not item[1].done():
+                    item[1].set_exception(RuntimeError(f"SQLite write queue stopped: {error}"))
+            raise
+
 
 @dataclass(frozen=True)
 class DateWindowPipelineSpec:
@@ -37,14 +132,22 @@ class DateWindowPipelineSpec:
     user_window_empty_message: str = "No data found for selected date range."
     user_success_message: str = "Data is being updated!"
     user_already_updated_message: str = "Data is already updated!"
+    user_unchanged_message: str = "Source data is unchanged since the last load."
     resolve_window: Callable[[str, Any, Any], tuple[Any, Any]] | None = None
+    merge_window: Callable[[AsyncSession, list[dict], Any, Any], Awaitable[WindowMergeCounts]] | None = None
+    refresh_window: Callable[[AsyncSession, Any, Any], Awaitable[None]] | None = None
 
 
 class DateWindowPipelineRunner:
     """Shared runner for ETL sources that replace one reporting date window."""
 
-    def __init__(self) -> None:
+    def __init__(self, write_queue: SqliteWriteQueue | None = None) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.write_queue = write_queue
+        # Final-load outcome and row changes per source, read by the job runner after the pipeline returns.
+        self.load_outcomes: dict[str, str] = {}
+        self.load_counts: dict[str, dict[str, int]] = {}
+        self.load_strategy = config("ETL_LOAD_STRATEGY", default=LOAD_STRATEGY_MERGE).strip().lower()
 
     def _log_event(self, event: str, **fields) -> None:
         """Emit one structured ETL log event."""
@@ -100,20 +203,28 @@ class DateWindowPipelineRunner:
                     )
                     return spec.user_already_updated_message
 
+            if self.write_queue is not None:
+                # Writes go through the shared writer; do not keep this session's
+                # connection checked out while waiting on the network.
+                await session.rollback()
             raw_rows = await spec.extract(target_start, target_end)
-            staged_count = await spec.stage(session, raw_rows, run_id)
-            await session.commit()
+            staged_count = await self._stage_raw_rows(
+                spec=spec,
+                session=session,
+                raw_rows=raw_rows,
+                run_id=run_id,
+            )
 
             df = spec.parse(raw_rows)
             raw_count = self._raw_count(raw_rows)
             if df.empty:
-                deleted_count = await self._replace_window_with_rows(
+                load_counts = await self._load_window(
+                    spec=spec,
                     session=session,
-                    delete_window=spec.delete_window,
-                    load_rows=spec.load_rows,
                     rows=[],
                     target_start=target_start,
                     target_end=target_end,
+                    run_id=run_id,
                 )
                 self._log_event(
                     f"etl_{spec.label}_source_empty_window_replaced",
@@ -121,7 +232,7 @@ class DateWindowPipelineRunner:
                     source=spec.source,
                     raw_count=raw_count,
                     staged_count=staged_count,
-                    deleted_count=deleted_count,
+                    deleted_count=load_counts.deleted,
                     duration_sec=round(perf_counter() - started_at, 3),
                 )
                 return spec.user_empty_message
@@ -147,19 +258,19 @@ class DateWindowPipelineRunner:
                     f"etl_{spec.label}_no_rows_in_window",
                     **empty_window_fields,
                 )
-                deleted_count = await self._replace_window_with_rows(
+                load_counts = await self._load_window(
+                    spec=spec,
                     session=session,
-                    delete_window=spec.delete_window,
-                    load_rows=spec.load_rows,
                     rows=[],
                     target_start=target_start,
                     target_end=target_end,
+                    run_id=run_id,
                 )
                 self._log_event(
                     f"etl_{spec.label}_window_replaced_empty",
                     run_id=run_id,
                     source=spec.source,
-                    deleted_count=deleted_count,
+                    deleted_count=load_counts.deleted,
                     duration_sec=round(perf_counter() - started_at, 3),
                 )
                 return spec.user_window_empty_message
@@ -172,13 +283,41 @@ class DateWindowPipelineRunner:
 
             spec.validate(df)
             rows = spec.build_rows(df, datetime.now().date())
-            deleted_count = await self._replace_window_with_rows(
+            content_hash = rows_fingerprint(rows)
+            if await load_is_unchanged(
+                session,
+                source=spec.source,
+                window_start=target_start,
+                window_end=target_end,
+                content_hash=content_hash,
+                stored_row_count=await window_row_count(
+                    session,
+                    spec.auto_skip_model,
+                    spec.date_column,
+                    target_start,
+                    target_end,
+                ),
+            ):
+                self.load_outcomes[spec.source] = LOAD_OUTCOME_SKIPPED_UNCHANGED
+                self._log_event(
+                    f"etl_{spec.label}_skipped_unchanged",
+                    run_id=run_id,
+                    source=spec.source,
+                    raw_count=raw_count,
+                    filtered_count=filtered_count,
+                    staged_count=staged_count,
+                    content_hash=content_hash,
+                    duration_sec=round(perf_counter() - started_at, 3),
+                )
+                return spec.user_unchanged_message
+            load_counts = await self._load_window(
+                spec=spec,
                 session=session,
-                delete_window=spec.delete_window,
-                load_rows=spec.load_rows,
                 rows=rows,
                 target_start=target_start,
                 target_end=target_end,
+                run_id=run_id,
+                content_hash=content_hash,
             )
             completed_fields = {
                 "run_id": run_id,
@@ -186,8 +325,12 @@ class DateWindowPipelineRunner:
                 "raw_count": raw_count,
                 "filtered_count": filtered_count,
                 "staged_count": staged_count,
-                "deleted_count": deleted_count,
+                "deleted_count": load_counts.deleted,
                 "loaded_count": len(rows),
+                "load_strategy": self._load_strategy_for(spec),
+                "inserted_count": load_counts.inserted,
+                "updated_count": load_counts.updated,
+                "unchanged_count": load_counts.unchanged,
                 "duration_sec": round(perf_counter() - started_at, 3),
             }
             if spec.label == "campaign_ads":
@@ -235,6 +378,105 @@ class DateWindowPipelineRunner:
             return len(raw_rows)
         return max(len(raw_rows) - 1, 0)
 
+    async def _stage_raw_rows(
+        self,
+        *,
+        spec: DateWindowPipelineSpec,
+        session: AsyncSession,
+        raw_rows: list,
+        run_id: str | None,
+    ) -> int:
+        """Persist raw rows into staging, through the write queue when one is set."""
+
+        async def _stage(write_session: AsyncSession) -> int:
+            staged_count = await spec.stage(write_session, raw_rows, run_id)
+            await write_session.commit()
+            return staged_count
+
+        if self.write_queue is not None:
+            return await self.write_queue.submit(_stage)
+        async with SQLITE_WRITE_LOCK:
+            return await _stage(session)
+
+    async def _load_window(
+        self,
+        *,
+        spec: DateWindowPipelineSpec,
+        session: AsyncSession,
+        rows: list[dict],
+        target_start,
+        target_end,
+        run_id: str | None = None,
+        content_hash: str | None = None,
+    ) -> WindowMergeCounts:
+        """Merge or replace the target window, through the write queue when one is set.
+
+        Derived tables registered through ``spec.refresh_window`` and the
+        window's content fingerprint are updated in the same transaction, so a
+        later run with identical rows can skip the load.
+        """
+
+        async def _record_fingerprint(write_session: AsyncSession) -> None:
+            await save_load_fingerprint(
+                write_session,
+                {
+                    "source": spec.source,
+                    "window_start": target_start,
+                    "window_end": target_end,
+                    "content_hash": content_hash or rows_fingerprint(rows),
+                    "row_count": await window_row_count(
+                        write_session,
+                        spec.auto_skip_model,
+                        spec.date_column,
+                        target_start,
+                        target_end,
+                    ),
+                    "run_id": run_id,
+                },
+            )
+
+        async def _after_load(write_session: AsyncSession) -> None:
+            if spec.refresh_window is not None:
+                await spec.refresh_window(write_session, target_start, target_end)
+            await _record_fingerprint(write_session)
+
+        async def _replace(write_session: AsyncSession) -> WindowMergeCounts:
+            deleted_count = await self._replace_window_with_rows(
+                session=write_session,
+                delete_window=spec.delete_window,
+                load_rows=spec.load_rows,
+                rows=rows,
+                target_start=target_start,
+                target_end=target_end,
+                after_load=_after_load,
+            )
+            return WindowMergeCounts(inserted=len(rows), deleted=deleted_count)
+
+        async def _merge(write_session: AsyncSession) -> WindowMergeCounts:
+            return await self._merge_window_with_rows(
+                session=write_session,
+                merge_window=spec.merge_window,
+                rows=rows,
+                target_start=target_start,
+                target_end=target_end,
+                after_load=_after_load,
+            )
+
+        write = _merge if self._load_strategy_for(spec) == LOAD_STRATEGY_MERGE else _replace
+        if self.write_queue is not None:
+            load_counts = await self.write_queue.submit(write)
+        else:
+            load_counts = await write(session)
+        self.load_outcomes[spec.source] = LOAD_OUTCOME_LOADED
+        self.load_counts[spec.source] = load_counts.as_dict()
+        return load_counts
+
+    def _load_strategy_for(self, spec: DateWindowPipelineSpec) -> str:
+        """Return the load strategy used for ``spec``; sources without a merge hook always replace."""
+        if self.load_strategy == LOAD_STRATEGY_MERGE and spec.merge_window is not None:
+            return LOAD_STRATEGY_MERGE
+        return LOAD_STRATEGY_REPLACE
+
     @staticmethod
     async def _replace_window_with_rows(
         *,
@@ -244,13 +486,39 @@ class DateWindowPipelineRunner:
         rows: list[dict],
         target_start,
         target_end,
+        after_load: Callable[[AsyncSession], Awaitable[None]] | None = None,
     ) -> int:
         """Replace one reporting window in a single final-load transaction."""
-        try:
-            deleted_count = await delete_window(session, target_start, target_end)
-            await load_rows(session, rows)
-            await session.commit()
-            return deleted_count
-        except Exception:
-            await session.rollback()
-            raise
+        async with SQLITE_WRITE_LOCK:
+            try:
+                deleted_count = await delete_window(session, target_start, target_end)
+                await load_rows(session, rows)
+                if after_load is not None:
+                    await after_load(session)
+                await session.commit()
+                return deleted_count
+            except Exception:
+                await session.rollback()
+                raise
+
+    @staticmethod
+    async def _merge_window_with_rows(
+        *,
+        session: AsyncSession,
+        merge_window: Callable[[AsyncSession, list[dict], Any, Any], Awaitable[WindowMergeCounts]],
+        rows: list[dict],
+        target_start,
+        target_end,
+        after_load: Callable[[AsyncSession], Awaitable[None]] | None = None,
+    ) -> WindowMergeCounts:
+        """Merge rows into one reporting window in a single final-load transaction."""
+        async with SQLITE_WRITE_LOCK:
+            try:
+                load_counts = await merge_window(session, rows, target_start, target_end)
+                if after_load is not None:
+                    await after_load(session)
+                await session.commit()
+                return load_counts
+            except Exception:
+                await session.rollback()
+                raise
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from typing import Any
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,7 +25,9 @@ from app.db.models.external_api import (
     YouTubeDailyInsight,
     YouTubeMediaInsight,
 )
+from app.etl.ads_rollup import refresh_ads_rollups
 from app.etl.extract import ExternalApiExtractor
+from app.etl.http_clients import HttpClientRegistry
 from app.etl.load import (
     build_ads_rows,
     build_daily_register_rows,
@@ -44,6 +48,9 @@ from app.etl.load import (
     delete_ms_deposit_rows_in_window,
     delete_play_console_install_rows_in_window,
     delete_rows_in_date_window,
+    merge_ads_rows,
+    merge_deposit_rows,
+    merge_rows_in_date_window,
     upsert_ads_rows,
     upsert_daily_register_rows,
     upsert_facebook_page_insights_rows,
@@ -76,7 +83,9 @@ from app.etl.quality import (
     validate_youtube_daily_insight_dataframe,
     validate_youtube_media_insight_dataframe,
 )
-from app.etl.pipeline_core import DateWindowPipelineRunner, DateWindowPipelineSpec
+from app.etl.pipeline_core import DateWindowPipelineRunner, DateWindowPipelineSpec, SqliteWriteQueue
+from app.etl.sheet_snapshot import SheetSnapshotCache
+from app.etl.sheet_watermark import SheetRead, read_sheet_incremental, save_sheet_watermark
 from app.etl.staging import (
     stage_ads_raw,
     stage_facebook_page_insights_raw,
@@ -123,9 +132,18 @@ class GoogleSheetApi(DateWindowPipelineRunner):
         - emit structured log events and ETL status messages.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.extractor = ExternalApiExtractor()
+    def __init__(
+        self,
+        write_queue: SqliteWriteQueue | None = None,
+        sheet_snapshots: SheetSnapshotCache | None = None,
+        http_clients: HttpClientRegistry | None = None,
+    ):
+        super().__init__(write_queue=write_queue)
+        self.extractor = ExternalApiExtractor(
+            sheet_snapshots=sheet_snapshots,
+            http_clients=http_clients,
+            write_queue=write_queue,
+        )
         self.service = self.extractor.service
         self.sheet_id = self.extractor.sheet_id
 
@@ -140,6 +158,40 @@ class GoogleSheetApi(DateWindowPipelineRunner):
         """
         return await self.extractor.fetch_sheet_values(range_name)
 
+    async def _read_sheet_incremental(
+        self,
+        *,
+        session: AsyncSession,
+        source: str,
+        spreadsheet_id: str | None,
+        range_name: str,
+        date_headers: tuple[str, ...],
+        target_start,
+        full_read: Callable[[], Awaitable[list]],
+    ) -> SheetRead:
+        """Read a sheet tab from its stored watermark when incremental reads are enabled."""
+        if not self.extractor.sheet_incremental_reads or not spreadsheet_id:
+            return SheetRead(rows=await full_read(), mode="full")
+        sheet_read = await read_sheet_incremental(
+            session=session,
+            source=source,
+            spreadsheet_id=spreadsheet_id,
+            range_name=range_name,
+            date_headers=date_headers,
+            window_start=target_start,
+            fetch_ranges=lambda ranges: self.extractor.fetch_spreadsheet_ranges(spreadsheet_id, ranges),
+            full_read=full_read,
+        )
+        self._log_event(
+            "etl_sheet_read",
+            source=source,
+            range_name=range_name,
+            mode=sheet_read.mode,
+            row_count=max(len(sheet_read.rows) - 1, 0),
+            resume_row=(sheet_read.watermark or {}).get("resume_row"),
+        )
+        return sheet_read
+
     async def _fetch_google_ads_metrics(self, start_date, end_date) -> list[dict]:
         """Fetch raw Google Ads API metrics for the requested ETL window."""
         return await self.extractor.fetch_google_ads_metrics(start_date=start_date, end_date=end_date)
@@ -460,22 +512,35 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             "google_ads": "google_ads_api",
             "facebook_ads": "meta_ads_api",
         }
+        sheet_watermark: dict[str, Any] = {}
 
         async def extract(target_start, target_end):
             if source_name == "google_ads":
                 return await self._fetch_google_ads_metrics(start_date=target_start, end_date=target_end)
             if source_name == "facebook_ads":
                 return await self._fetch_facebook_ads_metrics(start_date=target_start, end_date=target_end)
-            return await self._fetch_sheet_values(range_name)
+            sheet_read = await self._read_sheet_incremental(
+                session=session,
+                source=source_name,
+                spreadsheet_id=self.sheet_id,
+                range_name=range_name,
+                date_headers=("date",),
+                target_start=target_start,
+                full_read=lambda: self._fetch_sheet_values(range_name),
+            )
+            sheet_watermark["value"] = sheet_read.watermark
+            return sheet_read.rows
 
         async def stage(session_: AsyncSession, raw_rows: list, run_id_: str | None) -> int:
-            return await stage_ads_raw(
+            staged_count = await stage_ads_raw(
                 session=session_,
                 raw_rows=raw_rows,
                 run_id=run_id_,
                 source=source_name,
                 range_name=api_range_name_map.get(source_name, range_name),
             )
+            await save_sheet_watermark(session_, sheet_watermark.get("value"))
+            return staged_count
 
         async def delete_window(session_: AsyncSession, target_start, target_end) -> int:
             return await delete_rows_in_date_window(
@@ -488,6 +553,23 @@ class GoogleSheetApi(DateWindowPipelineRunner):
         async def load_rows(session_: AsyncSession, rows: list[dict]) -> None:
             await upsert_ads_rows(session=session_, model_cls=classes, rows=rows)
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_ads_rows(
+                session=session_,
+                model_cls=classes,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
+        async def refresh_window(session_: AsyncSession, target_start, target_end) -> None:
+            await refresh_ads_rollups(
+                session_,
+                window_start=target_start,
+                window_end=target_end,
+                sources=(source_name,),
+            )
+
         spec = DateWindowPipelineSpec(
             label="campaign_ads",
             source=source_name,
@@ -505,6 +587,8 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             ),
             delete_window=delete_window,
             load_rows=load_rows,
+            merge_window=merge_window,
+            refresh_window=refresh_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -557,6 +641,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=Ga4DailyMetrics,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="ga4",
             source="ga4_daily_metrics",
@@ -570,6 +663,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_ga4_models,
             delete_window=delete_window,
             load_rows=upsert_ga4_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -589,17 +683,31 @@ class GoogleSheetApi(DateWindowPipelineRunner):
         run_id: str | None = None,
     ) -> str:
         """Run daily registration ETL flow into ``daily_register``."""
-        async def extract(_target_start, _target_end):
-            return await self._fetch_daily_register_rows()
+        sheet_watermark: dict[str, Any] = {}
+
+        async def extract(target_start, _target_end):
+            sheet_read = await self._read_sheet_incremental(
+                session=session,
+                source="daily_register",
+                spreadsheet_id=self.extractor.daily_regis_sheet_id,
+                range_name=self.extractor.daily_regis_sheet_range,
+                date_headers=("tanggal_regis", "tgl_regis"),
+                target_start=target_start,
+                full_read=self._fetch_daily_register_rows,
+            )
+            sheet_watermark["value"] = sheet_read.watermark
+            return sheet_read.rows
 
         async def stage(session_: AsyncSession, raw_rows: list, run_id_: str | None) -> int:
-            return await stage_ads_raw(
+            staged_count = await stage_ads_raw(
                 session=session_,
                 raw_rows=raw_rows,
                 run_id=run_id_,
                 source="daily_register",
                 range_name=self.extractor.daily_regis_sheet_range,
             )
+            await save_sheet_watermark(session_, sheet_watermark.get("value"))
+            return staged_count
 
         async def delete_window(session_: AsyncSession, target_start, target_end) -> int:
             return await delete_rows_in_date_window(
@@ -609,6 +717,19 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_deposit_rows(
+                session=session_,
+                model_cls=DailyRegister,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
+        async def refresh_window(session_: AsyncSession, target_start, target_end) -> None:
+            # Register totals feed the lead allocation of every ads source.
+            await refresh_ads_rollups(session_, window_start=target_start, window_end=target_end)
+
         spec = DateWindowPipelineSpec(
             label="daily_register",
             source="daily_register",
@@ -622,6 +743,8 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_daily_register_models,
             delete_window=delete_window,
             load_rows=upsert_daily_register_rows,
+            merge_window=merge_window,
+            refresh_window=refresh_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -697,7 +820,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 source="instagram_insights",
             )
 
-        async def delete_window(session_: AsyncSession, target_start, target_end) -> int:
+        async def capture_total_followers(session_: AsyncSession, target_start, target_end) -> None:
             nonlocal existing_total_followers, snapshot_date
             snapshot_date = target_end if target_start == target_end else None
             existing_rows = await session_.execute(
@@ -711,14 +834,8 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 for row in existing_rows
                 if int(row.total_followers or 0) > 0
             }
-            return await delete_rows_in_date_window(
-                session=session_,
-                model_cls=InstagramInsights,
-                window_start=target_start,
-                window_end=target_end,
-            )
 
-        async def load_rows(session_: AsyncSession, rows: list[dict]) -> None:
+        def keep_total_followers(rows: list[dict]) -> list[dict]:
             safe_rows = []
             for row in rows:
                 safe_row = dict(row)
@@ -728,7 +845,29 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 elif snapshot_date is not None and row_date != snapshot_date:
                     safe_row["total_followers"] = 0
                 safe_rows.append(safe_row)
-            await upsert_instagram_insights_rows(session=session_, rows=safe_rows)
+            return safe_rows
+
+        async def delete_window(session_: AsyncSession, target_start, target_end) -> int:
+            await capture_total_followers(session_, target_start, target_end)
+            return await delete_rows_in_date_window(
+                session=session_,
+                model_cls=InstagramInsights,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
+        async def load_rows(session_: AsyncSession, rows: list[dict]) -> None:
+            await upsert_instagram_insights_rows(session=session_, rows=keep_total_followers(rows))
+
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            await capture_total_followers(session_, target_start, target_end)
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=InstagramInsights,
+                rows=keep_total_followers(rows),
+                window_start=target_start,
+                window_end=target_end,
+            )
 
         spec = DateWindowPipelineSpec(
             label="instagram_insights",
@@ -743,6 +882,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_instagram_insights_models,
             delete_window=delete_window,
             load_rows=load_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -781,6 +921,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=InstagramMediaInsights,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="instagram_media_insights",
             source="instagram_media_insights",
@@ -794,6 +943,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_instagram_media_insights_models,
             delete_window=delete_window,
             load_rows=upsert_instagram_media_insights_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -843,6 +993,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=TikTokInsights,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="tiktok_insights",
             source="tiktok_insights",
@@ -857,6 +1016,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             delete_window=delete_window,
             load_rows=upsert_tiktok_insights_rows,
             resolve_window=resolve_snapshot_window,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -895,6 +1055,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=TikTokMediaInsights,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="tiktok_media_insights",
             source="tiktok_media_insights",
@@ -908,6 +1077,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_tiktok_media_insights_models,
             delete_window=delete_window,
             load_rows=upsert_tiktok_media_insights_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -950,6 +1120,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=YouTubeDailyInsight,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="youtube_daily_insight",
             source="youtube_daily_insight",
@@ -963,6 +1142,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_youtube_daily_insight_models,
             delete_window=delete_window,
             load_rows=upsert_youtube_daily_insight_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1005,6 +1185,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=YouTubeMediaInsight,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="youtube_media_insight",
             source="youtube_media_insight",
@@ -1018,6 +1207,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_youtube_media_insight_models,
             delete_window=delete_window,
             load_rows=upsert_youtube_media_insight_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1056,6 +1246,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=FacebookPageInsights,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="facebook_page_insights",
             source="facebook_page_insights",
@@ -1069,6 +1268,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_facebook_page_insights_models,
             delete_window=delete_window,
             load_rows=upsert_facebook_page_insights_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1107,6 +1307,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=FacebookPageMediaInsights,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="facebook_page_media_insights",
             source="facebook_page_media_insights",
@@ -1120,6 +1329,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_facebook_page_media_insights_models,
             delete_window=delete_window,
             load_rows=upsert_facebook_page_media_insights_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1175,6 +1385,16 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_deposit_rows(
+                session=session_,
+                model_cls=DataDepo,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+                date_column="tanggal_regis",
+            )
+
         spec = DateWindowPipelineSpec(
             label="first_deposit",
             source="first_deposit",
@@ -1188,6 +1408,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_first_deposit_models,
             delete_window=delete_window,
             load_rows=upsert_first_deposit_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1225,6 +1446,16 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_deposit_rows(
+                session=session_,
+                model_cls=DataDepoBa,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+                date_column="tanggal_regis",
+            )
+
         spec = DateWindowPipelineSpec(
             label="first_deposit_ba",
             source="first_deposit_ba",
@@ -1238,6 +1469,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_first_deposit_ba_models,
             delete_window=delete_window,
             load_rows=upsert_first_deposit_ba_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1275,6 +1507,16 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_deposit_rows(
+                session=session_,
+                model_cls=DataMsDeposit,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+                date_column="last_activity",
+            )
+
         spec = DateWindowPipelineSpec(
             label="ms_deposit",
             source="ms_deposit",
@@ -1288,6 +1530,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_ms_deposit_models,
             delete_window=delete_window,
             load_rows=upsert_ms_deposit_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -1325,6 +1568,15 @@ class GoogleSheetApi(DateWindowPipelineRunner):
                 window_end=target_end,
             )
 
+        async def merge_window(session_: AsyncSession, rows: list[dict], target_start, target_end):
+            return await merge_rows_in_date_window(
+                session=session_,
+                model_cls=PlayConsoleInstallMetrics,
+                rows=rows,
+                window_start=target_start,
+                window_end=target_end,
+            )
+
         spec = DateWindowPipelineSpec(
             label="play_console_install_metrics",
             source="play_console_install_metrics",
@@ -1338,6 +1590,7 @@ class GoogleSheetApi(DateWindowPipelineRunner):
             build_rows=self._build_play_console_install_models,
             delete_window=delete_window,
             load_rows=upsert_play_console_install_rows,
+            merge_window=merge_window,
         )
         return await self._run_date_window_pipeline(
             spec=spec,
@@ -14,6 +14,8 @@ def build_quality_report(
     rows_extracted: int | None = None,
     rows_loaded: int | None = None,
     duration_ms: int | None = None,
+    http_hosts: dict[str, dict[str, Any]] | None = None,
+    load_counts: dict[str, dict[str, int]] | None = None,
 ) -> dict[str, Any]:
     """Build a stable quality-report payload for one ETL run."""
     checks: list[dict[str, Any]] = []
@@ -25,7 +27,7 @@ def build_quality_report(
                 "detail": error_detail[:500],
             }
         )
-    elif status == "success":
+    elif status in {"success", "skipped_unchanged"}:
         checks.append(
             {
                 "name": "data_quality",
@@ -44,4 +46,6 @@ def build_quality_report(
         "rows_loaded": rows_loaded,
         "duration_ms": duration_ms,
         "checks": checks,
+        "http_hosts": http_hosts or {},
+        "load_counts": load_counts or {},
     }
@@ -0,0 +1,120 @@
+"""Dependency-aware scheduling for multi-source ETL batches."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+logger = logging.getLogger(__name__)
+
+SOURCE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    # Campaign dimension is rebuilt from the three ads fact tables.
+    "unique_campaign": ("google_ads", "facebook_ads", "tiktok_ads"),
+    # Registrations and deposits attach to campaign rows.
+    "daily_register": ("unique_campaign",),
+    "first_deposit": ("unique_campaign",),
+    "first_deposit_ba": ("unique_campaign",),
+    "ms_deposit": ("unique_campaign",),
+    # Account insights read engagement totals from the media insight table.
+    "instagram_insights": ("instagram_media_insights",),
+}
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_FAILED = "failed"
+OUTCOME_SKIPPED = "skipped"
+
+
+def resolve_source_graph(
+    sources: Sequence[str],
+    dependencies: Mapping[str, Sequence[str]] = SOURCE_DEPENDENCIES,
+) -> dict[str, tuple[str, ...]]:
+    """Restrict dependency edges to the selected sources.
+
+    Args:
+        sources (Sequence[str]): Requested source keys, duplicates ignored.
+        dependencies (Mapping[str, Sequence[str]]): Full dependency map.
+
+    Returns:
+        dict[str, tuple[str, ...]]: Selected sources in request order mapped to
+        the upstream sources they must wait for.
+
+    Raises:
+        ValueError: When the selected edges contain a cycle.
+    """
+    selected = list(dict.fromkeys(sources))
+    selected_set = set(selected)
+    graph = {
+        source: tuple(dep for dep in dependencies.get(source, ()) if dep in selected_set)
+        for source in selected
+    }
+
+    remaining = {source: set(deps) for source, deps in graph.items()}
+    while remaining:
+        ready = [source for source, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(
+                "Circular ETL source dependencies: " + ", ".join(sorted(remaining))
+            )
+        for source in ready:
+            remaining.pop(source)
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return graph
+
+
+async def run_source_graph(
+    *,
+    sources: Sequence[str],
+    run_source: Callable[[str], Awaitable[bool]],
+    max_workers: int,
+    fail_fast: bool = False,
+    dependencies: Mapping[str, Sequence[str]] = SOURCE_DEPENDENCIES,
+) -> dict[str, str]:
+    """Run sources once their upstream sources finish, bounded by ``max_workers``.
+
+    A failed upstream source does not block its dependents, matching the serial
+    runner. With ``fail_fast`` enabled, sources that have not started yet are
+    skipped after the first failure while in-flight sources finish normally.
+
+    Args:
+        sources (Sequence[str]): Requested source keys.
+        run_source (Callable[[str], Awaitable[bool]]): Coroutine running one
+            source and returning ``True`` on success.
+        max_workers (int): Maximum number of sources running at the same time.
+        fail_fast (bool): Stop starting new sources after the first failure.
+        dependencies (Mapping[str, Sequence[str]]): Full dependency map.
+
+    Returns:
+        dict[str, str]: Outcome per source (``success``, ``failed``, ``skipped``).
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    graph = resolve_source_graph(sources, dependencies)
+    semaphore = asyncio.Semaphore(max_workers)
+    finished = {source: asyncio.Event() for source in graph}
+    stop_requested = asyncio.Event()
+    outcomes: dict[str, str] = {}
+
+    async def _run(source: str) -> None:
+        try:
+            for upstream in graph[source]:
+                await finished[upstream].wait()
+            async with semaphore:
+                if stop_requested.is_set():
+                    outcomes[source] = OUTCOME_SKIPPED
+                    return
+                try:
+                    succeeded = await run_source(source)
+                except Exception:
+                    logger.exception("Unhandled error while running ETL source %s", source)
+                    succeeded = False
+            outcomes[source] = OUTCOME_SUCCESS if succeeded else OUTCOME_FAILED
+            if not succeeded and fail_fast:
+                stop_requested.set()
+        finally:
+            finished[source].set()
+
+    await asyncio.gather(*(_run(source) for source in graph))
+    return {source: outcomes.get(source, OUTCOME_SKIPPED) for source in graph}
@@ -0,0 +1,140 @@
+"""Per-batch Google Sheets snapshots shared by sources reading the same tab."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import uuid
+from typing import Any
+
+_COLUMN_RANGE_PATTERN = re.compile(r"^(?P<sheet>.+)!(?P<start>[A-Za-z]+):(?P<end>[A-Za-z]+)$")
+
+
+def column_letter_to_index(letters: str) -> int:
+    """Convert an A1 column label (``A``, ``T``, ``AB``) into a zero-based index."""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index - 1
+
+
+def column_index_to_letter(index: int) -> str:
+    """Convert a zero-based column index into its A1 column label."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def parse_column_range(range_name: str) -> tuple[str, int, int] | None:
+    """Split a whole-column A1 range into ``(sheet, first_col, last_col)``.
+
+    Ranges with row bounds (``A2:G100``) are not sliceable and return ``None``.
+    """
+    match = _COLUMN_RANGE_PATTERN.match(range_name.strip())
+    if match is None:
+        return None
+    start = column_letter_to_index(match.group("start"))
+    end = column_letter_to_index(match.group("end"))
+    if end < start:
+        return None
+    return match.group("sheet"), start, end
+
+
+def _slice_rows(values: list, offset: int, width: int) -> list:
+    """Cut one column span out of snapshot rows, trimming like the Sheets API does."""
+    sliced: list = []
+    for row in values:
+        cells = list(row[offset:offset + width])
+        while cells and cells[-1] == "":
+            cells.pop()
+        sliced.append(cells)
+    while sliced and not sliced[-1]:
+        sliced.pop()
+    return sliced
+
+
+class SheetSnapshotCache:
+    """Fetch each spreadsheet tab once per ETL batch and slice columns per consumer.
+
+    Consumers register the ranges they will read, so the first fetch of a tab
+    downloads the widest registered column span in one ``batchGet`` call and later
+    consumers get their columns from memory.
+    """
+
+    def __init__(self, batch_id: str | None = None) -> None:
+        self.batch_id = batch_id or str(uuid.uuid4())
+        self.fetch_count = 0
+        self._registered: dict[tuple[str, str], tuple[int, int]] = {}
+        self._snapshots: dict[tuple[str, str], tuple[int, int, list]] = {}
+        self._raw_snapshots: dict[tuple[str, str], list] = {}
+        self._locks: dict[tuple[str, str], asyncio.Lock] = {}
+
+    def register(self, spreadsheet_id: str | None, range_name: str | None) -> None:
+        """Declare that one consumer will read ``range_name`` in this batch."""
+        if not spreadsheet_id or not range_name:
+            return
+        parsed = parse_column_range(range_name)
+        if parsed is None:
+            return
+        sheet, start, end = parsed
+        key = (spreadsheet_id, sheet)
+        if key in self._registered:
+            known_start, known_end = self._registered[key]
+            start, end = min(start, known_start), max(end, known_end)
+        self._registered[key] = (start, end)
+
+    def _lock_for(self, key: tuple[str, str]) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def get_values(self, service: Any, spreadsheet_id: str, range_name: str) -> list:
+        """Return sheet values for ``range_name``, downloading the tab at most once.
+
+        Args:
+            service (Any): Google Sheets API client.
+            spreadsheet_id (str): Spreadsheet identifier.
+            range_name (str): A1 range requested by the consumer.
+
+        Returns:
+            list: Row values shaped like a direct ``values().get`` response.
+        """
+        parsed = parse_column_range(range_name)
+        if parsed is None:
+            key = (spreadsheet_id, range_name)
+            async with self._lock_for(key):
+                if key not in self._raw_snapshots:
+                    fetched = await self._batch_get(service, spreadsheet_id, range_name)
+                    self._raw_snapshots[key] = fetched
+            return [list(row) for row in self._raw_snapshots[key]]
+
+        sheet, start, end = parsed
+        key = (spreadsheet_id, sheet)
+        async with self._lock_for(key):
+            snapshot = self._snapshots.get(key)
+            if snapshot is None or not (snapshot[0] <= start and end <= snapshot[1]):
+                self.register(spreadsheet_id, range_name)
+                wide_start, wide_end = self._registered[key]
+                wide_range = (
+                    f"{sheet}!{column_index_to_letter(wide_start)}:{column_index_to_letter(wide_end)}"
+                )
+                values = await self._batch_get(service, spreadsheet_id, wide_range)
+                snapshot = self._snapshots[key] = (wide_start, wide_end, values)
+        snapshot_start, _snapshot_end, values = snapshot
+        return _slice_rows(values, start - snapshot_start, end - start + 1)
+
+    async def _batch_get(self, service: Any, spreadsheet_id: str, range_name: str) -> list:
+        def _request():
+            result = service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=[range_name],
+            ).execute()
+            value_ranges = result.get("valueRanges", [])
+            return value_ranges[0].get("values", []) if value_ranges else []
+
+        self.fetch_count += 1
+        return await asyncio.to_thread(_request)
@@ -0,0 +1,208 @@
+"""Row watermarks for incremental reads of append-only Google Sheets tabs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+
+import pandas as pd
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.etl_run import EtlSheetWatermark
+from app.etl.sheet_snapshot import column_index_to_letter, parse_column_range
+from app.etl.transform import normalize_columns
+
+SHEET_WATERMARK_ANCHOR_ROWS = 5
+
+
+@dataclass(frozen=True)
+class SheetRead:
+    """Rows returned by one sheet read plus the watermark to persist for it."""
+
+    rows: list
+    mode: str
+    watermark: dict[str, Any] | None = None
+
+
+def rows_hash(rows: Sequence[Sequence[Any]]) -> str:
+    """Hash sheet rows in a stable way for watermark comparisons."""
+    payload = json.dumps([list(row) for row in rows], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _date_column_index(header: Sequence[Any], date_headers: Sequence[str]) -> int | None:
+    normalized = normalize_columns(list(header))
+    for candidate in date_headers:
+        if candidate in normalized:
+            return normalized.index(candidate)
+    return None
+
+
+def build_sheet_watermark(
+    *,
+    source: str,
+    spreadsheet_id: str,
+    range_name: str,
+    header: list,
+    numbered_rows: list[tuple[int, list]],
+    date_headers: Sequence[str],
+    window_start: date,
+) -> dict[str, Any] | None:
+    """Compute the resume point for the next read of one sheet tab.
+
+    Args:
+        source (str): ETL source that owns the watermark.
+        spreadsheet_id (str): Spreadsheet identifier.
+        range_name (str): Whole-column range configured for the source.
+        header (list): Header row of the tab.
+        numbered_rows (list[tuple[int, list]]): Data rows keyed by their 1-based
+            sheet row number, in sheet order.
+        date_headers (Sequence[str]): Normalized header names holding row dates.
+        window_start (date): Start of the window loaded by this run.
+
+    Returns:
+        dict[str, Any] | None: Watermark column values, or ``None`` when the tab
+        has no recognizable date column.
+    """
+    date_index = _date_column_index(header, date_headers)
+    if date_index is None:
+        return None
+
+    last_row = numbered_rows[-1][0] if numbered_rows else 1
+    resume_row = last_row + 1
+    if numbered_rows:
+        raw_dates = pd.Series(
+            [row[date_index] if date_index < len(row) else None for _row_number, row in numbered_rows],
+            dtype="object",
+        )
+        parsed_dates = pd.to_datetime(raw_dates, errors="coerce").dt.date
+        for (row_number, _row), parsed_date in zip(numbered_rows, parsed_dates):
+            # Undated rows are kept after the watermark so they are never skipped.
+            if pd.isna(parsed_date) or parsed_date >= window_start:
+                resume_row = row_number
+                break
+
+    rows_by_number = dict(numbered_rows)
+    anchor_start = max(2, resume_row - SHEET_WATERMARK_ANCHOR_ROWS)
+    anchor_rows = [rows_by_number.get(row_number, []) for row_number in range(anchor_start, resume_row)]
+    return {
+        "source": source,
+        "spreadsheet_id": spreadsheet_id,
+        "range_name": range_name,
+        "window_start": window_start,
+        "resume_row": resume_row,
+        "last_row": last_row,
+        "header_hash": rows_hash([header]),
+        "anchor_hash": rows_hash(anchor_rows),
+        "updated_at": datetime.now(),
+    }
+
+
+async def read_sheet_incremental(
+    *,
+    session: AsyncSession,
+    source: str,
+    spreadsheet_id: str,
+    range_name: str,
+    date_headers: Sequence[str],
+    window_start: date,
+    fetch_ranges: Callable[[list[str]], Awaitable[list[list]]],
+    full_read: Callable[[], Awaitable[list]],
+) -> SheetRead:
+    """Read only rows at or after the stored watermark, falling back to a full read.
+
+    The incremental path requests the header row and ``A{n}:Z`` (starting a few
+    anchor rows above the watermark) in one call. When the header or anchor rows
+    no longer match their stored hashes, or the requested window starts before
+    the stored one, the whole range is read instead.
+
+    Returns:
+        SheetRead: Header plus data rows shaped like a full ``values().get``
+        response, the read mode, and the next watermark to persist.
+    """
+    parsed_range = parse_column_range(range_name)
+    if parsed_range is None:
+        return SheetRead(rows=await full_read(), mode="full")
+    sheet, first_col, last_col = parsed_range
+    first_letter = column_index_to_letter(first_col)
+    last_letter = column_index_to_letter(last_col)
+
+    watermark = await session.get(EtlSheetWatermark, source)
+    header: list | None = None
+    numbered_rows: list[tuple[int, list]] | None = None
+    mode = "full"
+    if (
+        watermark is not None
+        and watermark.spreadsheet_id == spreadsheet_id
+        and watermark.range_name == range_name
+        and watermark.window_start <= window_start
+        and watermark.resume_row > 2
+    ):
+        anchor_start = max(2, watermark.resume_row - SHEET_WATERMARK_ANCHOR_ROWS)
+        header_values, tail_values = await fetch_ranges(
+            [
+                f"{sheet}!{first_letter}1:{last_letter}1",
+                f"{sheet}!{first_letter}{anchor_start}:{last_letter}",
+            ]
+        )
+        candidate_header = list(header_values[0]) if header_values else []
+        anchor_count = watermark.resume_row - anchor_start
+        anchor_rows = [list(row) for row in tail_values[:anchor_count]]
+        while len(anchor_rows) < anchor_count:
+            anchor_rows.append([])
+        if (
+            candidate_header
+            and rows_hash([candidate_header]) == watermark.header_hash
+            and rows_hash(anchor_rows) == watermark.anchor_hash
+        ):
+            header = candidate_header
+            numbered_rows = [
+                (anchor_start + offset, list(row))
+                for offset, row in enumerate(tail_values)
+            ]
+            mode = "incremental"
+
+    if header is None or numbered_rows is None:
+        values = await full_read()
+        if not values:
+            return SheetRead(rows=[], mode="full")
+        header = list(values[0])
+        numbered_rows = [(offset + 2, list(row)) for offset, row in enumerate(values[1:])]
+
+    next_watermark = build_sheet_watermark(
+        source=source,
+        spreadsheet_id=spreadsheet_id,
+        range_name=range_name,
+        header=header,
+        numbered_rows=numbered_rows,
+        date_headers=date_headers,
+        window_start=window_start,
+    )
+    if mode == "incremental":
+        resume_row = watermark.resume_row
+        data_rows = [row for row_number, row in numbered_rows if row_number >= resume_row]
+    else:
+        data_rows = [row for _row_number, row in numbered_rows]
+    return SheetRead(rows=[header, *data_rows], mode=mode, watermark=next_watermark)
+
+
+async def save_sheet_watermark(session: AsyncSession, watermark: dict[str, Any] | None) -> None:
+    """Upsert one sheet watermark in the caller's transaction."""
+    if not watermark:
+        return
+    insert_stmt = sqlite_insert(EtlSheetWatermark).values(**watermark)
+    await session.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=["source"],
+            set_={
+                column: insert_stmt.excluded[column]
+                for column in watermark
+                if column != "source"
+            },
+        )
+    )
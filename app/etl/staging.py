@@ -14,7 +14,7 @@ from app.db.models.external_api import StgAdsRaw
 from app.etl.transform import normalize_columns
 
 
-def _payload_hash(payload) -> str:
+def payload_hash(payload) -> str:
     """Build stable payload hash for raw staging rows.
 
     Args:
@@ -85,7 +85,7 @@ async def stage_ads_raw(
             "source": source,
             "range_name": range_name,
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in payloads
@@ -121,7 +121,7 @@ async def stage_ga4_raw(
             "source": source,
             "range_name": "ga4_daily_metrics",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -147,7 +147,7 @@ async def stage_instagram_insights_raw(
             "source": source,
             "range_name": "instagram_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -173,7 +173,7 @@ async def stage_tiktok_insights_raw(
             "source": source,
             "range_name": "tiktok_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -199,7 +199,7 @@ async def stage_tiktok_media_insights_raw(
             "source": source,
             "range_name": "tiktok_media_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -225,7 +225,7 @@ async def stage_youtube_daily_insight_raw(
             "source": source,
             "range_name": "youtube_daily_insight_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -251,7 +251,7 @@ async def stage_youtube_media_insight_raw(
             "source": source,
             "range_name": "youtube_media_insight_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -277,7 +277,7 @@ async def stage_instagram_media_insights_raw(
             "source": source,
             "range_name": "instagram_media_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -303,7 +303,7 @@ async def stage_facebook_page_insights_raw(
             "source": source,
             "range_name": "facebook_page_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -329,7 +329,7 @@ async def stage_facebook_page_media_insights_raw(
             "source": source,
             "range_name": "facebook_page_media_insights_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -371,7 +371,7 @@ async def stage_first_deposit_raw(
             "source": source,
             "range_name": "first_deposit_api",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -397,7 +397,7 @@ async def stage_ms_deposit_raw(
             "source": source,
             "range_name": "ms_deposit_sheet",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -423,7 +423,7 @@ async def stage_play_console_install_raw(
             "source": source,
             "range_name": "play_console_gcs_export",
             "payload": item,
-            "payload_hash": _payload_hash(item),
+            "payload_hash": payload_hash(item),
             "ingested_at": ingested_at,
         }
         for item in raw_rows
@@ -815,21 +815,10 @@ def _first_present_column(df: pd.DataFrame, aliases: list[str]) -> str | None:
     return None
 
 
-def parse_play_console_install_dataframe(raw_rows: list[dict]) -> pd.DataFrame:
-    """Parse Google Play Console overview install CSV rows into daily metrics."""
-    if not raw_rows:
-        return pd.DataFrame()
-
+def _parse_play_console_install_rows(raw_rows: list[dict]) -> pd.DataFrame:
+    """Resolve one report object's rows into ungrouped daily install metrics."""
     df = pd.DataFrame(raw_rows)
     df.columns = normalize_columns(df.columns.tolist())
-    if "source_object" in df.columns:
-        source_object = df["source_object"].fillna("").astype(str).str.lower()
-        overview_rows = df.loc[
-            source_object.str.contains("/installs/", regex=False)
-            & source_object.str.endswith("_overview.csv")
-        ].copy()
-        if not overview_rows.empty:
-            df = overview_rows
 
     column_aliases = {
         "date": ["date"],
@@ -897,7 +886,33 @@ def parse_play_console_install_dataframe(raw_rows: list[dict]) -> pd.DataFrame:
             )
             parsed[metric] = pd.to_numeric(parsed[metric], errors="coerce").fillna(0).astype(int)
 
-    parsed = parsed[(parsed["date"].notna()) & (parsed["package_name"] != "")].copy()
+    return parsed[(parsed["date"].notna()) & (parsed["package_name"] != "")]
+
+
+def parse_play_console_install_dataframe(raw_rows: list[dict]) -> pd.DataFrame:
+    """Parse Google Play Console overview install CSV rows into daily metrics.
+
+    Columns are resolved per ``source_object``: monthly exports do not always
+    share a header, and rows rebuilt from loaded metrics use canonical names.
+    """
+    if not raw_rows:
+        return pd.DataFrame()
+
+    rows_by_object: dict[str, list[dict]] = {}
+    for row in raw_rows:
+        rows_by_object.setdefault(str(row.get("source_object") or "").lower(), []).append(row)
+    overview_objects = [
+        source_object
+        for source_object in rows_by_object
+        if "/installs/" in source_object and source_object.endswith("_overview.csv")
+    ]
+    if overview_objects:
+        rows_by_object = {source_object: rows_by_object[source_object] for source_object in overview_objects}
+
+    parsed = pd.concat(
+        [_parse_play_console_install_rows(object_rows) for object_rows in rows_by_object.values()],
+        ignore_index=True,
+    )
     if parsed.empty:
         return pd.DataFrame(
             columns=[
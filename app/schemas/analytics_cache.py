@@ -0,0 +1,40 @@
+"""Schemas for analytics cache admin endpoints."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from app.schemas.responses import ApiResponseV1
+
+
+class AnalyticsResponseCacheStats(BaseModel):
+    """Size, budget and hit/miss counters of the analytics response cache."""
+
+    enabled: bool
+    entries: int
+    max_entries: int
+    total_bytes: int
+    max_bytes: int | None
+    hits: int
+    misses: int
+    hit_ratio: float | None
+    evictions: int
+
+
+class AnalyticsCacheStats(ApiResponseV1):
+    """Size, budget and hit/miss counters of the analytics DataFrame cache."""
+
+    enabled: bool
+    read_only: bool
+    entries: int
+    max_entries: int
+    ttl_seconds: int
+    total_bytes: int
+    max_bytes: int | None
+    hits: int
+    misses: int
+    hit_ratio: float | None
+    evictions: int
+    evicted_bytes: int
+    oversized_rejections: int
+    response_cache: AnalyticsResponseCacheStats
@@ -51,7 +51,8 @@ class UpdateDataStatusResponse(BaseModel):
         pipeline (str): Logical pipeline family, for example external API sync.
         source (str): Source selected by the user for this run.
         mode (str): Trigger mode such as ``auto`` or ``manual``.
-        status (str): Current lifecycle state (`queued`, `running`, `success`, `failed`).
+        status (str): Current lifecycle state (`queued`, `running`, `success`,
+            `skipped_unchanged`, `failed`).
         message (str | None): Success/status message persisted by the ETL job.
         error_detail (str | None): Failure detail stored when the job fails.
         window_start (date | None): Inclusive ETL window start.
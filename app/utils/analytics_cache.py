@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import date
 
 from app.core.config import settings
 from app.utils.dataframe_cache import CacheKey, DataFrameCache
@@ -14,6 +15,8 @@ CAMPAIGN_CACHE_PREFIX: CacheKey = ("campaign",)
 campaign_dataframe_cache = DataFrameCache(
     max_entries=settings.ANALYTICS_DATAFRAME_CACHE_MAX_ENTRIES,
     ttl_seconds=settings.ANALYTICS_DATAFRAME_CACHE_TTL_SECONDS,
+    max_bytes=settings.ANALYTICS_DATAFRAME_CACHE_MAX_BYTES,
+    read_only=settings.ANALYTICS_DATAFRAME_CACHE_READ_ONLY,
 )
 
 
@@ -27,3 +30,16 @@ def clear_campaign_analytics_cache() -> int:
     removed = campaign_dataframe_cache.clear(prefix=CAMPAIGN_CACHE_PREFIX)
     logger.info("Cleared %s campaign analytics DataFrame cache entries", removed)
     return removed
+
+
+def invalidate_campaign_analytics_cache(table: str, start: date | None = None, end: date | None = None) -> int:
+    """Drop cached campaign DataFrames that read ``table`` within ``[start, end]``."""
+    removed = campaign_dataframe_cache.invalidate(table, start, end, prefix=CAMPAIGN_CACHE_PREFIX)
+    logger.info(
+        "Invalidated %s campaign analytics DataFrame cache entries for %s (%s..%s)",
+        removed,
+        table,
+        start,
+        end,
+    )
+    return removed
@@ -22,6 +22,7 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from uvicorn import run as uvicorn_run
 
+from app.api.v1.endpoint.analytics_cache import router as analytics_cache_router
 from app.api.v1.endpoint.auth import router as auth_router
 from app.api.v1.endpoint.campaign import router as campaign_router
 from app.api.v1.endpoint.deposit import router as deposit_router
@@ -39,7 +40,8 @@ from app.api.v1.endpoint.youtube import router as youtube_router
 from app.api.v1.endpoint.youtube_oauth import router as youtube_oauth_router
 from app.core.config import settings
 from app.db.bootstrap import initialize_database_schema, verify_database_ready
-from app.db.session import sqlite_async_session, sqlite_engine
+from app.db.session import sqlite_async_session, sqlite_engine, sqlite_read_engine
+from app.etl.ads_rollup import backfill_missing_ads_rollups
 from app.utils.http_security import security_headers_middleware
 from app.utils.request_logging import RequestLogService
 from app.utils.superadmin_bootstrap import SuperadminBootstrapService
@@ -371,7 +373,7 @@ class FastApiApp:
             None: Control is yielded back to FastAPI during normal runtime.
 
         Returns:
-            None: Disposes database engine after shutdown sequence.
+            None: Disposes the database engines after shutdown sequence.
         """
         if settings.AUTO_INIT_DB_ON_STARTUP:
             self.logger.warning(
@@ -379,6 +381,8 @@ class FastApiApp:
                 "or the dedicated db-init service for controlled schema bootstrap."
             )
             await initialize_database_schema()
+            async with sqlite_engine.begin() as connection:
+                await backfill_missing_ads_rollups(connection)
         else:
             self.logger.info("Application startup: verifying database readiness")
             await verify_database_ready()
@@ -386,8 +390,10 @@ class FastApiApp:
         self._request_logging.start_worker()
         yield
         await self._request_logging.stop_worker()
-        self.logger.info("Application shutdown: disposing database engine")
+        self.logger.info("Application shutdown: disposing database engines")
         await sqlite_engine.dispose()
+        if sqlite_read_engine is not None:
+            await sqlite_read_engine.dispose()
 
     def _add_builtin_routes(self) -> None:
         """Register lightweight operational routes that do not belong to API v1."""
@@ -492,6 +498,7 @@ class FastApiApp:
         self.app.include_router(meta_ads_token_router, tags=["Meta Ads Token"])
         self.app.include_router(feature_router, tags=["Update Data"])
         self.app.include_router(sqlite_maintenance_router, tags=["SQLite Maintenance"])
+        self.app.include_router(analytics_cache_router, tags=["Analytics Cache"])
         self.app.include_router(overview_router, tags=["Overview Analytics"])
         self.app.include_router(install_router, tags=["Install Analytics"])
         self.app.include_router(campaign_router, tags=["Campaign Analytics"])
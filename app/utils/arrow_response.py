@@ -0,0 +1,107 @@
+"""Arrow IPC transport for analytics responses.
+
+Clients that send ``Accept: application/vnd.apache.arrow.stream`` receive
+the analytics envelope as an Arrow IPC stream instead of JSON:
+
+- the outer stream has one record batch with columns ``name`` (string) and
+  ``ipc`` (binary), one row per table field of the payload;
+- every ``ipc`` value is itself an Arrow IPC stream holding that table;
+- the schema metadata key ``analytics_envelope`` holds the JSON envelope,
+  where each table field is replaced by ``{"arrow_table": <name>}``.
+
+Table fields are the DataFrames payload builders return for ``orient=split``,
+so endpoints with an ``orient`` parameter build those when Arrow is
+negotiated. Numeric columns travel as raw Arrow buffers and the client can
+map them without a JSON parse.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.utils.json_response import TableOrient, dumps
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_ENVELOPE_METADATA_KEY = b"analytics_envelope"
+ARROW_TABLE_MARKER = "arrow_table"
+
+
+def accepts_arrow_stream(request: Request | None) -> bool:
+    """Return whether ``request`` lists the Arrow stream media type with a non-zero quality."""
+    if request is None:
+        return False
+    for media_range in request.headers.get("accept", "").split(","):
+        media_type, *parameters = (part.strip() for part in media_range.split(";"))
+        if media_type.lower() != ARROW_STREAM_MEDIA_TYPE:
+            continue
+        for parameter in parameters:
+            key, _, value = parameter.partition("=")
+            if key.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def negotiated_orient(request: Request, orient: TableOrient) -> TableOrient:
+    """Return the table orient to build: Arrow responses always need DataFrame (``split``) tables."""
+    return "split" if accepts_arrow_stream(request) else orient
+
+
+def _extract_tables(value: Any, path: str, tables: dict[str, pd.DataFrame]) -> Any:
+    """Move DataFrames out of ``value`` into ``tables`` and leave name markers behind."""
+    if isinstance(value, pd.DataFrame):
+        tables[path] = value
+        return {ARROW_TABLE_MARKER: path}
+    if isinstance(value, dict):
+        return {
+            key: _extract_tables(item, f"{path}.{key}" if path else str(key), tables)
+            for key, item in value.items()
+        }
+    return value
+
+
+def table_ipc_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize one table as an Arrow IPC stream."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def render_arrow_stream(content: dict[str, Any]) -> bytes:
+    """Serialize an analytics envelope as the Arrow IPC stream described in the module docstring."""
+    tables: dict[str, pd.DataFrame] = {}
+    envelope = _extract_tables(content, "", tables)
+    schema = pa.schema(
+        [pa.field("name", pa.string()), pa.field("ipc", pa.binary())],
+        metadata={ARROW_ENVELOPE_METADATA_KEY: dumps(envelope)},
+    )
+    batch = pa.record_batch(
+        [
+            pa.array(list(tables), type=pa.string()),
+            pa.array([table_ipc_bytes(df) for df in tables.values()], type=pa.binary()),
+        ],
+        schema=schema,
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+class AnalyticsArrowResponse(Response):
+    """Analytics envelope rendered as an Arrow IPC stream."""
+
+    media_type = ARROW_STREAM_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return render_arrow_stream(content)
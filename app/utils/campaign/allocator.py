@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
@@ -23,14 +24,17 @@ class CampaignLeadAllocator:
         group_keys = ["date", "campaign_id"]
         merged["_row_count"] = merged.groupby(group_keys)["campaign_id"].transform("size")
         merged["_cost_total"] = merged.groupby(group_keys)["cost"].transform("sum")
-        merged["leads"] = merged.apply(
-            lambda row: (
-                float(row["leads"]) * (float(row["cost"]) / float(row["_cost_total"]))
-                if float(row["_cost_total"]) > 0
-                else float(row["leads"]) / float(row["_row_count"])
-            ),
-            axis=1,
-        )
+        leads = merged["leads"].to_numpy(dtype=float)
+        cost = merged["cost"].to_numpy(dtype=float)
+        cost_total = merged["_cost_total"].to_numpy(dtype=float)
+        row_count = merged["_row_count"].to_numpy(dtype=float)
+        # Split by cost share; groups without spend fall back to an equal split.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            merged["leads"] = np.where(
+                cost_total > 0,
+                leads * (cost / cost_total),
+                leads / row_count,
+            )
         return merged.drop(columns=["_row_count", "_cost_total"])
 
     @staticmethod
@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from datetime import date, timedelta
 
 import pandas as pd
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+from app.db.models.ads_rollup import AdsDailyCampaignRollup
 from app.db.models.external_api import Campaign, DailyRegister, FacebookAds, GoogleAds, TikTokAds
 from app.utils.campaign.allocator import CampaignLeadAllocator
 from app.utils.campaign.cache_adapter import CampaignCacheAdapter
@@ -22,8 +24,15 @@ from app.utils.campaign.types import AdsModel
 class CampaignDataBase:
     """Base campaign analytics service with shared loading and aggregations."""
 
-    def __init__(self, session: AsyncSession, from_date: date, to_date: date) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        from_date: date,
+        to_date: date,
+        read_session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
         self.session = session
+        self.read_session_factory = read_session_factory
         self.from_date = from_date
         self.to_date = to_date
         self.cache_adapter = CampaignCacheAdapter()
@@ -42,27 +51,36 @@ class CampaignDataBase:
         self._query_lock = asyncio.Lock()
 
     @classmethod
-    async def load_data(cls, session: AsyncSession, from_date: date, to_date: date):
-        instance = cls(session, from_date, to_date)
+    async def load_data(
+        cls,
+        session: AsyncSession,
+        from_date: date,
+        to_date: date,
+        read_session_factory: Callable[[], AsyncSession] | None = None,
+    ):
+        instance = cls(session, from_date, to_date, read_session_factory=read_session_factory)
         await instance._fetch_data()
         return instance
 
     async def _fetch_data(self) -> None:
-        self.df_google = await self._read_ads_db(GoogleAds)
-        self.df_facebook = await self._read_ads_db(FacebookAds)
-        self.df_tiktok = await self._read_ads_db(TikTokAds)
-        self.df_depo = await self._read_depo_db()
+        # Deposit rows and the register leads shared by every ads source load first,
+        # so the three ads reads below hit the cached lead frame instead of racing it.
+        self.df_depo, _ = await asyncio.gather(
+            self._read_depo_db(),
+            self._read_daily_register_db(from_date=self.from_date, to_date=self.to_date),
+        )
+        self.df_google, self.df_facebook, self.df_tiktok = await asyncio.gather(
+            self._read_ads_db(GoogleAds),
+            self._read_ads_db(FacebookAds),
+            self._read_ads_db(TikTokAds),
+        )
 
     async def _read_ads_db(self, model: type[AdsModel]) -> pd.DataFrame:
         return await self._read_ads_db_with_range(model=model, from_date=self.from_date, to_date=self.to_date)
 
-    async def _read_ads_db_with_range(self, model: type[AdsModel], from_date: date, to_date: date) -> pd.DataFrame:
-        cache_key = self.cache_adapter.make_key("ads", model.__tablename__, from_date, to_date)
-        cached = self.cache_adapter.get(cache_key)
-        if cached is not None:
-            return cached
-
-        query = (
+    @staticmethod
+    def _ads_range_query(model: type[AdsModel], from_date: date, to_date: date):
+        return (
             select(
                 model.date.label("date"),
                 model.campaign_id.label("campaign_id"),
@@ -76,7 +94,7 @@ class CampaignDataBase:
                 func.sum(model.clicks).label("clicks"),
             )
             .join(model.campaign)
-            .filter(func.date(model.date).between(from_date, to_date))
+            .filter(model.date.between(from_date, to_date))
             .group_by(
                 model.date,
                 model.campaign_id,
@@ -87,15 +105,28 @@ class CampaignDataBase:
                 Campaign.ad_type,
             )
         )
+
+    async def _read_ads_db_with_range(self, model: type[AdsModel], from_date: date, to_date: date) -> pd.DataFrame:
+        cache_key = self.cache_adapter.make_key("ads", model.__tablename__, from_date, to_date)
+        dependencies = self.cache_adapter.depends_on(
+            (model.__tablename__, Campaign.__tablename__, DailyRegister.__tablename__),
+            from_date,
+            to_date,
+        )
+        cached = self.cache_adapter.get(cache_key)
+        if cached is not None:
+            return cached
+
+        query = self._ads_range_query(model=model, from_date=from_date, to_date=to_date)
         result = await self._execute_query(query)
         rows = result.fetchall()
         if not rows:
-            return self.cache_adapter.set(cache_key, self.serializer.empty_ads_frame(self.to_date))
+            return self.cache_adapter.set(cache_key, self.serializer.empty_ads_frame(self.to_date), dependencies)
 
         df = pd.DataFrame(rows)
         df["date"] = pd.to_datetime(df["date"]).dt.date
         df = await self._attach_register_leads(df=df, from_date=from_date, to_date=to_date)
-        return self.cache_adapter.set(cache_key, df)
+        return self.cache_adapter.set(cache_key, df, dependencies)
 
     async def _read_daily_register_db(self, from_date: date, to_date: date) -> pd.DataFrame:
         return await self.repository.read_daily_register(from_date=from_date, to_date=to_date)
@@ -143,6 +174,11 @@ class CampaignDataBase:
         return await self.repository.read_depo(from_date=self.from_date, to_date=self.to_date)
 
     async def _execute_query(self, query: Select):
+        if self.read_session_factory is not None:
+            # Each query gets its own pooled read-only connection; results are
+            # buffered, so they stay readable after the session closes.
+            async with self.read_session_factory() as read_session:
+                return await read_session.execute(query)
         async with self._query_lock:
             return await self.session.execute(query)
 
@@ -250,53 +286,26 @@ class CampaignDataBase:
 
     async def _ads_metrics_from_sql(self, model: type[AdsModel], from_date: date, to_date: date, ad_type: str | None = None) -> dict[str, float]:
         cache_key = self.cache_adapter.make_key("metrics", model.__tablename__, ad_type or "all", from_date, to_date)
+        dependencies = self.cache_adapter.depends_on(
+            (model.__tablename__, Campaign.__tablename__, DailyRegister.__tablename__),
+            from_date,
+            to_date,
+        )
         cached = self.cache_adapter.get(cache_key)
         if cached is not None:
             return self.serializer.normalize_ads_metrics_payload(cached.iloc[0].to_dict())
 
-        filters = [model.date.between(from_date, to_date)]
+        filters = [AdsDailyCampaignRollup.source == model.__tablename__, AdsDailyCampaignRollup.date.between(from_date, to_date)]
+        query = select(
+            func.coalesce(func.sum(AdsDailyCampaignRollup.impressions), 0).label("impressions"),
+            func.coalesce(func.sum(AdsDailyCampaignRollup.clicks), 0).label("clicks"),
+            func.coalesce(func.sum(AdsDailyCampaignRollup.cost), 0.0).label("cost"),
+            func.coalesce(func.sum(AdsDailyCampaignRollup.leads), 0).label("leads"),
+        ).select_from(AdsDailyCampaignRollup)
         if ad_type:
+            query = query.join(Campaign, Campaign.campaign_id == AdsDailyCampaignRollup.campaign_id)
             filters.append(Campaign.ad_type == ad_type)
-
-        ads_by_campaign = (
-            select(
-                model.date.label("date"),
-                model.campaign_id.label("campaign_id"),
-                func.sum(model.cost).label("cost"),
-                func.sum(model.impressions).label("impressions"),
-                func.sum(model.clicks).label("clicks"),
-            )
-            .join(model.campaign)
-            .where(*filters)
-            .group_by(model.date, model.campaign_id)
-            .subquery()
-        )
-        daily_register = (
-            select(
-                DailyRegister.date.label("date"),
-                DailyRegister.campaign_id.label("campaign_id"),
-                func.sum(DailyRegister.total_regis).label("total_regis"),
-            )
-            .where(DailyRegister.date.between(from_date, to_date))
-            .group_by(DailyRegister.date, DailyRegister.campaign_id)
-            .subquery()
-        )
-        query = (
-            select(
-                func.coalesce(func.sum(ads_by_campaign.c.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(ads_by_campaign.c.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(ads_by_campaign.c.cost), 0.0).label("cost"),
-                func.coalesce(func.sum(daily_register.c.total_regis), 0).label("leads"),
-            )
-            .select_from(ads_by_campaign)
-            .outerjoin(
-                daily_register,
-                and_(
-                    daily_register.c.date == ads_by_campaign.c.date,
-                    daily_register.c.campaign_id == ads_by_campaign.c.campaign_id,
-                ),
-            )
-        )
+        query = query.where(*filters)
         row = (await self._execute_query(query)).one()
         leads_total = float(row.leads or 0)
         cost_total = float(row.cost or 0.0)
@@ -307,7 +316,7 @@ class CampaignDataBase:
             "leads": int(leads_total),
             "cost_leads": round(cost_total / leads_total, 2) if leads_total else 0.0,
         }
-        cached_payload = self.cache_adapter.set(cache_key, pd.DataFrame([payload]))
+        cached_payload = self.cache_adapter.set(cache_key, pd.DataFrame([payload]), dependencies)
         return self.serializer.normalize_ads_metrics_payload(cached_payload.iloc[0].to_dict())
 
     async def _ads_base_details_dataframe(self, data: str, from_date: date, to_date: date, ad_type: str | None = None) -> pd.DataFrame:
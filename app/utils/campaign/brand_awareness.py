@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
+
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 
 class BrandAwarenessCampaignMixin:
@@ -116,7 +115,7 @@ class BrandAwarenessCampaignMixin:
         source_label = data.strip().replace("_", " ").title()
         campaign_title = self._campaign_type_title(ad_type)
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(
                 title=f"{source_label} - {campaign_title} Spend",
                 annotations=[
@@ -132,12 +131,12 @@ class BrandAwarenessCampaignMixin:
             )
         else:
             cost_values = pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist()
-            figure = go.Figure(data=[go.Bar(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=cost_values, name="Spend", text=[f"Rp. {float(value):,.0f}" for value in cost_values], textposition="inside", hovertemplate="<b>%{x}</b><br>Spend: Rp. %{y:,.0f}<extra></extra>")])
+            figure = ChartData(data=[trace("bar", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=cost_values, name="Spend", text=[f"Rp. {float(value):,.0f}" for value in cost_values], textposition="inside", hovertemplate="<b>%{x}</b><br>Spend: Rp. %{y:,.0f}<extra></extra>")])
             figure.update_layout(title=f"{source_label} - {campaign_title} Spend", xaxis_title="Date", yaxis_title="Spend", xaxis=dict(type="category"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(self._serialize_daily_rows, daily)
-        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def brand_awareness_performance_chart(
         self,
@@ -155,7 +154,7 @@ class BrandAwarenessCampaignMixin:
         source_label = data.strip().replace("_", " ").title()
         campaign_title = self._campaign_type_title(ad_type)
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(
                 title=f"{source_label} - {campaign_title} Performance",
                 annotations=[
@@ -176,17 +175,17 @@ class BrandAwarenessCampaignMixin:
             cpc_values = pd.to_numeric(daily["cpc"], errors="coerce").fillna(0).tolist()
             cpm_values = pd.to_numeric(daily["cpm"], errors="coerce").fillna(0).tolist()
             ctr_values = pd.to_numeric(daily["ctr"], errors="coerce").fillna(0).tolist()
-            figure = go.Figure()
-            figure.add_trace(go.Bar(x=date_labels, y=click_values, name="Clicks", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
-            figure.add_trace(go.Bar(x=date_labels, y=impression_values, name="Impressions", hovertemplate="<b>%{x}</b><br>Impressions: %{y:,}<extra></extra>"))
-            figure.add_trace(go.Scatter(x=date_labels, y=cpc_values, mode="lines+markers", name="Cost Per Clicks", yaxis="y2", hovertemplate="<b>%{x}</b><br>CPC: Rp. %{y:,.0f}<extra></extra>"))
-            figure.add_trace(go.Scatter(x=date_labels, y=cpm_values, mode="lines+markers", name="Cost Per Impressions", yaxis="y2", hovertemplate="<b>%{x}</b><br>CPM: Rp. %{y:,.2f}<extra></extra>"))
-            figure.add_trace(go.Scatter(x=date_labels, y=ctr_values, mode="lines+markers", name="Click Through Rate", yaxis="y2", hovertemplate="<b>%{x}</b><br>CTR: %{y:,.2f}%<extra></extra>"))
+            figure = ChartData()
+            figure.add_trace(trace("bar", x=date_labels, y=click_values, name="Clicks", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
+            figure.add_trace(trace("bar", x=date_labels, y=impression_values, name="Impressions", hovertemplate="<b>%{x}</b><br>Impressions: %{y:,}<extra></extra>"))
+            figure.add_trace(trace("scatter", x=date_labels, y=cpc_values, mode="lines+markers", name="Cost Per Clicks", yaxis="y2", hovertemplate="<b>%{x}</b><br>CPC: Rp. %{y:,.0f}<extra></extra>"))
+            figure.add_trace(trace("scatter", x=date_labels, y=cpm_values, mode="lines+markers", name="Cost Per Impressions", yaxis="y2", hovertemplate="<b>%{x}</b><br>CPM: Rp. %{y:,.2f}<extra></extra>"))
+            figure.add_trace(trace("scatter", x=date_labels, y=ctr_values, mode="lines+markers", name="Click Through Rate", yaxis="y2", hovertemplate="<b>%{x}</b><br>CTR: %{y:,.2f}%<extra></extra>"))
             figure.update_layout(title=f"{source_label} - {campaign_title} Performance", xaxis_title="Date", xaxis=dict(type="category"), yaxis=dict(title="Clicks / Impressions"), yaxis2=dict(title="CPC / CPM / CTR", overlaying="y", side="right"), barmode="group", legend=dict(orientation="h", y=1.12, x=0))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(self._serialize_daily_rows, daily)
-        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def brand_awareness_details_table(
         self,
@@ -255,7 +254,7 @@ class BrandAwarenessCampaignMixin:
         metric_title = {"ctr": "CTR", "cpm": "CPM", "cpc": "CPC"}[metric_key]
         campaign_title = self._campaign_type_title(ad_type)
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(
                 title=f"{source_label} {metric_title} Trend",
                 annotations=[
@@ -276,7 +275,7 @@ class BrandAwarenessCampaignMixin:
             daily["clicks"] = pd.to_numeric(daily["clicks"], errors="coerce").fillna(0)
             top_dimensions = daily.groupby("dimension_name", as_index=False)["clicks"].sum().sort_values("clicks", ascending=False).head(top_n)["dimension_name"].tolist()
             selected = daily.loc[daily["dimension_name"].isin(top_dimensions)].copy()
-            figure = go.Figure()
+            figure = ChartData()
             for dimension_name in top_dimensions:
                 subset = selected.loc[selected["dimension_name"] == dimension_name].sort_values("date").copy()
                 if subset.empty:
@@ -291,13 +290,13 @@ class BrandAwarenessCampaignMixin:
                 if len(short_label) > 28:
                     short_label = f"{short_label[:25]}..."
                 hover_suffix = "%" if metric_key == "ctr" else ""
-                figure.add_trace(go.Scatter(x=pd.to_datetime(subset["date"]).dt.strftime("%b %d\n%Y").tolist(), y=subset["metric_value"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br><b>%{x}</b><br>" f"{metric_title}: " "%{y:,.2f}" f"{hover_suffix}<extra></extra>"))
+                figure.add_trace(trace("scatter", x=pd.to_datetime(subset["date"]).dt.strftime("%b %d\n%Y").tolist(), y=subset["metric_value"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br><b>%{x}</b><br>" f"{metric_title}: " "%{y:,.2f}" f"{hover_suffix}<extra></extra>"))
             figure.update_layout(title=f"{source_label} {metric_title} Trend ({dimension.replace('_', ' ').title()})", xaxis_title="Date", xaxis=dict(type="category"), yaxis_title=metric_title, legend=dict(orientation="h", y=1.12, x=0), showlegend=False if dimension == "campaign_id" else True)
             serializable = selected.copy()
             serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
             rows = await asyncio.to_thread(lambda: serializable.to_dict(orient="records"))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "metric": metric_key, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "metric": metric_key, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def remarketing_metrics_with_growth(
         self,
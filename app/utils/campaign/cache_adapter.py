@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import date
 
 import pandas as pd
@@ -11,7 +12,7 @@ from app.utils.analytics_cache import (
     analytics_dataframe_cache_enabled,
     campaign_dataframe_cache,
 )
-from app.utils.dataframe_cache import CacheKey
+from app.utils.dataframe_cache import CacheDependency, CacheKey
 
 
 class CampaignCacheAdapter:
@@ -29,7 +30,15 @@ class CampaignCacheAdapter:
         return campaign_dataframe_cache.get(cache_key)
 
     @staticmethod
-    def set(cache_key: CacheKey, df: pd.DataFrame) -> pd.DataFrame:
+    def depends_on(tables: Iterable[str], from_date: date, to_date: date) -> tuple[CacheDependency, ...]:
+        return tuple(CacheDependency(table=table, start=from_date, end=to_date) for table in tables)
+
+    @staticmethod
+    def set(
+        cache_key: CacheKey,
+        df: pd.DataFrame,
+        dependencies: Iterable[CacheDependency] = (),
+    ) -> pd.DataFrame:
         if not analytics_dataframe_cache_enabled():
             return df
-        return campaign_dataframe_cache.set(cache_key, df)
+        return campaign_dataframe_cache.set(cache_key, df, dependencies=dependencies)
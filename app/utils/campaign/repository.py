@@ -6,8 +6,9 @@ from collections.abc import Awaitable, Callable
 from datetime import date
 
 import pandas as pd
-from sqlalchemy import and_, case, func, select
+from sqlalchemy import func, select
 
+from app.db.models.ads_rollup import AdsDailyAdRollup
 from app.db.models.external_api import Campaign, DailyRegister, DataDepo, DataMsDeposit
 from app.utils.campaign.cache_adapter import CampaignCacheAdapter
 from app.utils.campaign.serializer import CampaignSerializer
@@ -32,6 +33,7 @@ class CampaignRepository:
 
     async def read_daily_register(self, *, from_date: date, to_date: date) -> pd.DataFrame:
         cache_key = self._cache.make_key("daily_register", from_date, to_date)
+        dependencies = self._cache.depends_on((DailyRegister.__tablename__,), from_date, to_date)
         cached = self._cache.get(cache_key)
         if cached is not None:
             return cached
@@ -47,16 +49,17 @@ class CampaignRepository:
         )
         rows = (await self._execute_query(query)).fetchall()
         if not rows:
-            return self._cache.set(cache_key, pd.DataFrame(columns=["date", "campaign_id", "leads"]))
+            return self._cache.set(cache_key, pd.DataFrame(columns=["date", "campaign_id", "leads"]), dependencies)
 
         df = pd.DataFrame(rows)
         df["date"] = pd.to_datetime(df["date"]).dt.date
         df["campaign_id"] = df["campaign_id"].astype(str)
         df["leads"] = pd.to_numeric(df["leads"], errors="coerce").fillna(0.0)
-        return self._cache.set(cache_key, df)
+        return self._cache.set(cache_key, df, dependencies)
 
     async def read_daily_login(self, *, from_date: date, to_date: date) -> pd.DataFrame:
         cache_key = self._cache.make_key("daily_login", from_date, to_date)
+        dependencies = self._cache.depends_on((DataMsDeposit.__tablename__,), from_date, to_date)
         cached = self._cache.get(cache_key)
         if cached is not None:
             return cached
@@ -72,16 +75,17 @@ class CampaignRepository:
         )
         rows = (await self._execute_query(query)).fetchall()
         if not rows:
-            return self._cache.set(cache_key, pd.DataFrame(columns=["date", "campaign_id", "leads"]))
+            return self._cache.set(cache_key, pd.DataFrame(columns=["date", "campaign_id", "leads"]), dependencies)
 
         df = pd.DataFrame(rows)
         df["date"] = pd.to_datetime(df["date"]).dt.date
         df["campaign_id"] = df["campaign_id"].astype(str)
         df["leads"] = pd.to_numeric(df["leads"], errors="coerce").fillna(0.0)
-        return self._cache.set(cache_key, df)
+        return self._cache.set(cache_key, df, dependencies)
 
     async def read_depo(self, *, from_date: date, to_date: date) -> pd.DataFrame:
         cache_key = self._cache.make_key("depo", from_date, to_date)
+        dependencies = self._cache.depends_on((DataDepo.__tablename__, Campaign.__tablename__), from_date, to_date)
         cached = self._cache.get(cache_key)
         if cached is not None:
             return cached
@@ -101,11 +105,35 @@ class CampaignRepository:
         )
         rows = (await self._execute_query(query)).fetchall()
         if not rows:
-            return self._cache.set(cache_key, self._serializer.empty_depo_frame(to_date))
+            return self._cache.set(cache_key, self._serializer.empty_depo_frame(to_date), dependencies)
 
         df = pd.DataFrame(rows)
         df["tanggal_regis"] = pd.to_datetime(df["tanggal_regis"]).dt.date
-        return self._cache.set(cache_key, df)
+        return self._cache.set(cache_key, df, dependencies)
+
+    @staticmethod
+    def ads_base_details_query(*, model: type[AdsModel], from_date: date, to_date: date, ad_type: str | None):
+        # Leads are already allocated per ad and day in the rollup.
+        filters = [AdsDailyAdRollup.source == model.__tablename__, AdsDailyAdRollup.date.between(from_date, to_date)]
+        if ad_type:
+            filters.append(Campaign.ad_type == ad_type)
+        return (
+            select(
+                Campaign.ad_source.label("campaign_source"),
+                AdsDailyAdRollup.campaign_id.label("campaign_id"),
+                AdsDailyAdRollup.campaign_name.label("campaign_name"),
+                AdsDailyAdRollup.ad_group.label("ad_group"),
+                AdsDailyAdRollup.ad_name.label("ad_name"),
+                func.coalesce(func.sum(AdsDailyAdRollup.cost), 0.0).label("spend"),
+                func.coalesce(func.sum(AdsDailyAdRollup.impressions), 0).label("impressions"),
+                func.coalesce(func.sum(AdsDailyAdRollup.clicks), 0).label("clicks"),
+                func.coalesce(func.sum(AdsDailyAdRollup.leads), 0.0).label("leads"),
+            )
+            .join(Campaign, Campaign.campaign_id == AdsDailyAdRollup.campaign_id)
+            .where(*filters)
+            .group_by(Campaign.ad_source, AdsDailyAdRollup.campaign_id, AdsDailyAdRollup.campaign_name, AdsDailyAdRollup.ad_group, AdsDailyAdRollup.ad_name)
+            .order_by(func.sum(AdsDailyAdRollup.cost).desc())
+        )
 
     async def read_ads_base_details(
         self,
@@ -117,77 +145,17 @@ class CampaignRepository:
     ) -> pd.DataFrame:
         columns = ["campaign_source", "campaign_id", "campaign_name", "ad_group", "ad_name", "spend", "impressions", "clicks", "leads"]
         cache_key = self._cache.make_key("details", model.__tablename__, ad_type or "all", from_date, to_date)
+        dependencies = self._cache.depends_on((model.__tablename__, Campaign.__tablename__, DailyRegister.__tablename__), from_date, to_date)
         cached = self._cache.get(cache_key)
         if cached is not None:
             return cached
-        filters = [model.date.between(from_date, to_date)]
-        if ad_type:
-            filters.append(Campaign.ad_type == ad_type)
-        daily_rows = (
-            select(
-                model.date.label("date"),
-                Campaign.ad_source.label("campaign_source"),
-                model.campaign_id.label("campaign_id"),
-                model.campaign_name.label("campaign_name"),
-                model.ad_group.label("ad_group"),
-                model.ad_name.label("ad_name"),
-                func.coalesce(func.sum(model.cost), 0.0).label("spend"),
-                func.coalesce(func.sum(model.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(model.clicks), 0).label("clicks"),
-            )
-            .join(model.campaign)
-            .where(*filters)
-            .group_by(model.date, Campaign.ad_source, model.campaign_id, model.campaign_name, model.ad_group, model.ad_name)
-            .subquery()
-        )
-        campaign_daily_totals = (
-            select(
-                daily_rows.c.date.label("date"),
-                daily_rows.c.campaign_id.label("campaign_id"),
-                func.sum(daily_rows.c.spend).label("campaign_spend"),
-                func.count().label("row_count"),
-            )
-            .group_by(daily_rows.c.date, daily_rows.c.campaign_id)
-            .subquery()
-        )
-        daily_register = (
-            select(
-                DailyRegister.date.label("date"),
-                DailyRegister.campaign_id.label("campaign_id"),
-                func.sum(DailyRegister.total_regis).label("total_regis"),
-            )
-            .where(DailyRegister.date.between(from_date, to_date))
-            .group_by(DailyRegister.date, DailyRegister.campaign_id)
-            .subquery()
-        )
-        lead_allocation = case(
-            (campaign_daily_totals.c.campaign_spend > 0, func.coalesce(daily_register.c.total_regis, 0) * (daily_rows.c.spend / campaign_daily_totals.c.campaign_spend)),
-            else_=func.coalesce(daily_register.c.total_regis, 0) / campaign_daily_totals.c.row_count,
-        )
-        query = (
-            select(
-                daily_rows.c.campaign_source.label("campaign_source"),
-                daily_rows.c.campaign_id.label("campaign_id"),
-                daily_rows.c.campaign_name.label("campaign_name"),
-                daily_rows.c.ad_group.label("ad_group"),
-                daily_rows.c.ad_name.label("ad_name"),
-                func.coalesce(func.sum(daily_rows.c.spend), 0.0).label("spend"),
-                func.coalesce(func.sum(daily_rows.c.impressions), 0).label("impressions"),
-                func.coalesce(func.sum(daily_rows.c.clicks), 0).label("clicks"),
-                func.coalesce(func.sum(lead_allocation), 0.0).label("leads"),
-            )
-            .select_from(daily_rows)
-            .join(campaign_daily_totals, and_(campaign_daily_totals.c.date == daily_rows.c.date, campaign_daily_totals.c.campaign_id == daily_rows.c.campaign_id))
-            .outerjoin(daily_register, and_(daily_register.c.date == daily_rows.c.date, daily_register.c.campaign_id == daily_rows.c.campaign_id))
-            .group_by(daily_rows.c.campaign_source, daily_rows.c.campaign_id, daily_rows.c.campaign_name, daily_rows.c.ad_group, daily_rows.c.ad_name)
-            .order_by(func.sum(daily_rows.c.spend).desc())
-        )
+        query = self.ads_base_details_query(model=model, from_date=from_date, to_date=to_date, ad_type=ad_type)
         rows = (await self._execute_query(query)).fetchall()
         if not rows:
-            return self._cache.set(cache_key, pd.DataFrame(columns=columns))
+            return self._cache.set(cache_key, pd.DataFrame(columns=columns), dependencies)
         df = pd.DataFrame(rows)
         for dim_col in ("campaign_name", "ad_group", "ad_name"):
             df[dim_col] = df[dim_col].fillna("N/A").replace("", "N/A")
         for metric_col in ("spend", "impressions", "clicks", "leads"):
             df[metric_col] = pd.to_numeric(df[metric_col], errors="coerce").fillna(0)
-        return self._cache.set(cache_key, df[columns])
+        return self._cache.set(cache_key, df[columns], dependencies)
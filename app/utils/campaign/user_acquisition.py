@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
+
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 
 class UserAcquisitionCampaignMixin:
@@ -21,14 +20,15 @@ class UserAcquisitionCampaignMixin:
         details = await self._ads_performance_dataframe(data=data, from_date=start_date, to_date=end_date, dimension=dimension, ad_type="user_acquisition")
         source_label = data.strip().replace("_", " ").title()
         if details.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"{source_label} Spend vs Register", annotations=[{"text": "No campaign data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows: list[dict[str, object]] = []
         else:
             marker_sizes = (pd.to_numeric(details["clicks"], errors="coerce").fillna(0) / 40).clip(lower=8, upper=30)
-            figure = go.Figure(
+            figure = ChartData(
                 data=[
-                    go.Scatter(
+                    trace(
+                        "scatter",
                         x=details["spend"],
                         y=details["leads"],
                         mode="markers",
@@ -42,8 +42,8 @@ class UserAcquisitionCampaignMixin:
             figure.update_layout(title=f"{source_label} Spend vs Register", xaxis_title="Spend (Rp)", yaxis_title="Register")
             rows = await asyncio.to_thread(lambda: details.to_dict(orient="records"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def user_acquisition_top_leads_chart(self, data: str, dimension: str, top_n: int = 10, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -56,18 +56,18 @@ class UserAcquisitionCampaignMixin:
         details = await self._ads_performance_dataframe(data=data, from_date=start_date, to_date=end_date, dimension=dimension, ad_type="user_acquisition")
         source_label = data.strip().replace("_", " ").title()
         if details.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"Top {top_n} {source_label} by Register", annotations=[{"text": "No campaign data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows: list[dict[str, object]] = []
         else:
             ranked = details.sort_values("leads", ascending=False).head(top_n).copy().sort_values("leads", ascending=True)
             ranked["short_label"] = ranked["dimension_name"].astype(str).apply(lambda value: value if len(value) <= 38 else f"{value[:35]}...")
-            figure = go.Figure(data=[go.Bar(x=ranked["leads"], y=ranked["short_label"], orientation="h", text=[f"{int(value):,}" for value in ranked["leads"]], textposition="auto", customdata=ranked["spend"], hovertemplate="<b>%{y}</b><br>Register: %{x:,}<br>Spend: Rp %{customdata:,.0f}<extra></extra>")])
+            figure = ChartData(data=[trace("bar", x=ranked["leads"], y=ranked["short_label"], orientation="h", text=[f"{int(value):,}" for value in ranked["leads"]], textposition="auto", customdata=ranked["spend"], hovertemplate="<b>%{y}</b><br>Register: %{x:,}<br>Spend: Rp %{customdata:,.0f}<extra></extra>")])
             figure.update_layout(title=f"Top {top_n} {source_label} by Register", xaxis_title="Register", yaxis_title="")
             rows = await asyncio.to_thread(lambda: ranked.to_dict(orient="records"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def _user_acquisition_daily_dimension_dataframe(self, data: str, dimension: str, from_date: date, to_date: date) -> pd.DataFrame:
         return await self._ads_daily_dimension_dataframe(
@@ -94,7 +94,7 @@ class UserAcquisitionCampaignMixin:
         source_label = data.strip().replace("_", " ").title()
         metric_title = {"cost_per_lead": "Cost per Register", "click_per_lead": "Click per Register", "click_through_lead": "Click Through Register"}[metric_key]
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"{source_label} {metric_title} Trend", annotations=[{"text": "No campaign data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows: list[dict[str, object]] = []
         else:
@@ -104,7 +104,7 @@ class UserAcquisitionCampaignMixin:
             daily["leads"] = pd.to_numeric(daily["leads"], errors="coerce").fillna(0)
             top_dimensions = daily.groupby("dimension_name", as_index=False)["leads"].sum().sort_values("leads", ascending=False).head(top_n)["dimension_name"].tolist()
             selected = daily.loc[daily["dimension_name"].isin(top_dimensions)].copy()
-            figure = go.Figure()
+            figure = ChartData()
             for dimension_name in top_dimensions:
                 subset = selected.loc[selected["dimension_name"] == dimension_name].sort_values("date").copy()
                 if subset.empty:
@@ -120,15 +120,15 @@ class UserAcquisitionCampaignMixin:
                 if len(short_label) > 28:
                     short_label = f"{short_label[:25]}..."
                 hover_suffix = "%" if metric_key == "click_through_lead" else ""
-                figure.add_trace(go.Scatter(x=pd.to_datetime(subset["date"]).dt.strftime("%b %d\n%Y").tolist(), y=subset["metric_value"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br><b>%{x}</b><br>" f"{metric_title}: " "%{y:,.2f}" f"{hover_suffix}<extra></extra>"))
+                figure.add_trace(trace("scatter", x=pd.to_datetime(subset["date"]).dt.strftime("%b %d\n%Y").tolist(), y=subset["metric_value"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br><b>%{x}</b><br>" f"{metric_title}: " "%{y:,.2f}" f"{hover_suffix}<extra></extra>"))
 
             figure.update_layout(title=f"{source_label} {metric_title} Trend ({dimension.replace('_', ' ').title()})", xaxis_title="Date", xaxis=dict(type="category"), yaxis_title=metric_title, legend=dict(orientation="h", y=1.12, x=0), showlegend=False if dimension == "campaign_id" else True)
             serializable = selected.copy()
             serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
             rows = await asyncio.to_thread(lambda: serializable.to_dict(orient="records"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "metric": metric_key, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "metric": metric_key, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def user_acquisition_cumulative_chart(self, data: str, dimension: str, top_n: int = 6, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -141,7 +141,7 @@ class UserAcquisitionCampaignMixin:
         daily = await self._user_acquisition_daily_dimension_dataframe(data=data, dimension=dimension, from_date=start_date, to_date=end_date)
         source_label = data.strip().replace("_", " ").title()
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"{source_label} Cumulative Register vs Spend ({dimension.replace('_', ' ').title()})", annotations=[{"text": "No campaign data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows: list[dict[str, object]] = []
         else:
@@ -149,7 +149,7 @@ class UserAcquisitionCampaignMixin:
             daily["leads"] = pd.to_numeric(daily["leads"], errors="coerce").fillna(0)
             top_dimensions = daily.groupby("dimension_name", as_index=False)["leads"].sum().sort_values("leads", ascending=False).head(top_n)["dimension_name"].tolist()
             selected = daily.loc[daily["dimension_name"].isin(top_dimensions)].copy()
-            figure = go.Figure()
+            figure = ChartData()
             for dimension_name in top_dimensions:
                 subset = selected.loc[selected["dimension_name"] == dimension_name].sort_values("date").copy()
                 if subset.empty:
@@ -159,14 +159,14 @@ class UserAcquisitionCampaignMixin:
                 short_label = str(dimension_name)
                 if len(short_label) > 30:
                     short_label = f"{short_label[:27]}..."
-                figure.add_trace(go.Scatter(x=subset["cumulative_cost"], y=subset["cumulative_leads"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br>Cum Spend: Rp %{x:,.0f}<br>Cum Register: %{y:,.0f}<extra></extra>"))
+                figure.add_trace(trace("scatter", x=subset["cumulative_cost"], y=subset["cumulative_leads"], mode="lines+markers", name=short_label, hovertemplate="<b>%{fullData.name}</b><br>Cum Spend: Rp %{x:,.0f}<br>Cum Register: %{y:,.0f}<extra></extra>"))
             figure.update_layout(title=f"{source_label} Cumulative Register vs Spend ({dimension.replace('_', ' ').title()})", xaxis_title="Cumulative Spend", yaxis_title="Cumulative Register", legend=dict(orientation="h", y=1.12, x=0))
             serializable = selected.copy()
             serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
             rows = await asyncio.to_thread(lambda: serializable.to_dict(orient="records"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def user_acquisition_daily_mix_chart(self, data: str, dimension: str, top_n: int = 6, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -179,7 +179,7 @@ class UserAcquisitionCampaignMixin:
         daily = await self._user_acquisition_daily_dimension_dataframe(data=data, dimension=dimension, from_date=start_date, to_date=end_date)
         source_label = data.strip().replace("_", " ").title()
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"{source_label} Daily Mix ({dimension.replace('_', ' ').title()})", annotations=[{"text": "No campaign data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows: list[dict[str, object]] = []
         else:
@@ -189,7 +189,7 @@ class UserAcquisitionCampaignMixin:
             pivot = filtered.pivot_table(index="date", columns="dimension_name", values="leads", aggfunc="sum", fill_value=0).reset_index()
             all_dates = pd.date_range(start=start_date, end=end_date, freq="D")
             mix = pd.DataFrame({"date": all_dates.date}).merge(pivot, on="date", how="left").fillna(0)
-            figure = go.Figure()
+            figure = ChartData()
             date_labels = pd.to_datetime(mix["date"]).dt.strftime("%b %d\n%Y").tolist()
             for dimension_name in top_dimensions:
                 if dimension_name not in mix.columns:
@@ -197,14 +197,14 @@ class UserAcquisitionCampaignMixin:
                 short_label = str(dimension_name)
                 if len(short_label) > 30:
                     short_label = f"{short_label[:27]}..."
-                figure.add_trace(go.Bar(x=date_labels, y=mix[dimension_name], name=short_label, hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>"))
+                figure.add_trace(trace("bar", x=date_labels, y=mix[dimension_name], name=short_label, hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>"))
             figure.update_layout(title=f"{source_label} Daily Mix ({dimension.replace('_', ' ').title()})", xaxis_title="Date", yaxis_title="Register", barmode="stack", xaxis=dict(type="category"), legend=dict(orientation="h", y=1.12, x=0))
             serializable = mix.copy()
             serializable["date"] = pd.to_datetime(serializable["date"]).dt.date.astype(str)
             rows = await asyncio.to_thread(lambda: serializable.to_dict(orient="records"))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"source": data.strip().lower(), "dimension": dimension, "top_n": top_n, "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def cost_to_leads_chart(self, data: str, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -220,20 +220,20 @@ class UserAcquisitionCampaignMixin:
         )
         source_label = data.strip().title()
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"Cost To Register - {source_label}", annotations=[{"text": "No register data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
         else:
             date_labels = pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist()
             cost_values = pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist()
             cpl_values = pd.to_numeric(daily["cost_leads"], errors="coerce").fillna(0).tolist()
-            figure = go.Figure()
-            figure.add_trace(go.Bar(x=date_labels, y=cost_values, name="Cost", text=[f"Rp. {float(value):,.0f}" for value in cost_values], textposition="auto", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
-            figure.add_trace(go.Scatter(x=date_labels, y=cpl_values, mode="lines+markers", name="Cost Per Register", yaxis="y2", hovertemplate="<b>%{x}</b><br>Cost/Register: %{y:,.2f}<extra></extra>"))
+            figure = ChartData()
+            figure.add_trace(trace("bar", x=date_labels, y=cost_values, name="Cost", text=[f"Rp. {float(value):,.0f}" for value in cost_values], textposition="auto", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
+            figure.add_trace(trace("scatter", x=date_labels, y=cpl_values, mode="lines+markers", name="Cost Per Register", yaxis="y2", hovertemplate="<b>%{x}</b><br>Cost/Register: %{y:,.2f}<extra></extra>"))
             figure.update_layout(title=f"Cost To Register - {source_label}", xaxis_title="Date", xaxis=dict(type="category"), yaxis=dict(title="Cost"), yaxis2=dict(title="Cost To Register", overlaying="y", side="right"), legend=dict(orientation="h", y=1.1, x=0))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(self._serialize_daily_rows, daily)
-        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def leads_by_periods_chart(self, data: str, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -248,16 +248,16 @@ class UserAcquisitionCampaignMixin:
         )
         source_label = data.strip().title()
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"Register By Periods - {source_label}", annotations=[{"text": "No register data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
         else:
             leads_values = pd.to_numeric(daily["leads"], errors="coerce").fillna(0).astype(int).tolist()
-            figure = go.Figure(data=[go.Bar(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=leads_values, name="Register", text=leads_values, textposition="auto", hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>")])
+            figure = ChartData(data=[trace("bar", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=leads_values, name="Register", text=leads_values, textposition="auto", hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>")])
             figure.update_layout(title=f"Register By Periods - {source_label}", xaxis_title="Date", xaxis=dict(type="category"), yaxis=dict(title="Total Register"), legend=dict(orientation="h", y=1.1, x=0))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(self._serialize_daily_rows, daily)
-        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
 
     async def clicks_to_leads_chart(self, data: str, from_date: date | None = None, to_date: date | None = None) -> dict[str, object]:
         start_date = from_date or self.from_date
@@ -272,16 +272,16 @@ class UserAcquisitionCampaignMixin:
         )
         source_label = data.strip().title()
         if daily.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=f"Clicks To Register - {source_label}", annotations=[{"text": "No register data for selected date range", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
         else:
             click_values = pd.to_numeric(daily["clicks"], errors="coerce").fillna(0).tolist()
             cpl_values = pd.to_numeric(daily["clicks_leads"], errors="coerce").fillna(0).tolist()
-            figure = go.Figure()
-            figure.add_trace(go.Bar(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=click_values, name="Clicks", text=[f"{int(float(value)):,}" for value in click_values], textposition="auto", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
-            figure.add_trace(go.Scatter(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=cpl_values, mode="lines+markers", name="Clicks Per Register", yaxis="y2", hovertemplate="<b>%{x}</b><br>Clicks/Register: %{y:,.2f}<extra></extra>"))
+            figure = ChartData()
+            figure.add_trace(trace("bar", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=click_values, name="Clicks", text=[f"{int(float(value)):,}" for value in click_values], textposition="auto", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
+            figure.add_trace(trace("scatter", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=cpl_values, mode="lines+markers", name="Clicks Per Register", yaxis="y2", hovertemplate="<b>%{x}</b><br>Clicks/Register: %{y:,.2f}<extra></extra>"))
             figure.update_layout(title=f"Clicks To Register - {source_label}", xaxis_title="Date", xaxis=dict(type="category"), yaxis=dict(title="Clicks"), yaxis2=dict(title="Clicks To Register", overlaying="y", side="right"), legend=dict(orientation="h", y=1.1, x=0))
 
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(self._serialize_daily_rows, daily)
-        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": data.strip().lower(), "from_date": start_date.isoformat(), "to_date": end_date.isoformat(), "rows": rows, **chart_fields}
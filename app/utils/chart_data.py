@@ -0,0 +1,94 @@
+"""Compact chart-data contract for analytics payloads.
+
+Charts are shipped as ``{"traces": [...], "layout": {...}}``: every trace is
+a Plotly trace ``type`` plus its properties, with array properties as plain
+columnar lists. Streamlit builds the ``go.Figure`` (and applies the Plotly
+template) client-side, so payload builders never instantiate or serialize
+Plotly figures. ``ANALYTICS_LEGACY_FIGURE_JSON`` additionally emits the old
+full figure JSON under ``figure`` for clients that still read it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+
+
+def _plain(value: Any) -> Any:
+    """Convert pandas/NumPy values into JSON-ready lists and scalars; NaN becomes ``None``."""
+    if isinstance(value, (pd.Series, pd.Index)):
+        value = value.to_numpy()
+    if isinstance(value, pd.DataFrame):
+        value = value.to_numpy()
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def trace(trace_type: str, **properties: Any) -> dict[str, Any]:
+    """Return one chart trace; ``properties`` use Plotly trace property names."""
+    return {"type": trace_type, **{key: _plain(value) for key, value in properties.items()}}
+
+
+def _merge(target: dict[str, Any], updates: dict[str, Any]) -> None:
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+class ChartData:
+    """Traces and layout of one chart, built without Plotly.
+
+    Mirrors the small part of the ``go.Figure`` API the payload builders use
+    (``data=``, ``add_trace`` and ``update_layout``).
+    """
+
+    def __init__(self, data: list[dict[str, Any]] | None = None) -> None:
+        self.traces: list[dict[str, Any]] = list(data or [])
+        self.layout: dict[str, Any] = {}
+
+    def add_trace(self, chart_trace: dict[str, Any]) -> ChartData:
+        self.traces.append(chart_trace)
+        return self
+
+    def update_layout(self, **layout: Any) -> ChartData:
+        _merge(self.layout, _plain(layout))
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"traces": self.traces, "layout": self.layout}
+
+
+def legacy_figure_json(chart: ChartData) -> dict[str, Any]:
+    """Return ``chart`` as the full Plotly figure JSON older clients expect."""
+    import plotly.graph_objects as go
+
+    return json.loads(go.Figure(data=chart.traces, layout=chart.layout).to_json())
+
+
+async def chart_payload(chart: ChartData) -> dict[str, Any]:
+    """Return the response fields of ``chart``: ``chart``, plus ``figure`` in legacy mode."""
+    payload: dict[str, Any] = {"chart": chart.to_dict()}
+    if settings.ANALYTICS_LEGACY_FIGURE_JSON:
+        payload["figure"] = await asyncio.to_thread(legacy_figure_json, chart)
+    return payload
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
+from datetime import date
 from threading import RLock
 from time import monotonic
 
+import numpy as np
 import pandas as pd
 
 
@@ -21,48 +23,189 @@ class DataFrameCacheStats:
     entries: int
     max_entries: int
     ttl_seconds: int
+    total_bytes: int
+    max_bytes: int | None
+    read_only: bool
+    hits: int
+    misses: int
+    evictions: int
+    evicted_bytes: int
+    oversized_rejections: int
+
+
+@dataclass(frozen=True)
+class CacheDependency:
+    """Table and inclusive date window a cached frame was read from.
+
+    ``None`` bounds mean the dependency covers every date of the table.
+    """
+
+    table: str
+    start: date | None = None
+    end: date | None = None
+
+    def overlaps(self, table: str, start: date | None, end: date | None) -> bool:
+        """Return whether a reload of ``table`` over ``[start, end]`` affects this dependency."""
+        if self.table != table:
+            return False
+        if None in (start, end, self.start, self.end):
+            return True
+        return self.start <= end and start <= self.end
 
 
 @dataclass
 class _CacheEntry:
     value: pd.DataFrame
     expires_at: float
+    size_bytes: int
+    shared: bool
+    priority: float
+    dependencies: tuple[CacheDependency, ...] = ()
+
+
+def dataframe_size_bytes(value: pd.DataFrame) -> int:
+    """Return the deep in-memory size of a DataFrame, including its index."""
+    return int(value.memory_usage(index=True, deep=True).sum())
+
+
+def _freeze_dataframe(value: pd.DataFrame) -> bool:
+    """Mark every NumPy block of ``value`` read-only.
+
+    Returns:
+        bool: ``True`` when all blocks were frozen, so zero-copy views are safe
+        to hand out; ``False`` when an extension-array block cannot be frozen.
+    """
+    frozen = True
+    for block in value._mgr.blocks:
+        if isinstance(block.values, np.ndarray):
+            block.values.flags.writeable = False
+        else:
+            frozen = False
+    return frozen
 
 
 class DataFrameCache:
-    """Bounded TTL cache that stores defensive copies of DataFrames."""
+    """Bounded TTL cache for DataFrames.
+
+    Entries are evicted with the GreedyDual-Size policy: each entry's priority
+    is the cache's inflation clock plus ``1 / size_bytes``, refreshed on every
+    hit, and the lowest priority goes first. Large frames therefore leave before
+    small ones of similar recency, and the clock (raised to each evicted
+    priority) lets untouched entries age out regardless of size.
+
+    The default mode stores and returns defensive deep copies. In ``read_only``
+    mode the cache takes ownership of stored frames, marks their NumPy buffers
+    read-only, and returns shallow views: adding or replacing columns on a view
+    is safe, while in-place writes raise ``ValueError`` so callers must
+    ``copy()`` before mutating.
+    """
 
-    def __init__(self, *, max_entries: int, ttl_seconds: int) -> None:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        max_bytes: int | None = None,
+        read_only: bool = False,
+    ) -> None:
         self.max_entries = max(1, int(max_entries))
         self.ttl_seconds = max(1, int(ttl_seconds))
+        self.max_bytes = int(max_bytes) if max_bytes and int(max_bytes) > 0 else None
+        self.read_only = bool(read_only)
         self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._clock = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._oversized_rejections = 0
         self._lock = RLock()
 
+    def _hand_out(self, entry: _CacheEntry) -> pd.DataFrame:
+        if entry.shared:
+            return entry.value.copy(deep=False)
+        return entry.value.copy(deep=True)
+
+    def _priority(self, size_bytes: int) -> float:
+        return self._clock + 1.0 / max(size_bytes, 1)
+
+    def _evict_one(self) -> None:
+        # Ties keep LRU order because hits move entries to the end.
+        victim_key = min(self._entries, key=lambda key: self._entries[key].priority)
+        victim = self._pop_entry(victim_key)
+        self._clock = max(self._clock, victim.priority)
+        self._evictions += 1
+        self._evicted_bytes += victim.size_bytes
+
+    def _pop_entry(self, key: CacheKey) -> _CacheEntry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+        return entry
+
     def get(self, key: CacheKey) -> pd.DataFrame | None:
-        """Return a copy of the cached DataFrame when the entry is still fresh."""
+        """Return the cached DataFrame when the entry is still fresh."""
         now = monotonic()
         with self._lock:
             entry = self._entries.get(key)
             if entry is None:
+                self._misses += 1
                 return None
             if entry.expires_at <= now:
-                self._entries.pop(key, None)
+                self._pop_entry(key)
+                self._misses += 1
                 return None
+            self._hits += 1
+            entry.priority = self._priority(entry.size_bytes)
             self._entries.move_to_end(key)
-            return entry.value.copy(deep=True)
+            return self._hand_out(entry)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: pd.DataFrame,
+        *,
+        dependencies: Iterable[CacheDependency] = (),
+    ) -> pd.DataFrame:
+        """Store ``value`` and return a frame for immediate caller use.
 
-    def set(self, key: CacheKey, value: pd.DataFrame) -> pd.DataFrame:
-        """Store a defensive copy and return a copy for immediate caller use."""
-        cached_value = value.copy(deep=True)
+        In ``read_only`` mode ``value`` itself is frozen and kept, so the caller
+        should use the returned frame rather than keep mutating ``value``.
+        ``dependencies`` record the tables and date windows the frame was read
+        from so :meth:`invalidate` can drop it selectively.
+        """
+        # Measured before freezing: pandas' deep object sizing rejects read-only buffers.
+        size_bytes = dataframe_size_bytes(value)
+        if self.read_only:
+            cached_value = value
+            shared = _freeze_dataframe(cached_value)
+        else:
+            cached_value = value.copy(deep=True)
+            shared = False
+        entry = _CacheEntry(
+            value=cached_value,
+            expires_at=monotonic() + self.ttl_seconds,
+            size_bytes=size_bytes,
+            shared=shared,
+            priority=0.0,
+            dependencies=tuple(dependencies),
+        )
         with self._lock:
-            self._entries[key] = _CacheEntry(
-                value=cached_value,
-                expires_at=monotonic() + self.ttl_seconds,
-            )
-            self._entries.move_to_end(key)
-            while len(self._entries) > self.max_entries:
-                self._entries.popitem(last=False)
-        return cached_value.copy(deep=True)
+            self._pop_entry(key)
+            if self.max_bytes is not None and entry.size_bytes > self.max_bytes:
+                # A single frame larger than the whole budget is served uncached.
+                self._oversized_rejections += 1
+                return self._hand_out(entry)
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or (self.max_bytes is not None and self._total_bytes + entry.size_bytes > self.max_bytes)
+            ):
+                self._evict_one()
+            entry.priority = self._priority(entry.size_bytes)
+            self._entries[key] = entry
+            self._total_bytes += entry.size_bytes
+        return self._hand_out(entry)
 
     def clear(self, prefix: CacheKey | None = None) -> int:
         """Clear all entries or entries whose key starts with ``prefix``."""
@@ -70,18 +213,55 @@ class DataFrameCache:
             if prefix is None:
                 removed = len(self._entries)
                 self._entries.clear()
+                self._total_bytes = 0
+                self._clock = 0.0
                 return removed
 
             keys = [key for key in self._entries if key[: len(prefix)] == prefix]
             for key in keys:
-                self._entries.pop(key, None)
+                self._pop_entry(key)
+            return len(keys)
+
+    def invalidate(
+        self,
+        table: str,
+        start: date | None = None,
+        end: date | None = None,
+        *,
+        prefix: CacheKey | None = None,
+    ) -> int:
+        """Drop entries that depend on ``table`` within the reloaded ``[start, end]`` window.
+
+        Entries stored without dependencies are always dropped, since their
+        sources are unknown. Omitting ``start``/``end`` invalidates every date.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (prefix is None or key[: len(prefix)] == prefix)
+                and (
+                    not entry.dependencies
+                    or any(dependency.overlaps(table, start, end) for dependency in entry.dependencies)
+                )
+            ]
+            for key in keys:
+                self._pop_entry(key)
             return len(keys)
 
     def stats(self) -> DataFrameCacheStats:
-        """Return cache size/configuration without exposing cached values."""
+        """Return cache size, configuration and counters without exposing cached values."""
         with self._lock:
             return DataFrameCacheStats(
                 entries=len(self._entries),
                 max_entries=self.max_entries,
                 ttl_seconds=self.ttl_seconds,
+                total_bytes=self._total_bytes,
+                max_bytes=self.max_bytes,
+                read_only=self.read_only,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                evicted_bytes=self._evicted_bytes,
+                oversized_rejections=self._oversized_rejections,
             )
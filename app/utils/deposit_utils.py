@@ -14,6 +14,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.external_api import Campaign, DataDepo
+from app.utils.json_response import TableOrient, table_payload
 
 
 class DepositData:
@@ -270,12 +271,18 @@ class DepositData:
             "growth_percentage": growth,
         }
 
-    async def build_daily_report_payload(self, campaign_type: str | None = None) -> dict[str, object]:
+    async def build_daily_report_payload(
+        self,
+        campaign_type: str | None = None,
+        orient: TableOrient = "records",
+    ) -> dict[str, object]:
         """Build daily report payload for frontend rendering.
 
         Args:
             campaign_type (str | None): Optional campaign type filter.
                 ``None`` includes all rows.
+            orient (TableOrient): Shape of the ``campaign_daily_metrics``
+                table, row dicts (``records``) or columnar (``split``).
 
         Returns:
             dict[str, object]: Report payload containing summary and chart data.
@@ -338,7 +345,10 @@ class DepositData:
         return {
             "timeline": timeline,
             "daily_metrics": self._build_daily_metrics_payload(dates=dates, dataframe=merged),
-            "campaign_daily_metrics": self._build_campaign_daily_metrics_payload(dataframe=positive_df),
+            "campaign_daily_metrics": table_payload(
+                self._build_campaign_daily_metrics_payload(dataframe=positive_df),
+                orient,
+            ),
             "campaign_totals": self._build_campaign_totals_payload(dataframe=positive_df),
             "deposit_method_summary": self._build_deposit_method_summary(dataframe=positive_df),
             "campaign_type": campaign_type or "all",
@@ -373,9 +383,9 @@ class DepositData:
             for day in dates
         ]
 
-    def _build_campaign_daily_metrics_payload(self, dataframe: pd.DataFrame) -> list[dict[str, object]]:
+    def _build_campaign_daily_metrics_payload(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         if dataframe.empty:
-            return []
+            return pd.DataFrame()
 
         daily = (
             dataframe.groupby(["tanggal_regis", "campaign_id", "campaign_name"], as_index=False)["email"]
@@ -394,7 +404,7 @@ class DepositData:
         daily["campaign_name"] = daily["campaign_name"].fillna("Unknown Campaign").astype(str)
         daily["qty"] = pd.to_numeric(daily["qty"], errors="coerce").fillna(0).astype(int)
         daily["depo_amount"] = pd.to_numeric(daily["depo_amount"], errors="coerce").fillna(0.0).round(2)
-        return daily.to_dict(orient="records")
+        return daily
 
     def _build_campaign_totals_payload(self, dataframe: pd.DataFrame) -> list[dict[str, object]]:
         if dataframe.empty:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 from typing import Any
 
@@ -12,11 +13,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.models.etl_run import EtlRun
+from app.utils.response_cache import bump_data_versions
 
 STATUS_QUEUED = "queued"
 STATUS_RUNNING = "running"
 STATUS_SUCCESS = "success"
 STATUS_FAILED = "failed"
+# Terminal success state for runs whose source rows matched the last load, so nothing was written.
+STATUS_SKIPPED_UNCHANGED = "skipped_unchanged"
 STALE_RUN_TIMEOUT = timedelta(hours=6)
 
 
@@ -27,6 +31,7 @@ async def _ensure_not_running_conflict(
     mode: str,
     window_start: date | None,
     window_end: date | None,
+    allow_concurrent_runs: bool = False,
 ) -> None:
     """Reject duplicate active ETL runs for the same source/window.
 
@@ -36,6 +41,8 @@ async def _ensure_not_running_conflict(
         mode (str): ETL mode (`auto` or `manual`).
         window_start (date | None): Inclusive run window start.
         window_end (date | None): Inclusive run window end.
+        allow_concurrent_runs (bool): Skip the global single-run guard, used by
+            the scheduler when it runs independent sources in parallel.
 
     Returns:
         None: Validation-only helper.
@@ -43,7 +50,7 @@ async def _ensure_not_running_conflict(
     Raises:
         HTTPException: ``409`` when a matching running ETL run already exists.
     """
-    if not settings.ALLOW_CONCURRENT_ETL_RUNS:
+    if not (allow_concurrent_runs or settings.ALLOW_CONCURRENT_ETL_RUNS):
         active_run = await session.execute(
             select(EtlRun.run_id, EtlRun.source, EtlRun.mode)
             .where(EtlRun.status.in_((STATUS_QUEUED, STATUS_RUNNING)))
@@ -90,6 +97,7 @@ async def start_run(
     window_start: date | None,
     window_end: date | None,
     triggered_by: str | None,
+    allow_concurrent_runs: bool = False,
 ) -> str:
     """Create and persist a new ETL run in ``queued`` status.
 
@@ -100,6 +108,8 @@ async def start_run(
         window_start (date | None): Inclusive run window start.
         window_end (date | None): Inclusive run window end.
         triggered_by (str | None): User identifier that triggered the job.
+        allow_concurrent_runs (bool): Allow other sources to be active at the
+            same time. Duplicate runs of the same source/window stay rejected.
 
     Returns:
         str: Generated ``run_id`` used for status polling.
@@ -113,6 +123,7 @@ async def start_run(
         mode=mode,
         window_start=window_start,
         window_end=window_end,
+        allow_concurrent_runs=allow_concurrent_runs,
     )
     run_id = str(uuid.uuid4())
     session.add(
@@ -187,18 +198,24 @@ async def complete_run(
     session: AsyncSession,
     run_id: str,
     *,
+    status: str = STATUS_SUCCESS,
     message: str | None = None,
     rows_extracted: int | None = None,
     rows_loaded: int | None = None,
     duration_ms: int | None = None,
     quality_report: dict[str, Any] | None = None,
+    changed_tables: Iterable[str] = (),
 ) -> None:
-    """Mark an ETL run successful and persist execution metadata."""
+    """Mark an ETL run successful (or ``skipped_unchanged``) and persist execution metadata.
+
+    The data versions of ``changed_tables`` are bumped in the same commit, which
+    retires every cached analytics response built from those tables.
+    """
     result = await session.execute(
         update(EtlRun)
         .where(EtlRun.run_id == run_id)
         .values(
-            status=STATUS_SUCCESS,
+            status=status,
             message=message,
             ended_at=datetime.now(),
             error_detail=None,
@@ -213,6 +230,7 @@ async def complete_run(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"ETL run not found while finishing run_id: {run_id}",
         )
+    await bump_data_versions(session, changed_tables)
     await session.commit()
 
 
@@ -290,6 +308,7 @@ async def summarize_runs(session: AsyncSession) -> dict[str, int]:
         "running": counts.get(STATUS_RUNNING, 0),
         "success": counts.get(STATUS_SUCCESS, 0),
         "failed": counts.get(STATUS_FAILED, 0),
+        "skipped_unchanged": counts.get(STATUS_SKIPPED_UNCHANGED, 0),
         "total": sum(counts.values()),
     }
 
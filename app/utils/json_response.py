@@ -0,0 +1,89 @@
+"""JSON response rendering for analytics endpoints.
+
+Analytics payloads are serialized by orjson straight from the dicts, NumPy
+arrays and pandas objects the payload builders produce, instead of being
+validated into ``AnalyticsResponse`` and walked by ``jsonable_encoder``.
+Table fields can be shipped column-wise (``orient="split"``) so numeric
+columns are encoded from their NumPy buffers without per-row dicts.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, datetime
+from typing import Any, Literal
+
+import numpy as np
+import orjson
+import pandas as pd
+from fastapi.responses import JSONResponse
+
+TableOrient = Literal["records", "split"]
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _column_values(series: pd.Series) -> Any:
+    """Return one table column in its cheapest JSON-ready form.
+
+    Numeric and boolean columns stay NumPy arrays, which orjson encodes
+    natively (NaN as ``null``); other columns become lists with missing
+    values as ``None`` and timestamps as ISO strings.
+    """
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biuf":
+        return np.ascontiguousarray(series.to_numpy())
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        series = series.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    values = series.astype(object).where(series.notna(), None)
+    return values.tolist()
+
+
+def split_table(df: pd.DataFrame) -> dict[str, Any]:
+    """Return ``df`` as ``{"columns": [...], "data": [...]}`` with one value list per column."""
+    return {
+        "columns": [str(column) for column in df.columns],
+        "data": [_column_values(df[column]) for column in df.columns],
+    }
+
+
+def table_payload(df: pd.DataFrame, orient: TableOrient = "records") -> list[dict[str, object]] | pd.DataFrame:
+    """Return one table field of an analytics payload.
+
+    ``records`` keeps the historical list of row dicts. ``split`` returns the
+    frame itself; the response renders it with :func:`split_table`.
+    """
+    if orient == "split":
+        return df
+    return df.to_dict(orient="records")
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the pandas/NumPy values orjson does not handle natively."""
+    if isinstance(value, pd.DataFrame):
+        return split_table(value)
+    if isinstance(value, (pd.Series, pd.Index)):
+        return _column_values(pd.Series(value))
+    if isinstance(value, np.ndarray):
+        return [_json_default(item) if isinstance(item, (np.generic, float)) else item for item in value.tolist()]
+    if value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+        return None if isinstance(value, float) and math.isnan(value) else value
+    if isinstance(value, float):
+        return None if math.isnan(value) else value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize an analytics payload to compact UTF-8 JSON."""
+    return orjson.dumps(content, default=_json_default, option=ORJSON_OPTIONS)
+
+
+class AnalyticsJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson and pandas/NumPy support."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
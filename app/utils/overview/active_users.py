@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
 from sqlalchemy import func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.external_api import Ga4DailyMetrics
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 
 class OverviewData:
@@ -159,10 +157,10 @@ class OverviewData:
     async def active_users_chart(self, from_date: date, to_date: date) -> dict[str, object]:
         daily = self._build_daily_series(await self._frame_for_range(from_date, to_date), from_date, to_date)
         source_label = "APP + WEB" if self.source == "app_web" else self.source.upper()
-        figure = go.Figure()
-        figure.add_trace(go.Scatter(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["daily_active_users"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="1 Day Active User", line=dict(color="#6176ff", width=2), marker=dict(size=7), hovertemplate="<b>%{x}</b><br>1 Day Active User: %{y:,}<extra></extra>"))
-        figure.add_trace(go.Scatter(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["monthly_active_users"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="28 Day Active User", yaxis="y2", line=dict(color="#ff6248", width=2), marker=dict(size=7), hovertemplate="<b>%{x}</b><br>28 Day Active User: %{y:,}<extra></extra>"))
+        figure = ChartData()
+        figure.add_trace(trace("scatter", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["daily_active_users"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="1 Day Active User", line=dict(color="#6176ff", width=2), marker=dict(size=7), hovertemplate="<b>%{x}</b><br>1 Day Active User: %{y:,}<extra></extra>"))
+        figure.add_trace(trace("scatter", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["monthly_active_users"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="28 Day Active User", yaxis="y2", line=dict(color="#ff6248", width=2), marker=dict(size=7), hovertemplate="<b>%{x}</b><br>28 Day Active User: %{y:,}<extra></extra>"))
         figure.update_layout(title=f"FireBase Active User {source_label}", xaxis_title="Date", yaxis=dict(title="Active Users"), yaxis2=dict(title="Active Users", overlaying="y", side="right"), xaxis=dict(type="category"), legend=dict(orientation="v", y=0.92, x=1.02), margin=dict(l=48, r=48, t=60, b=20))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = await asyncio.to_thread(lambda: [{"date": row["date"].isoformat(), "daily_active_users": int(row["daily_active_users"]), "monthly_active_users": int(row["monthly_active_users"]), "active_users": int(row["active_users"]), "stickiness": float(row["stickiness"])} for _, row in daily.iterrows()])
-        return {"source": self.source, "from_date": from_date.isoformat(), "to_date": to_date.isoformat(), "rows": rows, "figure": json.loads(chart_json)}
+        return {"source": self.source, "from_date": from_date.isoformat(), "to_date": to_date.isoformat(), "rows": rows, **chart_fields}
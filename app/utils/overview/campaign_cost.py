@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.external_api import Campaign, FacebookAds, GoogleAds, TikTokAds
+from app.db.models.ads_rollup import AdsDailyTypeRollup
+from app.db.models.external_api import FacebookAds, GoogleAds, TikTokAds
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 
 class OverviewCampaignCostData:
@@ -44,13 +42,16 @@ class OverviewCampaignCostData:
             return 100.0 if current_value else 0.0
         return round(((current_value - previous_value) / previous_value) * 100, 2)
 
+    @staticmethod
+    def _ads_cost_query(model, from_date: date, to_date: date):
+        return select(
+            AdsDailyTypeRollup.date.label("date"),
+            AdsDailyTypeRollup.ad_type.label("campaign_type"),
+            AdsDailyTypeRollup.cost.label("cost"),
+        ).where(AdsDailyTypeRollup.source == model.__tablename__, AdsDailyTypeRollup.date.between(from_date, to_date))
+
     async def _read_one_source_cost(self, model, source_key: str, from_date: date, to_date: date) -> pd.DataFrame:
-        query = (
-            select(model.date.label("date"), Campaign.ad_type.label("campaign_type"), func.sum(model.cost).label("cost"))
-            .join(model.campaign)
-            .where(func.date(model.date).between(from_date, to_date))
-            .group_by(model.date, Campaign.ad_type)
-        )
+        query = self._ads_cost_query(model, from_date, to_date)
         result = await self.session.execute(query)
         rows = result.fetchall()
         if not rows:
@@ -84,15 +85,15 @@ class OverviewCampaignCostData:
     @staticmethod
     async def _pie_payload(title: str, labels: list[str], values: list[float]) -> dict[str, object]:
         if not labels or not values or not any(float(v) > 0 for v in values):
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title=title, showlegend=False, margin=dict(l=24, r=24, t=56, b=24), annotations=[{"text": "No data available", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
             rows = []
         else:
-            figure = go.Figure(data=[go.Pie(labels=labels, values=values, hole=0.38, textinfo="label+percent", hovertemplate="<b>%{label}</b><br>Cost: Rp. %{value:,.0f}<extra></extra>")])
+            figure = ChartData(data=[trace("pie", labels=labels, values=values, hole=0.38, textinfo="label+percent", hovertemplate="<b>%{label}</b><br>Cost: Rp. %{value:,.0f}<extra></extra>")])
             figure.update_layout(title=title, showlegend=False, margin=dict(l=24, r=24, t=56, b=24))
             rows = [{"label": label, "cost": float(value)} for label, value in zip(labels, values)]
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        chart_fields = await chart_payload(figure)
+        return {"rows": rows, **chart_fields}
 
     async def cost_metrics_with_growth(self, from_date: date, to_date: date) -> dict[str, object]:
         current_df = await self._frame_for_range(from_date, to_date)
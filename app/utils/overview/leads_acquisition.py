@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.models.ads_rollup import AdsDailyTypeRollup
 from app.db.models.external_api import Campaign, DailyRegister, DataDepo, DataMsDeposit, FacebookAds, GoogleAds, TikTokAds
+from app.utils.chart_data import ChartData, chart_payload, trace
 from app.utils.overview.shared import USD_TO_IDR_RATE
 
 
@@ -47,32 +46,37 @@ class OverviewLeadsAcquisitionData:
             return 100.0 if current_value else 0.0
         return round(((current_value - previous_value) / previous_value) * 100, 2)
 
-    async def _read_one_source_ads_ua(self, model, source_key: str, from_date: date, to_date: date, ad_type: str = "user_acquisition") -> pd.DataFrame:
-        query = (
+    @staticmethod
+    def _ads_ua_query(model, from_date: date, to_date: date, ad_type: str = "user_acquisition"):
+        return (
             select(
-                model.date.label("date"),
-                model.campaign_id.label("campaign_id"),
-                func.sum(model.cost).label("cost"),
-                func.sum(model.impressions).label("impressions"),
-                func.sum(model.clicks).label("clicks"),
+                AdsDailyTypeRollup.date.label("date"),
+                AdsDailyTypeRollup.cost.label("cost"),
+                AdsDailyTypeRollup.impressions.label("impressions"),
+                AdsDailyTypeRollup.clicks.label("clicks"),
+                AdsDailyTypeRollup.leads.label("leads"),
             )
-            .join(model.campaign)
-            .where(func.date(model.date).between(from_date, to_date), Campaign.ad_type == ad_type)
-            .group_by(model.date, model.campaign_id)
-            .order_by(model.date.asc())
+            .where(
+                AdsDailyTypeRollup.source == model.__tablename__,
+                AdsDailyTypeRollup.date.between(from_date, to_date),
+                AdsDailyTypeRollup.ad_type == ad_type,
+            )
+            .order_by(AdsDailyTypeRollup.date.asc())
         )
+
+    async def _read_one_source_ads_ua(self, model, source_key: str, from_date: date, to_date: date, ad_type: str = "user_acquisition") -> pd.DataFrame:
+        # The rollup already carries each day's register leads for campaigns with ads rows.
+        query = self._ads_ua_query(model, from_date, to_date, ad_type)
         result = await self.session.execute(query)
         rows = result.fetchall()
         if not rows:
             return pd.DataFrame(columns=["date", "cost", "impressions", "clicks", "leads", "source"])
         dataframe = pd.DataFrame(rows)
         dataframe["date"] = pd.to_datetime(dataframe["date"]).dt.date
-        dataframe = await self._attach_register_leads(dataframe, from_date, to_date)
-        grouped = dataframe.groupby("date", as_index=False)[["cost", "impressions", "clicks", "leads"]].sum()
         for column in ("cost", "impressions", "clicks", "leads"):
-            grouped[column] = pd.to_numeric(grouped[column], errors="coerce").fillna(0)
-        grouped["source"] = source_key
-        return grouped
+            dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce").fillna(0)
+        dataframe["source"] = source_key
+        return dataframe
 
     async def _read_daily_register_db(self, from_date: date, to_date: date) -> pd.DataFrame:
         query = (
@@ -100,18 +104,6 @@ class OverviewLeadsAcquisitionData:
             return 0
         return int(pd.to_numeric(register_df["leads"], errors="coerce").fillna(0).sum())
 
-    async def _attach_register_leads(self, dataframe: pd.DataFrame, from_date: date, to_date: date) -> pd.DataFrame:
-        regis_df = await self._read_daily_register_db(from_date=from_date, to_date=to_date)
-        if regis_df.empty:
-            dataframe["leads"] = 0.0
-            return dataframe
-        dataframe["campaign_id"] = dataframe["campaign_id"].astype(str)
-        dataframe = dataframe.merge(regis_df, on=["date", "campaign_id"], how="left")
-        dataframe["leads"] = pd.to_numeric(dataframe["leads"], errors="coerce").fillna(0)
-        for column in ("cost", "impressions", "clicks"):
-            dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce").fillna(0)
-        return dataframe
-
     async def _read_ads_ua_with_range(self, from_date: date, to_date: date) -> pd.DataFrame:
         return await self._read_ads_by_ad_type_with_range("user_acquisition", from_date, to_date)
 
@@ -222,10 +214,10 @@ class OverviewLeadsAcquisitionData:
     async def leads_by_source(self, from_date: date, to_date: date) -> dict[str, object]:
         ads_df = await self._ads_for_range(from_date, to_date)
         if ads_df.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(title="Register by Source", showlegend=False, annotations=[{"text": "No data available", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
-            chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-            return {"table_rows": [], "pie_chart": {"rows": [], "figure": json.loads(chart_json)}}
+            chart_fields = await chart_payload(figure)
+            return {"table_rows": [], "pie_chart": {"rows": [], **chart_fields}}
         grouped = ads_df.groupby("source", as_index=False)[["cost", "impressions", "clicks", "leads"]].sum().sort_values("leads", ascending=False)
         total_leads = float(grouped["leads"].sum())
         grouped["cost_per_lead"] = grouped.apply(lambda row: round(float(row["cost"]) / float(row["leads"]), 2) if float(row["leads"]) else 0.0, axis=1)
@@ -233,22 +225,22 @@ class OverviewLeadsAcquisitionData:
         table_rows = [{"source": str(row["source"]).title(), "cost": float(row["cost"]), "impressions": int(row["impressions"]), "clicks": int(row["clicks"]), "leads": int(row["leads"]), "cost_per_lead": float(row["cost_per_lead"]), "leads_share_pct": float(row["leads_share_pct"])} for _, row in grouped.iterrows()]
         labels = [str(value).title() for value in grouped["source"].tolist()]
         values = [float(value) for value in grouped["leads"].tolist()]
-        pie_figure = go.Figure(data=[go.Pie(labels=labels, values=values, hole=0.38, textinfo="label+percent", hovertemplate="<b>%{label}</b><br>Register: %{value:,}<extra></extra>")])
+        pie_figure = ChartData(data=[trace("pie", labels=labels, values=values, hole=0.38, textinfo="label+percent", hovertemplate="<b>%{label}</b><br>Register: %{value:,}<extra></extra>")])
         pie_figure.update_layout(title="Register by Source", showlegend=False, margin=dict(l=24, r=24, t=56, b=24))
-        pie_json = await asyncio.to_thread(json.dumps, pie_figure, cls=plotly.utils.PlotlyJSONEncoder)
-        return {"table_rows": table_rows, "pie_chart": {"rows": [{"label": label, "leads": float(value)} for label, value in zip(labels, values)], "figure": json.loads(pie_json)}}
+        pie_fields = await chart_payload(pie_figure)
+        return {"table_rows": table_rows, "pie_chart": {"rows": [{"label": label, "leads": float(value)} for label, value in zip(labels, values)], **pie_fields}}
 
     async def cost_vs_leads_chart(self, from_date: date, to_date: date) -> dict[str, object]:
         ads_df = await self._ads_for_range(from_date, to_date)
         daily = self._daily_totals_frame(ads_df, from_date, to_date)
         daily["cost_leads"] = daily.apply(lambda row: round(float(row["cost"]) / float(row["leads"]), 2) if float(row["leads"]) else 0.0, axis=1)
-        figure = go.Figure()
-        figure.add_trace(go.Bar(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist(), name="Cost", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
-        figure.add_trace(go.Scatter(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["cost_leads"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="Cost/Register", yaxis="y2", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>Cost/Register: Rp. %{y:,.0f}<extra></extra>"))
+        figure = ChartData()
+        figure.add_trace(trace("bar", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist(), name="Cost", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
+        figure.add_trace(trace("scatter", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["cost_leads"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="Cost/Register", yaxis="y2", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>Cost/Register: Rp. %{y:,.0f}<extra></extra>"))
         figure.update_layout(title="Overall Cost per Register - All Platforms", xaxis=dict(type="category"), yaxis=dict(title="Cost"), yaxis2=dict(title="Cost/Register", overlaying="y", side="right"), legend=dict(orientation="h", y=1.1, x=0))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = [{"date": row["date"].isoformat(), "cost": float(row["cost"]), "leads": int(row["leads"]), "cost_leads": float(row["cost_leads"])} for _, row in daily.iterrows()]
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        return {"rows": rows, **chart_fields}
 
     async def leads_per_day_chart(self, from_date: date, to_date: date) -> dict[str, object]:
         register_df = await self._read_daily_register_db(from_date=from_date, to_date=to_date)
@@ -260,11 +252,11 @@ class OverviewLeadsAcquisitionData:
             grouped = register_df.groupby("date", as_index=False)["leads"].sum().sort_values("date")
             daily = timeline.merge(grouped, on="date", how="left")
             daily["leads"] = pd.to_numeric(daily["leads"], errors="coerce").fillna(0).astype(int)
-        figure = go.Figure(data=[go.Bar(x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["leads"], errors="coerce").fillna(0).tolist(), name="Register", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>")])
+        figure = ChartData(data=[trace("bar", x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(), y=pd.to_numeric(daily["leads"], errors="coerce").fillna(0).tolist(), name="Register", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Register: %{y:,}<extra></extra>")])
         figure.update_layout(title="Register per Day", xaxis=dict(type="category"), yaxis=dict(title="Register"))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = [{"date": row["date"].isoformat(), "leads": int(row["leads"])} for _, row in daily.iterrows()]
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        return {"rows": rows, **chart_fields}
 
     async def _cost_to_revenue_frames(self, mode: str, from_date: date, to_date: date) -> tuple[pd.DataFrame, pd.DataFrame]:
         if mode == "brand_awareness":
@@ -350,12 +342,12 @@ class OverviewLeadsAcquisitionData:
         daily["revenue_idr"] = daily["revenue"] * float(USD_TO_IDR_RATE)
         daily["first_deposit_idr"] = daily["revenue_idr"]
         daily["cost_to_revenue_pct"] = daily.apply(lambda row: round((float(row["revenue_idr"]) / float(row["cost"])) * 100, 2) if float(row["cost"]) else 0.0, axis=1)
-        figure = go.Figure()
+        figure = ChartData()
         date_labels = pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist()
-        figure.add_trace(go.Bar(x=date_labels, y=pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist(), name="Cost", marker_color="#6176ff", yaxis="y", offsetgroup="cost", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
-        figure.add_trace(go.Bar(x=date_labels, y=pd.to_numeric(daily["revenue_idr"], errors="coerce").fillna(0).tolist(), name="Revenue", marker_color="#13c39c", yaxis="y2", offsetgroup="deposit", hovertemplate="<b>%{x}</b><br>Revenue: Rp. %{y:,.0f}<extra></extra>"))
-        figure.add_trace(go.Scatter(x=date_labels, y=pd.to_numeric(daily["cost_to_revenue_pct"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="Cost To Deposit", yaxis="y3", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>Cost To Deposit: %{y:.2f}%<extra></extra>"))
+        figure.add_trace(trace("bar", x=date_labels, y=pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist(), name="Cost", marker_color="#6176ff", yaxis="y", offsetgroup="cost", hovertemplate="<b>%{x}</b><br>Cost: Rp. %{y:,.0f}<extra></extra>"))
+        figure.add_trace(trace("bar", x=date_labels, y=pd.to_numeric(daily["revenue_idr"], errors="coerce").fillna(0).tolist(), name="Revenue", marker_color="#13c39c", yaxis="y2", offsetgroup="deposit", hovertemplate="<b>%{x}</b><br>Revenue: Rp. %{y:,.0f}<extra></extra>"))
+        figure.add_trace(trace("scatter", x=date_labels, y=pd.to_numeric(daily["cost_to_revenue_pct"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="Cost To Deposit", yaxis="y3", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>Cost To Deposit: %{y:.2f}%<extra></extra>"))
         figure.update_layout(title="Cost To Deposit Per Hari", barmode="group", xaxis=dict(type="category"), yaxis=dict(title="Cost"), yaxis2=dict(title="Deposit", overlaying="y", side="right", anchor="free", position=0.94, showgrid=False), yaxis3=dict(title="Cost To Deposit", overlaying="y", side="right", anchor="free", position=1, ticksuffix="%", showgrid=False), legend=dict(orientation="h", y=1.12, x=0))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = [{"date": row["date"].isoformat(), "cost": float(row["cost"]), "first_deposit_idr": float(row["first_deposit_idr"]), "revenue_idr": float(row["revenue_idr"]), "cost_to_revenue_pct": float(row["cost_to_revenue_pct"])} for _, row in daily.iterrows()]
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        return {"rows": rows, **chart_fields}
@@ -2,17 +2,15 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 from datetime import date, timedelta
 
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.utils
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models.external_api import Campaign, FacebookAds, GoogleAds
+from app.db.models.ads_rollup import AdsDailyTypeRollup
+from app.db.models.external_api import FacebookAds, GoogleAds
+from app.utils.chart_data import ChartData, chart_payload, trace
 
 
 class OverviewRemarketingPerformanceData:
@@ -31,19 +29,25 @@ class OverviewRemarketingPerformanceData:
     async def _fetch_data(self) -> None:
         self.df_ads = await self._read_ads_rm_with_range(self.from_date, self.to_date)
 
-    async def _read_one_source_ads_rm(self, model, source_key: str, from_date: date, to_date: date) -> pd.DataFrame:
-        query = (
+    @staticmethod
+    def _ads_rm_query(model, from_date: date, to_date: date):
+        return (
             select(
-                model.date.label("date"),
-                func.sum(model.cost).label("cost"),
-                func.sum(model.impressions).label("impressions"),
-                func.sum(model.clicks).label("clicks"),
+                AdsDailyTypeRollup.date.label("date"),
+                AdsDailyTypeRollup.cost.label("cost"),
+                AdsDailyTypeRollup.impressions.label("impressions"),
+                AdsDailyTypeRollup.clicks.label("clicks"),
+            )
+            .where(
+                AdsDailyTypeRollup.source == model.__tablename__,
+                AdsDailyTypeRollup.date.between(from_date, to_date),
+                AdsDailyTypeRollup.ad_type == "remarketing",
             )
-            .join(model.campaign)
-            .where(func.date(model.date).between(from_date, to_date), Campaign.ad_type == "remarketing")
-            .group_by(model.date)
-            .order_by(model.date.asc())
+            .order_by(AdsDailyTypeRollup.date.asc())
         )
+
+    async def _read_one_source_ads_rm(self, model, source_key: str, from_date: date, to_date: date) -> pd.DataFrame:
+        query = self._ads_rm_query(model, from_date, to_date)
         rows = (await self.session.execute(query)).fetchall()
         if not rows:
             return pd.DataFrame(columns=["date", "cost", "impressions", "clicks", "source"])
@@ -140,9 +144,10 @@ class OverviewRemarketingPerformanceData:
 
     async def spend_chart(self, from_date: date, to_date: date) -> dict[str, object]:
         daily = self._daily_frame(await self._ads_for_range(from_date, to_date), from_date, to_date)
-        figure = go.Figure(
+        figure = ChartData(
             data=[
-                go.Bar(
+                trace(
+                    "bar",
                     x=pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist(),
                     y=pd.to_numeric(daily["cost"], errors="coerce").fillna(0).tolist(),
                     name="Spend",
@@ -152,9 +157,9 @@ class OverviewRemarketingPerformanceData:
             ]
         )
         figure.update_layout(title="Overall Remarketing Spend - All Platforms", xaxis=dict(type="category"), yaxis=dict(title="Spend"))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = [{"date": row["date"].isoformat(), "cost": float(row["cost"])} for _, row in daily.iterrows()]
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        return {"rows": rows, **chart_fields}
 
     async def performance_chart(self, from_date: date, to_date: date) -> dict[str, object]:
         daily = self._daily_frame(await self._ads_for_range(from_date, to_date), from_date, to_date)
@@ -163,28 +168,28 @@ class OverviewRemarketingPerformanceData:
         daily["cpc"] = daily.apply(lambda row: round(float(row["cost"]) / float(row["clicks"]), 2) if float(row["clicks"]) else 0.0, axis=1)
 
         date_labels = pd.to_datetime(daily["date"]).dt.strftime("%b %d\n%Y").tolist()
-        figure = go.Figure()
-        figure.add_trace(go.Bar(x=date_labels, y=pd.to_numeric(daily["impressions"], errors="coerce").fillna(0).tolist(), name="Impressions", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Impressions: %{y:,}<extra></extra>"))
-        figure.add_trace(go.Bar(x=date_labels, y=pd.to_numeric(daily["clicks"], errors="coerce").fillna(0).tolist(), name="Clicks", marker_color="#13c39c", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
-        figure.add_trace(go.Scatter(x=date_labels, y=pd.to_numeric(daily["ctr"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CTR", yaxis="y2", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>CTR: %{y:.2f}%<extra></extra>"))
-        figure.add_trace(go.Scatter(x=date_labels, y=pd.to_numeric(daily["cpm"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CPM", yaxis="y2", line=dict(color="#ffb547", width=2), hovertemplate="<b>%{x}</b><br>CPM: Rp. %{y:,.2f}<extra></extra>"))
-        figure.add_trace(go.Scatter(x=date_labels, y=pd.to_numeric(daily["cpc"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CPC", yaxis="y2", line=dict(color="#b379ff", width=2), hovertemplate="<b>%{x}</b><br>CPC: Rp. %{y:,.0f}<extra></extra>"))
+        figure = ChartData()
+        figure.add_trace(trace("bar", x=date_labels, y=pd.to_numeric(daily["impressions"], errors="coerce").fillna(0).tolist(), name="Impressions", marker_color="#6176ff", hovertemplate="<b>%{x}</b><br>Impressions: %{y:,}<extra></extra>"))
+        figure.add_trace(trace("bar", x=date_labels, y=pd.to_numeric(daily["clicks"], errors="coerce").fillna(0).tolist(), name="Clicks", marker_color="#13c39c", hovertemplate="<b>%{x}</b><br>Clicks: %{y:,}<extra></extra>"))
+        figure.add_trace(trace("scatter", x=date_labels, y=pd.to_numeric(daily["ctr"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CTR", yaxis="y2", line=dict(color="#ff6248", width=2), hovertemplate="<b>%{x}</b><br>CTR: %{y:.2f}%<extra></extra>"))
+        figure.add_trace(trace("scatter", x=date_labels, y=pd.to_numeric(daily["cpm"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CPM", yaxis="y2", line=dict(color="#ffb547", width=2), hovertemplate="<b>%{x}</b><br>CPM: Rp. %{y:,.2f}<extra></extra>"))
+        figure.add_trace(trace("scatter", x=date_labels, y=pd.to_numeric(daily["cpc"], errors="coerce").fillna(0).tolist(), mode="lines+markers", name="CPC", yaxis="y2", line=dict(color="#b379ff", width=2), hovertemplate="<b>%{x}</b><br>CPC: Rp. %{y:,.0f}<extra></extra>"))
         figure.update_layout(title="Overall Remarketing Performance - All Platforms", barmode="stack", xaxis=dict(type="category"), yaxis=dict(title="Impressions / Clicks"), yaxis2=dict(title="CTR / CPM / CPC", overlaying="y", side="right"), legend=dict(orientation="h", y=1.12, x=0))
-        chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
+        chart_fields = await chart_payload(figure)
         rows = [{"date": row["date"].isoformat(), "cost": float(row["cost"]), "impressions": int(row["impressions"]), "clicks": int(row["clicks"]), "ctr": float(row["ctr"]), "cpm": float(row["cpm"]), "cpc": float(row["cpc"])} for _, row in daily.iterrows()]
-        return {"rows": rows, "figure": json.loads(chart_json)}
+        return {"rows": rows, **chart_fields}
 
     async def performance_by_source(self, from_date: date, to_date: date) -> dict[str, object]:
         ads_df = await self._ads_for_range(from_date, to_date)
         if ads_df.empty:
-            figure = go.Figure()
+            figure = ChartData()
             figure.update_layout(
                 title="Remarketing Cost by Source",
                 showlegend=False,
                 annotations=[{"text": "No data available", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}],
             )
-            chart_json = await asyncio.to_thread(json.dumps, figure, cls=plotly.utils.PlotlyJSONEncoder)
-            return {"table_rows": [], "pie_chart": {"rows": [], "figure": json.loads(chart_json)}}
+            chart_fields = await chart_payload(figure)
+            return {"table_rows": [], "pie_chart": {"rows": [], **chart_fields}}
 
         grouped = (
             ads_df.groupby("source", as_index=False)[["cost", "impressions", "clicks"]]
@@ -226,9 +231,10 @@ class OverviewRemarketingPerformanceData:
 
         labels = [str(value).title() for value in grouped["source"].tolist()]
         values = [float(value) for value in grouped["cost"].tolist()]
-        pie_figure = go.Figure(
+        pie_figure = ChartData(
             data=[
-                go.Pie(
+                trace(
+                    "pie",
                     labels=labels,
                     values=values,
                     hole=0.38,
@@ -238,11 +244,11 @@ class OverviewRemarketingPerformanceData:
             ]
         )
         pie_figure.update_layout(title="Remarketing Cost by Source", showlegend=False, margin=dict(l=24, r=24, t=56, b=24))
-        pie_json = await asyncio.to_thread(json.dumps, pie_figure, cls=plotly.utils.PlotlyJSONEncoder)
+        pie_fields = await chart_payload(pie_figure)
         return {
             "table_rows": table_rows,
             "pie_chart": {
                 "rows": [{"label": label, "cost": float(value)} for label, value in zip(labels, values)],
-                "figure": json.loads(pie_json),
+                **pie_fields,
             },
         }
@@ -0,0 +1,194 @@
+"""Response-level cache for analytics endpoints.
+
+Entries are keyed by route, normalized query params and the current version
+of every table the payload reads. ``complete_run`` bumps those versions when
+an ETL run loads new data, so a stale entry can never be looked up again and
+no TTL is needed; superseded entries simply age out of the LRU.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from threading import RLock
+
+import pandas as pd
+from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.clock import now
+from app.core.config import settings
+from app.db.models.etl_run import AnalyticsDataVersion
+from app.utils.arrow_response import ARROW_STREAM_MEDIA_TYPE, accepts_arrow_stream
+
+logger = logging.getLogger(__name__)
+
+ResponseCacheKey = tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class ResponseCacheScope:
+    """Route, query params and source tables one analytics response depends on."""
+
+    route: str
+    params: tuple[tuple[str, str], ...]
+    tables: tuple[str, ...]
+    session: AsyncSession = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Snapshot of response cache usage."""
+
+    entries: int
+    max_entries: int
+    total_bytes: int
+    max_bytes: int | None
+    hits: int
+    misses: int
+    evictions: int
+
+
+def response_cache_scope(request: Request, session: AsyncSession, *, tables: Iterable[str]) -> ResponseCacheScope:
+    """Describe the cached response of ``request``.
+
+    The route template (not the concrete path) and sorted query params form
+    the request part of the key, so parameter order does not split entries.
+    Arrow requests get their own entries since they build DataFrame tables.
+    """
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    params = request.query_params.multi_items()
+    if accepts_arrow_stream(request):
+        params.append(("accept", ARROW_STREAM_MEDIA_TYPE))
+    return ResponseCacheScope(
+        route=route,
+        params=tuple(sorted(params)),
+        tables=tuple(sorted(set(tables))),
+        session=session,
+    )
+
+
+async def read_data_versions(session: AsyncSession, tables: tuple[str, ...]) -> tuple[int, ...]:
+    """Return the current data version of each table, ``0`` for never-loaded tables."""
+    result = await session.execute(
+        select(AnalyticsDataVersion.table_name, AnalyticsDataVersion.version).where(
+            AnalyticsDataVersion.table_name.in_(tables)
+        )
+    )
+    versions = dict(result.all())
+    return tuple(int(versions.get(table, 0)) for table in tables)
+
+
+async def bump_data_versions(session: AsyncSession, tables: Iterable[str]) -> None:
+    """Increment the data version of ``tables`` in the caller's transaction."""
+    timestamp = now()
+    for table in sorted(set(tables)):
+        insert_stmt = sqlite_insert(AnalyticsDataVersion).values(table_name=table, version=1, updated_at=timestamp)
+        await session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[AnalyticsDataVersion.table_name],
+                set_={
+                    "version": AnalyticsDataVersion.version + 1,
+                    "updated_at": insert_stmt.excluded.updated_at,
+                },
+            )
+        )
+
+
+def payload_size_bytes(value: object) -> int:
+    """Approximate the retained size of a JSON-like payload from its strings and scalars."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=False, deep=True).sum())
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(payload_size_bytes(key) + payload_size_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size_bytes(item) for item in value)
+    return 8
+
+
+class AnalyticsResponseCache:
+    """Bounded LRU of analytics payloads.
+
+    Stored payloads are shared between requests and must not be mutated by
+    callers; endpoints only wrap them in a fresh response envelope.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int | None = None) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = int(max_bytes) if max_bytes and int(max_bytes) > 0 else None
+        self._entries: OrderedDict[ResponseCacheKey, tuple[dict[str, object], int]] = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = RLock()
+
+    def get(self, key: ResponseCacheKey) -> dict[str, object] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: ResponseCacheKey, payload: dict[str, object]) -> dict[str, object]:
+        size_bytes = payload_size_bytes(payload)
+        if self.max_bytes is not None and size_bytes > self.max_bytes:
+            return payload
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._entries[key] = (payload, size_bytes)
+            self._total_bytes += size_bytes
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_bytes
+                self._evictions += 1
+        return payload
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._total_bytes = 0
+            return removed
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+                total_bytes=self._total_bytes,
+                max_bytes=self.max_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+analytics_response_cache = AnalyticsResponseCache(
+    max_entries=settings.ANALYTICS_RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.ANALYTICS_RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+def analytics_response_cache_enabled() -> bool:
+    """Return whether analytics response caching is enabled at runtime."""
+    return settings.ANALYTICS_RESPONSE_CACHE_ENABLED
+
+
+async def response_cache_key(scope: ResponseCacheScope) -> ResponseCacheKey:
+    """Build the cache key of ``scope`` from its request and the current data versions."""
+    versions = await read_data_versions(scope.session, scope.tables)
+    return (scope.route, scope.params, tuple(zip(scope.tables, versions)))
@@ -10,11 +10,15 @@ import logging
 
 from app.core.config import settings
 from app.db.bootstrap import initialize_database_schema, verify_database_ready
+from app.db.session import sqlite_engine
+from app.etl.ads_rollup import backfill_missing_ads_rollups
 
 
 async def _run() -> None:
     settings.validate_runtime_constraints()
     await initialize_database_schema()
+    async with sqlite_engine.begin() as connection:
+        await backfill_missing_ads_rollups(connection)
     await verify_database_ready()
 
 
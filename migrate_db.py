@@ -8,12 +8,16 @@ import logging
 from app.core.config import settings
 from app.db.bootstrap import apply_schema_migrations, verify_database_ready
 from app.db.session import sqlite_engine
+from app.etl.ads_rollup import backfill_missing_ads_rollups
 
 
 async def _run() -> list[str]:
     settings.validate_runtime_constraints()
     async with sqlite_engine.begin() as connection:
         applied = await apply_schema_migrations(connection)
+        backfilled = await backfill_missing_ads_rollups(connection)
+    if backfilled:
+        logging.info("Backfilled daily ads rollups for: %s", ", ".join(backfilled))
     await verify_database_ready()
     return applied
 
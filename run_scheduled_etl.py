@@ -1,4 +1,4 @@
-"""Run ETL jobs sequentially so the script can be scheduled by cron or Task Scheduler."""
+"""Run ETL jobs as a dependency-ordered batch so the script can be scheduled by cron or Task Scheduler."""
 
 from __future__ import annotations
 
@@ -9,7 +9,14 @@ from typing import Sequence
 
 from fastapi import HTTPException
 
+from app.db.session import sqlite_async_session
+from app.etl.http_clients import HttpClientRegistry
 from app.etl.job_runner import DEFAULT_SCHEDULED_SOURCES, trigger_and_wait_update_job
+from app.etl.pipeline_core import SqliteWriteQueue
+from app.etl.scheduler import OUTCOME_FAILED, OUTCOME_SKIPPED, run_source_graph
+from app.etl.sheet_snapshot import SheetSnapshotCache
+
+DEFAULT_MAX_WORKERS = 4
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -20,7 +27,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--sources",
         nargs="+",
         default=list(DEFAULT_SCHEDULED_SOURCES),
-        help="Ordered source list to execute. Default runs the standard daily ETL sequence.",
+        help=(
+            "Source list to execute. Dependencies between the selected sources are "
+            "honoured automatically. Default runs the standard daily ETL set."
+        ),
     )
     parser.add_argument(
         "--triggered-by",
@@ -30,7 +40,13 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--fail-fast",
         action="store_true",
-        help="Stop execution immediately after the first failed source.",
+        help="Do not start further sources after the first failed source.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Maximum number of independent sources running at once. Use 1 for a serial run.",
     )
     return parser
 
@@ -40,45 +56,74 @@ async def run_sources(
     sources: Sequence[str],
     triggered_by: str,
     fail_fast: bool,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> int:
-    failures = 0
-    logging.info("Starting scheduled ETL for sources: %s", ", ".join(sources))
+    logging.info(
+        "Starting scheduled ETL for sources: %s (max_workers=%s)",
+        ", ".join(sources),
+        max_workers,
+    )
+
+    parallel = max_workers > 1
+    write_queue = SqliteWriteQueue(sqlite_async_session) if parallel else None
+    # Sources reading the same spreadsheet tab share one download per batch.
+    sheet_snapshots = SheetSnapshotCache()
+    # One keep-alive pool per host for the whole batch instead of one client per source.
+    http_clients = HttpClientRegistry.from_env()
 
-    for source in sources:
+    async def _run_source(source: str) -> bool:
         try:
             result = await trigger_and_wait_update_job(
                 data=source,
                 types="auto",
                 triggered_by=triggered_by,
+                allow_concurrent_runs=parallel,
+                write_queue=write_queue,
+                sheet_snapshots=sheet_snapshots,
+                http_clients=http_clients,
             )
-            if result.get("success"):
-                logging.info(
-                    "[SUCCESS] source=%s run_id=%s message=%s",
-                    source,
-                    result.get("run_id"),
-                    result.get("message"),
-                )
-            else:
-                failures += 1
-                logging.error(
-                    "[FAILED] source=%s run_id=%s error=%s",
-                    source,
-                    result.get("run_id"),
-                    result.get("error"),
-                )
-                if fail_fast:
-                    break
         except HTTPException as error:
-            failures += 1
             logging.error("[FAILED] source=%s error=%s", source, error.detail)
-            if fail_fast:
-                break
+            return False
         except Exception as error:
-            failures += 1
             logging.exception("[FAILED] source=%s error=%s", source, error)
-            if fail_fast:
-                break
+            return False
+
+        if result.get("success"):
+            logging.info(
+                "[SUCCESS] source=%s run_id=%s message=%s",
+                source,
+                result.get("run_id"),
+                result.get("message"),
+            )
+            return True
+        logging.error(
+            "[FAILED] source=%s run_id=%s error=%s",
+            source,
+            result.get("run_id"),
+            result.get("error"),
+        )
+        return False
+
+    if write_queue is not None:
+        # Extract/parse/validate run per source; one writer task applies the loads.
+        write_queue.start()
+    try:
+        outcomes = await run_source_graph(
+            sources=sources,
+            run_source=_run_source,
+            max_workers=max_workers,
+            fail_fast=fail_fast,
+        )
+    finally:
+        if write_queue is not None:
+            await write_queue.close()
+        await http_clients.aclose()
+    skipped = [source for source, outcome in outcomes.items() if outcome == OUTCOME_SKIPPED]
+    if skipped:
+        logging.warning("[SKIPPED] sources=%s", ", ".join(skipped))
 
+    failures = sum(1 for outcome in outcomes.values() if outcome == OUTCOME_FAILED)
     if failures:
         logging.error("Scheduled ETL finished with %s failure(s).", failures)
         return 1
@@ -90,6 +135,8 @@ async def run_sources(
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1.")
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s | %(levelname)s | %(message)s",
@@ -99,6 +146,7 @@ def main() -> int:
             sources=args.sources,
             triggered_by=args.triggered_by,
             fail_fast=args.fail_fast,
+            max_workers=args.max_workers,
         )
     )
 
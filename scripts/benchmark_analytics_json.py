@@ -0,0 +1,142 @@
+"""Benchmark analytics response transports (validated stdlib JSON vs orjson records/split vs Arrow IPC)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import JSONResponse
+
+from app.api.v1.functions import fetch_instagram
+from app.schemas.responses import AnalyticsResponse
+from app.utils.arrow_response import AnalyticsArrowResponse
+from app.utils.deposit_utils import DepositData
+from app.utils.json_response import AnalyticsJSONResponse, table_payload
+from streamlit_app.functions.tables import arrow_stream_payload, table_dataframe
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+MODES = ("legacy", "records", "split", "arrow")
+HASHTAGS = np.array(["#forex", "#trading", "#gold", "#Crypto", "#edukasi", "#market", "#tradersfamily"], dtype=object)
+
+
+def build_instagram_media_frame(rows: int, *, seed: int = 7) -> pd.DataFrame:
+    """Build a synthetic 90-day media frame shaped like ``_read_instagram_media_rows`` output."""
+    rng = np.random.default_rng(seed)
+    days = np.array([date(2026, 1, 1) + timedelta(days=offset) for offset in range(90)], dtype=object)
+    frame = pd.DataFrame(
+        {
+            "date": rng.choice(days, size=rows),
+            "media_id": rng.integers(0, max(rows // 3, 1), size=rows).astype(str),
+            "media_type": rng.choice(np.array(["IMAGE", "VIDEO", "CAROUSEL_ALBUM"], dtype=object), size=rows),
+            "media_product_type": rng.choice(np.array(["FEED", "REELS"], dtype=object), size=rows),
+            "timestamp": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 90 * 86_400, size=rows), unit="s"),
+            "caption": [
+                "Market update " + " ".join(rng.choice(HASHTAGS, size=3, replace=False)) for _ in range(rows)
+            ],
+            "permalink": [f"https://www.instagram.com/p/{index:08d}/" for index in range(rows)],
+        }
+    )
+    for column in ("likes", "comments", "shares", "saves", "reach", "views", "profile_visits", "follows"):
+        frame[column] = rng.integers(0, 2_000, size=rows)
+    frame["total_engagement"] = frame[["likes", "comments", "shares", "saves"]].sum(axis=1)
+    return frame
+
+
+def build_deposit_frame(rows: int, *, seed: int = 7) -> pd.DataFrame:
+    """Build a synthetic 90-day ``df_depo`` with positive first deposits."""
+    rng = np.random.default_rng(seed)
+    days = np.array([date(2026, 1, 1) + timedelta(days=offset) for offset in range(90)], dtype=object)
+    campaign_ids = rng.integers(0, 400, size=rows)
+    return pd.DataFrame(
+        {
+            "tanggal_regis": rng.choice(days, size=rows),
+            "campaign_id": campaign_ids.astype(str),
+            "campaign_name": [f"Campaign {value:03d} - Performance Max Evergreen" for value in campaign_ids],
+            "user_status": rng.choice(np.array(["new", "existing"], dtype=object), size=rows),
+            "email": rng.integers(0, max(rows // 2, 1), size=rows).astype(str),
+            "first_depo": rng.gamma(2.0, 250.0, size=rows).round(2),
+        }
+    )
+
+
+def instagram_tables(media: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    return {
+        "media_daily_rows": fetch_instagram._media_daily_rows_payload(media),
+        "media_rows": fetch_instagram._media_rows_payload(media),
+        "hashtag_rows": fetch_instagram._hashtag_rows_payload(media),
+    }
+
+
+def deposit_tables(depo: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    deposit_data = DepositData(session=None, from_date=date(2026, 1, 1), to_date=date(2026, 3, 31))
+    return {"campaign_daily_metrics": deposit_data._build_campaign_daily_metrics_payload(dataframe=depo)}
+
+
+def _encode(tables: dict[str, pd.DataFrame], mode: str) -> bytes:
+    """Encode ``tables`` the way ``build_analytics_response`` does in ``mode``."""
+    if mode == "legacy":
+        data = {key: table.to_dict(orient="records") for key, table in tables.items()}
+        model = AnalyticsResponse(success=True, message="ok", data=data)
+        return JSONResponse(content=model.model_dump(mode="json")).body
+    response_class = AnalyticsArrowResponse if mode == "arrow" else AnalyticsJSONResponse
+    data = {key: table_payload(table, "split" if mode == "arrow" else mode) for key, table in tables.items()}
+    return response_class(content={"api_version": "v1", "success": True, "message": "ok", "data": data}).body
+
+
+def _decode(body: bytes, mode: str) -> dict[str, pd.DataFrame]:
+    """Decode a response body into dataframes like the Streamlit pages do."""
+    payload = arrow_stream_payload(body) if mode == "arrow" else json.loads(body)
+    return {key: table_dataframe(table) for key, table in payload["data"].items()}
+
+
+def _p95(samples: list[float]) -> float:
+    return float(np.percentile(samples, 95))
+
+
+def _run(label: str, tables: dict[str, pd.DataFrame], repeat: int) -> None:
+    results: dict[str, tuple[float, float, int]] = {}
+    for mode in MODES:
+        _decode(_encode(tables, mode), mode)
+        encode_samples: list[float] = []
+        decode_samples: list[float] = []
+        body = b""
+        for _ in range(repeat):
+            started = perf_counter()
+            body = _encode(tables, mode)
+            encode_samples.append(perf_counter() - started)
+            started = perf_counter()
+            _decode(body, mode)
+            decode_samples.append(perf_counter() - started)
+        results[mode] = (_p95(encode_samples), _p95(decode_samples), len(body))
+    legacy_encode = results["legacy"][0]
+    for mode, (encode_p95, decode_p95, size_bytes) in results.items():
+        print(
+            f"{label:>18} {mode:>8} {size_bytes / 1024:>10.1f} {encode_p95 * 1000:>14.1f} "
+            f"{decode_p95 * 1000:>14.1f} {legacy_encode / encode_p95:>7.1f}x"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark analytics response transports: server encoding and client decoding.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Source row counts to benchmark.")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per mode used for the p95 latency.")
+    args = parser.parse_args()
+
+    builders: tuple[tuple[str, Callable[[int], pd.DataFrame], Callable[[pd.DataFrame], dict[str, pd.DataFrame]]], ...] = (
+        ("instagram", build_instagram_media_frame, instagram_tables),
+        ("deposit", build_deposit_frame, deposit_tables),
+    )
+    print(f"{'endpoint/rows':>18} {'mode':>8} {'body_kb':>10} {'encode_p95_ms':>14} {'decode_p95_ms':>14} {'speedup':>8}")
+    for rows in args.sizes:
+        for name, build_frame, build_tables in builders:
+            _run(f"{name}/{rows}", build_tables(build_frame(rows)), args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+"""Benchmark login-activity chart payloads (compact chart data vs legacy Plotly figure JSON)."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from app.api.v1.functions import fetch_login_activity
+from app.core.config import settings
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+CHART_BUILDERS = (
+    fetch_login_activity._daily_trend_chart,
+    fetch_login_activity._cumulative_trend_chart,
+    fetch_login_activity._source_mix_chart,
+    fetch_login_activity._type_mix_chart,
+    fetch_login_activity._top_campaign_chart,
+    fetch_login_activity._campaign_heatmap_chart,
+)
+
+
+def build_login_frame(rows: int, *, seed: int = 7) -> pd.DataFrame:
+    """Build a synthetic 90-day login frame shaped like ``_read_login_rows`` output."""
+    rng = np.random.default_rng(seed)
+    days = np.array([date(2026, 1, 1) + timedelta(days=offset) for offset in range(90)], dtype=object)
+    campaign_ids = rng.integers(0, 60, size=rows)
+    return pd.DataFrame(
+        {
+            "date": rng.choice(days, size=rows),
+            "campaign_id": campaign_ids.astype(str),
+            "campaign_name": [f"Campaign {value:03d} - Performance Max Evergreen" for value in campaign_ids],
+            "ad_source": rng.choice(np.array(["google_ads", "facebook_ads", "tiktok_ads"], dtype=object), size=rows),
+            "ad_type": rng.choice(np.array(["user_acquisition", "brand_awareness", "remarketing"], dtype=object), size=rows),
+            "email": rng.integers(0, max(rows // 3, 1), size=rows).astype(str),
+        }
+    )
+
+
+async def _render_charts(df: pd.DataFrame, *, legacy: bool) -> tuple[float, int]:
+    """Build every chart and encode it like the API would; return seconds and encoded bytes."""
+    settings.ANALYTICS_LEGACY_FIGURE_JSON = legacy
+    started = perf_counter()
+    charts = await asyncio.gather(*(builder(df) for builder in CHART_BUILDERS))
+    encoded = json.dumps(charts, allow_nan=False).encode()
+    return perf_counter() - started, len(encoded)
+
+
+def _p95(samples: list[float]) -> float:
+    return float(np.percentile(samples, 95))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compact chart data against legacy Plotly figure JSON.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Login row counts to benchmark.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per mode used for the p95 latency.")
+    args = parser.parse_args()
+
+    original = settings.ANALYTICS_LEGACY_FIGURE_JSON
+    print(f"{'rows':>8} {'legacy_kb':>10} {'compact_kb':>11} {'legacy_p95_ms':>14} {'compact_p95_ms':>15} {'speedup':>8}")
+    try:
+        for rows in args.sizes:
+            df = build_login_frame(rows)
+            results: dict[bool, tuple[list[float], int]] = {}
+            for legacy in (True, False):
+                asyncio.run(_render_charts(df, legacy=legacy))
+                samples = []
+                size_bytes = 0
+                for _ in range(args.repeat):
+                    seconds, size_bytes = asyncio.run(_render_charts(df, legacy=legacy))
+                    samples.append(seconds)
+                results[legacy] = (samples, size_bytes)
+            legacy_p95 = _p95(results[True][0])
+            compact_p95 = _p95(results[False][0])
+            print(
+                f"{rows:>8} {results[True][1] / 1024:>10.1f} {results[False][1] / 1024:>11.1f} "
+                f"{legacy_p95 * 1000:>14.1f} {compact_p95 * 1000:>15.1f} {legacy_p95 / compact_p95:>7.1f}x"
+            )
+    finally:
+        settings.ANALYTICS_LEGACY_FIGURE_JSON = original
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,200 @@
+"""Benchmark ETL fact-table upserts (multi-row VALUES chunks vs one executemany statement)."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+from datetime import date, datetime, timedelta
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.db.base import SqliteBase
+from app.db.models.external_api import (
+    Campaign,
+    DailyRegister,
+    DataDepo,
+    DataDepoBa,
+    DataMsDeposit,
+    FacebookAds,
+    FacebookPageInsights,
+    FacebookPageMediaInsights,
+    Ga4DailyMetrics,
+    GoogleAds,
+    InstagramInsights,
+    InstagramMediaInsights,
+    PlayConsoleInstallMetrics,
+    TikTokInsights,
+    TikTokMediaInsights,
+    YouTubeDailyInsight,
+    YouTubeMediaInsight,
+)
+from app.db.session import create_engine, create_session_factory
+from app.etl.load import (
+    SQLITE_LEGACY_MAX_VARIABLES,
+    SQLITE_MAX_VARIABLES,
+    SQLITE_VARIABLE_HEADROOM,
+    natural_key_columns,
+    upsert_ads_rows,
+    upsert_daily_register_rows,
+    upsert_facebook_page_insights_rows,
+    upsert_facebook_page_media_insights_rows,
+    upsert_first_deposit_ba_rows,
+    upsert_first_deposit_rows,
+    upsert_ga4_rows,
+    upsert_instagram_insights_rows,
+    upsert_instagram_media_insights_rows,
+    upsert_ms_deposit_rows,
+    upsert_play_console_install_rows,
+    upsert_tiktok_insights_rows,
+    upsert_tiktok_media_insights_rows,
+    upsert_youtube_daily_insight_rows,
+    upsert_youtube_media_insight_rows,
+)
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+CAMPAIGN_COUNT = 50
+
+UPSERTS = {
+    "upsert_ads_rows[google_ads]": (GoogleAds, partial(upsert_ads_rows, model_cls=GoogleAds)),
+    "upsert_ads_rows[facebook_ads]": (FacebookAds, partial(upsert_ads_rows, model_cls=FacebookAds)),
+    "upsert_ga4_rows": (Ga4DailyMetrics, upsert_ga4_rows),
+    "upsert_daily_register_rows": (DailyRegister, upsert_daily_register_rows),
+    "upsert_instagram_insights_rows": (InstagramInsights, upsert_instagram_insights_rows),
+    "upsert_tiktok_insights_rows": (TikTokInsights, upsert_tiktok_insights_rows),
+    "upsert_tiktok_media_insights_rows": (TikTokMediaInsights, upsert_tiktok_media_insights_rows),
+    "upsert_youtube_daily_insight_rows": (YouTubeDailyInsight, upsert_youtube_daily_insight_rows),
+    "upsert_youtube_media_insight_rows": (YouTubeMediaInsight, upsert_youtube_media_insight_rows),
+    "upsert_instagram_media_insights_rows": (InstagramMediaInsights, upsert_instagram_media_insights_rows),
+    "upsert_facebook_page_insights_rows": (FacebookPageInsights, upsert_facebook_page_insights_rows),
+    "upsert_facebook_page_media_insights_rows": (FacebookPageMediaInsights, upsert_facebook_page_media_insights_rows),
+    "upsert_first_deposit_rows": (DataDepo, upsert_first_deposit_rows),
+    "upsert_first_deposit_ba_rows": (DataDepoBa, upsert_first_deposit_ba_rows),
+    "upsert_ms_deposit_rows": (DataMsDeposit, upsert_ms_deposit_rows),
+    "upsert_play_console_install_rows": (PlayConsoleInstallMetrics, upsert_play_console_install_rows),
+}
+
+
+def build_rows(model_cls, rows: int) -> list[dict]:
+    """Build synthetic payload rows with unique business keys for ``model_cls``."""
+    table = model_cls.__table__
+    key_columns = set(natural_key_columns(table))
+    base_date = date(1900, 1, 1)
+    base_time = datetime(2026, 1, 1)
+    columns = [column for column in table.columns if column.name != "id"]
+
+    def value(column, index: int):
+        is_key = column.name in key_columns
+        if column.name == "campaign_id":
+            return f"c{index % CAMPAIGN_COUNT}"
+        python_type = column.type.python_type
+        if python_type is date:
+            return base_date + timedelta(days=index) if is_key else date(2026, 1, 1 + index % 28)
+        if python_type is datetime:
+            return base_time + timedelta(seconds=index)
+        if python_type is int:
+            return index if is_key else index % 1_000
+        if python_type is float:
+            return float(index % 1_000) / 7
+        if python_type is bool:
+            return bool(index % 2)
+        return f"{column.name}-{index}" if is_key else f"{column.name}-{index % 100}"
+
+    return [{column.name: value(column, index) for column in columns} for index in range(rows)]
+
+
+async def legacy_values_upsert(session, model_cls, rows: list[dict]) -> None:
+    """Previous loader shape: multi-row VALUES chunks sized for a 999-variable limit."""
+    key_columns = natural_key_columns(model_cls.__table__)
+    columns_per_row = len(rows[0])
+    chunk_size = max(1, (SQLITE_LEGACY_MAX_VARIABLES - SQLITE_VARIABLE_HEADROOM) // columns_per_row)
+    for idx in range(0, len(rows), chunk_size):
+        insert_stmt = sqlite_insert(model_cls).values(rows[idx : idx + chunk_size])
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column: insert_stmt.excluded[column] for column in rows[0] if column not in key_columns},
+        )
+        await session.execute(upsert_stmt)
+
+
+async def time_loads(loader, rows: list[dict], database: Path) -> tuple[float, float]:
+    """Return seconds for loading ``rows`` into an empty table, then re-loading them as conflicts."""
+    engine = create_engine(f"sqlite+aiosqlite:///{database}")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(SqliteBase.metadata.create_all)
+        session_factory = create_session_factory(engine)
+        async with session_factory() as session:
+            session.add_all(
+                Campaign(
+                    campaign_id=f"c{index}",
+                    campaign_name=f"GG - UA - {index}",
+                    ad_source="google_ads",
+                    ad_type="user_acquisition",
+                    created_at=datetime(2026, 1, 1),
+                )
+                for index in range(CAMPAIGN_COUNT)
+            )
+            await session.commit()
+            timings = []
+            for _ in range(2):
+                started = perf_counter()
+                await loader(session, rows)
+                await session.commit()
+                timings.append(perf_counter() - started)
+        return timings[0], timings[1]
+    finally:
+        await engine.dispose()
+
+
+async def run(args) -> None:
+    names = args.upserts or list(UPSERTS)
+    print(f"SQLite variable limit: {SQLITE_MAX_VARIABLES} (legacy chunks assume {SQLITE_LEGACY_MAX_VARIABLES})")
+    print(
+        f"{'upsert':<42} {'rows':>9} {'values_ins_s':>12} {'bulk_ins_s':>10} "
+        f"{'values_upd_s':>12} {'bulk_upd_s':>10} {'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows_count in args.sizes:
+            for name in names:
+                model_cls, loader = UPSERTS[name]
+                rows = build_rows(model_cls, rows_count)
+                bulk = await time_loads(
+                    lambda session, payload: loader(session=session, rows=payload),
+                    rows,
+                    Path(workdir) / f"bulk-{name}-{rows_count}.db",
+                )
+                if args.skip_values_above is not None and rows_count > args.skip_values_above:
+                    print(f"{name:<42} {rows_count:>9} {'-':>12} {bulk[0]:>10.3f} {'-':>12} {bulk[1]:>10.3f} {'-':>8}")
+                    continue
+                values = await time_loads(
+                    lambda session, payload: legacy_values_upsert(session, model_cls, payload),
+                    rows,
+                    Path(workdir) / f"values-{name}-{rows_count}.db",
+                )
+                speedup = sum(values) / sum(bulk)
+                print(
+                    f"{name:<42} {rows_count:>9} {values[0]:>12.3f} {bulk[0]:>10.3f} "
+                    f"{values[1]:>12.3f} {bulk[1]:>10.3f} {speedup:>7.1f}x"
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark app.etl.load upsert_*_rows functions.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Row counts to benchmark.")
+    parser.add_argument("--upserts", nargs="+", choices=sorted(UPSERTS), help="Only benchmark these loaders.")
+    parser.add_argument(
+        "--skip-values-above",
+        type=int,
+        default=None,
+        help="Skip the multi-row VALUES reference above this row count.",
+    )
+    asyncio.run(run(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Micro-benchmark for campaign lead allocation (row-wise apply vs columnar NumPy)."""
+
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from app.utils.campaign.allocator import CampaignLeadAllocator
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def rowwise_attach_activity_leads(df: pd.DataFrame, activity_df: pd.DataFrame) -> pd.DataFrame:
+    """Previous ``merged.apply(..., axis=1)`` implementation, kept as the reference."""
+    merged = df.merge(activity_df, on=["date", "campaign_id"], how="left")
+    merged["leads"] = pd.to_numeric(merged["leads"], errors="coerce").fillna(0.0)
+    merged["cost"] = pd.to_numeric(merged["cost"], errors="coerce").fillna(0.0)
+    group_keys = ["date", "campaign_id"]
+    merged["_row_count"] = merged.groupby(group_keys)["campaign_id"].transform("size")
+    merged["_cost_total"] = merged.groupby(group_keys)["cost"].transform("sum")
+    merged["leads"] = merged.apply(
+        lambda row: (
+            float(row["leads"]) * (float(row["cost"]) / float(row["_cost_total"]))
+            if float(row["_cost_total"]) > 0
+            else float(row["leads"]) / float(row["_row_count"])
+        ),
+        axis=1,
+    )
+    return merged.drop(columns=["_row_count", "_cost_total"])
+
+
+def build_frames(rows: int, *, seed: int = 7) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build a synthetic 90-day ads frame plus per-campaign daily activity leads."""
+    rng = np.random.default_rng(seed)
+    days = [date(2026, 1, 1) + timedelta(days=offset) for offset in range(90)]
+    campaign_count = max(rows // (90 * 8), 1)
+    ads = pd.DataFrame(
+        {
+            "date": rng.choice(np.array(days, dtype=object), size=rows),
+            "campaign_id": rng.integers(0, campaign_count, size=rows).astype(str),
+            "ad_name": rng.integers(0, 50, size=rows).astype(str),
+            # Roughly one in five rows has no spend so the equal-split path is exercised.
+            "cost": np.where(rng.random(rows) < 0.2, 0.0, rng.gamma(2.0, 15.0, size=rows)),
+        }
+    )
+    activity = (
+        ads[["date", "campaign_id"]]
+        .drop_duplicates()
+        .assign(leads=lambda frame: rng.integers(0, 40, size=len(frame)))
+    )
+    return ads, activity
+
+
+def _time_call(func, *args) -> tuple[float, pd.DataFrame]:
+    started = perf_counter()
+    result = func(*args)
+    return perf_counter() - started, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CampaignLeadAllocator.attach_activity_leads.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Row counts to benchmark.")
+    parser.add_argument(
+        "--skip-rowwise-above",
+        type=int,
+        default=None,
+        help="Skip the slow row-wise reference above this row count.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'rowwise_s':>10} {'columnar_s':>11} {'speedup':>8}")
+    for rows in args.sizes:
+        ads, activity = build_frames(rows)
+        columnar_s, columnar = _time_call(CampaignLeadAllocator.attach_activity_leads, ads.copy(), activity)
+        if args.skip_rowwise_above is not None and rows > args.skip_rowwise_above:
+            print(f"{rows:>10} {'-':>10} {columnar_s:>11.3f} {'-':>8}")
+            continue
+        rowwise_s, rowwise = _time_call(rowwise_attach_activity_leads, ads.copy(), activity)
+        pd.testing.assert_frame_equal(columnar, rowwise, check_exact=True)
+        print(f"{rows:>10} {rowwise_s:>10.3f} {columnar_s:>11.3f} {rowwise_s / columnar_s:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,6 +17,7 @@ from streamlit_app.functions.runtime import (
     refresh_backend_tokens,
     start_auth_bridge_request,
 )
+from streamlit_app.functions.tables import ARROW_STREAM_MEDIA_TYPE, arrow_stream_payload
 
 
 @dataclass(slots=True)
@@ -62,8 +63,14 @@ async def fetch_api_result(
     params=None,
     method: str = "GET",
     json_payload: dict | None = None,
+    accept: str | None = None,
 ) -> ApiClientResult:
-    """Fetch a protected API endpoint and return a stable result wrapper."""
+    """Fetch a protected API endpoint and return a stable result wrapper.
+
+    ``accept`` is sent as the ``Accept`` header. Arrow IPC responses
+    (``accept=ARROW_STREAM_MEDIA_TYPE`` on analytics endpoints) are decoded
+    by :func:`arrow_stream_payload`, with table fields as dataframes.
+    """
     st_module = st if st is not None else stlib
     try:
         access_token = get_access_token()
@@ -71,6 +78,8 @@ async def fetch_api_result(
             return _error_result("Session invalid. Please log in again.", status_code=401)
         url = f"{host}/api/{uri}"
         headers = {"Authorization": f"Bearer {access_token}"}
+        if accept:
+            headers["Accept"] = accept
         async with httpx.AsyncClient(timeout=120) as client:
             response = await client.request(
                 method=method.upper(),
@@ -94,7 +103,11 @@ async def fetch_api_result(
                 else:
                     clear_auth_state()
             response.raise_for_status()
-            return _result_from_payload(response.json(), status_code=response.status_code)
+            if response.headers.get("content-type", "").startswith(ARROW_STREAM_MEDIA_TYPE):
+                payload = arrow_stream_payload(response.content)
+            else:
+                payload = response.json()
+            return _result_from_payload(payload, status_code=response.status_code)
     except httpx.HTTPStatusError as http_error:
         logging.error("HTTP error occurred: %s", http_error)
         return _error_result(
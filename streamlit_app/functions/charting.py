@@ -5,10 +5,21 @@ from __future__ import annotations
 import plotly.graph_objects as go
 
 
+def figure_from_chart_data(chart: dict) -> go.Figure:
+    """Build a Plotly figure from the backend's compact ``{"traces", "layout"}`` chart data."""
+    return go.Figure(data=chart.get("traces") or [], layout=chart.get("layout") or {})
+
+
 def campaign_figure_from_payload(payload: dict | None, title: str) -> go.Figure:
-    """Convert serialized Plotly payload into a display-ready figure object."""
-    if payload and isinstance(payload, dict):
-        figure = go.Figure(payload)
+    """Convert an analytics chart entry into a display-ready figure object.
+
+    Entries carry compact ``chart`` data; a serialized Plotly ``figure`` from
+    older backends is still accepted.
+    """
+    chart = payload.get("chart") if isinstance(payload, dict) else None
+    legacy_figure = payload.get("figure") if isinstance(payload, dict) else None
+    if isinstance(chart, dict) or isinstance(legacy_figure, dict):
+        figure = figure_from_chart_data(chart) if isinstance(chart, dict) else go.Figure(legacy_figure)
         if figure.data and isinstance(figure.data[0], go.Table):
             table_trace = figure.data[0]
             header_values = [str(value).strip().lower() for value in (table_trace.header.values or [])]
@@ -0,0 +1,61 @@
+"""Table payload helpers shared across Streamlit pages."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+ARROW_ENVELOPE_METADATA_KEY = b"analytics_envelope"
+ARROW_TABLE_MARKER = "arrow_table"
+
+
+def table_dataframe(table: object) -> pd.DataFrame:
+    """Build a dataframe from an analytics table field.
+
+    Accepts row dicts (``orient=records``), the columnar
+    ``{"columns": [...], "data": [...]}`` shape (``orient=split``), where
+    ``data`` holds one value list per column, and dataframes already decoded
+    from an Arrow response. Decoded dataframes usually live in cached page
+    state, so they come back as a shallow copy that callers may reassign
+    columns on.
+    """
+    if isinstance(table, pd.DataFrame):
+        return table.copy(deep=False)
+    if isinstance(table, dict):
+        columns = [str(column) for column in table.get("columns") or []]
+        values = table.get("data") or []
+        return pd.DataFrame(dict(zip(columns, values)), columns=columns)
+    if isinstance(table, list) and table:
+        return pd.DataFrame(table)
+    return pd.DataFrame()
+
+
+def _restore_tables(value: Any, tables: dict[str, pd.DataFrame]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {ARROW_TABLE_MARKER}:
+            return tables[value[ARROW_TABLE_MARKER]]
+        return {key: _restore_tables(item, tables) for key, item in value.items()}
+    return value
+
+
+def arrow_stream_payload(body: bytes) -> dict[str, Any]:
+    """Decode an Arrow IPC analytics response into the JSON envelope shape.
+
+    The outer stream carries one row per table (``name`` plus a nested
+    ``ipc`` stream) and the JSON envelope in its schema metadata; table
+    fields come back as dataframes. Reading wraps the response bytes without
+    copying, and numeric columns stay backed by that buffer (read-only), so
+    callers assign converted columns rather than writing in place.
+    """
+    reader = pa.ipc.open_stream(pa.py_buffer(body))
+    outer = reader.read_all()
+    envelope = json.loads(reader.schema.metadata[ARROW_ENVELOPE_METADATA_KEY])
+    tables: dict[str, pd.DataFrame] = {}
+    for name, ipc in zip(outer.column("name").to_pylist(), outer.column("ipc")):
+        table = pa.ipc.open_stream(ipc.as_buffer()).read_all()
+        tables[name] = table.to_pandas(split_blocks=True)
+    return _restore_tables(envelope, tables)
@@ -5,6 +5,7 @@ import datetime as dt
 import streamlit as st
 
 from streamlit_app.functions.dates import campaign_preset_ranges
+from streamlit_app.functions.tables import ARROW_STREAM_MEDIA_TYPE
 from streamlit_app.page.deposit_components.api import fetch_legacy_deposit_payload
 from streamlit_app.page.deposit_components.charts import (
     build_campaign_deposit_amount_heatmap_figure,
@@ -113,6 +114,7 @@ async def show_deposit_page(host: str) -> None:
                 end_date=end_date,
                 campaign_type=selected_type,
                 fallback_message="Failed to fetch first deposit report.",
+                accept=ARROW_STREAM_MEDIA_TYPE,
             )
         if response is None:
             return
@@ -17,6 +17,7 @@ async def fetch_legacy_deposit_payload(
     end_date: dt.date,
     campaign_type: str,
     fallback_message: str,
+    accept: str | None = None,
 ) -> dict[str, object] | None:
     """Fetch deposit payload using the standard API client and return raw shape."""
     result = await fetch_api_result(
@@ -29,6 +30,7 @@ async def fetch_legacy_deposit_payload(
             "end_date": end_date.isoformat(),
             "campaign_type": campaign_type,
         },
+        accept=accept,
     )
     if result.ok and isinstance(result.raw, dict):
         return result.raw
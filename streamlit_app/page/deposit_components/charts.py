@@ -8,6 +8,7 @@ import math
 import pandas as pd
 import plotly.graph_objects as go
 
+from streamlit_app.functions.tables import table_dataframe
 from streamlit_app.page.deposit_components.formatting import currency_label, currency_multiplier, format_amount_full
 
 
@@ -176,13 +177,12 @@ def build_campaign_deposit_amount_heatmap_figure(
     deposit_label: str = "First Deposit",
 ) -> go.Figure:
     timeline = [str(day) for day in report.get("timeline", [])]
-    rows = [row for row in report.get("campaign_daily_metrics", []) if isinstance(row, dict)]
-    if not timeline or not rows:
+    dataframe = table_dataframe(report.get("campaign_daily_metrics"))
+    if not timeline or dataframe.empty:
         figure = go.Figure()
         figure.update_layout(title=f"Daily {deposit_label} Amount Heatmap (Top {top_n} Campaigns)", annotations=[{"text": "No data available", "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5, "showarrow": False}])
         return figure
 
-    dataframe = pd.DataFrame(rows)
     required_columns = {"date", "campaign_id", "campaign_name", "depo_amount"}
     if dataframe.empty or not required_columns.issubset(dataframe.columns):
         figure = go.Figure()
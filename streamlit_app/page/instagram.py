@@ -10,6 +10,7 @@ import streamlit as st
 
 from streamlit_app.functions.dates import campaign_preset_ranges
 from streamlit_app.functions.metrics import _campaign_format_growth
+from streamlit_app.functions.tables import ARROW_STREAM_MEDIA_TYPE, table_dataframe
 from streamlit_app.page.campaign_components.common import PAGE_STYLE
 from streamlit_app.page.socmed_components.api import fetch_legacy_socmed_payload
 
@@ -91,10 +92,10 @@ def _render_metrics(metrics: dict[str, object]) -> None:
                     )
 
 
-def _daily_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
-    if not rows:
+def _daily_dataframe(table: object) -> pd.DataFrame:
+    df = table_dataframe(table)
+    if df.empty:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
     df["date"] = pd.to_datetime(df["date"]).dt.date
     if "engagement_rate" not in df.columns:
         df["engagement_rate"] = 0.0
@@ -113,10 +114,10 @@ def _daily_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
     return df.sort_values("date")
 
 
-def _media_daily_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
-    if not rows:
+def _media_daily_dataframe(table: object) -> pd.DataFrame:
+    df = table_dataframe(table)
+    if df.empty:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
     df["date"] = pd.to_datetime(df["date"]).dt.date
     if "media_bucket" not in df.columns:
         df["media_bucket"] = df.get("media_product_type", "").fillna("").astype(str)
@@ -140,10 +141,10 @@ def _media_daily_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
     return df.sort_values(["date", "media_bucket"])
 
 
-def _media_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
-    if not rows:
+def _media_dataframe(table: object) -> pd.DataFrame:
+    df = table_dataframe(table)
+    if df.empty:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
     df["date"] = pd.to_datetime(df["date"]).dt.date
     if "engagement_rate" not in df.columns:
         df["engagement_rate"] = 0.0
@@ -165,10 +166,10 @@ def _media_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
     return df.sort_values(["total_engagement", "reach", "date"], ascending=[False, False, False])
 
 
-def _hashtag_dataframe(rows: list[dict[str, object]]) -> pd.DataFrame:
-    if not rows:
+def _hashtag_dataframe(table: object) -> pd.DataFrame:
+    df = table_dataframe(table)
+    if df.empty:
         return pd.DataFrame()
-    df = pd.DataFrame(rows)
     for column in [
         "post_count",
         "total_engagement",
@@ -871,6 +872,7 @@ async def show_instagram_page(host: str) -> None:
                 start_date=start_date,
                 end_date=end_date,
                 fallback_message="Failed to fetch Instagram analytics.",
+                accept=ARROW_STREAM_MEDIA_TYPE,
             )
         if response is None:
             return
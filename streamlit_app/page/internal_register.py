@@ -180,13 +180,13 @@ async def show_internal_register_page(host: str) -> None:
 
     charts = data.get("charts", {})
     tag_mix = charts.get("tag_mix", {})
-    tag_figure = set_transparent_chart_background(campaign_figure_from_payload(tag_mix.get("figure"), "Register by Tag"))
-    daily_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("daily_trend", {}).get("figure"), "Daily Internal Register"))
-    cumulative_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("cumulative_trend", {}).get("figure"), "Cumulative Register by Campaign"))
-    source_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("source_mix", {}).get("figure"), "Register by Source"))
-    type_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("type_mix", {}).get("figure"), "Register by Campaign Type"))
-    top_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("top_campaigns", {}).get("figure"), "Top Campaigns by Register"))
-    heatmap_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("campaign_heatmap", {}).get("figure"), "Daily Register Heatmap"))
+    tag_figure = set_transparent_chart_background(campaign_figure_from_payload(tag_mix, "Register by Tag"))
+    daily_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("daily_trend", {}), "Daily Internal Register"))
+    cumulative_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("cumulative_trend", {}), "Cumulative Register by Campaign"))
+    source_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("source_mix", {}), "Register by Source"))
+    type_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("type_mix", {}), "Register by Campaign Type"))
+    top_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("top_campaigns", {}), "Top Campaigns by Register"))
+    heatmap_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("campaign_heatmap", {}), "Daily Register Heatmap"))
 
     tag_figure.update_layout(height=360)
     daily_figure.update_layout(height=440)
@@ -135,12 +135,12 @@ async def show_login_activity_page(host: str) -> None:
     data = st.session_state.get("login_activity_payload", {}).get("data", {})
     _render_metrics(data.get("metrics", {}))
     charts = data.get("charts", {})
-    daily_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("daily_trend", {}).get("figure"), "Daily Login"))
-    cumulative_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("cumulative_trend", {}).get("figure"), "Cumulative Login by Campaign"))
-    source_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("source_mix", {}).get("figure"), "Login by Source"))
-    type_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("type_mix", {}).get("figure"), "Login by Campaign Type"))
-    top_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("top_campaigns", {}).get("figure"), "Top Campaigns by Login"))
-    heatmap_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("campaign_heatmap", {}).get("figure"), "Daily Login Heatmap"))
+    daily_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("daily_trend", {}), "Daily Login"))
+    cumulative_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("cumulative_trend", {}), "Cumulative Login by Campaign"))
+    source_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("source_mix", {}), "Login by Source"))
+    type_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("type_mix", {}), "Login by Campaign Type"))
+    top_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("top_campaigns", {}), "Top Campaigns by Login"))
+    heatmap_figure = set_transparent_chart_background(campaign_figure_from_payload(charts.get("campaign_heatmap", {}), "Daily Login Heatmap"))
     daily_figure.update_layout(height=440)
     cumulative_figure.update_layout(height=440)
     source_figure.update_layout(height=440)
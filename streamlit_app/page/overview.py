@@ -85,7 +85,7 @@ def _render_overall_source_breakdown(section_data: dict[str, object], *, title_p
     table_df = _format_campaign_source_table(source_rows)
     pie_figure = set_transparent_chart_background(
         campaign_figure_from_payload(
-            breakdown_data.get("pie_chart", {}).get("figure"),
+            breakdown_data.get("pie_chart", {}),
             f"{title_prefix} Cost by Source",
         )
     )
@@ -315,7 +315,7 @@ async def show_overview_page(host: str) -> None:
     selected_source_key = source_options[selected_source]
     active_data = st.session_state.get("overview_active_users_payload_by_source", {}).get(selected_source_key, {}).get("data", {})
     stickiness_summary = active_data.get("stickiness_with_growth", {})
-    active_chart_figure = set_transparent_chart_background(campaign_figure_from_payload(active_data.get("active_users_chart", {}).get("figure"), f"FireBase Active User {selected_source.upper()}"))
+    active_chart_figure = set_transparent_chart_background(campaign_figure_from_payload(active_data.get("active_users_chart", {}), f"FireBase Active User {selected_source.upper()}"))
     active_chart_figure.update_layout(height=430)
     render_overview_metric_cards(st, stickiness_summary)
     with st.container(border=True):
@@ -337,9 +337,9 @@ async def show_overview_page(host: str) -> None:
     st.markdown('<div class="metric-section-title">Ad Cost Spend</div>', unsafe_allow_html=True)
     render_overview_cost_metric_cards(st, cost_summary)
     pie_figures = [
-        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("cost_by_campaign_type", {}).get("figure"), "Cost by Campaign Type")),
-        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("ua_cost_by_platform", {}).get("figure"), "User Acquisition Cost by Platform")),
-        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("ba_cost_by_platform", {}).get("figure"), "Brand Awareness Cost by Platform")),
+        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("cost_by_campaign_type", {}), "Cost by Campaign Type")),
+        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("ua_cost_by_platform", {}), "User Acquisition Cost by Platform")),
+        set_transparent_chart_background(campaign_figure_from_payload(cost_charts.get("ba_cost_by_platform", {}), "Brand Awareness Cost by Platform")),
     ]
     for figure in pie_figures:
         figure.update_layout(height=420)
@@ -360,8 +360,8 @@ async def show_overview_page(host: str) -> None:
     if performance_options[selected_performance_label] == "brand_awareness":
         render_brand_awareness_metric_cards(st, brand_data.get("metrics_with_growth", {}), "")
         _render_overall_source_breakdown(brand_data, title_prefix="Brand Awareness")
-        brand_spend_figure = set_transparent_chart_background(campaign_figure_from_payload(brand_data.get("spend_chart", {}).get("figure"), "Overall Brand Awareness Spend - All Platforms"))
-        brand_performance_figure = set_transparent_chart_background(campaign_figure_from_payload(brand_data.get("performance_chart", {}).get("figure"), "Overall Brand Awareness Performance - All Platforms"))
+        brand_spend_figure = set_transparent_chart_background(campaign_figure_from_payload(brand_data.get("spend_chart", {}), "Overall Brand Awareness Spend - All Platforms"))
+        brand_performance_figure = set_transparent_chart_background(campaign_figure_from_payload(brand_data.get("performance_chart", {}), "Overall Brand Awareness Performance - All Platforms"))
         brand_spend_figure.update_layout(height=430)
         brand_performance_figure.update_layout(height=430)
         for column, figure in zip(st.columns(2, gap="small"), [brand_spend_figure, brand_performance_figure]):
@@ -371,8 +371,8 @@ async def show_overview_page(host: str) -> None:
     elif performance_options[selected_performance_label] == "remarketing":
         render_brand_awareness_metric_cards(st, remarketing_data.get("metrics_with_growth", {}), "")
         _render_overall_source_breakdown(remarketing_data, title_prefix="Remarketing")
-        remarketing_spend_figure = set_transparent_chart_background(campaign_figure_from_payload(remarketing_data.get("spend_chart", {}).get("figure"), "Overall Remarketing Spend - All Platforms"))
-        remarketing_performance_figure = set_transparent_chart_background(campaign_figure_from_payload(remarketing_data.get("performance_chart", {}).get("figure"), "Overall Remarketing Performance - All Platforms"))
+        remarketing_spend_figure = set_transparent_chart_background(campaign_figure_from_payload(remarketing_data.get("spend_chart", {}), "Overall Remarketing Spend - All Platforms"))
+        remarketing_performance_figure = set_transparent_chart_background(campaign_figure_from_payload(remarketing_data.get("performance_chart", {}), "Overall Remarketing Performance - All Platforms"))
         remarketing_spend_figure.update_layout(height=430)
         remarketing_performance_figure.update_layout(height=430)
         for column, figure in zip(st.columns(2, gap="small"), [remarketing_spend_figure, remarketing_performance_figure]):
@@ -393,7 +393,7 @@ async def show_overview_page(host: str) -> None:
                 leads_table_df[column_name] = pd.to_numeric(leads_table_df[column_name], errors="coerce").fillna(0)
             leads_table_df = apply_currency_to_ua_table(leads_table_df, leads_currency_unit)
 
-        leads_pie_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_by_source.get("pie_chart", {}).get("figure"), "Register by Source"))
+        leads_pie_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_by_source.get("pie_chart", {}), "Register by Source"))
         leads_pie_figure.update_layout(height=430)
         leads_source_left, leads_source_right = st.columns(2, gap="small")
         with leads_source_left:
@@ -407,10 +407,10 @@ async def show_overview_page(host: str) -> None:
             with st.container(border=True):
                 st.plotly_chart(leads_pie_figure, width="stretch")
 
-        cost_vs_leads_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_data.get("cost_vs_leads_chart", {}).get("figure"), "Overall Cost per Register - All Platforms"))
+        cost_vs_leads_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_data.get("cost_vs_leads_chart", {}), "Overall Cost per Register - All Platforms"))
         cost_vs_leads_figure = apply_currency_to_ua_figure(cost_vs_leads_figure, chart_type="cost_vs_leads", currency_unit=leads_currency_unit)
         cost_vs_leads_figure.update_layout(height=430)
-        leads_per_day_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_data.get("leads_per_day_chart", {}).get("figure"), "Register per Day"))
+        leads_per_day_figure = set_transparent_chart_background(campaign_figure_from_payload(leads_data.get("leads_per_day_chart", {}), "Register per Day"))
         leads_per_day_figure.update_layout(height=430)
         for column, figure in zip(st.columns(2, gap="small"), [cost_vs_leads_figure, leads_per_day_figure]):
             with column:
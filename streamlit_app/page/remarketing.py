@@ -67,8 +67,8 @@ async def show_remarketing_page(host: str) -> None:
     )
 
     selected_charts = overview_data.get("charts", {}).get(selected_key, {})
-    spend_figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get("spend", {}).get("figure"), f"{selected_source} - Remarketing Spend"))
-    performance_figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get("performance", {}).get("figure"), f"{selected_source} - Remarketing Performance"))
+    spend_figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get("spend", {}), f"{selected_source} - Remarketing Spend"))
+    performance_figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get("performance", {}), f"{selected_source} - Remarketing Performance"))
     spend_figure.update_layout(height=540)
     performance_figure.update_layout(height=540)
     for column, figure in zip(st.columns(2, gap="small"), [spend_figure, performance_figure]):
@@ -93,7 +93,7 @@ async def show_remarketing_page(host: str) -> None:
     st.markdown("### Campaign Insights")
     trend_figures = []
     for key, title in trend_specs:
-        figure = set_transparent_chart_background(campaign_figure_from_payload(ratio_trends_payload.get(key, {}).get("figure"), title))
+        figure = set_transparent_chart_background(campaign_figure_from_payload(ratio_trends_payload.get(key, {}), title))
         figure.update_layout(height=390)
         trend_figures.append(figure)
     for column, figure in zip(st.columns(3, gap="small"), trend_figures):
@@ -16,6 +16,7 @@ async def fetch_legacy_socmed_payload(
     start_date: dt.date,
     end_date: dt.date,
     fallback_message: str,
+    accept: str | None = None,
 ) -> dict[str, object] | None:
     """Fetch social-media payload using the standard API client and return raw shape."""
     result = await fetch_api_result(
@@ -27,6 +28,7 @@ async def fetch_legacy_socmed_payload(
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
         },
+        accept=accept,
     )
     if result.ok and isinstance(result.raw, dict):
         return result.raw
@@ -66,7 +66,7 @@ async def _run_update_for_source(
     final_rows_loaded = poll_result.get("final_rows_loaded")
     final_duration_ms = poll_result.get("final_duration_ms")
 
-    if final_status == "success":
+    if final_status in {"success", "skipped_unchanged"}:
         status_placeholder.empty()
         progress_placeholder.empty()
         st.success(final_message or "Update completed successfully.")
@@ -47,7 +47,7 @@ async def poll_update_job(host: str, access_token: str, run_id: str) -> dict[str
             status_placeholder.info(f"Current status: `{final_status}` | Elapsed: {elapsed}s / {max_wait_seconds}s")
             progress_placeholder.progress(min(elapsed / max_wait_seconds, 1.0))
 
-            if final_status in {"success", "failed"}:
+            if final_status in {"success", "skipped_unchanged", "failed"}:
                 break
             await asyncio.sleep(poll_interval_seconds)
             elapsed += poll_interval_seconds
@@ -65,7 +65,7 @@ async def show_user_acquisition_page(host: str) -> None:
     ]
     figures = []
     for key, title, height in chart_specs:
-        figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get(key, {}).get("figure"), title))
+        figure = set_transparent_chart_background(campaign_figure_from_payload(selected_charts.get(key, {}), title))
         figure.update_layout(height=height)
         figures.append(figure)
     for column, figure in zip(st.columns(3, gap="small"), figures):
@@ -91,7 +91,7 @@ async def show_user_acquisition_page(host: str) -> None:
     st.markdown("### Campaign Insights")
     trend_figures = []
     for key, title in trend_specs:
-        figure = set_transparent_chart_background(campaign_figure_from_payload(ratio_trends_payload.get(key, {}).get("figure"), title))
+        figure = set_transparent_chart_background(campaign_figure_from_payload(ratio_trends_payload.get(key, {}), title))
         figure.update_layout(height=390)
         trend_figures.append(figure)
     for column, figure in zip(st.columns(3, gap="small"), trend_figures):
@@ -102,13 +102,13 @@ async def show_user_acquisition_page(host: str) -> None:
     top_n = int(ua_insight_charts.get("top_n", 10) or 10)
     scatter_figure = set_transparent_chart_background(
         campaign_figure_from_payload(
-            ua_insight_charts.get("spend_vs_leads", {}).get(selected_key, {}).get(level_column, {}).get("figure"),
+            ua_insight_charts.get("spend_vs_leads", {}).get(selected_key, {}).get(level_column, {}),
             f"{selected_source} Spend vs Register",
         )
     )
     top_n_figure = set_transparent_chart_background(
         campaign_figure_from_payload(
-            ua_insight_charts.get("top_leads", {}).get(selected_key, {}).get(level_column, {}).get("figure"),
+            ua_insight_charts.get("top_leads", {}).get(selected_key, {}).get(level_column, {}),
             f"Top {top_n} {selected_source} by Register",
         )
     )
@@ -122,13 +122,13 @@ async def show_user_acquisition_page(host: str) -> None:
     st.markdown("### Daily Pacing Insights")
     cumulative_figure = set_transparent_chart_background(
         campaign_figure_from_payload(
-            ua_insight_charts.get("cumulative", {}).get(selected_key, {}).get(level_column, {}).get("figure"),
+            ua_insight_charts.get("cumulative", {}).get(selected_key, {}).get(level_column, {}),
             f"{selected_source} Cumulative Register vs Spend",
         )
     )
     daily_mix_figure = set_transparent_chart_background(
         campaign_figure_from_payload(
-            ua_insight_charts.get("daily_mix", {}).get(selected_key, {}).get(level_column, {}).get("figure"),
+            ua_insight_charts.get("daily_mix", {}).get(selected_key, {}).get(level_column, {}),
             "Daily Mix (UA Register by Source)",
         )
     )
@@ -0,0 +1,18 @@
+import os
+
+# Settings are resolved at import time; give tests a self-contained environment.
+for _name, _value in {
+    "ENV": "development",
+    "DEV_DB_URL": "sqlite+aiosqlite:///:memory:",
+    "DB_URL": "sqlite+aiosqlite:///:memory:",
+    "DEV_HOST": "localhost",
+    "HOST": "localhost",
+    "DEV_PORT": "8000",
+    "PORT": "8000",
+    "CSRF_SECRET": "test-csrf-secret",
+    "JWT_SECRET_KEY": "test-jwt-secret",
+    "JWT_REFRESH_SECRET_KEY": "test-jwt-refresh-secret",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "60",
+    "REFRESH_TOKEN_EXPIRE_DAYS": "7",
+}.items():
+    os.environ.setdefault(_name, _value)
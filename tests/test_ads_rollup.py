@@ -0,0 +1,148 @@
+import asyncio
+from datetime import date, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.base import SqliteBase
+from app.db.models.ads_rollup import AdsDailyAdRollup, AdsDailyCampaignRollup, AdsDailyTypeRollup
+from app.db.models.external_api import Campaign, DailyRegister, GoogleAds
+from app.db.session import create_session_factory
+from app.etl.ads_rollup import backfill_missing_ads_rollups, refresh_ads_rollups
+from app.utils.campaign.repository import CampaignRepository
+
+PULL_DATE = date(2026, 10, 18)
+
+
+def _ad(day: int, campaign_id: str, ad_name: str, cost: float | None) -> GoogleAds:
+    return GoogleAds(
+        date=date(2026, 10, day),
+        campaign_id=campaign_id,
+        campaign_name=f"GG - UA - {campaign_id}",
+        ad_group="group",
+        ad_name=ad_name,
+        cost=cost,
+        impressions=100,
+        clicks=10,
+        pull_date=PULL_DATE,
+    )
+
+
+def _register(day: int, campaign_id: str, total: int) -> DailyRegister:
+    return DailyRegister(date=date(2026, 10, day), campaign_id=campaign_id, tag_name="CP1", total_regis=total, pull_date=PULL_DATE)
+
+
+async def _rollup_rows(session, model, *columns) -> list[tuple]:
+    result = await session.execute(select(*columns).where(model.source == "google_ads").order_by(*columns))
+    return [tuple(row) for row in result]
+
+
+def test_rollups_allocate_register_leads_and_refresh_one_window():
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(SqliteBase.metadata.create_all)
+        try:
+            async with create_session_factory(engine)() as session:
+                session.add_all(
+                    [
+                        Campaign(campaign_id="c1", campaign_name="GG - UA - c1", ad_source="google_ads", ad_type="user_acquisition", created_at=datetime(2026, 1, 1)),
+                        Campaign(campaign_id="c2", campaign_name="GG - BA - c2", ad_source="google_ads", ad_type="brand_awareness", created_at=datetime(2026, 1, 1)),
+                    ]
+                )
+                await session.flush()
+                session.add_all(
+                    [
+                        _ad(1, "c1", "a", 30.0),
+                        _ad(1, "c1", "b", 10.0),
+                        _ad(1, "c2", "a", None),
+                        _ad(1, "c2", "b", None),
+                        _ad(2, "c1", "a", 5.0),
+                        _register(1, "c1", 8),
+                        _register(1, "c2", 4),
+                        _register(2, "c1", 3),
+                    ]
+                )
+                await session.commit()
+
+                await refresh_ads_rollups(session)
+                await session.commit()
+                full = await _rollup_rows(
+                    session, AdsDailyAdRollup, AdsDailyAdRollup.date, AdsDailyAdRollup.campaign_id, AdsDailyAdRollup.ad_name, AdsDailyAdRollup.leads
+                )
+                by_type = await _rollup_rows(
+                    session, AdsDailyTypeRollup, AdsDailyTypeRollup.date, AdsDailyTypeRollup.ad_type, AdsDailyTypeRollup.cost, AdsDailyTypeRollup.leads
+                )
+                details = (
+                    await session.execute(
+                        CampaignRepository.ads_base_details_query(
+                            model=GoogleAds, from_date=date(2026, 10, 1), to_date=date(2026, 10, 2), ad_type="user_acquisition"
+                        )
+                    )
+                ).all()
+
+                # Only day 2 is reloaded, so day 1 rollups keep their values.
+                (await session.get(DailyRegister, 3)).total_regis = 6
+                (await session.get(DailyRegister, 1)).total_regis = 100
+                await session.flush()
+                await refresh_ads_rollups(session, window_start=date(2026, 10, 2), window_end=date(2026, 10, 2))
+                await session.commit()
+                by_campaign = await _rollup_rows(
+                    session, AdsDailyCampaignRollup, AdsDailyCampaignRollup.date, AdsDailyCampaignRollup.campaign_id, AdsDailyCampaignRollup.leads
+                )
+            return full, by_type, details, by_campaign
+        finally:
+            await engine.dispose()
+
+    full, by_type, details, by_campaign = asyncio.run(main())
+
+    assert full == [
+        (date(2026, 10, 1), "c1", "a", 6.0),
+        (date(2026, 10, 1), "c1", "b", 2.0),
+        (date(2026, 10, 1), "c2", "a", 2.0),
+        (date(2026, 10, 1), "c2", "b", 2.0),
+        (date(2026, 10, 2), "c1", "a", 3.0),
+    ]
+    assert by_type == [
+        (date(2026, 10, 1), "brand_awareness", 0.0, 4.0),
+        (date(2026, 10, 1), "user_acquisition", 40.0, 8.0),
+        (date(2026, 10, 2), "user_acquisition", 5.0, 3.0),
+    ]
+    assert [(row.campaign_source, row.ad_name, row.spend, row.impressions, row.leads) for row in details] == [
+        ("google_ads", "a", 35.0, 200, 9.0),
+        ("google_ads", "b", 10.0, 100, 2.0),
+    ]
+    assert by_campaign == [
+        (date(2026, 10, 1), "c1", 8.0),
+        (date(2026, 10, 1), "c2", 4.0),
+        (date(2026, 10, 2), "c1", 6.0),
+    ]
+
+
+def test_backfill_builds_rollups_only_for_sources_without_them():
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(SqliteBase.metadata.create_all)
+        try:
+            async with create_session_factory(engine)() as session:
+                session.add(
+                    Campaign(campaign_id="c1", campaign_name="GG - UA - c1", ad_source="google_ads", ad_type="user_acquisition", created_at=datetime(2026, 1, 1))
+                )
+                await session.flush()
+                session.add_all([_ad(1, "c1", "a", 30.0), _register(1, "c1", 8)])
+                await session.commit()
+
+                first = await backfill_missing_ads_rollups(session)
+                second = await backfill_missing_ads_rollups(session)
+                await session.commit()
+                rows = await _rollup_rows(session, AdsDailyCampaignRollup, AdsDailyCampaignRollup.campaign_id, AdsDailyCampaignRollup.leads)
+            return first, second, rows
+        finally:
+            await engine.dispose()
+
+    first, second, rows = asyncio.run(main())
+
+    assert first == ["google_ads"]
+    assert second == []
+    assert rows == [("c1", 8.0)]
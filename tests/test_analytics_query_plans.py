@@ -0,0 +1,78 @@
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import app.db.models  # noqa: F401
+from app.db.base import SqliteBase
+from app.db.models.ads_rollup import AdsDailyAdRollup, AdsDailyCampaignRollup, AdsDailyTypeRollup
+from app.db.models.external_api import FacebookAds, GoogleAds, TikTokAds
+from app.etl.ads_rollup import ad_rollup_select, campaign_rollup_select, type_rollup_select
+from app.utils.campaign.base import CampaignDataBase
+from app.utils.campaign.repository import CampaignRepository
+from app.utils.overview.brand_awareness import OverviewBrandAwarenessData
+from app.utils.overview.campaign_cost import OverviewCampaignCostData
+from app.utils.overview.leads_acquisition import OverviewLeadsAcquisitionData
+from app.utils.overview.remarketing_performance import OverviewRemarketingPerformanceData
+
+FROM_DATE = date(2026, 1, 1)
+TO_DATE = date(2026, 1, 31)
+TABLE_SCAN = re.compile(r"^SCAN (google_ads|facebook_ads|tiktok_ads|daily_register|campaign|ads_daily_\w+_rollup)\b")
+
+# Query name -> (query builder, table the range read must SEARCH, or None for the ads table itself).
+QUERY_BUILDERS = {
+    "campaign_ads_range": (lambda model: CampaignDataBase._ads_range_query(model, FROM_DATE, TO_DATE), None),
+    "campaign_ads_details": (
+        lambda model: CampaignRepository.ads_base_details_query(
+            model=model, from_date=FROM_DATE, to_date=TO_DATE, ad_type="user_acquisition"
+        ),
+        AdsDailyAdRollup.__tablename__,
+    ),
+    "overview_cost": (
+        lambda model: OverviewCampaignCostData._ads_cost_query(model, FROM_DATE, TO_DATE),
+        AdsDailyTypeRollup.__tablename__,
+    ),
+    "overview_brand_awareness": (
+        lambda model: OverviewBrandAwarenessData._ads_ba_query(model, FROM_DATE, TO_DATE),
+        AdsDailyTypeRollup.__tablename__,
+    ),
+    "overview_remarketing": (
+        lambda model: OverviewRemarketingPerformanceData._ads_rm_query(model, FROM_DATE, TO_DATE),
+        AdsDailyTypeRollup.__tablename__,
+    ),
+    "overview_leads": (
+        lambda model: OverviewLeadsAcquisitionData._ads_ua_query(model, FROM_DATE, TO_DATE),
+        AdsDailyTypeRollup.__tablename__,
+    ),
+    "rollup_refresh_ad": (lambda model: ad_rollup_select(model.__tablename__, FROM_DATE, TO_DATE), None),
+    "rollup_refresh_campaign": (
+        lambda model: campaign_rollup_select(model.__tablename__, FROM_DATE, TO_DATE),
+        AdsDailyAdRollup.__tablename__,
+    ),
+    "rollup_refresh_type": (
+        lambda model: type_rollup_select(model.__tablename__, FROM_DATE, TO_DATE),
+        AdsDailyCampaignRollup.__tablename__,
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_engine("sqlite://")
+    SqliteBase.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("model", [GoogleAds, FacebookAds, TikTokAds], ids=lambda model: model.__tablename__)
+@pytest.mark.parametrize("query_name", sorted(QUERY_BUILDERS))
+def test_ads_analytics_queries_do_not_scan_tables(engine, query_name, model):
+    build_query, searched_table = QUERY_BUILDERS[query_name]
+    query = build_query(model)
+    sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as connection:
+        plan = [row[3] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+    assert not [detail for detail in plan if TABLE_SCAN.match(detail)], plan
+    assert any(f"SEARCH {searched_table or model.__tablename__} USING" in detail for detail in plan), plan
@@ -0,0 +1,156 @@
+import asyncio
+from datetime import date, datetime
+
+import httpx
+import pandas as pd
+from fastapi import FastAPI
+
+from app.api.v1.endpoint import instagram_token
+from app.db.base import SqliteBase
+from app.db.models.external_api import InstagramInsights, InstagramMediaInsights
+from app.db.models.user import TfUser
+from app.db.session import create_engine, create_session_factory, get_db
+from app.utils.arrow_response import ARROW_STREAM_MEDIA_TYPE, render_arrow_stream
+from app.utils.rbac import SOCMED_ANALYTICS_ROLES
+from app.utils.response_cache import analytics_response_cache
+from app.utils.user_utils import get_current_user
+from streamlit_app.functions.tables import arrow_stream_payload, table_dataframe
+from streamlit_app.page.deposit_components.charts import build_campaign_deposit_amount_heatmap_figure
+
+
+def _media(media_id: str, day: int, likes: int, caption: str) -> InstagramMediaInsights:
+    return InstagramMediaInsights(
+        date=date(2026, 10, day),
+        media_id=media_id,
+        media_type="IMAGE",
+        media_product_type="FEED",
+        timestamp=datetime(2026, 10, day, 9, 30),
+        caption=caption,
+        permalink=f"https://instagram.test/{media_id}",
+        likes=likes,
+        comments=1,
+        shares=0,
+        saves=0,
+        reach=likes * 10,
+        views=likes * 20,
+        profile_visits=0,
+        follows=0,
+        total_engagement=likes + 1,
+        pull_date=date(2026, 10, 18),
+    )
+
+
+def _fetch_instagram_analytics(*header_sets: dict[str, str]) -> list[httpx.Response]:
+    async def main():
+        engine = create_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(SqliteBase.metadata.create_all)
+        session_factory = create_session_factory(engine)
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    InstagramInsights(date=date(2026, 10, 1), total_followers=100, total_engagement=5, pull_date=date(2026, 10, 18)),
+                    InstagramInsights(date=date(2026, 10, 2), total_followers=0, total_engagement=3, pull_date=date(2026, 10, 18)),
+                    _media("m1", 1, 40, "#Forex update #gold"),
+                    _media("m2", 2, 25, "#forex again"),
+                ]
+            )
+            await session.commit()
+
+        async def override_db():
+            async with session_factory() as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(instagram_token.router)
+        app.dependency_overrides[get_db] = override_db
+        app.dependency_overrides[get_current_user] = lambda: TfUser(role=SOCMED_ANALYTICS_ROLES[0])
+        analytics_response_cache.clear()
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                return [
+                    await client.get(
+                        "/api/instagram/analytics",
+                        params={"start_date": "2026-10-01", "end_date": "2026-10-31"},
+                        headers=headers,
+                    )
+                    for headers in header_sets
+                ]
+        finally:
+            analytics_response_cache.clear()
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_arrow_stream_carries_the_same_tables_as_json():
+    json_response, arrow_response, refused_response = _fetch_instagram_analytics(
+        {},
+        {"Accept": f"{ARROW_STREAM_MEDIA_TYPE}, application/json;q=0.5"},
+        {"Accept": f"{ARROW_STREAM_MEDIA_TYPE};q=0, application/json"},
+    )
+
+    assert arrow_response.status_code == 200
+    assert arrow_response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    assert arrow_response.headers["vary"] == "Accept"
+    assert refused_response.headers["content-type"] == "application/json"
+    assert refused_response.json() == json_response.json()
+
+    json_payload = json_response.json()
+    arrow_payload = arrow_stream_payload(arrow_response.content)
+    assert {key: value for key, value in arrow_payload.items() if key != "data"} == {
+        "api_version": "v1",
+        "success": True,
+        "message": "Instagram analytics generated.",
+    }
+    assert len(arrow_payload["data"]["media_rows"]) == 2
+    assert arrow_payload["data"]["hashtag_rows"]["hashtag"].tolist() == ["#forex", "#gold"]
+    for key in ("daily_rows", "media_daily_rows", "media_rows", "hashtag_rows"):
+        assert isinstance(arrow_payload["data"][key], pd.DataFrame)
+        pd.testing.assert_frame_equal(
+            table_dataframe(arrow_payload["data"][key]),
+            table_dataframe(json_payload["data"][key]),
+        )
+    for key in ("metrics", "media_summary", "best_time", "start_date", "end_date"):
+        assert arrow_payload["data"][key] == json_payload["data"][key]
+
+
+def test_arrow_stream_restores_nested_and_empty_tables():
+    body = render_arrow_stream(
+        {
+            "success": True,
+            "data": {
+                "report": {
+                    "campaign_daily_metrics": pd.DataFrame({"date": ["2026-10-01"], "qty": [3], "depo_amount": [12.5]}),
+                    "campaign_totals": [{"campaign_id": "c1"}],
+                },
+                "empty": pd.DataFrame(),
+            },
+        }
+    )
+
+    payload = arrow_stream_payload(body)
+
+    pd.testing.assert_frame_equal(
+        payload["data"]["report"]["campaign_daily_metrics"],
+        pd.DataFrame({"date": ["2026-10-01"], "qty": [3], "depo_amount": [12.5]}),
+    )
+    assert payload["data"]["report"]["campaign_totals"] == [{"campaign_id": "c1"}]
+    assert payload["data"]["empty"].empty
+    assert payload["success"] is True
+
+
+def test_rendering_a_decoded_report_twice_leaves_the_cached_tables_untouched():
+    campaign_daily_metrics = pd.DataFrame(
+        {"date": ["2026-10-01"], "campaign_id": ["c1"], "campaign_name": ["Campaign 1"], "qty": [1], "depo_amount": [10.0]}
+    )
+    payload = arrow_stream_payload(
+        render_arrow_stream({"data": {"report": {"timeline": ["2026-10-01"], "campaign_daily_metrics": campaign_daily_metrics}}})
+    )
+    report = payload["data"]["report"]
+
+    first = build_campaign_deposit_amount_heatmap_figure(report, currency_unit="IDR")
+    second = build_campaign_deposit_amount_heatmap_figure(report, currency_unit="IDR")
+
+    assert first.data[0].customdata.tolist() == second.data[0].customdata.tolist()
+    pd.testing.assert_frame_equal(report["campaign_daily_metrics"], campaign_daily_metrics)
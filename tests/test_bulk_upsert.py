@@ -0,0 +1,83 @@
+import asyncio
+from datetime import date, timedelta
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.models.external_api import YouTubeDailyInsight
+from app.db.session import create_session_factory
+from app.etl.load import SQLITE_LEGACY_MAX_VARIABLES, sqlite_max_variables, upsert_youtube_daily_insight_rows
+
+
+def _row(day: int, views: int) -> dict:
+    return {
+        "date": date(2020, 1, 1) + timedelta(days=day),
+        "views": views,
+        "watch_hours": 1.5,
+        "subscribers_gained": 1,
+        "subscribers_lost": 0,
+        "net_subscribers": 1,
+        "likes": 2,
+        "comments": 3,
+        "shares": 4,
+        "average_view_duration": 30.0,
+        "pull_date": date(2026, 10, 18),
+    }
+
+
+def test_bulk_upsert_is_not_bounded_by_the_variable_limit():
+    # More bound values than one legacy statement could carry.
+    row_count = SQLITE_LEGACY_MAX_VARIABLES
+    rows = [_row(day, views=1) for day in range(row_count)]
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(YouTubeDailyInsight.__table__.create)
+        try:
+            async with create_session_factory(engine)() as session:
+                await upsert_youtube_daily_insight_rows(session, rows)
+                await upsert_youtube_daily_insight_rows(session, [_row(day, views=7) for day in range(10)])
+                await session.commit()
+                return (
+                    await session.execute(
+                        select(func.count(), func.sum(YouTubeDailyInsight.views)).select_from(YouTubeDailyInsight)
+                    )
+                ).one()
+        finally:
+            await engine.dispose()
+
+    stored_rows, total_views = asyncio.run(main())
+
+    assert stored_rows == row_count
+    assert total_views == row_count + 10 * 6
+    assert sqlite_max_variables() >= SQLITE_LEGACY_MAX_VARIABLES
+
+
+def test_bulk_upsert_runs_one_executemany_past_the_variable_limit():
+    # Enough rows that their bound values exceed what one multi-row VALUES statement may carry.
+    row_count = sqlite_max_variables() // len(_row(0, views=1)) + 1
+    rows = [_row(day, views=1) for day in range(row_count)]
+    insert_calls: list[tuple[bool, int]] = []
+
+    def record_insert(_connection, _cursor, statement, parameters, _context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            insert_calls.append((executemany, len(parameters) if executemany else 1))
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(YouTubeDailyInsight.__table__.create)
+        event.listen(engine.sync_engine, "before_cursor_execute", record_insert)
+        try:
+            async with create_session_factory(engine)() as session:
+                await upsert_youtube_daily_insight_rows(session, rows)
+                await session.commit()
+                return (await session.execute(select(func.count()).select_from(YouTubeDailyInsight))).scalar_one()
+        finally:
+            await engine.dispose()
+
+    stored_rows = asyncio.run(main())
+
+    assert stored_rows == row_count
+    assert insert_calls == [(True, row_count)]
@@ -0,0 +1,28 @@
+import pandas as pd
+
+from app.utils.campaign.allocator import CampaignLeadAllocator
+from scripts.benchmark_lead_allocator import build_frames, rowwise_attach_activity_leads
+
+
+def test_columnar_allocation_matches_rowwise_reference():
+    ads, activity = build_frames(5_000)
+
+    columnar = CampaignLeadAllocator.attach_activity_leads(ads.copy(), activity)
+    rowwise = rowwise_attach_activity_leads(ads.copy(), activity)
+
+    pd.testing.assert_frame_equal(columnar, rowwise, check_exact=True)
+
+
+def test_zero_cost_group_falls_back_to_equal_split():
+    ads = pd.DataFrame(
+        {
+            "date": ["2026-01-01"] * 3,
+            "campaign_id": ["c1", "c1", "c2"],
+            "cost": [0.0, 0.0, 10.0],
+        }
+    )
+    activity = pd.DataFrame({"date": ["2026-01-01", "2026-01-01"], "campaign_id": ["c1", "c2"], "leads": [3, 4]})
+
+    result = CampaignLeadAllocator.attach_activity_leads(ads, activity)
+
+    assert result["leads"].tolist() == [1.5, 1.5, 4.0]
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.db.base import SqliteBase
+from app.db.models.external_api import Campaign, DailyRegister, FacebookAds, GoogleAds
+from app.db.session import create_engine, create_readonly_engine, create_session_factory
+from app.utils.analytics_cache import clear_campaign_analytics_cache
+from app.utils.campaign import CampaignData
+
+
+async def _seed(session_factory) -> None:
+    async with session_factory() as session:
+        session.add_all(
+            [
+                Campaign(
+                    campaign_id="c1",
+                    campaign_name="Campaign 1",
+                    ad_source="google",
+                    ad_type="user_acquisition",
+                    created_at=datetime(2026, 1, 1),
+                ),
+                Campaign(
+                    campaign_id="c2",
+                    campaign_name="Campaign 2",
+                    ad_source="facebook",
+                    ad_type="user_acquisition",
+                    created_at=datetime(2026, 1, 1),
+                ),
+                GoogleAds(
+                    date=date(2026, 1, 2),
+                    campaign_id="c1",
+                    campaign_name="Campaign 1",
+                    ad_group="g",
+                    ad_name="a1",
+                    cost=30.0,
+                    impressions=100,
+                    clicks=10,
+                    pull_date=date(2026, 1, 3),
+                ),
+                GoogleAds(
+                    date=date(2026, 1, 2),
+                    campaign_id="c1",
+                    campaign_name="Campaign 1",
+                    ad_group="g",
+                    ad_name="a2",
+                    cost=10.0,
+                    impressions=50,
+                    clicks=5,
+                    pull_date=date(2026, 1, 3),
+                ),
+                FacebookAds(
+                    date=date(2026, 1, 2),
+                    campaign_id="c2",
+                    campaign_name="Campaign 2",
+                    ad_group="g",
+                    ad_name="a1",
+                    cost=20.0,
+                    impressions=80,
+                    clicks=4,
+                    pull_date=date(2026, 1, 3),
+                ),
+                DailyRegister(
+                    date=date(2026, 1, 2),
+                    campaign_id="c1",
+                    tag_name="CP1",
+                    total_regis=8,
+                    pull_date=date(2026, 1, 3),
+                ),
+            ]
+        )
+        await session.commit()
+
+
+def test_readonly_pool_loads_same_frames_as_shared_session(tmp_path):
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'campaign.db'}"
+
+    async def main():
+        engine = create_engine(db_url)
+        read_engine = create_readonly_engine(db_url, pool_size=2)
+        assert read_engine is not None
+        session_factory = create_session_factory(engine)
+        read_session_factory = create_session_factory(read_engine)
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(SqliteBase.metadata.create_all)
+            await _seed(session_factory)
+
+            async with session_factory() as session:
+                clear_campaign_analytics_cache()
+                shared = await CampaignData.load_data(session, date(2026, 1, 1), date(2026, 1, 31))
+                clear_campaign_analytics_cache()
+                pooled = await CampaignData.load_data(
+                    session,
+                    date(2026, 1, 1),
+                    date(2026, 1, 31),
+                    read_session_factory=read_session_factory,
+                )
+            clear_campaign_analytics_cache()
+
+            async with read_session_factory() as read_session:
+                with pytest.raises(OperationalError):
+                    await read_session.execute(Campaign.__table__.delete())
+            return shared, pooled
+        finally:
+            await read_engine.dispose()
+            await engine.dispose()
+
+    shared, pooled = asyncio.run(main())
+
+    for attribute in ("df_google", "df_facebook", "df_tiktok", "df_depo"):
+        pd.testing.assert_frame_equal(getattr(pooled, attribute), getattr(shared, attribute))
+    assert pooled.df_google["leads"].tolist() == [6.0, 2.0]
+
+
+def test_readonly_engine_is_skipped_for_memory_databases():
+    assert create_readonly_engine("sqlite+aiosqlite:///:memory:", pool_size=4) is None
+    assert create_readonly_engine("sqlite+aiosqlite:////tmp/campaign.db", pool_size=0) is None
@@ -0,0 +1,50 @@
+import asyncio
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from app.core.config import settings
+from app.utils.chart_data import ChartData, chart_payload, trace
+from streamlit_app.functions.charting import campaign_figure_from_payload
+
+
+def _chart() -> ChartData:
+    daily = pd.DataFrame({"date": [date(2026, 10, 1), date(2026, 10, 2)], "cost": [np.float64(1.5), np.nan], "leads": np.array([3, 4], dtype=np.int64)})
+    chart = ChartData(data=[trace("bar", x=daily["date"], y=daily["cost"], customdata=daily[["leads"]].to_numpy(), marker_color="#6176ff")])
+    chart.update_layout(title="Spend", xaxis=dict(type="category"))
+    chart.update_layout(xaxis=dict(title="Date"))
+    return chart
+
+
+def test_chart_payload_ships_plain_columnar_traces():
+    payload = asyncio.run(chart_payload(_chart()))
+
+    assert set(payload) == {"chart"}
+    assert payload["chart"] == {
+        "traces": [
+            {
+                "type": "bar",
+                "x": ["2026-10-01", "2026-10-02"],
+                "y": [1.5, None],
+                "customdata": [[3], [4]],
+                "marker_color": "#6176ff",
+            }
+        ],
+        "layout": {"title": "Spend", "xaxis": {"type": "category", "title": "Date"}},
+    }
+    json.dumps(payload, allow_nan=False)
+
+
+def test_legacy_flag_adds_figure_json_matching_client_rebuild(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYTICS_LEGACY_FIGURE_JSON", True)
+
+    payload = asyncio.run(chart_payload(_chart()))
+    client_figure = campaign_figure_from_payload(payload, "Spend")
+    legacy_figure = campaign_figure_from_payload({"figure": payload["figure"]}, "Spend")
+
+    assert isinstance(client_figure.data[0], go.Bar)
+    assert client_figure.data[0].marker.color == "#6176ff"
+    assert client_figure.to_plotly_json() == legacy_figure.to_plotly_json()
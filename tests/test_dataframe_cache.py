@@ -0,0 +1,113 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app.utils.dataframe_cache import CacheDependency, DataFrameCache, dataframe_size_bytes
+
+
+def _frame(rows: int = 4) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "campaign_id": [f"c{index}" for index in range(rows)],
+            "cost": [float(index) for index in range(rows)],
+        }
+    )
+
+
+def test_read_only_mode_hands_out_zero_copy_views():
+    cache = DataFrameCache(max_entries=4, ttl_seconds=60, read_only=True)
+    stored = cache.set(("ads",), _frame())
+    first = cache.get(("ads",))
+    second = cache.get(("ads",))
+
+    assert first is not second
+    assert first["cost"].to_numpy().base is second["cost"].to_numpy().base
+    with pytest.raises(ValueError):
+        first.loc[0, "cost"] = 99.0
+
+    # Replacing or adding columns only touches the caller's view.
+    first["cost"] = first["cost"] * 2
+    first["leads"] = 1.0
+    assert cache.get(("ads",))["cost"].tolist() == stored["cost"].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert "leads" not in cache.get(("ads",)).columns
+
+
+def test_copy_mode_keeps_defensive_copies():
+    cache = DataFrameCache(max_entries=4, ttl_seconds=60)
+    source = _frame()
+    cache.set(("ads",), source)
+    source.loc[0, "cost"] = 99.0
+    hit = cache.get(("ads",))
+    hit.loc[1, "cost"] = 42.0
+
+    assert cache.get(("ads",))["cost"].tolist() == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_byte_budget_evicts_least_recently_used_entries():
+    entry_bytes = dataframe_size_bytes(_frame(100))
+    cache = DataFrameCache(max_entries=10, ttl_seconds=60, max_bytes=entry_bytes * 2, read_only=True)
+    cache.set(("a",), _frame(100))
+    cache.set(("b",), _frame(100))
+    cache.get(("a",))
+    cache.set(("c",), _frame(100))
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    stats = cache.stats()
+    assert stats.entries == 2
+    assert stats.total_bytes == entry_bytes * 2
+
+    oversized = cache.set(("huge",), _frame(1000))
+    assert len(oversized) == 1000
+    assert cache.get(("huge",)) is None
+    assert cache.clear() == 2
+    assert cache.stats().total_bytes == 0
+
+
+def test_eviction_prefers_large_frames_and_tracks_counters():
+    small_bytes = dataframe_size_bytes(_frame(10))
+    large_bytes = dataframe_size_bytes(_frame(200))
+    cache = DataFrameCache(
+        max_entries=10,
+        ttl_seconds=60,
+        max_bytes=large_bytes + small_bytes * 2,
+        read_only=True,
+    )
+    cache.set(("large",), _frame(200))
+    cache.set(("small-1",), _frame(10))
+    cache.get(("large",))
+    cache.set(("small-2",), _frame(10))
+    cache.set(("small-3",), _frame(10))
+
+    # The large frame was touched more recently, but its size makes it the cheapest loss.
+    assert cache.get(("large",)) is None
+    assert cache.get(("small-1",)) is not None
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.evictions == 1
+    assert stats.evicted_bytes == large_bytes
+    assert stats.total_bytes == small_bytes * 3
+
+
+def test_invalidate_drops_only_overlapping_table_windows():
+    cache = DataFrameCache(max_entries=10, ttl_seconds=60)
+    january = (date(2026, 1, 1), date(2026, 1, 31))
+    march = (date(2026, 3, 1), date(2026, 3, 31))
+    cache.set(("campaign", "ads", "jan"), _frame(), dependencies=[CacheDependency("google_ads", *january)])
+    cache.set(("campaign", "ads", "mar"), _frame(), dependencies=[CacheDependency("google_ads", *march)])
+    cache.set(
+        ("campaign", "depo", "mar"),
+        _frame(),
+        dependencies=[CacheDependency("data_depo", *march), CacheDependency("campaign", *march)],
+    )
+
+    assert cache.invalidate("instagram_insights", *march, prefix=("campaign",)) == 0
+    assert cache.invalidate("google_ads", date(2026, 3, 15), date(2026, 4, 15), prefix=("campaign",)) == 1
+    assert cache.get(("campaign", "ads", "jan")) is not None
+    assert cache.get(("campaign", "ads", "mar")) is None
+
+    # Undated reloads (unique_campaign) reach every window of the table.
+    assert cache.invalidate("campaign", prefix=("campaign",)) == 1
+    assert cache.get(("campaign", "depo", "mar")) is None
+    assert cache.stats().entries == 1
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from app.etl.scheduler import resolve_source_graph, run_source_graph
+
+
+def test_run_source_graph_respects_dependencies_and_worker_limit():
+    dependencies = {"campaign": ("ads_a", "ads_b"), "deposit": ("campaign",)}
+    started: list[str] = []
+    active = 0
+    peak = 0
+
+    async def run_source(source: str) -> bool:
+        nonlocal active, peak
+        started.append(source)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return source != "ads_b"
+
+    outcomes = asyncio.run(
+        run_source_graph(
+            sources=["deposit", "campaign", "ads_a", "ads_b", "ga4"],
+            run_source=run_source,
+            max_workers=2,
+            dependencies=dependencies,
+        )
+    )
+
+    assert peak == 2
+    assert started.index("campaign") > max(started.index("ads_a"), started.index("ads_b"))
+    assert started.index("deposit") > started.index("campaign")
+    assert outcomes["ads_b"] == "failed"
+    assert outcomes["deposit"] == "success"
+
+
+def test_run_source_graph_fail_fast_skips_pending_sources():
+    async def run_source(source: str) -> bool:
+        return source != "first"
+
+    outcomes = asyncio.run(
+        run_source_graph(
+            sources=["first", "second"],
+            run_source=run_source,
+            max_workers=1,
+            fail_fast=True,
+            dependencies={},
+        )
+    )
+
+    assert outcomes == {"first": "failed", "second": "skipped"}
+
+
+def test_resolve_source_graph_rejects_cycles():
+    with pytest.raises(ValueError):
+        resolve_source_graph(["a", "b"], {"a": ("b",), "b": ("a",)})
@@ -0,0 +1,52 @@
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+import httpx
+
+from app.etl.extract import INSTAGRAM_MEDIA_METRIC_ALIASES, ExternalApiExtractor
+
+
+def _insight_body(value) -> str:
+    return json.dumps({"data": [{"values": [{"value": value}]}]})
+
+
+def test_graph_batch_maps_each_sub_request_and_retries_aliases():
+    batch_calls: list[list[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sub_requests = json.loads(parse_qs(request.content.decode())["batch"][0])
+        urls = [item["relative_url"] for item in sub_requests]
+        batch_calls.append(urls)
+        results = []
+        for url in urls:
+            if url.startswith("bad/"):
+                results.append({"code": 400, "body": json.dumps({"error": {"message": "invalid media"}})})
+            elif url.endswith("metric=saves"):
+                # Older media only expose the legacy ``saved`` metric.
+                results.append({"code": 400, "body": json.dumps({"error": {"message": "unsupported"}})})
+            elif url.endswith("metric=saved"):
+                results.append({"code": 200, "body": _insight_body(7)})
+            else:
+                results.append({"code": 200, "body": _insight_body(3)})
+        return httpx.Response(200, json=results)
+
+    async def main():
+        extractor = ExternalApiExtractor()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractor._fetch_graph_insight_metrics_batch(
+                client=client,
+                base_url="https://graph.instagram.com/v24.0",
+                access_token="token",
+                object_ids=["m1", "bad"] + [f"m{index}" for index in range(2, 10)],
+                metric_aliases=INSTAGRAM_MEDIA_METRIC_ALIASES,
+                semaphore=asyncio.Semaphore(2),
+                raise_api_error=ExternalApiExtractor._raise_instagram_api_error,
+            )
+
+    totals = asyncio.run(main())
+
+    # 10 media x 6 metrics = 60 sub-requests in 2 calls, then one alias round.
+    assert [len(urls) for urls in batch_calls] == [50, 10, 10]
+    assert totals["m1"] == {"shares": 3, "saves": 7, "reach": 3, "views": 3, "profile_visits": 3, "follows": 3}
+    assert totals["bad"] == {}
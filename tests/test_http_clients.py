@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+
+from app.etl.http_clients import AdaptiveHostLimiter, HttpClientRegistry, ThrottleSignal, _PerHostTransport
+
+
+class _FakeTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        status_code = 500 if request.url.path.endswith("/fail") else 200
+        return httpx.Response(status_code, json={"host": request.url.host})
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def test_registry_reuses_per_host_transports_and_scopes_counters(monkeypatch):
+    created: dict[str, _FakeTransport] = {}
+
+    def fake_new_transport(self, host):
+        assert host not in created
+        return created.setdefault(host, _FakeTransport())
+
+    monkeypatch.setattr(_PerHostTransport, "_new_transport", fake_new_transport)
+
+    async def main():
+        registry = HttpClientRegistry(http2=False)
+        async with registry.session() as client:
+            with registry.scope("run-a"):
+                await asyncio.gather(
+                    client.get("https://graph.facebook.com/v24.0/me"),
+                    client.get("https://graph.facebook.com/v24.0/fail"),
+                )
+        async with registry.session() as client_again:
+            assert client_again is client
+            with registry.scope("run-b"):
+                await client_again.get("https://open.tiktokapis.com/v2/user/info/")
+        stats_a = registry.pop_host_stats("run-a")
+        stats_b = registry.host_stats("run-b")
+        await registry.aclose()
+        return stats_a, stats_b, client.is_closed
+
+    stats_a, stats_b, closed = asyncio.run(main())
+
+    assert set(created) == {"graph.facebook.com", "open.tiktokapis.com"}
+    assert stats_a["graph.facebook.com"]["requests"] == 2
+    assert stats_a["graph.facebook.com"]["errors"] == 1
+    assert list(stats_b) == ["open.tiktokapis.com"]
+    assert closed
+    assert all(transport.closed for transport in created.values())
+
+
+class _ScriptedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        status_code, headers = self.responses.pop(0) if self.responses else (200, {})
+        return httpx.Response(status_code, headers=headers, json={})
+
+    async def aclose(self) -> None:
+        pass
+
+
+def test_throttled_requests_are_retried_and_shrink_the_host_window(monkeypatch):
+    transport = _ScriptedTransport(
+        [
+            (429, {"Retry-After": "0"}),
+            (400, {"X-App-Usage": '{"call_count": 100, "total_time": 40, "total_cputime": 12}'}),
+        ]
+    )
+    monkeypatch.setattr(_PerHostTransport, "_new_transport", lambda self, host: transport)
+
+    async def main():
+        async with HttpClientRegistry(http2=False, retry_backoff_seconds=0) as registry:
+            with registry.scope("run"):
+                response = await registry.client.get("https://graph.facebook.com/v24.0/me")
+            return response.status_code, registry.host_stats("run")
+
+    status_code, stats = asyncio.run(main())
+
+    assert status_code == 200
+    assert transport.calls == 3
+    host_stats = stats["graph.facebook.com"]
+    assert (host_stats["requests"], host_stats["retries"], host_stats["throttled"]) == (3, 2, 2)
+    # Each retry starts after the previous decrease: 10 -> 5 -> 2.5, then +1/2.5 on success.
+    assert host_stats["concurrency_limit"] == 2.9
+
+
+def test_retry_budget_caps_retries_per_host(monkeypatch):
+    transport = _ScriptedTransport([(503, {})] * 10)
+    monkeypatch.setattr(_PerHostTransport, "_new_transport", lambda self, host: transport)
+
+    async def main():
+        async with HttpClientRegistry(http2=False, retry_backoff_seconds=0, retry_attempts=4, retry_budget=2) as registry:
+            first = await registry.client.get("https://open.tiktokapis.com/v2/video/list/")
+            second = await registry.client.get("https://open.tiktokapis.com/v2/video/list/")
+            return first.status_code, second.status_code
+
+    assert asyncio.run(main()) == (503, 503)
+    # Three attempts for the first request exhaust the budget; the second is sent once.
+    assert transport.calls == 4
+
+
+def test_limiter_window_bounds_in_flight_requests():
+    async def main():
+        limiter = AdaptiveHostLimiter(max_concurrency=4)
+        limiter.release(await limiter.acquire(), ThrottleSignal(throttled=True))
+        assert limiter.limit == 2.0
+        tickets = [await limiter.acquire(), await limiter.acquire()]
+        blocked = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        limiter.release(tickets[0], ThrottleSignal())
+        await asyncio.wait_for(blocked, timeout=1)
+        assert limiter.limit == 2.5
+        assert limiter.in_flight == 2
+
+    asyncio.run(main())
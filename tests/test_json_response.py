@@ -0,0 +1,113 @@
+import asyncio
+import json
+import logging
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from app.api.v1.endpoint.common import build_analytics_response
+from app.api.v1.functions import fetch_instagram
+from app.schemas.responses import AnalyticsResponse
+from app.utils.json_response import AnalyticsJSONResponse, dumps, table_payload
+from streamlit_app.functions.tables import table_dataframe
+
+
+def _media_frame() -> pd.DataFrame:
+    frame = pd.DataFrame(
+        {
+            "date": [date(2026, 10, 1), date(2026, 10, 1), date(2026, 10, 2)],
+            "media_id": ["m1", "m2", "m1"],
+            "media_type": ["IMAGE", "VIDEO", "IMAGE"],
+            "media_product_type": ["FEED", "REELS", "FEED"],
+            "timestamp": pd.to_datetime(["2026-10-01 08:00:00", None, "2026-10-01 08:00:00"]),
+            "caption": ["#Forex and #forex #gold", "no tags", "#gold"],
+            "permalink": ["p1", "p2", "p1"],
+        }
+    )
+    for column in ("likes", "comments", "shares", "saves", "reach", "views", "profile_visits", "follows"):
+        frame[column] = np.array([10, 20, 0], dtype=np.int64)
+    frame["total_engagement"] = frame["likes"] * 2
+    return frame
+
+
+def test_split_orient_decodes_to_the_same_frame_as_records():
+    media = _media_frame()
+
+    for builder in (
+        fetch_instagram._media_rows_payload,
+        fetch_instagram._media_daily_rows_payload,
+        fetch_instagram._hashtag_rows_payload,
+    ):
+        table = builder(media)
+        records = json.loads(dumps(table_payload(table, "records")))
+        split = json.loads(dumps(table_payload(table, "split")))
+
+        assert set(split) == {"columns", "data"}
+        pd.testing.assert_frame_equal(table_dataframe(split), table_dataframe(records))
+
+    assert json.loads(dumps(table_payload(fetch_instagram._hashtag_rows_payload(media), "records")))[0] == {
+        "hashtag": "#forex",
+        "post_count": 1,
+        "total_engagement": 20,
+        "likes": 10,
+        "comments": 10,
+        "shares": 10,
+        "saves": 10,
+        "reach": 10,
+        "views": 10,
+        "profile_visits": 10,
+        "follows": 10,
+        "avg_engagement_per_post": 20.0,
+        "engagement_rate": 200.0,
+    }
+    assert table_payload(fetch_instagram._media_rows_payload(media.iloc[:0]), "records") == []
+
+
+def test_encoder_handles_numpy_and_pandas_values():
+    frame = pd.DataFrame({"amount": [1.5, np.nan], "at": pd.to_datetime(["2026-10-01 08:30:00", None]), "label": ["a", None]})
+
+    assert json.loads(
+        dumps(
+            {
+                "table": frame,
+                "count": np.int64(3),
+                "values": np.array([1.0, np.nan]),
+                "when": pd.Timestamp("2026-10-01 08:30:00"),
+                "missing": pd.NaT,
+                "by_key": {1: "one"},
+            }
+        )
+    ) == {
+        "table": {"columns": ["amount", "at", "label"], "data": [[1.5, None], ["2026-10-01T08:30:00", None], ["a", None]]},
+        "count": 3,
+        "values": [1.0, None],
+        "when": "2026-10-01T08:30:00",
+        "missing": None,
+        "by_key": {"1": "one"},
+    }
+
+
+def test_build_analytics_response_renders_the_versioned_envelope():
+    async def loader():
+        return {"rows": table_payload(pd.DataFrame({"value": [1, 2]}), "split")}
+
+    response = asyncio.run(
+        build_analytics_response(
+            loader=loader,
+            success_message="ok",
+            logger=logging.getLogger(__name__),
+            failure_log_message="failed",
+            failure_detail_message="failed",
+        )
+    )
+
+    assert isinstance(response, AnalyticsJSONResponse)
+    assert response.media_type == "application/json"
+    body = AnalyticsResponse.model_validate_json(response.body)
+    assert body.model_dump() == {
+        "api_version": "v1",
+        "success": True,
+        "message": "ok",
+        "data": {"rows": {"columns": ["value"], "data": [[1, 2]]}},
+    }
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from app.etl.pagination import enrich_pages
+
+
+def test_enrichment_overlaps_listing_and_keeps_listing_order():
+    listed: list[int] = []
+    max_unenriched = 0
+    enriched_pages: set[int] = set()
+
+    async def pages():
+        nonlocal max_unenriched
+        for page_number in range(8):
+            await asyncio.sleep(0)
+            if page_number == 3:
+                yield []
+                continue
+            listed.append(page_number)
+            max_unenriched = max(max_unenriched, len(listed) - len(enriched_pages))
+            yield [page_number * 10, page_number * 10 + 1]
+
+    async def enrich(page):
+        # Later pages finish first to check the output is reassembled in listing order.
+        await asyncio.sleep(0.001 * (10 - page[0] // 10))
+        enriched_pages.add(page[0] // 10)
+        return [value * 2 for value in page]
+
+    rows = asyncio.run(enrich_pages(pages(), enrich, max_pending_pages=2))
+
+    assert rows == [value * 2 for page in range(8) if page != 3 for value in (page * 10, page * 10 + 1)]
+    # Two pages being enriched, two queued and one waiting on a full queue at most.
+    assert max_unenriched <= 5
+
+
+def test_enrichment_error_stops_listing_and_propagates():
+    closed = False
+
+    async def pages():
+        nonlocal closed
+        try:
+            page_number = 0
+            while True:
+                yield [page_number]
+                page_number += 1
+                await asyncio.sleep(0)
+        finally:
+            closed = True
+
+    async def enrich(page):
+        if page[0] == 2:
+            raise ValueError("insights request failed")
+        return page
+
+    with pytest.raises(ValueError, match="insights request failed"):
+        asyncio.run(enrich_pages(pages(), enrich, max_pending_pages=2))
+    assert closed
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.models.etl_run import EtlLoadFingerprint
+from app.db.models.external_api import DailyRegister
+from app.db.session import create_session_factory
+from app.etl.pipeline_core import (
+    LOAD_OUTCOME_LOADED,
+    LOAD_OUTCOME_SKIPPED_UNCHANGED,
+    DateWindowPipelineRunner,
+    DateWindowPipelineSpec,
+)
+
+
+def _spec(source_rows: list[dict], writes: list[str]) -> DateWindowPipelineSpec:
+    async def extract(_start, _end):
+        return [dict(row) for row in source_rows]
+
+    async def stage(_session, _raw_rows, _run_id):
+        return 0
+
+    def parse(raw_rows):
+        df = pd.DataFrame(raw_rows)
+        df["date"] = pd.to_datetime(df["date"]).dt.date
+        return df
+
+    def build_rows(df, pull_date):
+        return [{**row, "pull_date": pull_date} for row in df.to_dict("records")]
+
+    async def delete_window(session, start, end):
+        writes.append("delete")
+        result = await session.execute(delete(DailyRegister).where(DailyRegister.date.between(start, end)))
+        return int(result.rowcount or 0)
+
+    async def load_rows(session, rows):
+        writes.append("insert")
+        await session.execute(insert(DailyRegister), rows)
+
+    return DateWindowPipelineSpec(
+        label="daily_register",
+        source="daily_register",
+        empty_metric_name="Daily register",
+        date_column="date",
+        auto_skip_model=DailyRegister,
+        extract=extract,
+        stage=stage,
+        parse=parse,
+        validate=lambda _df: None,
+        build_rows=build_rows,
+        delete_window=delete_window,
+        load_rows=load_rows,
+    )
+
+
+def test_identical_rerun_skips_load_until_source_or_table_changes():
+    source_rows = [
+        {"date": "2026-10-01", "campaign_id": "c1", "tag_name": "CP1", "total_regis": 3},
+        {"date": "2026-10-02", "campaign_id": "c1", "tag_name": "CP1", "total_regis": 5},
+    ]
+    window = (date(2026, 10, 1), date(2026, 10, 7))
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(DailyRegister.__table__.create)
+            await connection.run_sync(EtlLoadFingerprint.__table__.create)
+        session_factory = create_session_factory(engine)
+        outcomes: list[tuple[str, list[str]]] = []
+        try:
+            async with session_factory() as session:
+
+                async def run(rows):
+                    writes: list[str] = []
+                    runner = DateWindowPipelineRunner()
+                    await runner._run_date_window_pipeline(
+                        spec=_spec(rows, writes),
+                        session=session,
+                        start_date=window[0],
+                        end_date=window[1],
+                        types="manual",
+                        run_id="run",
+                    )
+                    outcomes.append((runner.load_outcomes["daily_register"], writes))
+
+                await run(source_rows)
+                # Same rows in a different order.
+                await run(list(reversed(source_rows)))
+                await run([{**source_rows[0], "total_regis": 4}, source_rows[1]])
+                # A row removed outside the pipeline invalidates the fingerprint.
+                await session.execute(delete(DailyRegister).where(DailyRegister.date == date(2026, 10, 2)))
+                await session.commit()
+                await run([{**source_rows[0], "total_regis": 4}, source_rows[1]])
+                stored = (await session.execute(select(func.count()).select_from(DailyRegister))).scalar_one()
+            return outcomes, stored
+        finally:
+            await engine.dispose()
+
+    outcomes, stored = asyncio.run(main())
+
+    assert outcomes == [
+        (LOAD_OUTCOME_LOADED, ["delete", "insert"]),
+        (LOAD_OUTCOME_SKIPPED_UNCHANGED, []),
+        (LOAD_OUTCOME_LOADED, ["delete", "insert"]),
+        (LOAD_OUTCOME_LOADED, ["delete", "insert"]),
+    ]
+    assert stored == 2
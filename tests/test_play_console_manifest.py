@@ -0,0 +1,133 @@
+import asyncio
+import codecs
+import gzip
+import io
+from datetime import date
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.models.etl_run import EtlGcsObjectManifest
+from app.db.models.external_api import PlayConsoleInstallMetrics
+from app.db.session import create_session_factory
+from app.etl import extract as extract_module
+from app.etl.extract import ExternalApiExtractor, _read_play_console_csv
+from app.etl.load import (
+    build_play_console_install_rows,
+    delete_play_console_install_rows_in_window,
+    upsert_play_console_install_rows,
+)
+from app.etl.transform import parse_play_console_install_dataframe
+
+CSV_TEXT = "Date,Package Name,Country,Daily User Installs\n2026-09-01,com.example.app,ID,12\n2026-09-02,com.example.app,ID,15\n"
+
+
+def test_play_console_csv_is_decoded_from_utf16_and_gzip_streams():
+    utf16 = codecs.BOM_UTF16_LE + CSV_TEXT.encode("utf-16-le")
+    bomless_utf16 = CSV_TEXT.encode("utf-16-le")
+    gzipped = gzip.compress(CSV_TEXT.encode("utf-8"))
+
+    for payload, gzipped_flag in ((utf16, False), (bomless_utf16, False), (gzipped, True)):
+        rows = _read_play_console_csv(io.BytesIO(payload), gzipped=gzipped_flag)
+        assert [row["Daily User Installs"] for row in rows] == ["12", "15"]
+        assert list(rows[0])[0] == "Date"
+
+
+def test_unchanged_report_objects_are_rebuilt_from_loaded_metrics(monkeypatch):
+    listing = {
+        "stats/installs/installs_com.example.app_202608_overview.csv": {"generation": "1", "md5Hash": "aug"},
+        "stats/installs/installs_com.example.app_202609_overview.csv": {"generation": "1", "md5Hash": "sep"},
+    }
+    installs = {"aug": "12", "sep": "15", "sep2": "18"}
+    downloads: list[str] = []
+
+    extractor = ExternalApiExtractor.__new__(ExternalApiExtractor)
+    extractor.play_console_storage_service = object()
+    extractor.play_console_credentials = None
+    extractor.play_console_package_name = "com.example.app"
+    extractor.play_console_report_bucket = "pubsite_prod_rev_1"
+    extractor.play_console_download_workers = 2
+    extractor.write_queue = None
+
+    def list_objects():
+        return [{"name": name, **meta} for name, meta in sorted(listing.items())]
+
+    def download(object_name):
+        downloads.append(object_name)
+        month = object_name.split("_")[-2]
+        return [
+            {
+                "Date": f"{month[:4]}-{month[4:]}-01",
+                "Package Name": "com.example.app",
+                "Country": "ID",
+                "Daily User Installs": installs[listing[object_name]["md5Hash"]],
+            }
+        ]
+
+    extractor._list_play_console_report_objects = list_objects
+    extractor._download_play_console_csv = download
+
+    async def fetch_and_load(session_factory):
+        rows = await extractor.fetch_play_console_install_rows(date(2026, 8, 1), date(2026, 9, 30))
+        fetched = sorted(downloads)
+        downloads.clear()
+        async with session_factory() as session:
+            await delete_play_console_install_rows_in_window(
+                session, window_start=date(2026, 8, 1), window_end=date(2026, 9, 30)
+            )
+            await upsert_play_console_install_rows(
+                session,
+                build_play_console_install_rows(parse_play_console_install_dataframe(rows), pull_date=date(2026, 10, 18)),
+            )
+            await session.commit()
+        return rows, fetched
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(EtlGcsObjectManifest.__table__.create)
+            await connection.run_sync(PlayConsoleInstallMetrics.__table__.create)
+        session_factory = create_session_factory(engine)
+        monkeypatch.setattr(extract_module, "sqlite_async_session", session_factory)
+        try:
+            first = await fetch_and_load(session_factory)
+            listing["stats/installs/installs_com.example.app_202609_overview.csv"] = {"generation": "2", "md5Hash": "sep2"}
+            second = await fetch_and_load(session_factory)
+            async with session_factory() as session:
+                await session.execute(
+                    update(PlayConsoleInstallMetrics)
+                    .where(PlayConsoleInstallMetrics.date == date(2026, 8, 1))
+                    .values(installers=0)
+                )
+                await session.commit()
+            third = await fetch_and_load(session_factory)
+            async with session_factory() as session:
+                manifest_columns = [column.name for column in EtlGcsObjectManifest.__table__.columns]
+                manifest_rows = (await session.execute(select(EtlGcsObjectManifest.row_count))).scalars().all()
+            return first, second, third, manifest_columns, manifest_rows
+        finally:
+            await engine.dispose()
+
+    (first, first_downloads), (second, second_downloads), (third, third_downloads), manifest_columns, manifest_rows = (
+        asyncio.run(main())
+    )
+
+    assert first_downloads == sorted(listing)
+    assert [row["Daily User Installs"] for row in first] == ["12", "15"]
+    # Only the rewritten September export is fetched again; August is rebuilt from the loaded metrics.
+    assert second_downloads == ["stats/installs/installs_com.example.app_202609_overview.csv"]
+    assert second[0] == {
+        "date": "2026-08-01",
+        "package_name": "com.example.app",
+        "country": "ID",
+        "installers": 12,
+        "uninstallers": 0,
+        "active_devices": 0,
+        "source_object": "stats/installs/installs_com.example.app_202608_overview.csv",
+    }
+    assert second[1]["Daily User Installs"] == "18"
+    # Loaded rows that no longer match the manifest summary send August back to GCS.
+    assert third_downloads == ["stats/installs/installs_com.example.app_202608_overview.csv"]
+    assert third[0]["Daily User Installs"] == "12"
+    assert "rows" not in manifest_columns
+    assert manifest_rows == [1, 1]
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import logging
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.v1.endpoint.common import build_analytics_response
+from app.db.base import SqliteBase
+from app.db.session import create_session_factory
+from app.utils.response_cache import AnalyticsResponseCache, ResponseCacheScope, analytics_response_cache, bump_data_versions
+
+
+def test_response_cache_serves_hits_until_a_source_table_is_reloaded():
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(SqliteBase.metadata.create_all)
+        analytics_response_cache.clear()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return {"rows": len(calls)}
+
+        try:
+            async with create_session_factory(engine)() as session:
+
+                async def respond(params):
+                    response = await build_analytics_response(
+                        loader=loader,
+                        success_message="ok",
+                        logger=logging.getLogger(__name__),
+                        failure_log_message="failed",
+                        failure_detail_message="failed",
+                        cache=ResponseCacheScope(
+                            route="/api/test",
+                            params=params,
+                            tables=("facebook_ads", "google_ads"),
+                            session=session,
+                        ),
+                    )
+                    return json.loads(response.body)["data"]
+
+                first = await respond((("end_date", "2026-10-18"), ("start_date", "2026-10-01")))
+                hit = await respond((("end_date", "2026-10-18"), ("start_date", "2026-10-01")))
+                other_params = await respond((("end_date", "2026-10-18"), ("start_date", "2026-10-02")))
+
+                # An unrelated table reload keeps the entry; a source table reload retires it.
+                await bump_data_versions(session, ["ga4_daily_metrics"])
+                await session.commit()
+                unrelated = await respond((("end_date", "2026-10-18"), ("start_date", "2026-10-01")))
+                await bump_data_versions(session, ["google_ads"])
+                await session.commit()
+                reloaded = await respond((("end_date", "2026-10-18"), ("start_date", "2026-10-01")))
+            return first, hit, other_params, unrelated, reloaded, len(calls)
+        finally:
+            analytics_response_cache.clear()
+            await engine.dispose()
+
+    first, hit, other_params, unrelated, reloaded, loader_calls = asyncio.run(main())
+
+    assert first == hit == unrelated == {"rows": 1}
+    assert other_params == {"rows": 2}
+    assert reloaded == {"rows": 3}
+    assert loader_calls == 3
+
+
+def test_response_cache_evicts_least_recently_used_within_budgets():
+    cache = AnalyticsResponseCache(max_entries=2, max_bytes=100)
+
+    cache.set(("a",), {"v": "x" * 10})
+    cache.set(("b",), {"v": "y" * 10})
+    cache.get(("a",))
+    cache.set(("c",), {"v": "z" * 10})
+    cache.set(("huge",), {"v": "w" * 200})
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == {"v": "x" * 10}
+    assert cache.get(("huge",)) is None
+    stats = cache.stats()
+    assert (stats.entries, stats.evictions) == (2, 1)
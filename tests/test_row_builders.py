@@ -0,0 +1,62 @@
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from app.etl.load import build_first_deposit_rows, build_tiktok_media_insights_rows
+
+
+def test_first_deposit_rows_coerce_nulls_and_blanks_column_wise():
+    df = pd.DataFrame(
+        {
+            "user_id": [1.0, 2.0],
+            "tanggal_regis": [date(2026, 10, 1), date(2026, 10, 2)],
+            "email": ["a@example.com", ""],
+            "user_status": ["new", None],
+            "campaign_id": ["c1", "c2"],
+            "protection": [0, 3],
+            "analyst": pd.Series([None, 7.0], dtype=object),
+            "first_depo": [100, 250.5],
+            "nmi": [np.nan, 1.5],
+            "pool": pd.Series([None, "Yes"], dtype=object),
+        }
+    )
+
+    rows = build_first_deposit_rows(df, date(2026, 10, 18))
+
+    assert rows[0]["user_id"] == 1 and type(rows[0]["user_id"]) is int
+    assert rows[1]["email"] is None
+    assert rows[1]["user_status"] is None
+    # Columns the sheet did not provide load as NULL.
+    assert rows[0]["fullname"] is None and rows[0]["lot"] is None
+    assert [row["analyst"] for row in rows] == [None, 7]
+    assert [row["nmi"] for row in rows] == [None, 1.5]
+    assert [row["pool"] for row in rows] == [None, True]
+    assert [row["first_depo"] for row in rows] == [100.0, 250.5]
+    assert all(row["pull_date"] == date(2026, 10, 18) for row in rows)
+
+
+def test_media_rows_drop_timezone_and_keep_native_types():
+    df = pd.DataFrame(
+        {
+            "date": [date(2026, 10, 1)],
+            "video_id": ["v1"],
+            "created_at": pd.to_datetime(["2026-10-01T21:30:00+07:00"]),
+            "description": [""],
+            "permalink": ["https://example.com/v1"],
+            "duration": [15],
+            "views": [np.int64(10)],
+            "likes": [1],
+            "comments": [0],
+            "shares": [0],
+            "engagement": [1],
+            "engagement_rate": [0.1],
+        }
+    )
+
+    (row,) = build_tiktok_media_insights_rows(df, date(2026, 10, 18))
+
+    assert row["created_at"] == datetime(2026, 10, 1, 21, 30)
+    assert row["description"] is None
+    assert row["cover_image_url"] is None
+    assert type(row["views"]) is int
@@ -0,0 +1,57 @@
+import asyncio
+
+from app.etl.sheet_snapshot import SheetSnapshotCache, parse_column_range
+
+
+class _FakeRequest:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def execute(self):
+        return self._payload
+
+
+class _FakeSheetsService:
+    def __init__(self, values):
+        self.values_payload = values
+        self.requested_ranges = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def batchGet(self, spreadsheetId, ranges):
+        self.requested_ranges.extend(ranges)
+        return _FakeRequest({"valueRanges": [{"values": self.values_payload}]})
+
+
+def test_snapshot_fetches_widest_range_once_and_slices_columns():
+    service = _FakeSheetsService(
+        [
+            ["id", "email", "tag", "extra"],
+            ["1", "a@x.com", "", "x"],
+            ["", "", "", "only-extra"],
+        ]
+    )
+    cache = SheetSnapshotCache()
+    cache.register("sheet-1", "'RAW Regis'!A:D")
+    cache.register("sheet-1", "'RAW Regis'!A:C")
+
+    async def main():
+        wide = await cache.get_values(service, "sheet-1", "'RAW Regis'!A:D")
+        narrow = await cache.get_values(service, "sheet-1", "'RAW Regis'!A:C")
+        return wide, narrow
+
+    wide, narrow = asyncio.run(main())
+
+    assert service.requested_ranges == ["'RAW Regis'!A:D"]
+    assert cache.fetch_count == 1
+    assert len(wide) == 3
+    assert narrow == [["id", "email", "tag"], ["1", "a@x.com"]]
+
+
+def test_parse_column_range_rejects_row_bounded_ranges():
+    assert parse_column_range("'RAW Regis'!A:AB") == ("'RAW Regis'", 0, 27)
+    assert parse_column_range("'RAW Regis'!A2:G100") is None
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.models.etl_run import EtlSheetWatermark
+from app.etl.sheet_watermark import read_sheet_incremental, save_sheet_watermark
+
+SHEET = [
+    ["date", "campaign_id", "cost"],
+    ["2026-10-01", "c1", "1"],
+    ["2026-10-02", "c1", "2"],
+    ["2026-10-03", "c1", "3"],
+    ["2026-10-04", "c1", "4"],
+]
+
+
+def _rows_for(range_name: str, sheet: list) -> list:
+    bounds = range_name.split("!", 1)[1]
+    start = bounds.split(":", 1)[0]
+    first_row = int("".join(char for char in start if char.isdigit()) or 1)
+    if bounds.endswith(":C1"):
+        return sheet[:1]
+    return sheet[first_row - 1:]
+
+
+def test_incremental_read_resumes_from_watermark_and_falls_back_on_edits():
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(EtlSheetWatermark.__table__.create)
+
+        sheet = [list(row) for row in SHEET]
+        requested: list[list[str]] = []
+
+        async def fetch_ranges(ranges):
+            requested.append(ranges)
+            return [_rows_for(range_name, sheet) for range_name in ranges]
+
+        async def full_read():
+            requested.append(["full"])
+            return [list(row) for row in sheet]
+
+        async def read(window_start):
+            async with AsyncSession(engine) as session:
+                result = await read_sheet_incremental(
+                    session=session,
+                    source="tiktok_ads",
+                    spreadsheet_id="sheet-1",
+                    range_name="'Ads'!A:C",
+                    date_headers=("date",),
+                    window_start=window_start,
+                    fetch_ranges=fetch_ranges,
+                    full_read=full_read,
+                )
+                await save_sheet_watermark(session, result.watermark)
+                await session.commit()
+                return result
+
+        first = await read(date(2026, 10, 3))
+        sheet.append(["2026-10-05", "c1", "5"])
+        second = await read(date(2026, 10, 4))
+        sheet[1][2] = "edited"
+        sheet.insert(1, ["2026-09-30", "c0", "0"])
+        third = await read(date(2026, 10, 5))
+        await engine.dispose()
+        return first, second, third, requested
+
+    first, second, third, requested = asyncio.run(main())
+
+    assert first.mode == "full"
+    assert first.watermark["resume_row"] == 4
+    assert second.mode == "incremental"
+    assert second.rows == [SHEET[0], SHEET[3], SHEET[4], ["2026-10-05", "c1", "5"]]
+    assert requested[1] == ["'Ads'!A1:C1", "'Ads'!A2:C"]
+    assert third.mode == "full"
+    assert requested[-1] == ["full"]
@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.etl.pipeline_core import SqliteWriteQueue
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.rollbacks = 0
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def test_write_queue_applies_jobs_serially_on_one_session():
+    session = _RecordingSession()
+    seen_sessions = []
+    active = 0
+    peak = 0
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    async def job(write_session):
+        nonlocal active, peak
+        seen_sessions.append(write_session)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return len(seen_sessions)
+
+    async def failing_job(_write_session):
+        raise ValueError("load failed")
+
+    async def main():
+        async with SqliteWriteQueue(session_factory, max_pending=1) as queue:
+            results = await asyncio.gather(*(queue.submit(job) for _ in range(3)))
+            with pytest.raises(ValueError):
+                await queue.submit(failing_job)
+        return results
+
+    results = asyncio.run(main())
+
+    assert sorted(results) == [1, 2, 3]
+    assert peak == 1
+    assert all(item is session for item in seen_sessions)
+    assert session.rollbacks == 1
@@ -0,0 +1,159 @@
+import asyncio
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.models.etl_run import EtlLoadFingerprint
+from app.db.models.external_api import Ga4DailyMetrics
+from app.db.session import create_session_factory
+from app.etl.load import (
+    WindowMergeCounts,
+    delete_rows_in_date_window,
+    merge_rows_in_date_window,
+    upsert_ga4_rows,
+)
+from app.etl.pipeline_core import DateWindowPipelineRunner, DateWindowPipelineSpec
+
+
+def _ga4_row(day: int, users: int, *, source: str = "app", pull_day: int = 20) -> dict:
+    return {
+        "date": date(2026, 10, day),
+        "source": source,
+        "daily_active_users": users,
+        "monthly_active_users": users * 10,
+        "active_users": users,
+        "pull_date": date(2026, 10, pull_day),
+    }
+
+
+async def _with_ga4_table(callback):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Ga4DailyMetrics.__table__.create)
+        await connection.run_sync(EtlLoadFingerprint.__table__.create)
+    try:
+        return await callback(create_session_factory(engine))
+    finally:
+        await engine.dispose()
+
+
+async def _stored(session) -> list[tuple]:
+    result = await session.execute(
+        select(
+            Ga4DailyMetrics.id,
+            Ga4DailyMetrics.date,
+            Ga4DailyMetrics.source,
+            Ga4DailyMetrics.daily_active_users,
+            Ga4DailyMetrics.pull_date,
+        ).order_by(Ga4DailyMetrics.date, Ga4DailyMetrics.source)
+    )
+    return [tuple(row) for row in result]
+
+
+def test_merge_only_rewrites_changed_keys_and_matches_replace():
+    window = {"window_start": date(2026, 10, 1), "window_end": date(2026, 10, 3)}
+    first = [_ga4_row(1, 5), _ga4_row(2, 6), _ga4_row(3, 7), _ga4_row(9, 1)]
+    rerun = [_ga4_row(1, 5, pull_day=21), _ga4_row(2, 8, pull_day=21), _ga4_row(3, 7, source="web", pull_day=21)]
+
+    async def main(session_factory):
+        async with session_factory() as session:
+            await upsert_ga4_rows(session, first)
+            await session.commit()
+            before = await _stored(session)
+            counts = await merge_rows_in_date_window(session, Ga4DailyMetrics, rerun, **window)
+            await session.commit()
+            merged = await _stored(session)
+
+            await delete_rows_in_date_window(session, Ga4DailyMetrics, **window)
+            await upsert_ga4_rows(session, rerun)
+            await session.commit()
+            replaced = await _stored(session)
+        return before, counts, merged, replaced
+
+    before, counts, merged, replaced = asyncio.run(_with_ga4_table(main))
+
+    assert counts == WindowMergeCounts(inserted=1, updated=1, deleted=1, unchanged=1)
+    assert [row[1:4] for row in merged] == [row[1:4] for row in replaced]
+    # The unchanged row keeps its id and pull date; the row outside the window is untouched.
+    assert merged[0] == before[0]
+    assert merged[-1] == before[-1]
+    assert merged[1][3:] == (8, date(2026, 10, 21))
+
+
+def test_runner_reports_merge_counts_per_source():
+    source_rows = [
+        {"date": "2026-10-01", "source": "app", "daily_active_users": 5},
+        {"date": "2026-10-02", "source": "app", "daily_active_users": 6},
+    ]
+
+    def spec(rows: list[dict]) -> DateWindowPipelineSpec:
+        async def extract(_start, _end):
+            return [dict(row) for row in rows]
+
+        async def stage(_session, _raw_rows, _run_id):
+            return 0
+
+        def parse(raw_rows):
+            df = pd.DataFrame(raw_rows)
+            df["date"] = pd.to_datetime(df["date"]).dt.date
+            return df
+
+        def build_rows(df, pull_date):
+            return [
+                {**row, "monthly_active_users": 0, "active_users": 0, "pull_date": pull_date}
+                for row in df.to_dict("records")
+            ]
+
+        async def unused(*_args):
+            raise AssertionError("merge mode must not delete and reload the window")
+
+        async def merge_window(session, load_rows, start, end):
+            return await merge_rows_in_date_window(
+                session,
+                Ga4DailyMetrics,
+                load_rows,
+                window_start=start,
+                window_end=end,
+            )
+
+        return DateWindowPipelineSpec(
+            label="ga4",
+            source="ga4_daily_metrics",
+            empty_metric_name="GA4",
+            date_column="date",
+            auto_skip_model=Ga4DailyMetrics,
+            extract=extract,
+            stage=stage,
+            parse=parse,
+            validate=lambda _df: None,
+            build_rows=build_rows,
+            delete_window=unused,
+            load_rows=unused,
+            merge_window=merge_window,
+        )
+
+    async def main(session_factory):
+        reported = []
+        async with session_factory() as session:
+            for rows in (source_rows, [source_rows[0], {**source_rows[1], "daily_active_users": 9}]):
+                runner = DateWindowPipelineRunner()
+                runner.load_strategy = "merge"
+                await runner._run_date_window_pipeline(
+                    spec=spec(rows),
+                    session=session,
+                    start_date=date(2026, 10, 1),
+                    end_date=date(2026, 10, 7),
+                    types="manual",
+                    run_id="run",
+                )
+                reported.append(runner.load_counts["ga4_daily_metrics"])
+        return reported
+
+    reported = asyncio.run(_with_ga4_table(main))
+
+    assert reported == [
+        {"inserted": 2, "updated": 0, "deleted": 0, "unchanged": 0},
+        {"inserted": 0, "updated": 1, "deleted": 0, "unchanged": 1},
+    ]
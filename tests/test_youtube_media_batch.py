@@ -0,0 +1,51 @@
+import asyncio
+from datetime import date
+
+import httpx
+
+from app.etl.extract import ExternalApiExtractor
+
+_METRICS = ["views", "estimatedMinutesWatched", "averageViewPercentage", "likes", "comments", "shares", "subscribersGained"]
+
+
+def _report(rows: list[list]) -> dict:
+    headers = [{"name": "video"}, {"name": "creatorContentType"}, *({"name": name} for name in _METRICS)]
+    return {"columnHeaders": headers, "rows": rows}
+
+
+def test_batched_video_analytics_demultiplexes_rows_per_video():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json=_report(
+                [
+                    ["vid-b", "shorts", 300, 60, 55.5, 9, 2, 1, 4],
+                    ["vid-a", "videoOnDemand", 120, 30, 40.0, 5, 1, 0, 2],
+                ]
+            ),
+        )
+
+    async def main():
+        extractor = ExternalApiExtractor()
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await extractor._youtube_video_analytics_batch(
+                client=client,
+                access_token="token",
+                video_ids=["vid-a", "vid-b", "vid-c"],
+                start_date=date(2026, 6, 1),
+            )
+
+    metrics = asyncio.run(main())
+
+    assert len(requests) == 1
+    params = requests[0].url.params
+    assert params["dimensions"] == "video,creatorContentType"
+    assert params["filters"] == "video==vid-a,vid-b,vid-c"
+    assert params["startDate"] == "2026-06-01"
+    assert metrics["vid-b"]["content_type"] == "SHORTS"
+    assert metrics["vid-b"]["views"] == 300
+    assert metrics["vid-a"]["watch_hours"] == 0.5
+    assert metrics["vid-c"] == ExternalApiExtractor._youtube_video_metrics({})